@@ -1,7 +1,4 @@
-from aiwf.interface.cli.cli import cli
-
-def main() -> None:
-    cli(prog_name="aiwf")
+from aiwf.interface.cli.daemon import main
 
 
 if __name__ == "__main__":
@@ -7,12 +7,13 @@ The service provides the core gating logic. Orchestrator methods delegate
 to this service but remain available for existing test compatibility.
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
 from aiwf.application.approval_config import ApprovalConfig
-from aiwf.application.storage import SessionFileGateway
+from aiwf.application.storage import SessionFileGateway, invalidate_session_file_cache
 from aiwf.application.transitions import TransitionTable
 from aiwf.domain.errors import ProviderError
 from aiwf.domain.models.approval_result import (
@@ -21,12 +22,15 @@ from aiwf.domain.models.approval_result import (
     validate_approval_result,
 )
 from aiwf.domain.models.workflow_state import (
+    TransitionCause,
     WorkflowPhase,
     WorkflowStage,
     WorkflowState,
     WorkflowStatus,
 )
 from aiwf.domain.profiles.profile_factory import ProfileFactory
+from aiwf.domain.providers.approval_files import ApprovalFile, ApprovalFiles
+from aiwf.domain.tracing import span, state_attributes
 
 if TYPE_CHECKING:
     from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
@@ -61,6 +65,10 @@ class GateContext:
     execute_action: Callable[[WorkflowState, Any, str], None]
     handle_pre_transition_approval: Callable[[WorkflowState, Path], None]
     write_regenerated_prompt: Callable[[WorkflowState, Path, Any], None]
+    # Writes deferred saves before an approver runs (SessionStore.flush)
+    flush_state: Callable[[], None] = lambda: None
+    # Held around an approver's evaluation (ProviderExecutionService.slot)
+    provider_slot: Callable[[str], AbstractContextManager[Any]] = lambda key: nullcontext()
 
 
 class ApprovalGateService:
@@ -75,13 +83,19 @@ class ApprovalGateService:
         state: WorkflowState,
         session_dir: Path,
         context: GateContext,
-    ) -> dict[str, str | None]:
-        """Build files dict for approval evaluation.
+    ) -> ApprovalFiles:
+        """Build files mapping for approval evaluation.
 
-        Returns dict of filepath -> content for files relevant to approval.
+        Returns a mapping of filepath -> content for files relevant to
+        approval. Nothing is read here: a file is read when an approver
+        looks up its content, or in part through its ApprovalFile handle.
         """
-        files: dict[str, str | None] = {}
-        iteration_dir = session_dir / f"iteration-{state.current_iteration}"
+        gateway = SessionFileGateway(session_dir)
+        files = ApprovalFiles()
+        iteration_dir = gateway.get_iteration_dir(state.current_iteration)
+
+        def add(path: Path) -> None:
+            files.add(ApprovalFile(path, reader=gateway.read_file))
 
         # Map phase/stage to relevant files
         phase_files = {
@@ -101,28 +115,21 @@ class ApprovalGateService:
         file_names = phase_files.get((state.phase, state.stage), [])
 
         for name in file_names:
-            file_path = iteration_dir / name
-            if file_path.exists():
-                files[str(file_path)] = file_path.read_text(encoding="utf-8")
-            else:
-                files[str(file_path)] = None
+            add(iteration_dir / name)
 
         # Add code files for GENERATE[RESPONSE] and REVISE[RESPONSE]
         if state.stage == WorkflowStage.RESPONSE and state.phase in (
             WorkflowPhase.GENERATE,
             WorkflowPhase.REVISE,
         ):
-            code_dir = iteration_dir / "code"
-            if code_dir.exists():
-                for code_file in code_dir.rglob("*"):
-                    if code_file.is_file():
-                        files[str(code_file)] = code_file.read_text(encoding="utf-8")
+            for code_file in gateway.list_code_files(state.current_iteration):
+                add(code_file)
 
         # Add plan.md for GENERATE and REVIEW phases
         if state.phase in (WorkflowPhase.GENERATE, WorkflowPhase.REVIEW):
-            plan_path = session_dir / "plan.md"
-            if plan_path.exists():
-                files[str(plan_path)] = plan_path.read_text(encoding="utf-8")
+            plan_path = gateway.get_plan_path()
+            if gateway.file_exists(plan_path):
+                add(plan_path)
 
         return files
 
@@ -140,6 +147,7 @@ class ApprovalGateService:
         ctx.update(
             {
                 "allow_rewrite": stage_config.allow_rewrite,
+                "token_budget": stage_config.token_budget,
                 "session_dir": str(session_dir),
                 "plan_file": str(session_dir / "plan.md"),
             }
@@ -163,13 +171,32 @@ class ApprovalGateService:
         approver = context.get_approver(state.phase, state.stage)
         files = self.build_approval_files(state, session_dir, context)
         approval_ctx = self.build_approval_context(state, session_dir, context)
-
-        result = approver.evaluate(
-            phase=state.phase,
-            stage=state.stage,
-            files=files,
-            context=approval_ctx,
-        )
+        # AI approvers can take minutes; persist saved state before waiting on one
+        context.flush_state()
+        approver_key = context.approval_config.get_stage_config(
+            state.phase.value, state.stage.value
+        ).approver
+
+        with context.provider_slot(approver_key), span(
+            "approval.evaluate",
+            **{"aiwf.approver": type(approver).__name__},
+            **state_attributes(state),
+        ) as current:
+            try:
+                result = approver.evaluate(
+                    phase=state.phase,
+                    stage=state.stage,
+                    files=files,
+                    context=approval_ctx,
+                )
+            finally:
+                # AI approvers with filesystem access may edit session files
+                invalidate_session_file_cache()
+            if current is not None and isinstance(result, ApprovalResult):
+                current.set_attribute("aiwf.decision", result.decision.value)
+                if result.truncated_files or result.omitted_files:
+                    current.set_attribute("aiwf.approval.truncated_files", len(result.truncated_files))
+                    current.set_attribute("aiwf.approval.omitted_files", len(result.omitted_files))
 
         return result
 
@@ -261,7 +288,7 @@ class ApprovalGateService:
             return state
 
         # Try profile regeneration if supported
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
         if profile.get_metadata().get("can_regenerate_prompts", False):
             try:
                 regeneration_result = self._try_prompt_regeneration(
@@ -344,7 +371,7 @@ class ApprovalGateService:
         context: GateContext,
     ) -> WorkflowState | None:
         """Attempt to regenerate prompt using profile capability."""
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
         try:
             provider_ctx = context.build_provider_context(state)
             new_prompt = profile.regenerate_prompt(
@@ -418,6 +445,8 @@ class ApprovalGateService:
         elif state.phase == WorkflowPhase.ERROR:
             state.status = WorkflowStatus.ERROR
 
+        state.record_transition(TransitionCause.AUTO_CONTINUE)
+
         # Execute the action for new state
         context.execute_action(state, transition.action, state.session_id)
 
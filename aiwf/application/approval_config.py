@@ -15,11 +15,13 @@ class StageApprovalConfig(BaseModel):
         approver: Approval provider key ("skip", "manual", or response provider key)
         max_retries: Maximum automatic retries on rejection (0 = no retries)
         allow_rewrite: Whether approver can suggest content rewrites
+        token_budget: Prompt token budget for AI approvers (None = approver default)
     """
 
     approver: str = "manual"
     max_retries: int = 0
     allow_rewrite: bool = False
+    token_budget: int | None = Field(default=None, gt=0)
 
 
 class ApprovalConfig(BaseModel):
@@ -33,12 +35,14 @@ class ApprovalConfig(BaseModel):
         default_approver: Default approver for stages not explicitly configured
         default_max_retries: Default max retries for stages not configured
         default_allow_rewrite: Default allow_rewrite for stages not configured
+        default_token_budget: Default token_budget for stages not configured
     """
 
     stages: dict[str, StageApprovalConfig] = Field(default_factory=dict)
     default_approver: str = "manual"
     default_max_retries: int = 0
     default_allow_rewrite: bool = False
+    default_token_budget: int | None = Field(default=None, gt=0)
 
     def get_stage_config(self, phase: str, stage: str) -> StageApprovalConfig:
         """Get approval config for a specific stage.
@@ -60,6 +64,7 @@ class ApprovalConfig(BaseModel):
             approver=self.default_approver,
             max_retries=self.default_max_retries,
             allow_rewrite=self.default_allow_rewrite,
+            token_budget=self.default_token_budget,
         )
 
     @classmethod
@@ -111,6 +116,7 @@ class ApprovalConfig(BaseModel):
         default_approver = data.get("default_approver", "manual")
         default_max_retries = data.get("default_max_retries", 0)
         default_allow_rewrite = data.get("default_allow_rewrite", False)
+        default_token_budget = data.get("default_token_budget")
 
         # Build stages dict
         stages: dict[str, StageApprovalConfig] = {}
@@ -120,7 +126,13 @@ class ApprovalConfig(BaseModel):
 
         # Also check for stage keys at top level (Format 1 & 3)
         for key, value in data.items():
-            if key in ("default_approver", "default_max_retries", "default_allow_rewrite", "stages"):
+            if key in (
+                "default_approver",
+                "default_max_retries",
+                "default_allow_rewrite",
+                "default_token_budget",
+                "stages",
+            ):
                 continue
 
             # Check if this looks like a stage key (contains a dot)
@@ -135,6 +147,7 @@ class ApprovalConfig(BaseModel):
                     approver=value,
                     max_retries=default_max_retries,
                     allow_rewrite=default_allow_rewrite,
+                    token_budget=default_token_budget,
                 )
             elif isinstance(value, dict):
                 # Full config dict
@@ -142,6 +155,7 @@ class ApprovalConfig(BaseModel):
                     approver=value.get("approver", default_approver),
                     max_retries=value.get("max_retries", default_max_retries),
                     allow_rewrite=value.get("allow_rewrite", default_allow_rewrite),
+                    token_budget=value.get("token_budget", default_token_budget),
                 )
             else:
                 raise ValueError(
@@ -153,6 +167,7 @@ class ApprovalConfig(BaseModel):
             default_approver=default_approver,
             default_max_retries=default_max_retries,
             default_allow_rewrite=default_allow_rewrite,
+            default_token_budget=default_token_budget,
         )
 
 
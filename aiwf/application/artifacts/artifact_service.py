@@ -9,6 +9,11 @@ import shutil
 from pathlib import Path
 from typing import Any, Callable
 
+from aiwf.application.storage import (
+    ArtifactBlobStore,
+    SessionFileGateway,
+    invalidate_session_file_cache,
+)
 from aiwf.domain.models.workflow_state import (
     Artifact,
     WorkflowPhase,
@@ -38,8 +43,14 @@ class ArtifactService:
     is approved, BEFORE the state transition to the next phase.
 
     Uses double dispatch pattern - looks up handler by (phase, stage) tuple.
+
+    Code files are written directly, or linked from blob_store when one is
+    set, so content unchanged between iterations is stored once.
     """
 
+    def __init__(self, blob_store: ArtifactBlobStore | None = None) -> None:
+        self.blob_store = blob_store
+
     def handle_pre_transition_approval(
         self,
         state: WorkflowState,
@@ -86,6 +97,7 @@ class ArtifactService:
             raise ValueError(f"Cannot copy plan: {source} not found")
 
         shutil.copy2(source, dest)
+        invalidate_session_file_cache(dest)
         add_message(state, "Copied plan to session")
 
     def _approve_plan_response(
@@ -95,12 +107,12 @@ class ArtifactService:
         add_message: Callable[[WorkflowState, str], None],
     ) -> None:
         """Approve plan response: hash planning-response.md, set plan_approved."""
-        iteration_dir = session_dir / f"iteration-{state.current_iteration}"
-        response_path = iteration_dir / "planning-response.md"
+        gateway = SessionFileGateway(session_dir)
+        response_path = gateway.get_response_path(state.current_iteration, WorkflowPhase.PLAN)
+        plan_hash = gateway.file_sha256(response_path)
 
-        if response_path.exists():
-            content = response_path.read_bytes()
-            state.plan_hash = hashlib.sha256(content).hexdigest()
+        if plan_hash is not None:
+            state.plan_hash = plan_hash
             state.plan_approved = True
             add_message(state, "Plan approved")
         else:
@@ -115,35 +127,31 @@ class ArtifactService:
         add_message: Callable[[WorkflowState, str], None],
     ) -> None:
         """Approve generation response: extract code, create artifacts."""
-        iteration_dir = session_dir / f"iteration-{state.current_iteration}"
-        response_path = iteration_dir / "generation-response.md"
+        gateway = SessionFileGateway(session_dir, self.blob_store)
+        response_path = gateway.get_response_path(state.current_iteration, WorkflowPhase.GENERATE)
+        content = gateway.read_file(response_path)
 
-        if not response_path.exists():
+        if content is None:
             raise ValueError(
                 f"Cannot approve: generation-response.md not found at {response_path}"
             )
 
-        content = response_path.read_text(encoding="utf-8")
-
         # Use profile to process and extract code
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
         result = profile.process_generation_response(
             content, session_dir, state.current_iteration
         )
 
         # Execute write plan if present
         if result.write_plan:
-            code_dir = iteration_dir / "code"
-            code_dir.mkdir(parents=True, exist_ok=True)
+            gateway.ensure_code_dir(state.current_iteration)
 
             for write_op in result.write_plan.writes:
                 # Validate and normalize path - profile returns filename-only or relative paths
                 normalized_path = PathValidator.validate_artifact_path(write_op.path)
 
                 # Write the file
-                file_path = code_dir / normalized_path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(write_op.content, encoding="utf-8")
+                gateway.write_code_file(state.current_iteration, normalized_path, write_op.content)
 
                 # Compute hash and create artifact
                 file_hash = hashlib.sha256(write_op.content.encode("utf-8")).hexdigest()
@@ -166,12 +174,12 @@ class ArtifactService:
         add_message: Callable[[WorkflowState, str], None],
     ) -> None:
         """Approve review response: hash review-response.md, set review_approved."""
-        iteration_dir = session_dir / f"iteration-{state.current_iteration}"
-        response_path = iteration_dir / "review-response.md"
+        gateway = SessionFileGateway(session_dir)
+        response_path = gateway.get_response_path(state.current_iteration, WorkflowPhase.REVIEW)
+        review_hash = gateway.file_sha256(response_path)
 
-        if response_path.exists():
-            content = response_path.read_bytes()
-            state.review_hash = hashlib.sha256(content).hexdigest()
+        if review_hash is not None:
+            state.review_hash = review_hash
             state.review_approved = True
             add_message(state, "Review approved")
         else:
@@ -186,35 +194,31 @@ class ArtifactService:
         add_message: Callable[[WorkflowState, str], None],
     ) -> None:
         """Approve revision response: extract code, update artifacts."""
-        iteration_dir = session_dir / f"iteration-{state.current_iteration}"
-        response_path = iteration_dir / "revision-response.md"
+        gateway = SessionFileGateway(session_dir, self.blob_store)
+        response_path = gateway.get_response_path(state.current_iteration, WorkflowPhase.REVISE)
+        content = gateway.read_file(response_path)
 
-        if not response_path.exists():
+        if content is None:
             raise ValueError(
                 f"Cannot approve: revision-response.md not found at {response_path}"
             )
 
-        content = response_path.read_text(encoding="utf-8")
-
         # Use profile to process and extract revised code
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
         result = profile.process_revision_response(
             content, session_dir, state.current_iteration
         )
 
         # Execute write plan if present
         if result.write_plan:
-            code_dir = iteration_dir / "code"
-            code_dir.mkdir(parents=True, exist_ok=True)
+            gateway.ensure_code_dir(state.current_iteration)
 
             for write_op in result.write_plan.writes:
                 # Validate and normalize path - profile returns filename-only or relative paths
                 normalized_path = PathValidator.validate_artifact_path(write_op.path)
 
                 # Write the file
-                file_path = code_dir / normalized_path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(write_op.content, encoding="utf-8")
+                gateway.write_code_file(state.current_iteration, normalized_path, write_op.content)
 
                 # Compute hash and create artifact for this iteration
                 file_hash = hashlib.sha256(write_op.content.encode("utf-8")).hexdigest()
@@ -0,0 +1,90 @@
+"""Async facade over WorkflowOrchestrator.
+
+Lets many sessions be driven concurrently from one event loop:
+
+    async_orch = AsyncWorkflowOrchestrator(orchestrator)
+    states = await asyncio.gather(*(async_orch.init(sid) for sid in session_ids))
+
+This is a thread offload, not an async state machine: each command runs
+the sync WorkflowOrchestrator (transitions, gates, file I/O, provider
+calls, retries and approvals) in a worker thread, which it occupies until
+the command returns. How many sessions progress at once is therefore
+bounded by the loop's default executor. Providers with a native
+agenerate() still do their I/O on the calling loop: their run_sync()
+calls are scheduled onto the shared loop published by use_shared_loop(),
+instead of a fresh asyncio.run() loop per call.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.models.workflow_state import WorkflowState
+from aiwf.domain.providers.event_loop import use_shared_loop
+
+T = TypeVar("T")
+
+
+@dataclass
+class AsyncWorkflowOrchestrator:
+    """Awaitable workflow commands sharing the caller's event loop.
+
+    Commands for the same session are serialized; commands for different
+    sessions run concurrently.
+    """
+
+    orchestrator: WorkflowOrchestrator
+
+    # Per-session locks; created lazily on the running loop
+    _session_locks: dict[str, asyncio.Lock] = field(default_factory=dict, repr=False)
+
+    async def initialize_run(self, **kwargs: Any) -> str:
+        """Async variant of WorkflowOrchestrator.initialize_run()."""
+        return await self._run(self.orchestrator.initialize_run, **kwargs)
+
+    async def init(self, session_id: str) -> WorkflowState:
+        """Async variant of WorkflowOrchestrator.init()."""
+        async with self._lock(session_id):
+            return await self._run(self.orchestrator.init, session_id)
+
+    async def approve(
+        self,
+        session_id: str,
+        hash_prompts: bool = False,
+        fs_ability: str | None = None,
+    ) -> WorkflowState:
+        """Async variant of WorkflowOrchestrator.approve()."""
+        async with self._lock(session_id):
+            return await self._run(
+                self.orchestrator.approve,
+                session_id,
+                hash_prompts=hash_prompts,
+                fs_ability=fs_ability,
+            )
+
+    async def reject(self, session_id: str, feedback: str) -> WorkflowState:
+        """Async variant of WorkflowOrchestrator.reject()."""
+        async with self._lock(session_id):
+            return await self._run(self.orchestrator.reject, session_id, feedback)
+
+    async def cancel(self, session_id: str) -> WorkflowState:
+        """Async variant of WorkflowOrchestrator.cancel()."""
+        async with self._lock(session_id):
+            return await self._run(self.orchestrator.cancel, session_id)
+
+    def _lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a sync orchestrator command in a worker thread.
+
+        The running loop is published as the shared loop; asyncio.to_thread
+        copies the current context, so provider run_sync() calls made by the
+        command are scheduled back onto this loop.
+        """
+        with use_shared_loop(asyncio.get_running_loop()):
+            return await asyncio.to_thread(fn, *args, **kwargs)
@@ -0,0 +1,378 @@
+"""Batch execution of many workflow sessions in one process.
+
+A batch manifest lists the entities of a bounded context; each entry
+becomes its own session driven through ``initialize_run`` -> ``init`` and
+whatever auto-continue the approval configuration allows. Entries run on
+a worker pool, so the wall-clock time of a batch approaches that of its
+slowest entry rather than the sum of all entries.
+
+Provider calls are additionally gated per provider key, so a batch can
+run many sessions while keeping e.g. at most two concurrent Claude calls.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import yaml
+from pydantic import BaseModel, Field, field_validator
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.providers import ProviderExecutionService, ResponseCache
+from aiwf.application.storage import ArtifactBlobStore
+from aiwf.domain.models.workflow_state import WorkflowStatus
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Roles whose provider defaults to "manual" when not configured (same as init)
+PROVIDER_ROLES = ("planner", "generator", "reviewer", "reviser")
+
+# Default number of sessions driven concurrently
+DEFAULT_BATCH_WORKERS = 4
+
+
+def _normalize_context(context: dict[str, Any]) -> dict[str, Any]:
+    """Normalize context keys the same way `aiwf init -c` does (- -> _)."""
+    return {str(key).replace("-", "_"): value for key, value in context.items()}
+
+
+class BatchEntry(BaseModel):
+    """One session to create in a batch.
+
+    Attributes:
+        context: Entity-specific context, merged over the manifest context
+        name: Label used in progress output (defaults to context entity)
+        profile: Optional profile override
+        providers: Optional role -> provider overrides
+        metadata: Optional metadata merged over the manifest metadata
+    """
+
+    context: dict[str, Any] = Field(default_factory=dict)
+    name: str | None = None
+    profile: str | None = None
+    providers: dict[str, str] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchManifest(BaseModel):
+    """Batch manifest: shared settings plus one entry per entity.
+
+    Example (YAML):
+        profile: jpa-mt
+        providers:
+          planner: claude-code
+          generator: claude-code
+        context:
+          bounded-context: catalog
+          schema-file: schema.sql
+        approval:
+          default_approver: skip
+        workers: 8
+        provider_limits:
+          claude-code: 3
+        entries:
+          - context: {entity: Product, table: app.products}
+          - context: {entity: Category, table: app.categories}
+    """
+
+    profile: str
+    providers: dict[str, str] = Field(default_factory=dict)
+    context: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    approval: dict[str, Any] | None = None
+    workers: int = DEFAULT_BATCH_WORKERS
+    provider_limits: dict[str, int] = Field(default_factory=dict)
+    entries: list[BatchEntry]
+
+    @field_validator("workers")
+    @classmethod
+    def _check_workers(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("workers must be >= 1")
+        return value
+
+    @field_validator("provider_limits")
+    @classmethod
+    def _check_provider_limits(cls, value: dict[str, int]) -> dict[str, int]:
+        for key, limit in value.items():
+            if limit < 1:
+                raise ValueError(f"provider_limits[{key!r}] must be >= 1")
+        return value
+
+    @classmethod
+    def from_file(cls, path: Path) -> "BatchManifest":
+        """Load a manifest from a YAML (or JSON) file.
+
+        Raises:
+            FileNotFoundError: If the manifest does not exist
+            ValueError: If the manifest is not a mapping or fails validation
+        """
+        if not path.is_file():
+            raise FileNotFoundError(2, "Batch manifest not found", str(path))
+        try:
+            data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid batch manifest {path}: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"Batch manifest {path} must be a mapping")
+        return cls.model_validate(data)
+
+    def resolve_entry(
+        self, entry: BatchEntry
+    ) -> tuple[str, dict[str, Any], dict[str, str], dict[str, Any]]:
+        """Merge manifest defaults with an entry.
+
+        Returns:
+            Tuple of (profile, context, providers, metadata)
+        """
+        profile = entry.profile or self.profile
+        context = {
+            **_normalize_context(self.context),
+            **_normalize_context(entry.context),
+        }
+        providers = {role: "manual" for role in PROVIDER_ROLES}
+        providers.update(self.providers)
+        providers.update(entry.providers)
+        metadata = {**self.metadata, **entry.metadata}
+        return profile, context, providers, metadata
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch entry."""
+
+    index: int
+    label: str
+    session_id: str | None = None
+    phase: str | None = None
+    stage: str | None = None
+    status: str | None = None
+    pending_approval: bool = False
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status == WorkflowStatus.ERROR.name
+
+
+@dataclass
+class BatchResult:
+    """Combined outcome of a batch run, items in manifest order."""
+
+    items: list[BatchItemResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for item in self.items if item.failed)
+
+
+class ProviderConcurrencyLimiter:
+    """Per-provider-key concurrency limits shared across worker threads.
+
+    Provider keys without a configured limit are not gated.
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None) -> None:
+        self._semaphores = {
+            key: threading.BoundedSemaphore(limit)
+            for key, limit in (limits or {}).items()
+        }
+
+    @contextmanager
+    def slot(self, provider_key: str) -> Iterator[None]:
+        """Hold a concurrency slot for provider_key for the duration of the block."""
+        semaphore = self._semaphores.get(provider_key)
+        if semaphore is None:
+            yield
+            return
+        with span("batch.provider_slot_wait", **{"aiwf.provider": provider_key}):
+            semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+class LimitedProviderExecutionService(ProviderExecutionService):
+    """ProviderExecutionService that respects per-provider concurrency limits.
+
+    The limit covers provider calls made through execute() and, via the
+    approval gate, AI approver evaluations by the same provider key.
+    """
+
+    def __init__(
+        self,
+        limiter: ProviderConcurrencyLimiter,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(response_cache)
+        self._limiter = limiter
+
+    def slot(self, provider_key: str) -> AbstractContextManager[None]:
+        """Concurrency slot for provider_key, held around provider and approver calls."""
+        return self._limiter.slot(provider_key)
+
+
+class BatchRunner:
+    """Drive the sessions of a batch manifest on a worker pool."""
+
+    def __init__(
+        self,
+        session_store: SessionStore,
+        sessions_root: Path,
+        *,
+        standards_cache_dir: Path | None = None,
+        workers: int = DEFAULT_BATCH_WORKERS,
+        provider_limits: dict[str, int] | None = None,
+        approval_config: ApprovalConfig | None = None,
+        on_result: Callable[[BatchItemResult], None] | None = None,
+        response_cache: ResponseCache | None = None,
+        artifact_store: ArtifactBlobStore | None = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            session_store: Store shared by all sessions of the batch
+            sessions_root: Root directory for session directories
+            standards_cache_dir: Shared standards bundle cache (None = no caching)
+            workers: Maximum number of sessions driven concurrently
+            provider_limits: Maximum concurrent calls per provider key
+            approval_config: Approval config for every session (default: manual)
+            on_result: Called on the calling thread as each entry finishes
+            response_cache: Shared provider response cache (None = no caching)
+            artifact_store: Shared code artifact blob store (None = write code files directly)
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.session_store = session_store
+        self.sessions_root = sessions_root
+        self.standards_cache_dir = standards_cache_dir
+        self.workers = workers
+        self.approval_config = approval_config or ApprovalConfig()
+        self._limiter = ProviderConcurrencyLimiter(provider_limits)
+        self._on_result = on_result
+        self.response_cache = response_cache
+        self.artifact_store = artifact_store
+
+    def run(self, manifest: BatchManifest) -> BatchResult:
+        """Run every manifest entry and return the combined result.
+
+        A failing entry never aborts the batch; its error is recorded on
+        its BatchItemResult.
+
+        Raises:
+            ValueError: If a manifest profile is not registered
+        """
+        started = time.perf_counter()
+        self._load_profiles(manifest)
+        results: list[BatchItemResult | None] = [None] * len(manifest.entries)
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="aiwf-batch"
+        ) as pool:
+            futures = {
+                pool.submit(self._run_entry, manifest, index, entry): index
+                for index, entry in enumerate(manifest.entries)
+            }
+            for future in as_completed(futures):
+                item = future.result()
+                results[futures[future]] = item
+                if self._on_result is not None:
+                    self._on_result(item)
+
+        return BatchResult(
+            items=[item for item in results if item is not None],
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def _load_profiles(self, manifest: BatchManifest) -> None:
+        """Load each distinct manifest profile once, before any worker starts.
+
+        Profiles are registered lazily; loading them here keeps the import
+        off the worker threads and reports an unknown profile once.
+        """
+        from aiwf.domain.profiles.profile_factory import ProfileFactory
+
+        profiles = dict.fromkeys(manifest.resolve_entry(entry)[0] for entry in manifest.entries)
+        for profile in profiles:
+            try:
+                if not ProfileFactory.is_registered(profile):
+                    raise KeyError(profile)
+                ProfileFactory.acquire(profile)
+            except KeyError:
+                available = ", ".join(ProfileFactory.list_profiles())
+                raise ValueError(
+                    f"Profile '{profile}' not found. Available: {available}"
+                ) from None
+
+    def _run_entry(
+        self, manifest: BatchManifest, index: int, entry: BatchEntry
+    ) -> BatchItemResult:
+        """Create one session and drive it as far as approvals allow."""
+        from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+        from aiwf.domain.profiles.profile_factory import ProfileFactory
+
+        profile, context, providers, metadata = manifest.resolve_entry(entry)
+        label = entry.name or str(context.get("entity") or f"entry-{index + 1}")
+        result = BatchItemResult(index=index, label=label)
+        started = time.perf_counter()
+
+        orchestrator = WorkflowOrchestrator(
+            session_store=self.session_store,
+            sessions_root=self.sessions_root,
+            approval_config=self.approval_config,
+            standards_cache_dir=self.standards_cache_dir,
+            artifact_store=self.artifact_store,
+            _provider_service=LimitedProviderExecutionService(
+                self._limiter, self.response_cache
+            ),
+        )
+
+        with span("batch.entry", **{"aiwf.batch.index": index, "aiwf.batch.label": label}):
+            try:
+                validated_context = ProfileFactory.acquire(profile).validate_context(context)
+
+                result.session_id = orchestrator.initialize_run(
+                    profile=profile,
+                    context=validated_context,
+                    metadata=metadata or None,
+                    providers=providers,
+                )
+                state = orchestrator.init(result.session_id)
+            except Exception as e:
+                logger.warning(f"Batch entry {label!r} failed: {e}")
+                result.error = str(e) or type(e).__name__
+                if result.session_id:
+                    self._fill_from_store(result)
+            else:
+                self._fill_from_state(result, state)
+                if state.status == WorkflowStatus.ERROR:
+                    result.error = state.last_error
+
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _fill_from_store(self, result: BatchItemResult) -> None:
+        """Record the persisted state of a session whose run raised."""
+        try:
+            state = self.session_store.load(result.session_id)
+        except Exception:
+            return
+        self._fill_from_state(result, state)
+
+    @staticmethod
+    def _fill_from_state(result: BatchItemResult, state: Any) -> None:
+        result.phase = state.phase.name
+        result.stage = state.stage.name if state.stage else None
+        result.status = state.status.name
+        result.pending_approval = bool(state.pending_approval)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
@@ -5,6 +6,7 @@ import yaml
 from pydantic import ValidationError
 
 from aiwf.domain.providers.capabilities import VALID_FS_ABILITIES
+from aiwf.domain.providers.provider_pool import DEFAULT_INSTANCE_TTL, DEFAULT_VALIDATION_TTL
 from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
 
 if TYPE_CHECKING:
@@ -38,6 +40,17 @@ def _defaults() -> dict[str, Any]:
         "dev": None,
         "default_standards_provider": "scoped-layer-fs",
         "profiles_dir": None,  # Default: ~/.aiwf/profiles/
+        "session_persistence": "snapshot",
+        "artifact_store": "files",
+        "response_cache": {
+            "mode": "off",
+            "max_size_mb": 256,
+            "max_age_days": 30,
+        },
+        "provider_pool": {
+            "ttl_seconds": DEFAULT_INSTANCE_TTL,
+            "validation_ttl_seconds": DEFAULT_VALIDATION_TTL,
+        },
     }
 
 
@@ -131,6 +144,110 @@ def _validate_fs_ability(value: str, source: str) -> str:
     return value
 
 
+# snapshot: rewrite session.json on every save
+# journal: append state deltas to session.journal.jsonl, compacted periodically
+# sqlite: keep state in sessions.sqlite3 under the sessions root (WAL mode)
+VALID_SESSION_PERSISTENCE = {"snapshot", "journal", "sqlite"}
+
+
+def resolve_session_persistence(config: dict[str, Any]) -> str:
+    """Resolve the session persistence mode from loaded config.
+
+    Args:
+        config: Loaded config dict
+
+    Returns:
+        One of VALID_SESSION_PERSISTENCE (default: "snapshot")
+
+    Raises:
+        ConfigLoadError: If config contains an invalid session_persistence value
+    """
+    value = config.get("session_persistence") or "snapshot"
+    if value not in VALID_SESSION_PERSISTENCE:
+        valid = ", ".join(sorted(VALID_SESSION_PERSISTENCE))
+        raise ConfigLoadError(
+            f"Invalid session_persistence '{value}'. Valid values: {valid}"
+        )
+    return value
+
+
+# files: write every iteration's code files in full
+# blobs: store code files once by hash under the sessions root, hard-linked into iterations
+VALID_ARTIFACT_STORES = {"files", "blobs"}
+
+
+def resolve_artifact_store(config: dict[str, Any]) -> str:
+    """Resolve how code artifacts are stored from loaded config.
+
+    Args:
+        config: Loaded config dict
+
+    Returns:
+        One of VALID_ARTIFACT_STORES (default: "files")
+
+    Raises:
+        ConfigLoadError: If config contains an invalid artifact_store value
+    """
+    value = config.get("artifact_store") or "files"
+    if value not in VALID_ARTIFACT_STORES:
+        valid = ", ".join(sorted(VALID_ARTIFACT_STORES))
+        raise ConfigLoadError(f"Invalid artifact_store '{value}'. Valid values: {valid}")
+    return value
+
+
+# off: always call providers
+# record: call providers and store every response
+# replay: serve stored responses, call providers (and store) on misses
+# strict-replay: serve stored responses, fail on misses
+VALID_RESPONSE_CACHE_MODES = {"off", "record", "replay", "strict-replay"}
+
+# Environment override for the cache mode (e.g. AIWF_RESPONSE_CACHE=strict-replay in CI)
+RESPONSE_CACHE_ENV_VAR = "AIWF_RESPONSE_CACHE"
+
+
+def resolve_response_cache(config: dict[str, Any]) -> dict[str, Any]:
+    """Resolve response cache settings from loaded config and environment.
+
+    ``response_cache`` may be a mapping (mode, max_size_mb, max_age_days)
+    or just a mode string. The AIWF_RESPONSE_CACHE environment variable
+    overrides the configured mode.
+
+    Args:
+        config: Loaded config dict
+
+    Returns:
+        Dict with mode (one of VALID_RESPONSE_CACHE_MODES), max_bytes and
+        max_age_seconds
+
+    Raises:
+        ConfigLoadError: If the mode or limits are invalid
+    """
+    settings = config.get("response_cache") or {}
+    if isinstance(settings, str):
+        settings = {"mode": settings}
+    if not isinstance(settings, dict):
+        raise ConfigLoadError("response_cache must be a mapping or a mode string")
+
+    mode = os.environ.get(RESPONSE_CACHE_ENV_VAR) or settings.get("mode") or "off"
+    if mode not in VALID_RESPONSE_CACHE_MODES:
+        valid = ", ".join(sorted(VALID_RESPONSE_CACHE_MODES))
+        raise ConfigLoadError(f"Invalid response_cache mode '{mode}'. Valid values: {valid}")
+
+    try:
+        max_size_mb = float(settings.get("max_size_mb", 256))
+        max_age_days = float(settings.get("max_age_days", 30))
+    except (TypeError, ValueError) as e:
+        raise ConfigLoadError("response_cache limits must be numbers", cause=e) from e
+    if max_size_mb <= 0 or max_age_days <= 0:
+        raise ConfigLoadError("response_cache max_size_mb and max_age_days must be > 0")
+
+    return {
+        "mode": mode,
+        "max_bytes": int(max_size_mb * 1024 * 1024),
+        "max_age_seconds": max_age_days * 24 * 3600,
+    }
+
+
 def resolve_fs_ability(
     cli_override: str | None,
     provider_key: str,
@@ -181,6 +298,46 @@ def resolve_fs_ability(
     return "local-write"
 
 
+def resolve_provider_pool(config: dict[str, Any]) -> dict[str, float | None]:
+    """Resolve provider pool lifetimes from loaded config.
+
+    ``provider_pool`` is a mapping with ttl_seconds (how long a pooled
+    provider instance is reused) and validation_ttl_seconds (how long a
+    successful validate() is trusted). null means forever; 0 disables
+    pooling or validation memoization respectively.
+
+    Args:
+        config: Loaded config dict
+
+    Returns:
+        Dict with ttl and validation_ttl, in seconds or None
+
+    Raises:
+        ConfigLoadError: If a lifetime is not a number >= 0 or null
+    """
+    settings = config.get("provider_pool") or {}
+    if not isinstance(settings, dict):
+        raise ConfigLoadError("provider_pool must be a mapping")
+
+    resolved: dict[str, float | None] = {}
+    for name, field, default in (
+        ("ttl", "ttl_seconds", DEFAULT_INSTANCE_TTL),
+        ("validation_ttl", "validation_ttl_seconds", DEFAULT_VALIDATION_TTL),
+    ):
+        value = settings.get(field, default)
+        if value is None:
+            resolved[name] = None
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError) as e:
+            raise ConfigLoadError(f"provider_pool.{field} must be a number or null", cause=e) from e
+        if seconds < 0:
+            raise ConfigLoadError(f"provider_pool.{field} must be >= 0")
+        resolved[name] = seconds
+    return resolved
+
+
 def load_config(*, project_root: Path | None = None, user_home: Path | None = None) -> dict[str, Any]:
     """
     Load and merge config with precedence (highest wins):
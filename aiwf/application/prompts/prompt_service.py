@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from aiwf.domain.constants import STANDARDS_BUNDLE_FILENAME
 from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowState
 from aiwf.domain.profiles.profile_factory import ProfileFactory
 
@@ -70,9 +71,11 @@ class PromptService:
         # Add filenames to context for profile
         context["prompt_filename"] = prompt_filename
         context["response_filename"] = response_filename
+        # Materialized (hashed) standards bundle, so profiles need not rebuild it
+        context["standards_bundle_path"] = str(session_dir / STANDARDS_BUNDLE_FILENAME)
 
         # Get profile and dispatch to appropriate method
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
 
         phase_prompt_methods = {
             WorkflowPhase.PLAN: profile.generate_planning_prompt,
@@ -171,9 +174,9 @@ class PromptService:
         if not provider_key:
             provider_key = "manual"
 
-        # Create provider and get fs_ability
+        # Get fs_ability from the pooled provider instance
         try:
-            provider = AIProviderFactory.create(provider_key, {})
+            provider = AIProviderFactory.acquire(provider_key, {})
             return provider.get_metadata().get("fs_ability", "none")
         except Exception:
             # Fallback to none if provider creation fails
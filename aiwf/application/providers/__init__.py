@@ -4,5 +4,12 @@ Phase 3 of orchestrator modularization: centralize provider calls.
 """
 
 from .provider_execution_service import ProviderExecutionService, ProviderExecutionResult
+from .response_cache import RESPONSE_CACHE_MODES, CachedResponse, ResponseCache
 
-__all__ = ["ProviderExecutionService", "ProviderExecutionResult"]
\ No newline at end of file
+__all__ = [
+    "ProviderExecutionService",
+    "ProviderExecutionResult",
+    "ResponseCache",
+    "CachedResponse",
+    "RESPONSE_CACHE_MODES",
+]
\ No newline at end of file
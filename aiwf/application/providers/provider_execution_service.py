@@ -4,13 +4,20 @@ Phase 3 of orchestrator modularization: centralizes provider lookup,
 metadata usage, timeouts, and response handling.
 """
 
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
 
+from aiwf.domain.command_profiler import provider_span
 from aiwf.domain.errors import ProviderError
 from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.providers.ai_provider import AIProvider
 from aiwf.domain.providers.provider_factory import AIProviderFactory
 
+if TYPE_CHECKING:
+    from aiwf.application.providers.response_cache import ResponseCache
+
 
 @dataclass
 class ProviderExecutionResult:
@@ -34,6 +41,9 @@ class ProviderExecutionResult:
     # Raw AIProviderResult if available
     raw_result: AIProviderResult | None = None
 
+    # True if served from the response cache without calling the provider
+    cache_hit: bool = False
+
 
 class ProviderExecutionService:
     """Service for executing AI providers.
@@ -42,8 +52,18 @@ class ProviderExecutionService:
     - Provider creation via factory
     - Timeout extraction from provider metadata
     - Response normalization
+    - Optional record/replay through a ResponseCache
     """
 
+    def __init__(self, response_cache: "ResponseCache | None" = None) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            response_cache: Optional response cache (None = always call providers)
+        """
+        self.response_cache = response_cache
+
     def execute(
         self,
         provider_key: str,
@@ -67,23 +87,90 @@ class ProviderExecutionService:
             ProviderError: If provider fails (network, auth, timeout, etc.)
             KeyError: If provider_key is not registered
         """
-        provider = AIProviderFactory.create(provider_key)
-        metadata = provider.get_metadata()
-
-        # Extract timeouts from provider metadata
-        connection_timeout = metadata.get("default_connection_timeout")
-        response_timeout = metadata.get("default_response_timeout")
+        with self.slot(provider_key), AIProviderFactory.lease(provider_key) as provider:
+            cache_key = self._cache_key(provider_key, provider, prompt, system_prompt)
+            hit = self._cache_lookup(provider_key, cache_key, context)
+            if hit is not None:
+                return hit
+            connection_timeout, response_timeout = self._get_timeouts(provider)
+
+            # Execute provider
+            with provider_span():
+                response = provider.generate(
+                    prompt,
+                    context=context,
+                    system_prompt=system_prompt,
+                    connection_timeout=connection_timeout,
+                    response_timeout=response_timeout,
+                )
+        self._cache_store(provider_key, cache_key, response, context)
+        return self._normalize(response)
+
+    @contextmanager
+    def slot(self, provider_key: str) -> Iterator[None]:
+        """Hold what a call to provider_key needs for the block (nothing by default).
+
+        Wraps every execute() call; the approval gate also holds it around
+        approvers, which call providers directly.
+        """
+        yield
 
-        # Execute provider
-        response = provider.generate(
+    def _cache_key(
+        self,
+        provider_key: str,
+        provider: AIProvider,
+        prompt: str,
+        system_prompt: str | None,
+    ) -> str | None:
+        """Response cache key for a call, or None if caching is off."""
+        if self.response_cache is None:
+            return None
+        config = getattr(provider, "config", None)
+        return self.response_cache.cache_key(
+            provider_key,
+            config if isinstance(config, dict) else None,
+            system_prompt,
             prompt,
-            context=context,
-            system_prompt=system_prompt,
-            connection_timeout=connection_timeout,
-            response_timeout=response_timeout,
         )
 
-        # Normalize result
+    def _cache_lookup(
+        self,
+        provider_key: str,
+        cache_key: str | None,
+        context: dict[str, Any] | None,
+    ) -> ProviderExecutionResult | None:
+        """Return a replayed result, or None to call the provider."""
+        if self.response_cache is None or cache_key is None:
+            return None
+        hit = self.response_cache.lookup(provider_key, cache_key, context)
+        if hit is None:
+            return None
+        return replace(self._normalize(hit.result), cache_hit=True)
+
+    def _cache_store(
+        self,
+        provider_key: str,
+        cache_key: str | None,
+        response: AIProviderResult | None,
+        context: dict[str, Any] | None,
+    ) -> None:
+        """Record a provider result in the response cache, if enabled."""
+        if self.response_cache is None or cache_key is None:
+            return
+        self.response_cache.store(provider_key, cache_key, response, context)
+
+    @staticmethod
+    def _get_timeouts(provider: AIProvider) -> tuple[int | None, int | None]:
+        """Extract (connection, response) timeouts from provider metadata."""
+        metadata = provider.get_metadata()
+        return (
+            metadata.get("default_connection_timeout"),
+            metadata.get("default_response_timeout"),
+        )
+
+    @staticmethod
+    def _normalize(response: AIProviderResult | None) -> ProviderExecutionResult:
+        """Normalize a provider response into a ProviderExecutionResult."""
         if response is None:
             # Provider didn't generate response - user provides externally
             return ProviderExecutionResult(awaiting_response=True)
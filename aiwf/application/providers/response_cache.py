@@ -0,0 +1,288 @@
+"""Content-addressed cache of AI provider responses.
+
+Entries are keyed by provider key, the provider's config, the system
+prompt and the SHA-256 of the prompt, and stored as one JSON file per key
+under ``.aiwf/cache/responses``. Modes:
+
+- record: always call the provider and store the result
+- replay: serve hits; call the provider on misses and store the result
+- strict-replay: serve hits; fail with ResponseCacheMiss on misses
+
+Local-write providers (Claude Code, Gemini CLI) write files themselves, so
+an entry also captures the content of those files. They are stored
+relative to the calling iteration directory and restored into the
+replaying session's iteration directory; a result with a provider-written
+file outside the iteration directory is not cached, since replaying it
+would write into another session or elsewhere on disk.
+
+The cache is bounded by total size and entry age; the least recently used
+entries are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aiwf.domain.errors import ResponseCacheMiss
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MODES = ("record", "replay", "strict-replay")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 3600.0
+
+ENTRY_FORMAT_VERSION = 2
+_ITERATION_PREFIX = "@iteration/"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cache hit. result is None when the provider awaited a manual response."""
+
+    result: AIProviderResult | None
+
+
+class ResponseCache:
+    """On-disk record/replay cache for provider responses."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        mode: str = "replay",
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding entries (created on demand)
+            mode: One of RESPONSE_CACHE_MODES
+            max_bytes: Total entry size before least recently used entries are evicted
+            max_age_seconds: Entries unused for longer than this are evicted
+
+        Raises:
+            ValueError: If mode is not a valid cache mode
+        """
+        if mode not in RESPONSE_CACHE_MODES:
+            raise ValueError(
+                f"Invalid response cache mode '{mode}'. "
+                f"Valid modes: {', '.join(RESPONSE_CACHE_MODES)}"
+            )
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+    @staticmethod
+    def cache_key(
+        provider_key: str,
+        provider_config: dict[str, Any] | None,
+        system_prompt: str | None,
+        prompt: str,
+    ) -> str:
+        """Compute the entry key for a provider call."""
+        payload = {
+            "provider": provider_key,
+            "config": provider_config or {},
+            "system_prompt": system_prompt,
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def lookup(
+        self, provider_key: str, key: str, context: dict[str, Any] | None
+    ) -> CachedResponse | None:
+        """
+        Serve a cached response, restoring any files the provider wrote.
+
+        Args:
+            provider_key: Provider being called (for errors and logs)
+            key: Entry key from cache_key()
+            context: Provider context of the replaying call
+
+        Returns:
+            The cached response, or None on a miss (or in record mode)
+
+        Raises:
+            ResponseCacheMiss: On a miss in strict-replay mode
+        """
+        if self.mode == "record":
+            return None
+
+        entry = self._read(key)
+        if entry is None:
+            if self.mode == "strict-replay":
+                raise ResponseCacheMiss(provider_key, key)
+            return None
+
+        logger.debug(f"Replaying cached {provider_key} response {key[:12]}")
+        # Touch for least-recently-used eviction
+        try:
+            os.utime(self._entry_path(key))
+        except OSError:
+            pass
+
+        if entry["awaiting_response"]:
+            return CachedResponse(result=None)
+
+        iteration_dir = _iteration_dir(context)
+        files: dict[str, str | None] = dict(entry["files"])
+        for token, content in entry["written"].items():
+            path = _resolve_path(token, iteration_dir)
+            if path is None:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            files[str(path)] = None
+        return CachedResponse(
+            result=AIProviderResult(response=entry["response"], files=files)
+        )
+
+    def store(
+        self,
+        provider_key: str,
+        key: str,
+        result: AIProviderResult | None,
+        context: dict[str, Any] | None,
+    ) -> bool:
+        """
+        Record a provider result.
+
+        Files the provider wrote itself are captured by content. Results
+        that reference provider-written files which can't be located
+        (relative paths, missing files) or lie outside the call's
+        iteration directory are not cached.
+
+        Returns:
+            True if the result was stored
+        """
+        entry: dict[str, Any] = {
+            "version": ENTRY_FORMAT_VERSION,
+            "provider": provider_key,
+            "created_at": time.time(),
+            "awaiting_response": result is None,
+            "response": None,
+            "files": {},
+            "written": {},
+        }
+        if result is not None:
+            iteration_dir = _iteration_dir(context)
+            entry["response"] = result.response
+            for path_str, content in result.files.items():
+                if content is not None:
+                    entry["files"][path_str] = content
+                    continue
+                path = Path(path_str)
+                token = _path_token(path, iteration_dir)
+                try:
+                    captured = path.read_text(encoding="utf-8") if token is not None else None
+                except (OSError, UnicodeDecodeError):
+                    captured = None
+                if captured is None:
+                    logger.debug(
+                        f"Not caching {provider_key} response {key[:12]}: "
+                        f"cannot capture provider-written file {path_str}"
+                    )
+                    return False
+                entry["written"][token] = captured
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(self._entry_path(key), json.dumps(entry, ensure_ascii=False))
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used ones over max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            paths = list(self.cache_dir.glob("*.json"))
+        except OSError:
+            return 0
+
+        entries: list[tuple[float, int, Path]] = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if now - mtime <= self.max_age_seconds and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable response cache entry {key[:12]}: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != ENTRY_FORMAT_VERSION:
+            return None
+        return entry
+
+    def _atomic_write(self, path: Path, content: str) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _iteration_dir(context: dict[str, Any] | None) -> Path | None:
+    """Iteration directory of the call (parent of its response file)."""
+    response_path = context.get("response_path") if context else None
+    return Path(response_path).parent if response_path else None
+
+
+def _path_token(path: Path, iteration_dir: Path | None) -> str | None:
+    """Token for a provider-written file, or None if it is not in iteration_dir."""
+    if iteration_dir is None or not path.is_absolute():
+        return None
+    try:
+        relative = path.resolve().relative_to(iteration_dir.resolve())
+    except ValueError:
+        return None
+    return _ITERATION_PREFIX + relative.as_posix()
+
+
+def _resolve_path(token: str, iteration_dir: Path | None) -> Path | None:
+    """Path of a token in the replaying iteration_dir, or None if it has none there."""
+    if iteration_dir is None or not token.startswith(_ITERATION_PREFIX):
+        return None
+    path = iteration_dir / token[len(_ITERATION_PREFIX):]
+    try:
+        path.resolve().relative_to(iteration_dir.resolve())
+    except ValueError:
+        return None
+    return path
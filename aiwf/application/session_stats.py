@@ -0,0 +1,188 @@
+"""Aggregation of provider telemetry and stage timings.
+
+Provider calls are read from the metrics files written by the orchestrator
+(one per session) and summarized by phase and provider, so it is easy to
+see which phases and providers dominate latency and spend. Stage timings
+come from the session catalog, so they are summarized across all sessions
+without loading any session state.
+"""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aiwf.domain.constants import SESSION_METRICS_FILENAME
+from aiwf.domain.models.phase_timing import StageInterval
+from aiwf.domain.persistence.session_metrics import ProviderCallMetric, SessionMetricsLog
+
+
+@dataclass
+class ProviderCallStats:
+    """Aggregate of provider calls sharing a phase and provider.
+
+    Token and cost totals only include calls whose provider reported them.
+    """
+
+    phase: str
+    provider: str
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    ttft_total_seconds: float = 0.0
+    ttft_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    durations: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    @property
+    def p50_seconds(self) -> float:
+        return percentile(self.durations, 50)
+
+    @property
+    def p90_seconds(self) -> float:
+        return percentile(self.durations, 90)
+
+    @property
+    def p99_seconds(self) -> float:
+        return percentile(self.durations, 99)
+
+    @property
+    def mean_ttft_seconds(self) -> float | None:
+        return self.ttft_total_seconds / self.ttft_calls if self.ttft_calls else None
+
+    def add(self, metric: ProviderCallMetric) -> None:
+        """Fold one call into the aggregate."""
+        self.calls += 1
+        self.errors += metric.outcome == "error"
+        self.cache_hits += metric.cache_hit
+        self.retries += metric.retry > 0
+        self.total_seconds += metric.wall_seconds
+        self.durations.append(metric.wall_seconds)
+        if metric.ttft_seconds is not None:
+            self.ttft_total_seconds += metric.ttft_seconds
+            self.ttft_calls += 1
+        self.input_tokens += metric.input_tokens or 0
+        self.output_tokens += metric.output_tokens or 0
+        self.cost_usd += metric.cost_usd or 0.0
+
+
+@dataclass
+class StageTimingStats:
+    """Duration distribution of one phase/stage/provider, split by kind.
+
+    kind is "machine" for engine and provider work, "human" for time spent
+    waiting on an approve/reject/retry command.
+    """
+
+    phase: str
+    stage: str | None
+    provider: str | None
+    kind: str
+    durations: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def p50_seconds(self) -> float:
+        return percentile(self.durations, 50)
+
+    @property
+    def p90_seconds(self) -> float:
+        return percentile(self.durations, 90)
+
+    @property
+    def p99_seconds(self) -> float:
+        return percentile(self.durations, 99)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile (0.0 for no values).
+
+    Args:
+        values: Samples in any order
+        pct: Percentile between 0 and 100
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def load_metrics(sessions_root: Path, session_id: str | None = None) -> list[ProviderCallMetric]:
+    """
+    Load provider call metrics for one session or every session.
+
+    Args:
+        sessions_root: Root directory containing session directories
+        session_id: Session to load (None = all sessions under the root)
+
+    Returns:
+        Call records, grouped by session in directory order
+
+    Raises:
+        FileNotFoundError: If session_id is given and its directory does not exist
+    """
+    if session_id is not None:
+        session_dir = sessions_root / session_id
+        if not session_dir.is_dir():
+            raise FileNotFoundError(f"Session '{session_id}' not found")
+        return SessionMetricsLog(session_dir).read()
+
+    metrics: list[ProviderCallMetric] = []
+    for metrics_file in sorted(sessions_root.glob(f"*/{SESSION_METRICS_FILENAME}")):
+        metrics.extend(SessionMetricsLog(metrics_file.parent).read())
+    return metrics
+
+
+def summarize_provider_calls(metrics: list[ProviderCallMetric]) -> list[ProviderCallStats]:
+    """
+    Aggregate call records by (phase, provider).
+
+    Returns:
+        One entry per phase/provider pair, in order of first appearance
+    """
+    groups: dict[tuple[str, str], ProviderCallStats] = {}
+    for metric in metrics:
+        key = (metric.phase, metric.provider)
+        if key not in groups:
+            groups[key] = ProviderCallStats(phase=metric.phase, provider=metric.provider)
+        groups[key].add(metric)
+    return list(groups.values())
+
+
+def summarize_stage_timings(intervals: list[StageInterval]) -> list[StageTimingStats]:
+    """
+    Aggregate stage intervals by (phase, stage, provider, kind).
+
+    Returns:
+        One entry per group, in order of first appearance
+    """
+    groups: dict[tuple[str, str | None, str | None, str], StageTimingStats] = {}
+    for interval in intervals:
+        key = (interval.phase, interval.stage, interval.provider, interval.kind)
+        if key not in groups:
+            groups[key] = StageTimingStats(
+                phase=interval.phase,
+                stage=interval.stage,
+                provider=interval.provider,
+                kind=interval.kind,
+            )
+        groups[key].durations.append(interval.seconds)
+    return list(groups.values())
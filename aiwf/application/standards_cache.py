@@ -0,0 +1,136 @@
+"""Shared on-disk cache of materialized standards bundles.
+
+Bundles are keyed by standards provider key plus the provider's own
+description of what the bundle depends on (selection settings and
+source files). Source files are fingerprinted by path, size and mtime,
+so editing a rules file invalidates every bundle built from it.
+
+Providers opt in by implementing ``get_cache_key(context)`` (see
+StandardsProvider); providers without it are never cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from aiwf.domain.constants import STANDARDS_BUNDLE_FILENAME
+from aiwf.domain.standards import StandardsProvider
+
+logger = logging.getLogger(__name__)
+
+
+class StandardsBundleCache:
+    """Content cache for standards bundles shared across sessions.
+
+    Each entry is ``<key>.md`` (the bundle) plus ``<key>.sha256`` (its
+    hash). Entries are written atomically, so concurrent sessions building
+    the same bundle are safe. Sessions get their own copy of the bundle,
+    and an entry whose content no longer matches its hash is rebuilt.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached bundles (created on demand)
+        """
+        self.cache_dir = cache_dir
+
+    def cache_key(
+        self,
+        provider_key: str,
+        provider: StandardsProvider,
+        context: dict[str, Any],
+    ) -> str | None:
+        """Compute the cache key for a bundle, or None if not cacheable."""
+        get_cache_key = getattr(provider, "get_cache_key", None)
+        if get_cache_key is None:
+            return None
+        material = get_cache_key(context)
+        if material is None:
+            return None
+
+        material = dict(material)
+        sources = [Path(p) for p in material.pop("sources", [])]
+        payload = {
+            "provider": provider_key,
+            "key": material,
+            "sources": [self._fingerprint(path) for path in sources],
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def materialize(
+        self,
+        *,
+        session_dir: Path,
+        provider_key: str,
+        provider: StandardsProvider,
+        context: dict[str, Any],
+    ) -> str | None:
+        """Place the bundle for context into session_dir from the cache.
+
+        Builds and stores the bundle on a miss. The session file is a copy
+        of the cache entry, so editing one session's bundle never changes
+        the cache or other sessions.
+
+        Returns:
+            SHA256 hash of the bundle, or None if the provider is not cacheable
+        """
+        key = self.cache_key(provider_key, provider, context)
+        if key is None:
+            return None
+
+        bundle_path = self.cache_dir / f"{key}.md"
+        hash_path = self.cache_dir / f"{key}.sha256"
+        bundle_bytes = self._read_verified(bundle_path, hash_path)
+
+        if bundle_bytes is None:
+            bundle_bytes = provider.create_bundle(context).encode("utf-8")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(bundle_path, bundle_bytes)
+            self._atomic_write(hash_path, hashlib.sha256(bundle_bytes).hexdigest().encode("ascii"))
+            logger.debug(f"Cached standards bundle {key[:12]} for {provider_key}")
+        else:
+            logger.debug(f"Reusing cached standards bundle {key[:12]} for {provider_key}")
+
+        self._atomic_write(session_dir / STANDARDS_BUNDLE_FILENAME, bundle_bytes)
+        return hashlib.sha256(bundle_bytes).hexdigest()
+
+    @staticmethod
+    def _fingerprint(path: Path) -> list[Any]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return [str(path), None, None]
+        return [str(path.resolve()), stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _read_verified(bundle_path: Path, hash_path: Path) -> bytes | None:
+        """Cached bundle content, or None if missing or not matching its hash."""
+        try:
+            expected = hash_path.read_text(encoding="utf-8").strip()
+            content = bundle_path.read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != expected:
+            if expected:
+                logger.warning(f"Standards bundle {bundle_path} does not match its hash; rebuilding")
+            return None
+        return content
+
+    @staticmethod
+    def _atomic_write(path: Path, content: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
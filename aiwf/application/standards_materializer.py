@@ -1,22 +1,47 @@
 import hashlib
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aiwf.application.standards_provider import StandardsProvider
 
+if TYPE_CHECKING:
+    from aiwf.application.standards_cache import StandardsBundleCache
+
 
 def materialize_standards(
     *, 
     session_dir: Path, 
     context: dict[str, Any],
-    provider: StandardsProvider
+    provider: StandardsProvider,
+    cache: "StandardsBundleCache | None" = None,
+    provider_key: str | None = None,
 ) -> str:
     """
     Materialize standards bundle and return hash.
+
+    When a cache is given and the provider supports caching, the bundle
+    is taken from (or added to) the shared cache instead of being rebuilt.
+
+    Args:
+        session_dir: Session directory to write standards-bundle.md into
+        context: Context passed to the provider
+        provider: Standards provider instance
+        cache: Optional shared bundle cache
+        provider_key: Registered provider key (required for caching)
     
     Returns:
         SHA256 hash of bundle
     """
+    if cache is not None and provider_key:
+        cached_hash = cache.materialize(
+            session_dir=session_dir,
+            provider_key=provider_key,
+            provider=provider,
+            context=context,
+        )
+        if cached_hash is not None:
+            return cached_hash
+
     bundle_text = provider.create_bundle(context)
     bundle_hash = hashlib.sha256(bundle_text.encode("utf-8")).hexdigest()
     
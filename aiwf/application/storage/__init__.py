@@ -3,6 +3,21 @@
 Phase 6 of orchestrator modularization: centralize file I/O.
 """
 
-from .session_file_gateway import SessionFileGateway
+from .artifact_blob_store import BLOB_STORE_DIRNAME, ArtifactBlobStore
+from .session_file_gateway import (
+    SessionFileCache,
+    SessionFileGateway,
+    active_session_file_cache,
+    invalidate_session_file_cache,
+    session_file_cache,
+)
 
-__all__ = ["SessionFileGateway"]
\ No newline at end of file
+__all__ = [
+    "ArtifactBlobStore",
+    "BLOB_STORE_DIRNAME",
+    "SessionFileCache",
+    "SessionFileGateway",
+    "active_session_file_cache",
+    "invalidate_session_file_cache",
+    "session_file_cache",
+]
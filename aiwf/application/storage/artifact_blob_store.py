@@ -0,0 +1,188 @@
+"""Content-addressed blob store for code artifacts.
+
+Every approved GENERATE/REVISE response writes a full iteration-N/code/
+tree, although most files are usually unchanged from the previous
+iteration. With artifact_store: blobs, code files are stored once under
+<sessions root>/.blobs/ by the SHA-256 of their bytes and hard-linked into
+the iteration directories, so disk usage and write time grow with the
+bytes that changed.
+
+The hard link count is the reference count: a blob whose only remaining
+link is the store's own (every session directory linking it was deleted)
+is garbage, and prune() removes it. Blobs, and so the code files linked to
+them, are read-only; writers replace a linked file instead of writing
+into it (see materialize()), which would change every iteration sharing
+the blob.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Blob store directory under the sessions root (never a valid session id)
+BLOB_STORE_DIRNAME = ".blobs"
+
+# Link failures meaning this filesystem cannot share blobs with the sessions
+_NO_LINK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+# Times materialize() stores a blob again after a concurrent prune() removed it
+_PRUNED_RETRIES = 3
+
+
+class ArtifactBlobStore:
+    """Stores file contents once by hash and links them into session directories.
+
+    Attributes:
+        root: Store directory; blobs live at root/<2 hex>/<62 hex>
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        # False once a hard link failed; files are then written as copies
+        self._links_supported = True
+        # Blob bytes written to and linked from disk, for diagnostics and tests
+        self.bytes_written = 0
+        self.files_linked = 0
+
+    @classmethod
+    def for_sessions_root(cls, sessions_root: Path) -> "ArtifactBlobStore":
+        """Store shared by all sessions under sessions_root."""
+        return cls(sessions_root / BLOB_STORE_DIRNAME)
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob with the given SHA-256 hex digest."""
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, data: bytes) -> tuple[str, Path]:
+        """Store data unless a blob with the same content exists.
+
+        Returns:
+            (SHA-256 hex digest, blob path)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return digest, blob
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=blob.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(temp_name, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            try:
+                # Unlike a rename, never replaces a blob another writer just stored
+                os.link(temp_name, blob)
+            except FileExistsError:
+                return digest, blob
+            except OSError as e:
+                if e.errno not in _NO_LINK_ERRNOS:
+                    raise
+                os.replace(temp_name, blob)
+            with self._lock:
+                self.bytes_written += len(data)
+        finally:
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass  # Renamed into place
+        return digest, blob
+
+    def materialize(self, data: bytes, target: Path) -> None:
+        """Make target a file with content data, linked to its blob.
+
+        An existing target is replaced, never written into: it may be a
+        link to a blob shared with other iterations. If the filesystem does
+        not support hard links to the store, target is written as a copy.
+
+        A blob that no session links to yet can be removed by a concurrent
+        prune() between put() and the link; it is then stored again.
+
+        Args:
+            data: File content
+            target: File to create or replace
+        """
+        if not self._links_supported:
+            _replace_with_copy(data, target)
+            return
+
+        temp_target = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        for _ in range(_PRUNED_RETRIES):
+            try:
+                _, blob = self.put(data)
+            except FileNotFoundError:
+                continue  # Fanout directory pruned while storing; store it again
+            try:
+                if target.exists() and os.path.samefile(blob, target):
+                    return  # Already linked to this content
+            except OSError:
+                pass
+
+            try:
+                os.link(blob, temp_target)
+                break
+            except FileNotFoundError:
+                if not target.parent.is_dir():
+                    raise
+                # Blob pruned after put(); store it again
+            except OSError as e:
+                if e.errno not in _NO_LINK_ERRNOS:
+                    raise
+                logger.info(f"Hard links to {self.root} not supported ({e}); writing copies")
+                self._links_supported = False
+                _replace_with_copy(data, target)
+                return
+        else:
+            # Pruned every time; the content still has to land
+            _replace_with_copy(data, target)
+            return
+        os.replace(temp_target, target)
+        with self._lock:
+            self.files_linked += 1
+
+    def prune(self) -> tuple[int, int]:
+        """Remove blobs no session links to any more.
+
+        Returns:
+            (blobs removed, bytes freed)
+        """
+        removed = freed = 0
+        if not self.root.is_dir():
+            return removed, freed
+
+        for fanout in self.root.iterdir():
+            if not fanout.is_dir():
+                continue
+            for blob in fanout.iterdir():
+                try:
+                    st = blob.stat()
+                    if blob.name.startswith(".tmp-") or st.st_nlink > 1:
+                        continue
+                    blob.unlink()
+                except OSError:
+                    continue
+                removed += 1
+                freed += st.st_size
+            try:
+                fanout.rmdir()
+            except OSError:
+                pass  # Not empty
+        return removed, freed
+
+
+def _replace_with_copy(data: bytes, target: Path) -> None:
+    try:
+        if target.stat().st_nlink > 1:
+            # Linked to a blob: writing into it would change the blob
+            target.unlink()
+    except FileNotFoundError:
+        pass
+    target.write_bytes(data)
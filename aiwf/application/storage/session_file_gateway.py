@@ -3,13 +3,220 @@
 Phase 6 of orchestrator modularization: centralize file I/O.
 Provides a clean interface for reading/writing session files
 without exposing Path operations to callers.
+
+Inside a session_file_cache() block (one orchestrator command) reads go
+through a SessionFileCache, so files read by several services are read
+from disk once.
 """
 
+import contextvars
+import hashlib
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from aiwf.domain.models.workflow_state import WorkflowPhase
 
+if TYPE_CHECKING:
+    from aiwf.application.storage.artifact_blob_store import ArtifactBlobStore
+
+# (st_mtime_ns, st_size, st_ino) of a cached file
+FileSignature = tuple[int, int, int]
+
+_current_cache: contextvars.ContextVar["SessionFileCache | None"] = contextvars.ContextVar(
+    "aiwf_session_file_cache", default=None
+)
+
+
+@dataclass
+class _CachedFile:
+    signature: FileSignature
+    data: bytes
+    text: str | None = None
+    sha256: str | None = None
+
+
+class SessionFileCache:
+    """Read-through cache of session files for the duration of one command.
+
+    Within one command the same response and code files are read by the
+    approval gate, the approver and the artifact service. Each read
+    re-stats the file and serves the cached bytes (and their decoded text
+    and SHA-256) while (mtime_ns, size, inode) is unchanged. Directory
+    walks are reused while the (mtime_ns, inode) of every directory in the
+    walked tree is unchanged.
+
+    Writes through SessionFileGateway update the cache; callers that let
+    something else write session files (a provider call) call
+    invalidate() afterwards, since a rewrite within the filesystem's
+    timestamp granularity can keep the signature.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[Path, _CachedFile] = {}
+        # Walked directory -> (signatures of every directory in the tree, files)
+        self._trees: dict[Path, tuple[dict[Path, tuple[int, int]], list[Path]]] = {}
+        # Disk passes, for diagnostics and tests
+        self.files_read = 0
+        self.trees_walked = 0
+
+    def read_bytes(self, path: Path) -> bytes | None:
+        """File content, or None if the file does not exist."""
+        entry = self._entry(path)
+        return entry.data if entry is not None else None
+
+    def read_text(self, path: Path) -> str | None:
+        """UTF-8 file content (universal newlines, as Path.read_text), or None."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        if entry.text is None:
+            text = entry.data.decode("utf-8")
+            entry.text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return entry.text
+
+    def sha256(self, path: Path) -> str | None:
+        """SHA-256 hex digest of the file's bytes, or None if it does not exist."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        if entry.sha256 is None:
+            entry.sha256 = hashlib.sha256(entry.data).hexdigest()
+        return entry.sha256
+
+    def list_files(self, directory: Path) -> list[Path]:
+        """Files under directory, recursively (as rglob("*") + is_file())."""
+        cached = self._trees.get(directory)
+        if cached is not None and all(
+            _dir_signature(d) == signature for d, signature in cached[0].items()
+        ):
+            return list(cached[1])
+
+        root_signature = _dir_signature(directory)
+        if root_signature is None:
+            self._trees.pop(directory, None)
+            return []
+        signatures = {directory: root_signature}
+        files: list[Path] = []
+        for path in directory.rglob("*"):
+            if path.is_dir():
+                signature = _dir_signature(path)
+                if signature is not None:
+                    signatures[path] = signature
+            elif path.is_file():
+                files.append(path)
+        self.trees_walked += 1
+        self._trees[directory] = (signatures, files)
+        return list(files)
+
+    def store(self, path: Path, data: bytes) -> None:
+        """Record content just written to path."""
+        self.invalidate(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        self._files[path] = _CachedFile(signature=_signature(stat), data=data)
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop one file (and any walk containing it), or everything."""
+        if path is None:
+            self._files.clear()
+            self._trees.clear()
+            return
+        self._files.pop(path, None)
+        for directory in [d for d in self._trees if path.is_relative_to(d)]:
+            del self._trees[directory]
+
+    def _entry(self, path: Path) -> _CachedFile | None:
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self._files.pop(path, None)
+            return None
+        signature = _signature(stat)
+        entry = self._files.get(path)
+        if entry is None or entry.signature != signature:
+            entry = _CachedFile(signature=signature, data=path.read_bytes())
+            self.files_read += 1
+            self._files[path] = entry
+        return entry
+
+
+@contextmanager
+def session_file_cache() -> Iterator[SessionFileCache]:
+    """Cache session file reads in this context for the block.
+
+    Nested blocks share the outermost cache. Each thread (e.g. each batch
+    worker) gets its own.
+    """
+    cache = _current_cache.get()
+    if cache is not None:
+        yield cache
+        return
+    cache = SessionFileCache()
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def active_session_file_cache() -> SessionFileCache | None:
+    """Return the cache of the enclosing session_file_cache() block, if any."""
+    return _current_cache.get()
+
+
+def invalidate_session_file_cache(path: Path | None = None) -> None:
+    """Invalidate a path (or everything) in the active cache, if any."""
+    cache = _current_cache.get()
+    if cache is not None:
+        cache.invalidate(path)
+
+
+def _signature(stat: os.stat_result) -> FileSignature:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _dir_signature(directory: Path) -> tuple[int, int] | None:
+    try:
+        stat = directory.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino)
+
+
+def _read_text(path: Path) -> str | None:
+    cache = _current_cache.get()
+    if cache is not None:
+        return cache.read_text(path)
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_text(path: Path, content: str) -> None:
+    # Same bytes as path.write_text(content, encoding="utf-8")
+    data = content.replace("\n", os.linesep).encode("utf-8")
+    path.write_bytes(data)
+    cache = _current_cache.get()
+    if cache is not None:
+        cache.store(path, data)
+
+
+def _unlink_shared(path: Path) -> None:
+    # A code file linked from the blob store is shared with other
+    # iterations; replace it rather than write into it
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
 
 class SessionFileGateway:
     """Gateway for session file I/O operations.
@@ -26,13 +233,18 @@ class SessionFileGateway:
         WorkflowPhase.REVISE: ("revision-prompt.md", "revision-response.md"),
     }
 
-    def __init__(self, session_dir: Path) -> None:
+    def __init__(
+        self, session_dir: Path, blob_store: "ArtifactBlobStore | None" = None
+    ) -> None:
         """Initialize gateway with session directory.
 
         Args:
             session_dir: Root directory for this session
+            blob_store: Content-addressed store code files are linked from
+                (None = write code files directly)
         """
         self._session_dir = session_dir
+        self._blob_store = blob_store
 
     @property
     def session_dir(self) -> Path:
@@ -177,9 +389,10 @@ class SessionFileGateway:
             FileNotFoundError: If prompt file doesn't exist
         """
         path = self.get_prompt_path(iteration, phase)
-        if not path.exists():
+        content = _read_text(path)
+        if content is None:
             raise FileNotFoundError(f"Prompt file not found: {path}")
-        return path.read_text(encoding="utf-8")
+        return content
 
     def read_response(self, iteration: int, phase: WorkflowPhase) -> str:
         """Read response file content.
@@ -195,9 +408,10 @@ class SessionFileGateway:
             FileNotFoundError: If response file doesn't exist
         """
         path = self.get_response_path(iteration, phase)
-        if not path.exists():
+        content = _read_text(path)
+        if content is None:
             raise FileNotFoundError(f"Response file not found: {path}")
-        return path.read_text(encoding="utf-8")
+        return content
 
     def write_prompt(
         self,
@@ -219,7 +433,7 @@ class SessionFileGateway:
         """
         self.ensure_iteration_dir(iteration)
         path = self.get_prompt_path(iteration, phase)
-        path.write_text(content, encoding="utf-8")
+        _write_text(path, content)
         return path
 
     def write_response(
@@ -242,7 +456,7 @@ class SessionFileGateway:
         """
         self.ensure_iteration_dir(iteration)
         path = self.get_response_path(iteration, phase)
-        path.write_text(content, encoding="utf-8")
+        _write_text(path, content)
         return path
 
     # ========================================================================
@@ -278,7 +492,16 @@ class SessionFileGateway:
             raise ValueError(f"Path escapes code directory: {relative_path}")
 
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        if self._blob_store is None:
+            _unlink_shared(file_path)
+            _write_text(file_path, content)
+            return file_path
+
+        data = content.replace("\n", os.linesep).encode("utf-8")
+        self._blob_store.materialize(data, file_path)
+        cache = _current_cache.get()
+        if cache is not None:
+            cache.store(file_path, data)
         return file_path
 
     def read_code_files(self, iteration: int) -> dict[str, str]:
@@ -293,14 +516,30 @@ class SessionFileGateway:
         code_dir = self.get_iteration_dir(iteration) / "code"
         files: dict[str, str] = {}
 
-        if code_dir.exists():
-            for file_path in code_dir.rglob("*"):
-                if file_path.is_file():
-                    rel_path = str(file_path.relative_to(code_dir))
-                    files[rel_path] = file_path.read_text(encoding="utf-8")
+        for file_path in self.list_code_files(iteration):
+            content = _read_text(file_path)
+            if content is not None:
+                files[str(file_path.relative_to(code_dir))] = content
 
         return files
 
+    def list_code_files(self, iteration: int) -> list[Path]:
+        """List all files in the code directory, recursively.
+
+        Args:
+            iteration: Iteration number
+
+        Returns:
+            Absolute paths of the code files (empty if no code directory)
+        """
+        code_dir = self.get_iteration_dir(iteration) / "code"
+        cache = _current_cache.get()
+        if cache is not None:
+            return cache.list_files(code_dir)
+        if not code_dir.exists():
+            return []
+        return [path for path in code_dir.rglob("*") if path.is_file()]
+
     # ========================================================================
     # Plan File Operations
     # ========================================================================
@@ -331,9 +570,10 @@ class SessionFileGateway:
             FileNotFoundError: If plan file doesn't exist
         """
         path = self.get_plan_path()
-        if not path.exists():
+        content = _read_text(path)
+        if content is None:
             raise FileNotFoundError(f"Plan file not found: {path}")
-        return path.read_text(encoding="utf-8")
+        return content
 
     # ========================================================================
     # Generic File Operations (for approval context building)
@@ -348,9 +588,24 @@ class SessionFileGateway:
         Returns:
             File content, or None if file doesn't exist
         """
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
+        return _read_text(path)
+
+    def file_sha256(self, path: Path) -> str | None:
+        """Compute the SHA-256 of a file's bytes, if it exists.
+
+        Args:
+            path: Absolute path to file
+
+        Returns:
+            Hex digest, or None if file doesn't exist
+        """
+        cache = _current_cache.get()
+        if cache is not None:
+            return cache.sha256(path)
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return None
 
     def file_exists(self, path: Path) -> bool:
         """Check if file exists.
@@ -3,24 +3,32 @@
 ADR-0012 Phase 5: Engine-owned workflow orchestration with explicit transitions.
 """
 
+import functools
+import logging
+import time
 import uuid
 import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from aiwf.application.context_validation import validate_context
+from aiwf.application.standards_cache import StandardsBundleCache
 from aiwf.application.standards_materializer import materialize_standards
 from aiwf.application.transitions import Action, TransitionTable, TransitionResult
 
+from aiwf.domain.command_profiler import action_span
+from aiwf.domain.tracing import current_span, span, state_attributes
 from aiwf.domain.models.workflow_state import (
     PhaseTransition,
+    TransitionCause,
     WorkflowPhase,
     WorkflowStage,
     WorkflowState,
     WorkflowStatus,
 )
+from aiwf.domain.persistence.session_metrics import ProviderCallMetric, SessionMetricsLog
 from aiwf.domain.persistence.session_store import SessionStore
 from aiwf.domain.errors import ProviderError
 from aiwf.domain.profiles.profile_factory import ProfileFactory
@@ -41,15 +49,86 @@ from aiwf.application.approval import (
     GateContext,
     _RegenerationNotImplemented,
 )
-from aiwf.application.providers import ProviderExecutionService
+from aiwf.application.providers import ProviderExecutionResult, ProviderExecutionService
 from aiwf.application.prompts import PromptService
 from aiwf.application.artifacts import ArtifactService
-from aiwf.application.storage import SessionFileGateway
+from aiwf.application.storage import (
+    SessionFileGateway,
+    invalidate_session_file_cache,
+    session_file_cache,
+)
 
 if TYPE_CHECKING:
+    from aiwf.application.providers.response_cache import ResponseCache
+    from aiwf.application.storage import ArtifactBlobStore
     from aiwf.domain.events.emitter import WorkflowEventEmitter
     from aiwf.domain.events.event_types import WorkflowEventType
 
+logger = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _session_command(method: _F) -> _F:
+    """Run a command holding its session's lock, with saves coalesced.
+
+    The lock spans load through final save, so two processes running
+    commands on the same session cannot interleave (the second waits, then
+    fails with SessionLockTimeout). In journal mode the saves are written
+    once, before the lock is released or a provider or approver is called.
+    A command that leaves the workflow in progress marks the start of a
+    wait for the next human command in phase_history; normally with the
+    save that sets pending_approval (see _save_state), so only a command
+    that stops without it saves again.
+    Session file reads are cached for the command (SessionFileCache).
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "WorkflowOrchestrator", session_id: str, *args: Any, **kwargs: Any) -> Any:
+        with (
+            self.session_store.lock(session_id),
+            self.session_store.coalesce(),
+            session_file_cache(),
+        ):
+            result = method(self, session_id, *args, **kwargs)
+            if isinstance(result, WorkflowState) and self._mark_awaiting(result):
+                self.session_store.save(result)
+            return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _traced_command(method: _F) -> _F:
+    """Record a (self, session_id, command) method as a tracing span.
+
+    Applied outside _session_command, so time waiting for the session
+    lock is part of the span.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "WorkflowOrchestrator", session_id: str, command: str) -> Any:
+        with span(
+            "orchestrator.execute_command",
+            **{"aiwf.session_id": session_id, "aiwf.command": command},
+        ):
+            return method(self, session_id, command)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _traced(name: str) -> Callable[[_F], _F]:
+    """Record a method taking (self, state, ...) as a tracing span."""
+
+    def decorator(method: _F) -> _F:
+        @functools.wraps(method)
+        def wrapper(self: "WorkflowOrchestrator", state: WorkflowState, *args: Any, **kwargs: Any) -> Any:
+            with span(name, **state_attributes(state)):
+                return method(self, state, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
 
 class InvalidCommand(Exception):
     """Raised when a command is not valid for the current state."""
@@ -90,6 +169,15 @@ class WorkflowOrchestrator:
     event_emitter: "WorkflowEventEmitter | None" = None
     approval_config: ApprovalConfig = field(default_factory=ApprovalConfig)
 
+    # Shared standards bundle cache directory (None = no caching)
+    standards_cache_dir: Path | None = None
+
+    # Provider response record/replay cache (None = always call providers)
+    response_cache: "ResponseCache | None" = None
+
+    # Content-addressed store for code artifacts (None = write code files directly)
+    artifact_store: "ArtifactBlobStore | None" = None
+
     # Approval gate service for handling approval gates
     _approval_gate_service: ApprovalGateService = field(default_factory=ApprovalGateService, repr=False)
 
@@ -106,6 +194,10 @@ class WorkflowOrchestrator:
         if self.event_emitter is None:
             from aiwf.domain.events.emitter import WorkflowEventEmitter
             self.event_emitter = WorkflowEventEmitter()
+        if self.response_cache is not None:
+            self._provider_service.response_cache = self.response_cache
+        if self.artifact_store is not None:
+            self._artifact_service.blob_store = self.artifact_store
 
     # ========================================================================
     # Command Methods (ADR-0012)
@@ -127,6 +219,7 @@ class WorkflowOrchestrator:
         """
         return self._execute_command(session_id, "init")
 
+    @_session_command
     def approve(
         self,
         session_id: str,
@@ -169,6 +262,8 @@ class WorkflowOrchestrator:
         # Clear error state if retrying after error
         if state.last_error:
             state.last_error = None
+            state.pending_approval = False
+            state.record_transition(TransitionCause.APPROVE)
             self._run_gate_after_action(state, session_dir)
             return state
 
@@ -176,10 +271,11 @@ class WorkflowOrchestrator:
         state.pending_approval = False
         self._clear_approval_state(state)
         self._handle_pre_transition_approval(state, session_dir)
-        self._auto_continue(state, session_dir)
+        self._auto_continue(state, session_dir, TransitionCause.APPROVE)
 
         return state
 
+    @_session_command
     def reject(self, session_id: str, feedback: str) -> WorkflowState:
         """Reject content and regenerate with feedback.
 
@@ -211,6 +307,7 @@ class WorkflowOrchestrator:
             )
 
         state.approval_feedback = feedback
+        state.record_transition(TransitionCause.REJECT)
         self._add_message(state, f"Rejected: {feedback}")
 
         # At RESPONSE stage with AI provider: regenerate response
@@ -223,7 +320,7 @@ class WorkflowOrchestrator:
                 self._action_call_ai(state, session_dir)
                 # After regeneration, set up for approval again
                 state.pending_approval = True
-                self.session_store.save(state)
+                self._save_state(state)
                 return state
 
         # For PROMPT stage or manual provider: pause for user intervention
@@ -231,7 +328,7 @@ class WorkflowOrchestrator:
         state.pending_approval = True
         self._add_message(state, "Awaiting manual intervention. Edit the file and run 'approve'.")
 
-        self.session_store.save(state)
+        self._save_state(state)
         return state
 
     def _get_provider_key_for_phase(self, state: WorkflowState) -> str | None:
@@ -254,6 +351,7 @@ class WorkflowOrchestrator:
             return state.ai_providers.get(role)
         return None
 
+    @_session_command
     def cancel(self, session_id: str) -> WorkflowState:
         """Cancel workflow.
 
@@ -279,14 +377,17 @@ class WorkflowOrchestrator:
         state.phase = transition.phase
         state.stage = transition.stage
         state.status = WorkflowStatus.CANCELLED
+        state.record_transition(TransitionCause.CANCEL)
 
-        self.session_store.save(state)
+        self._save_state(state)
         return state
 
     # ========================================================================
     # Internal Methods
     # ========================================================================
 
+    @_traced_command
+    @_session_command
     def _execute_command(self, session_id: str, command: str) -> WorkflowState:
         """Execute a command using the TransitionTable.
 
@@ -303,6 +404,10 @@ class WorkflowOrchestrator:
         state = self.session_store.load(session_id)
         state.messages = []
         session_dir = self.sessions_root / session_id
+        command_span = current_span()
+        if command_span is not None:
+            for key, value in state_attributes(state).items():
+                command_span.set_attribute(key, value)
 
         transition = TransitionTable.get_transition(state.phase, state.stage, command)
         if transition is None:
@@ -312,9 +417,6 @@ class WorkflowOrchestrator:
         state.phase = transition.phase
         state.stage = transition.stage
 
-        # Execute the action after transition
-        self._execute_action(state, transition.action, session_id)
-
         # Update status for terminal states
         if state.phase == WorkflowPhase.COMPLETE:
             state.status = WorkflowStatus.SUCCESS
@@ -323,7 +425,12 @@ class WorkflowOrchestrator:
         elif state.phase == WorkflowPhase.ERROR:
             state.status = WorkflowStatus.ERROR
 
-        self.session_store.save(state)
+        state.record_transition(TransitionCause(command))
+
+        # Execute the action after transition
+        self._execute_action(state, transition.action, session_id)
+
+        self._save_state(state)
         return state
 
     def _build_gate_context(self, session_dir: Path) -> GateContext:
@@ -341,11 +448,13 @@ class WorkflowOrchestrator:
             build_base_context=self._build_base_context,
             build_provider_context=self._build_provider_context,
             get_approver=self._get_approver,
-            save_state=self.session_store.save,
+            save_state=self._save_state,
             action_retry=self._action_retry,
             execute_action=self._execute_action,
             handle_pre_transition_approval=self._handle_pre_transition_approval,
             write_regenerated_prompt=self._write_regenerated_prompt,
+            flush_state=self.session_store.flush,
+            provider_slot=self._provider_service.slot,
         )
 
     def _execute_action(
@@ -365,22 +474,27 @@ class WorkflowOrchestrator:
         """
         session_dir = self.sessions_root / session_id
 
-        match action:
-            case Action.CREATE_PROMPT:
-                self._action_create_prompt(state, session_dir)
-            case Action.CALL_AI:
-                self._action_call_ai(state, session_dir)
-            case Action.CHECK_VERDICT:
-                self._action_check_verdict(state, session_dir)
-            case Action.FINALIZE:
-                self._action_finalize(state, session_dir)
-            case Action.HALT | Action.CANCEL:
-                pass
-
-        # Run approval gate after content-creating actions
-        if action in (Action.CREATE_PROMPT, Action.CALL_AI):
-            self._run_gate_after_action(state, session_dir)
-
+        with (
+            action_span(f"{action.value}:{state.phase.value}", session_id),
+            span("orchestrator.execute_action", **{"aiwf.action": action.value}, **state_attributes(state)),
+        ):
+            match action:
+                case Action.CREATE_PROMPT:
+                    self._action_create_prompt(state, session_dir)
+                case Action.CALL_AI:
+                    self._action_call_ai(state, session_dir)
+                case Action.CHECK_VERDICT:
+                    self._action_check_verdict(state, session_dir)
+                case Action.FINALIZE:
+                    self._action_finalize(state, session_dir)
+                case Action.HALT | Action.CANCEL:
+                    pass
+
+            # Run approval gate after content-creating actions
+            if action in (Action.CREATE_PROMPT, Action.CALL_AI):
+                self._run_gate_after_action(state, session_dir)
+
+    @_traced("orchestrator.create_prompt")
     def _action_create_prompt(self, state: WorkflowState, session_dir: Path) -> None:
         """Create prompt file for current phase.
 
@@ -409,6 +523,7 @@ class WorkflowOrchestrator:
 
         self._add_message(state, f"Created {result.prompt_filename}")
 
+    @_traced("orchestrator.call_ai")
     def _action_call_ai(self, state: WorkflowState, session_dir: Path) -> None:
         """Call AI provider to generate response.
 
@@ -432,6 +547,10 @@ class WorkflowOrchestrator:
         provider_key = state.ai_providers.get(role)
         if provider_key is None:
             raise ValueError(f"No provider configured for role: {role}")
+        call_span = current_span()
+        if call_span is not None:
+            call_span.set_attribute("aiwf.role", role)
+            call_span.set_attribute("aiwf.provider", provider_key)
 
         # Get filenames via gateway
         prompt_filename = gateway.get_prompt_filename(state.phase)
@@ -447,17 +566,36 @@ class WorkflowOrchestrator:
         context = self._build_provider_context(state)
         context["prompt_filename"] = prompt_filename
         context["response_filename"] = response_filename
+        # Streaming providers write here directly and report progress
+        context["response_path"] = str(
+            gateway.get_response_path(state.current_iteration, state.phase)
+        )
+        context["on_progress"] = self._provider_progress_callback(state)
+
+        # Provider calls can take minutes; persist saved state before waiting
+        self.session_store.flush()
 
         # Execute via provider service
+        started = time.monotonic()
         try:
             result = self._provider_service.execute(
                 provider_key, prompt_content, context=context
             )
         except ProviderError as e:
+            invalidate_session_file_cache()
+            self._record_provider_call(
+                state, session_dir, role, provider_key, time.monotonic() - started, error=e
+            )
             state.last_error = str(e)
             state.status = WorkflowStatus.ERROR
-            self.session_store.save(state)  # Persist error state before raising
+            state.record_transition(TransitionCause.ERROR)
+            self._save_state(state)  # Persist error state before raising
             raise
+        # Local-write providers may have rewritten session files
+        invalidate_session_file_cache()
+        self._record_provider_call(
+            state, session_dir, role, provider_key, time.monotonic() - started, result=result
+        )
 
         if result.awaiting_response:
             # Provider didn't generate response - user provides externally
@@ -500,7 +638,7 @@ class WorkflowOrchestrator:
         content = gateway.read_response(state.current_iteration, WorkflowPhase.REVIEW)
 
         # Use profile to process review response
-        profile = ProfileFactory.create(state.profile)
+        profile = ProfileFactory.acquire(state.profile)
         result = profile.process_review_response(content)
 
         # Extract verdict from result metadata
@@ -511,12 +649,14 @@ class WorkflowOrchestrator:
             state.phase = WorkflowPhase.COMPLETE
             state.stage = None
             state.status = WorkflowStatus.SUCCESS
+            state.record_transition(TransitionCause.VERDICT)
             self._add_message(state, "Review verdict: PASS → workflow complete")
         elif verdict == "FAIL":
             # Transition to REVISE[PROMPT], increment iteration
             state.current_iteration += 1
             state.phase = WorkflowPhase.REVISE
             state.stage = WorkflowStage.PROMPT
+            state.record_transition(TransitionCause.VERDICT)
             self._add_message(state, "Review verdict: FAIL → revision required")
             # Create revision prompt for new iteration
             self._action_create_prompt(state, session_dir)
@@ -531,6 +671,7 @@ class WorkflowOrchestrator:
         """Finalize workflow completion."""
         self._add_message(state, "Workflow complete")
 
+    @_traced("orchestrator.retry")
     def _action_retry(self, state: WorkflowState, session_dir: Path) -> None:
         """Retry response generation with feedback.
 
@@ -538,6 +679,7 @@ class WorkflowOrchestrator:
         and regenerates the response using the same prompt + feedback context.
         """
         feedback = state.approval_feedback
+        state.record_transition(TransitionCause.RETRY)
         self._add_message(
             state,
             f"Retrying {state.phase.value}" + (" with feedback" if feedback else "")
@@ -626,14 +768,13 @@ class WorkflowOrchestrator:
 
         # Validate all configured AI providers before continuing setup
         try:
-            for role, provider_key in providers.items():
-                ai_provider = AIProviderFactory.create(provider_key)
-                ai_provider.validate()
+            for provider_key in dict.fromkeys(providers.values()):
+                AIProviderFactory.acquire_validated(provider_key)
         except (KeyError, ProviderError):
             shutil.rmtree(session_dir, ignore_errors=True)
             raise
 
-        profile_instance = ProfileFactory.create(profile)
+        profile_instance = ProfileFactory.acquire(profile)
         profile_instance.validate_metadata(metadata)
 
         # Resolve standards provider: CLI > profile default
@@ -662,9 +803,15 @@ class WorkflowOrchestrator:
             session_dir=session_dir,
             context=standards_context,
             provider=sp,
+            cache=(
+                StandardsBundleCache(self.standards_cache_dir)
+                if self.standards_cache_dir is not None
+                else None
+            ),
+            provider_key=resolved_standards_provider,
         )
         state.standards_hash = bundle_hash
-        self.session_store.save(state)
+        self._save_state(state)
 
         return session_id
 
@@ -730,6 +877,64 @@ class WorkflowOrchestrator:
         ctx["stage"] = state.stage.value if state.stage else None
         return ctx
 
+    def _record_provider_call(
+        self,
+        state: WorkflowState,
+        session_dir: Path,
+        role: str,
+        provider_key: str,
+        wall_seconds: float,
+        *,
+        result: ProviderExecutionResult | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Append telemetry for a provider call to the session metrics file.
+
+        Telemetry is best-effort: a failed write is logged, never raised.
+        """
+        raw = result.raw_result if result is not None else None
+        if error is not None:
+            outcome = "error"
+        elif result is not None and result.awaiting_response:
+            outcome = "awaiting"
+        else:
+            outcome = "ok"
+        metric = ProviderCallMetric(
+            session_id=state.session_id,
+            phase=state.phase.value,
+            iteration=state.current_iteration,
+            role=role,
+            provider=provider_key,
+            outcome=outcome,
+            retry=state.retry_count,
+            cache_hit=result.cache_hit if result is not None else False,
+            wall_seconds=wall_seconds,
+            ttft_seconds=raw.ttft_seconds if raw else None,
+            input_tokens=raw.input_tokens if raw else None,
+            output_tokens=raw.output_tokens if raw else None,
+            cost_usd=raw.cost_usd if raw else None,
+            error=str(error) if error is not None else None,
+        )
+        try:
+            SessionMetricsLog(session_dir).append(metric)
+        except OSError as e:
+            logger.warning(f"Could not record provider metrics for {state.session_id}: {e}")
+
+    def _provider_progress_callback(
+        self, state: WorkflowState
+    ) -> Callable[[str, dict[str, Any]], None]:
+        """Build a progress callback that emits PROVIDER_PROGRESS events."""
+        from aiwf.domain.events.event_types import WorkflowEventType
+
+        def on_progress(kind: str, data: dict[str, Any]) -> None:
+            self._emit(
+                WorkflowEventType.PROVIDER_PROGRESS,
+                state,
+                metadata={"kind": kind, **data},
+            )
+
+        return on_progress
+
     def _emit(
         self,
         event_type: "WorkflowEventType",
@@ -771,6 +976,7 @@ class WorkflowOrchestrator:
         stage_config = self.approval_config.get_stage_config(phase.value, stage.value)
         return ApprovalProviderFactory.create(stage_config.approver)
 
+    @_traced("approval.gate")
     def _run_gate_after_action(
         self,
         state: WorkflowState,
@@ -792,6 +998,7 @@ class WorkflowOrchestrator:
         self,
         state: WorkflowState,
         session_dir: Path,
+        cause: TransitionCause = TransitionCause.APPROVE,
     ) -> None:
         """Automatically continue to next stage after approval.
 
@@ -802,6 +1009,7 @@ class WorkflowOrchestrator:
         Args:
             state: Current workflow state
             session_dir: Session directory path
+            cause: Recorded in phase_history for the transition
         """
         # Get transition for approve command (same as manual approve)
         transition = TransitionTable.get_transition(state.phase, state.stage, "approve")
@@ -820,11 +1028,13 @@ class WorkflowOrchestrator:
         elif state.phase == WorkflowPhase.ERROR:
             state.status = WorkflowStatus.ERROR
 
+        state.record_transition(cause)
+
         # Execute the action for new state
         self._execute_action(state, transition.action, state.session_id)
 
         # Save state
-        self.session_store.save(state)
+        self._save_state(state)
 
     def _run_approval_gate(
         self,
@@ -897,6 +1107,31 @@ class WorkflowOrchestrator:
             state, session_dir, result, context
         )
 
+    def _save_state(self, state: WorkflowState) -> None:
+        """Save state, recording the wait for a human command it now starts.
+
+        A command records no further transitions once it has set
+        pending_approval, so the AWAIT entry goes into that save rather
+        than into an extra one after the command.
+        """
+        if state.pending_approval:
+            self._mark_awaiting(state)
+        self.session_store.save(state)
+
+    def _mark_awaiting(self, state: WorkflowState) -> bool:
+        """Record that an in-progress workflow now waits on a human command.
+
+        Returns:
+            True if an AWAIT entry was added (state needs saving)
+        """
+        if state.status != WorkflowStatus.IN_PROGRESS:
+            return False
+        history = state.phase_history
+        if history and history[-1].cause == TransitionCause.AWAIT:
+            return False
+        state.record_transition(TransitionCause.AWAIT)
+        return True
+
     def _clear_approval_state(self, state: WorkflowState) -> None:
         """Clear approval tracking fields after successful approval."""
         state.approval_feedback = None
@@ -991,5 +1226,12 @@ def _build_initial_state(
         phase=initial_phase,
         status=initial_status,
         standards_hash="0" * 64,
-        phase_history=[PhaseTransition(phase=initial_phase, status=initial_status)],
+        phase_history=[
+            PhaseTransition(
+                phase=initial_phase,
+                status=initial_status,
+                iteration=1,
+                cause=TransitionCause.INIT,
+            )
+        ],
     )
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""CPU and memory profiling of a single CLI command.
+
+Enabled with ``aiwf --perf-profile <command>`` (or AIWF_PERF_PROFILE=1).
+The whole command runs under cProfile and tracemalloc. The orchestrator
+marks each action it executes with ``action_span()`` and provider calls
+are marked with ``provider_span()``, so the report splits engine time
+from provider wall time per action.
+
+When no profiler is active the span helpers only check a module global,
+so the hooks cost nothing in normal runs.
+"""
+
+import cProfile
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Functions and allocation sites listed in a report
+DEFAULT_TOP_N = 25
+
+# Frames kept per allocation traceback (1 = allocation site only)
+_TRACEMALLOC_FRAMES = 1
+
+_active: "CommandProfiler | None" = None
+
+
+@dataclass
+class ActionProfile:
+    """Accumulated cost of one orchestrator action (e.g. call_ai:generate).
+
+    Times are exclusive of nested actions (an approval gate that
+    auto-continues runs the next action inside the current one).
+    """
+
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    provider_seconds: float = 0.0
+    net_alloc_bytes: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def engine_seconds(self) -> float:
+        return max(self.wall_seconds - self.provider_seconds, 0.0)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "action": self.name,
+            "calls": self.calls,
+            "wall_seconds": self.wall_seconds,
+            "engine_seconds": self.engine_seconds,
+            "provider_seconds": self.provider_seconds,
+            "net_alloc_bytes": self.net_alloc_bytes,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+@dataclass
+class _Frame:
+    """An open action span."""
+
+    name: str
+    started: float
+    alloc_start: int
+    peak: int = 0
+    child_wall: float = 0.0
+    child_alloc: int = 0
+    provider_seconds: float = 0.0
+
+
+class CommandProfiler:
+    """Profiles one command: cProfile for CPU, tracemalloc for memory.
+
+    Usage:
+        profiler = CommandProfiler("approve")
+        profiler.start()
+        ...  # run the command
+        report = profiler.stop()
+        profiler.write_report(path, report)
+    """
+
+    def __init__(self, command: str, *, top_n: int = DEFAULT_TOP_N) -> None:
+        self.command = command
+        self.top_n = top_n
+        self.session_ids: list[str] = []
+        self.actions: dict[str, ActionProfile] = {}
+        self.provider_seconds = 0.0
+        self._profile = cProfile.Profile()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._peak = 0
+        self._started = 0.0
+        self._cpu_started = 0.0
+        self._owns_tracemalloc = False
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    def start(self) -> None:
+        """Start profiling and make this the active profiler."""
+        global _active
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        _active = self
+        self._profile.enable()
+
+    def stop(self) -> dict[str, Any]:
+        """
+        Stop profiling and build the report.
+
+        Returns:
+            JSON-serializable report
+        """
+        global _active
+        self._profile.disable()
+        if _active is self:
+            _active = None
+        wall = time.perf_counter() - self._started
+        cpu = time.process_time() - self._cpu_started
+
+        self._fold_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        return {
+            "command": self.command,
+            "session_id": self.session_ids[0] if len(set(self.session_ids)) == 1 else None,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "wall_seconds": wall,
+            "cpu_seconds": cpu,
+            "provider_seconds": self.provider_seconds,
+            "engine_seconds": max(wall - self.provider_seconds, 0.0),
+            "memory": {
+                "peak_bytes": self._peak,
+                "retained_bytes": current,
+                "top_allocations": self._top_allocations(snapshot),
+            },
+            "actions": [action.to_dict() for action in self.actions.values()],
+            "top_functions": self._top_functions(),
+        }
+
+    @staticmethod
+    def write_report(path: Path, report: dict[str, Any]) -> Path:
+        """Write a report as JSON, creating parent directories."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return path
+
+    # ========================================================================
+    # Spans
+    # ========================================================================
+
+    @contextmanager
+    def _action(self, name: str, session_id: str | None) -> Iterator[None]:
+        stack: list[_Frame] = self._local.__dict__.setdefault("stack", [])
+        self._fold_peak()
+        frame = _Frame(
+            name=name,
+            started=time.perf_counter(),
+            alloc_start=tracemalloc.get_traced_memory()[0],
+        )
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            self._fold_peak()
+            stack.pop()
+            wall = time.perf_counter() - frame.started
+            alloc = tracemalloc.get_traced_memory()[0] - frame.alloc_start
+            if stack:
+                stack[-1].child_wall += wall
+                stack[-1].child_alloc += alloc
+            with self._lock:
+                if session_id is not None:
+                    self.session_ids.append(session_id)
+                action = self.actions.setdefault(name, ActionProfile(name=name))
+                action.calls += 1
+                action.wall_seconds += wall - frame.child_wall
+                action.provider_seconds += frame.provider_seconds
+                action.net_alloc_bytes += alloc - frame.child_alloc
+                action.peak_bytes = max(action.peak_bytes, frame.peak)
+
+    @contextmanager
+    def _provider(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            stack: list[_Frame] = self._local.__dict__.get("stack", [])
+            if stack:
+                stack[-1].provider_seconds += elapsed
+            with self._lock:
+                self.provider_seconds += elapsed
+
+    def _fold_peak(self) -> None:
+        """Credit the traced peak since the last fold to every open span."""
+        if not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        for frame in self._local.__dict__.get("stack", []):
+            frame.peak = max(frame.peak, peak)
+        self._peak = max(self._peak, peak)
+        tracemalloc.reset_peak()
+
+    # ========================================================================
+    # Report sections
+    # ========================================================================
+
+    def _top_functions(self) -> list[dict[str, Any]]:
+        stats = pstats.Stats(self._profile)
+        rows = []
+        for (filename, line, func), (_, calls, total, cumulative, _) in stats.stats.items():  # type: ignore[attr-defined]
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({func})",
+                    "calls": calls,
+                    "total_seconds": total,
+                    "cumulative_seconds": cumulative,
+                }
+            )
+        rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+        return rows[: self.top_n]
+
+    def _top_allocations(self, snapshot: tracemalloc.Snapshot) -> list[dict[str, Any]]:
+        snapshot = snapshot.filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        return [
+            {
+                "site": str(stat.traceback[0]),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[: self.top_n]
+        ]
+
+
+def active_profiler() -> CommandProfiler | None:
+    """Return the profiler of the running command, if any."""
+    return _active
+
+
+@contextmanager
+def action_span(name: str, session_id: str | None = None) -> Iterator[None]:
+    """Attribute time and allocations in the block to an orchestrator action."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler._action(name, session_id):
+        yield
+
+
+@contextmanager
+def provider_span() -> Iterator[None]:
+    """Count the block as provider wall time (not engine overhead)."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler._provider():
+        yield
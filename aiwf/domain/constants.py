@@ -4,6 +4,30 @@ from pathlib import Path
 DEFAULT_SESSIONS_ROOT = Path(".aiwf/sessions")
 SESSION_FILENAME = "session.json"
 SESSION_TEMP_SUFFIX = ".json.tmp"
+# Append-only delta journal replayed on top of session.json (journal mode)
+SESSION_JOURNAL_FILENAME = "session.journal.jsonl"
+# Journal entries written before the journal is compacted into session.json
+DEFAULT_JOURNAL_COMPACT_EVERY = 50
+# Advisory per-session lock file and how long to wait for it (seconds)
+SESSION_LOCK_FILENAME = "session.lock"
+DEFAULT_SESSION_LOCK_TIMEOUT = 30.0
+# Append-only per-call provider telemetry (kept out of session.json)
+SESSION_METRICS_FILENAME = "metrics.jsonl"
+# Per-command CPU/memory reports (--perf-profile), per session and project-wide
+SESSION_PERF_DIRNAME = "perf"
+PERF_REPORTS_DIR = Path(".aiwf/perf")
 
 # Standards and templates
-STANDARDS_BUNDLE_FILENAME = "standards-bundle.md"
\ No newline at end of file
+STANDARDS_BUNDLE_FILENAME = "standards-bundle.md"
+# Shared standards bundle cache (relative to the project root)
+STANDARDS_CACHE_DIR = Path(".aiwf/cache/standards")
+# Recorded AI provider responses (relative to the project root)
+RESPONSE_CACHE_DIR = Path(".aiwf/cache/responses")
+# Cached profile discovery results (relative to the user's home, like ~/.aiwf/profiles)
+PROFILE_MANIFEST_FILE = Path(".aiwf/cache/profiles.json")
+# Unix socket of the `aiwf serve` daemon (relative to the user's home)
+DAEMON_SOCKET_FILE = Path(".aiwf/run/daemon.sock")
+# Session catalog index (lives directly under the sessions root)
+SESSION_CATALOG_FILENAME = "catalog.sqlite3"
+# Session state database for the SQLite session store (under the sessions root)
+SESSION_DATABASE_FILENAME = "sessions.sqlite3"
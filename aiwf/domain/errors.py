@@ -4,4 +4,43 @@
 class ProviderError(Exception):
     """Raised when a provider fails (network, auth, timeout, etc.)."""
 
-    pass
\ No newline at end of file
+    pass
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was saved by another writer since it was loaded."""
+
+    def __init__(self, session_id: str, expected_version: int, actual_version: int) -> None:
+        super().__init__(
+            f"Session '{session_id}' was modified concurrently "
+            f"(loaded version {expected_version}, stored version {actual_version}). "
+            f"Reload the session and retry."
+        )
+        self.session_id = session_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
+class SessionLockTimeout(Exception):
+    """Raised when a session lock cannot be acquired within the timeout."""
+
+    def __init__(self, session_id: str, timeout: float) -> None:
+        super().__init__(
+            f"Session '{session_id}' is busy (lock not acquired within {timeout:g}s). "
+            f"Another aiwf process may be working on it."
+        )
+        self.session_id = session_id
+        self.timeout = timeout
+
+
+class ResponseCacheMiss(ProviderError):
+    """Raised in strict-replay mode when no cached response matches a call."""
+
+    def __init__(self, provider_key: str, cache_key: str) -> None:
+        super().__init__(
+            f"No cached response for provider '{provider_key}' (key {cache_key[:12]}) "
+            f"and response cache is in strict-replay mode. "
+            f"Record it first with response_cache mode 'record' or 'replay'."
+        )
+        self.provider_key = provider_key
+        self.cache_key = cache_key
@@ -23,3 +23,6 @@ class WorkflowEventType(str, Enum):
 
     # Iteration
     ITERATION_STARTED = "iteration_started"
+
+    # Provider execution
+    PROVIDER_PROGRESS = "provider_progress"
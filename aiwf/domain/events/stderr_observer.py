@@ -17,4 +17,8 @@ class StderrEventObserver:
             parts.append(f"iteration={event.iteration}")
         if event.artifact_path:
             parts.append(f"path={event.artifact_path}")
+        for key, value in event.metadata.items():
+            if isinstance(value, float):
+                value = f"{value:.3f}"
+            parts.append(f"{key}={value}")
         click.echo(" ".join(parts), err=True)
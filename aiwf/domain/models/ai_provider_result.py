@@ -13,4 +13,9 @@ class AIProviderResult(BaseModel):
     """
 
     files: dict[str, str | None] = Field(default_factory=dict)
-    response: str | None = None  # Optional commentary for response file
\ No newline at end of file
+    response: str | None = None  # Optional commentary for response file
+    ttft_seconds: float | None = None  # Time to first token (streaming providers)
+    latency_seconds: float | None = None  # Total generation time (streaming providers)
+    input_tokens: int | None = None  # Prompt tokens, including cached input (if reported)
+    output_tokens: int | None = None  # Completion tokens (if reported)
+    cost_usd: float | None = None  # Provider-reported cost of the call
@@ -39,6 +39,9 @@ class ApprovalResult(BaseModel):
             When present, the orchestrator may apply this content instead of
             or in addition to the feedback, depending on configuration.
             Whether the orchestrator uses this is controlled by allow_rewrite settings.
+        truncated_files: Files the approver saw only a prefix of
+        omitted_files: Files left out of the evaluation entirely (e.g. when
+            an AI approver's prompt token budget was exhausted)
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -46,6 +49,8 @@ class ApprovalResult(BaseModel):
     decision: ApprovalDecision
     feedback: str | None = None
     suggested_content: str | None = None
+    truncated_files: tuple[str, ...] = ()
+    omitted_files: tuple[str, ...] = ()
 
     @model_validator(mode="after")
     def _validate_rejection_has_feedback(self) -> "ApprovalResult":
@@ -0,0 +1,60 @@
+"""Stage timing derived from a session's phase_history.
+
+Each phase_history entry marks entry into a phase/stage; it is exited when
+the next entry is recorded. An interval that starts at an AWAIT or ERROR
+entry is time spent waiting for a human command. Every other interval is
+machine time: prompt creation, provider calls and approval gates.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from aiwf.domain.models.workflow_state import TransitionCause, WorkflowPhase, WorkflowState
+
+# Provider role that does the work of each active phase
+_PHASE_ROLES = {
+    WorkflowPhase.PLAN: "planner",
+    WorkflowPhase.GENERATE: "generator",
+    WorkflowPhase.REVIEW: "reviewer",
+    WorkflowPhase.REVISE: "reviser",
+}
+
+_HUMAN_CAUSES = (TransitionCause.AWAIT, TransitionCause.ERROR)
+
+
+@dataclass(frozen=True)
+class StageInterval:
+    """Time spent in one phase/stage between two history entries."""
+
+    phase: str
+    stage: str | None
+    provider: str | None
+    cause: str | None  # Cause of the entry that started the interval
+    kind: Literal["machine", "human"]
+    seconds: float
+
+
+def stage_intervals(state: WorkflowState) -> list[StageInterval]:
+    """
+    Compute closed intervals from a session's phase_history.
+
+    The last entry is still open (or terminal) and has no interval.
+
+    Returns:
+        Intervals in history order
+    """
+    intervals: list[StageInterval] = []
+    history = state.phase_history
+    for entry, exit_entry in zip(history, history[1:]):
+        role = _PHASE_ROLES.get(entry.phase)
+        intervals.append(
+            StageInterval(
+                phase=entry.phase.value,
+                stage=entry.stage.value if entry.stage else None,
+                provider=state.ai_providers.get(role) if role else None,
+                cause=entry.cause.value if entry.cause else None,
+                kind="human" if entry.cause in _HUMAN_CAUSES else "machine",
+                seconds=max((exit_entry.timestamp - entry.timestamp).total_seconds(), 0.0),
+            )
+        )
+    return intervals
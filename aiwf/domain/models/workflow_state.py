@@ -50,6 +50,20 @@ class WorkflowStatus(str, Enum):
     CANCELLED = "cancelled"        # User stopped
 
 
+class TransitionCause(str, Enum):
+    """Why a phase_history entry was recorded."""
+
+    INIT = "init"                    # Session created or init command
+    APPROVE = "approve"              # Manual approve command
+    AUTO_CONTINUE = "auto-continue"  # Approval gate passed without a human
+    RETRY = "retry"                  # Response regenerated after gate rejection
+    REJECT = "reject"                # Manual reject command
+    VERDICT = "verdict"              # Review verdict moved the workflow on
+    CANCEL = "cancel"                # Cancel command
+    ERROR = "error"                  # Provider failure
+    AWAIT = "await"                  # Command finished; waiting on a human
+
+
 class Artifact(BaseModel):
     """
     Artifact metadata only.
@@ -96,11 +110,20 @@ class Artifact(BaseModel):
 
 
 class PhaseTransition(BaseModel):
-    """Record of a phase/status change."""
+    """Record of a phase/stage/status change.
+
+    timestamp is when the state was entered; it is exited at the next
+    entry's timestamp. Entries are only ever appended, which keeps
+    phase_history cheap to journal. stage, iteration and cause are None
+    on entries written before they were recorded.
+    """
 
     phase: WorkflowPhase
     status: WorkflowStatus
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    stage: WorkflowStage | None = None
+    iteration: int | None = None
+    cause: TransitionCause | None = None
 
 
 class WorkflowState(BaseModel):
@@ -179,9 +202,24 @@ class WorkflowState(BaseModel):
     # Phase history
     phase_history: list[PhaseTransition] = Field(default_factory=list)
 
+    # Optimistic concurrency: incremented by SessionStore on every save
+    version: int = 0
+
     # Transient progress messages (excluded from serialization)
     messages: list[str] = Field(default_factory=list, exclude=True)
 
+    def record_transition(self, cause: TransitionCause) -> None:
+        """Append the current phase, stage and status to phase_history."""
+        self.phase_history.append(
+            PhaseTransition(
+                phase=self.phase,
+                stage=self.stage,
+                status=self.status,
+                iteration=self.current_iteration,
+                cause=cause,
+            )
+        )
+
     @field_validator("current_iteration")
     @classmethod
     def _current_iteration_ge_1(cls, v: int) -> int:
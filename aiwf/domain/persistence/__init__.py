@@ -1,3 +1,13 @@
+from .session_catalog import SessionCatalog, SessionCatalogEntry
+from .session_metrics import ProviderCallMetric, SessionMetricsLog
 from .session_store import SessionStore
+from .sqlite_session_store import SqliteSessionStore
 
-__all__ = ["SessionStore"]
\ No newline at end of file
+__all__ = [
+    "ProviderCallMetric",
+    "SessionCatalog",
+    "SessionCatalogEntry",
+    "SessionMetricsLog",
+    "SessionStore",
+    "SqliteSessionStore",
+]
@@ -0,0 +1,344 @@
+"""Compact catalog index of workflow sessions.
+
+The catalog holds one row per session with the fields needed to list,
+filter and sort sessions (profile, phase, stage, status, iteration,
+entity, timestamps), plus the stage timing intervals of each session's
+phase_history for latency analytics. It is derived data: the session store's records
+(``session.json``, or the state table of the SQLite store) remain the
+source of truth and the catalog can always be rebuilt from them.
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiwf.domain.models.phase_timing import StageInterval, stage_intervals
+from aiwf.domain.models.workflow_state import WorkflowState
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    stage TEXT,
+    status TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    entity TEXT,
+    context TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions (status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_profile ON sessions (profile, updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_phase ON sessions (phase, updated_at);
+CREATE TABLE IF NOT EXISTS stage_timings (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    stage TEXT,
+    provider TEXT,
+    cause TEXT,
+    kind TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_stage_timings_phase ON stage_timings (phase, stage, kind);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "session_id, profile, phase, stage, status, iteration, "
+    "entity, context, created_at, updated_at"
+)
+_TIMING_COLUMNS = "session_id, seq, phase, stage, provider, cause, kind, seconds"
+
+# Bumped when the catalog gains derived data, so older catalogs are rebuilt
+_CATALOG_VERSION = "2"
+
+
+@dataclass(frozen=True)
+class SessionCatalogEntry:
+    """One catalog row - the listing view of a session."""
+
+    session_id: str
+    profile: str
+    phase: str
+    stage: str | None
+    status: str
+    iteration: int
+    entity: str | None
+    created_at: str
+    updated_at: str
+    context: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_state(cls, state: WorkflowState) -> "SessionCatalogEntry":
+        """Build a catalog entry from a workflow state."""
+        entity = state.context.get("entity")
+        return cls(
+            session_id=state.session_id,
+            profile=state.profile,
+            phase=state.phase.value,
+            stage=state.stage.value if state.stage else None,
+            status=state.status.value,
+            iteration=state.current_iteration,
+            entity=str(entity) if entity is not None else None,
+            created_at=state.created_at.isoformat(),
+            updated_at=state.updated_at.isoformat(),
+            context=dict(state.context),
+        )
+
+
+class SessionCatalog:
+    """SQLite-backed index of sessions under a sessions root.
+
+    The database file is created lazily on first write or query, so
+    constructing a catalog (and therefore a SessionStore) costs nothing.
+    Each operation opens its own short-lived connection, which keeps the
+    catalog safe to use from several CLI processes at once.
+    """
+
+    def __init__(self, db_path: Path, *, timeout: float = 30.0) -> None:
+        """
+        Initialize the catalog.
+
+        Args:
+            db_path: Path to the SQLite database file
+            timeout: Seconds to wait on a locked database before failing
+        """
+        self.db_path = db_path
+        self._timeout = timeout
+
+    def upsert(self, state: WorkflowState) -> None:
+        """Insert or replace the catalog row for a session."""
+        entry = SessionCatalogEntry.from_state(state)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO sessions ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._to_row(entry),
+            )
+            conn.execute("DELETE FROM stage_timings WHERE session_id = ?", (state.session_id,))
+            conn.executemany(
+                f"INSERT INTO stage_timings ({_TIMING_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._timing_rows(state),
+            )
+
+    def remove(self, session_id: str) -> None:
+        """Remove the catalog row for a session (no-op if absent)."""
+        if not self.db_path.exists():
+            return
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM stage_timings WHERE session_id = ?", (session_id,))
+
+    def query(
+        self,
+        *,
+        status: str | None = None,
+        phase: str | None = None,
+        profile: str | None = None,
+        limit: int | None = None,
+    ) -> list[SessionCatalogEntry]:
+        """
+        Query catalog rows, most recently updated first.
+
+        Args:
+            status: Only include sessions with this WorkflowStatus value
+            phase: Only include sessions with this WorkflowPhase value
+            profile: Only include sessions for this profile
+            limit: Maximum rows to return (None = no limit)
+
+        Returns:
+            Matching entries sorted by updated_at descending
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if phase is not None:
+            clauses.append("phase = ?")
+            params.append(phase)
+        if profile is not None:
+            clauses.append("profile = ?")
+            params.append(profile)
+
+        sql = f"SELECT {_COLUMNS} FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY updated_at DESC, session_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(limit, 0))
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def query_stage_timings(
+        self,
+        *,
+        session_id: str | None = None,
+        profile: str | None = None,
+    ) -> list[StageInterval]:
+        """
+        Query stage timing intervals.
+
+        Args:
+            session_id: Only include this session
+            profile: Only include sessions for this profile
+
+        Returns:
+            Intervals ordered by session and history position
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if session_id is not None:
+            clauses.append("t.session_id = ?")
+            params.append(session_id)
+        if profile is not None:
+            clauses.append("s.profile = ?")
+            params.append(profile)
+
+        sql = (
+            "SELECT t.phase, t.stage, t.provider, t.cause, t.kind, t.seconds "
+            "FROM stage_timings t JOIN sessions s ON s.session_id = t.session_id"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY t.session_id, t.seq"
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            StageInterval(
+                phase=phase, stage=stage, provider=provider, cause=cause,
+                kind=kind, seconds=seconds,
+            )
+            for phase, stage, provider, cause, kind, seconds in rows
+        ]
+
+    def count(self) -> int:
+        """Return the number of indexed sessions."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def is_built(self) -> bool:
+        """Return True once the catalog has been fully built from disk.
+
+        Sessions created before the catalog existed (or before it held
+        stage timings) are only picked up by a rebuild, so callers use this
+        to trigger a one-time rebuild.
+        """
+        if not self.db_path.exists():
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM catalog_meta WHERE key = 'built'"
+            ).fetchone()
+        return row is not None and row[0] == _CATALOG_VERSION
+
+    def replace_all(self, states: list[WorkflowState]) -> None:
+        """Replace the whole catalog with rows for the given states.
+
+        Runs in a single transaction and marks the catalog as built.
+        """
+        rows = [self._to_row(SessionCatalogEntry.from_state(s)) for s in states]
+        timing_rows = [row for s in states for row in self._timing_rows(s)]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM stage_timings")
+            conn.executemany(
+                f"INSERT OR REPLACE INTO sessions ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                f"INSERT OR REPLACE INTO stage_timings ({_TIMING_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                timing_rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('built', ?)",
+                (_CATALOG_VERSION,),
+            )
+
+    def _connect(self) -> "_ClosingConnection":
+        """Open a connection, creating the schema if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=self._timeout)
+        conn.executescript(_SCHEMA)
+        return _ClosingConnection(conn)
+
+    @staticmethod
+    def _to_row(entry: SessionCatalogEntry) -> tuple[Any, ...]:
+        return (
+            entry.session_id,
+            entry.profile,
+            entry.phase,
+            entry.stage,
+            entry.status,
+            entry.iteration,
+            entry.entity,
+            json.dumps(entry.context, ensure_ascii=False, default=str),
+            entry.created_at,
+            entry.updated_at,
+        )
+
+    @staticmethod
+    def _timing_rows(state: WorkflowState) -> list[tuple[Any, ...]]:
+        return [
+            (
+                state.session_id, seq, interval.phase, interval.stage, interval.provider,
+                interval.cause, interval.kind, interval.seconds,
+            )
+            for seq, interval in enumerate(stage_intervals(state))
+        ]
+
+    @staticmethod
+    def _from_row(row: tuple[Any, ...]) -> SessionCatalogEntry:
+        (session_id, profile, phase, stage, status, iteration,
+         entity, context, created_at, updated_at) = row
+        return SessionCatalogEntry(
+            session_id=session_id,
+            profile=profile,
+            phase=phase,
+            stage=stage,
+            status=status,
+            iteration=iteration,
+            entity=entity,
+            created_at=created_at,
+            updated_at=updated_at,
+            context=json.loads(context) if context else {},
+        )
+
+
+class _ClosingConnection:
+    """Context manager that commits (or rolls back) and always closes.
+
+    sqlite3.Connection's own context manager only manages the transaction;
+    it leaves the connection open, which leaks file handles per call.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self._conn.close()
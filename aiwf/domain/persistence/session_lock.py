@@ -0,0 +1,146 @@
+"""Advisory per-session file locks.
+
+Each session has its own lock file, so workers operating on different
+sessions never contend; only processes touching the same session wait.
+Locks are OS advisory locks (flock on POSIX, msvcrt on Windows), released
+automatically if the holding process dies.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from aiwf.domain.constants import DEFAULT_SESSION_LOCK_TIMEOUT
+from aiwf.domain.errors import SessionLockTimeout
+from aiwf.domain.tracing import span
+
+try:  # POSIX
+    import fcntl
+
+    def _try_lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover - Windows
+    import msvcrt
+
+    def _try_lock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LockStats:
+    """Contention metrics for session locks acquired through one locker."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class SessionLocker:
+    """Acquires per-session advisory locks with timeouts.
+
+    Locks are re-entrant within a thread: nested holds of the same lock
+    file (e.g. a save inside a locked command) do not deadlock. Different
+    threads and processes exclude each other.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_SESSION_LOCK_TIMEOUT,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Initialize the locker.
+
+        Args:
+            timeout: Default seconds to wait for a lock before giving up
+            poll_interval: Seconds between acquisition attempts while contended
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stats = LockStats()
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def hold(
+        self, session_id: str, lock_path: Path, timeout: float | None = None
+    ) -> Iterator[None]:
+        """
+        Hold the lock at lock_path for the duration of the block.
+
+        Args:
+            session_id: Session the lock protects (for errors and logs)
+            lock_path: Lock file path (created if missing)
+            timeout: Seconds to wait (default: the locker's timeout)
+
+        Raises:
+            SessionLockTimeout: If the lock is not acquired in time
+        """
+        held: dict[str, list[int]] = self._local.__dict__.setdefault("held", {})
+        key = str(lock_path)
+        if key in held:
+            held[key][1] += 1
+            try:
+                yield
+            finally:
+                held[key][1] -= 1
+            return
+
+        with span("session_store.lock_wait", **{"aiwf.session_id": session_id}):
+            fd = self._acquire(session_id, lock_path, self.timeout if timeout is None else timeout)
+        held[key] = [fd, 1]
+        try:
+            yield
+        finally:
+            del held[key]
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+
+    def _acquire(self, session_id: str, lock_path: Path, timeout: float) -> int:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        start = time.monotonic()
+        contended = False
+        while True:
+            try:
+                _try_lock(fd)
+                break
+            except OSError:
+                contended = True
+                if time.monotonic() - start >= timeout:
+                    os.close(fd)
+                    with self._stats_lock:
+                        self.stats.timeouts += 1
+                    raise SessionLockTimeout(session_id, timeout) from None
+                time.sleep(self.poll_interval)
+
+        waited = time.monotonic() - start
+        with self._stats_lock:
+            self.stats.acquisitions += 1
+            if contended:
+                self.stats.contended += 1
+            self.stats.total_wait_seconds += waited
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        if contended:
+            logger.debug(f"Waited {waited:.3f}s for lock on session {session_id}")
+        return fd
@@ -0,0 +1,76 @@
+"""Per-call provider telemetry for a session.
+
+Each provider call appends one JSON line to ``metrics.jsonl`` in the
+session directory. Keeping telemetry out of session.json means it can grow
+with every call and retry without slowing down state saves and loads.
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field, ValidationError
+
+from aiwf.domain.constants import SESSION_METRICS_FILENAME
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderCallMetric(BaseModel):
+    """Telemetry for one AI provider call."""
+
+    session_id: str
+    phase: str
+    iteration: int
+    role: str
+    provider: str
+    # ok: response produced; awaiting: manual response expected; error: provider failed
+    outcome: Literal["ok", "awaiting", "error"]
+    retry: int = 0  # Approval retry number (0 = first attempt)
+    cache_hit: bool = False
+    wall_seconds: float  # Time the workflow spent in the call
+    ttft_seconds: float | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cost_usd: float | None = None
+    error: str | None = None
+    recorded_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SessionMetricsLog:
+    """Append-only metrics file in a session directory."""
+
+    def __init__(self, session_dir: Path) -> None:
+        self.path = session_dir / SESSION_METRICS_FILENAME
+
+    def append(self, metric: ProviderCallMetric) -> None:
+        """Append one call record."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(metric.model_dump_json() + "\n")
+
+    def read(self) -> list[ProviderCallMetric]:
+        """
+        Read all call records.
+
+        Malformed lines (e.g. a torn final write) are skipped.
+
+        Returns:
+            Records in the order they were written
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        metrics: list[ProviderCallMetric] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                metrics.append(ProviderCallMetric.model_validate(json.loads(line)))
+            except (json.JSONDecodeError, ValidationError):
+                logger.warning(f"Ignoring malformed entry in {self.path}")
+        return metrics
@@ -1,34 +1,100 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
 from pydantic import Field
 import json
+import logging
+import os
 import shutil
+import sqlite3
+import threading
 from typing import Any
+from aiwf.domain.errors import SessionConflictError
+from aiwf.domain.models.phase_timing import StageInterval
 from aiwf.domain.models.workflow_state import WorkflowState
+from aiwf.domain.persistence.session_catalog import SessionCatalog, SessionCatalogEntry
+from aiwf.domain.persistence.session_lock import LockStats, SessionLocker
+from aiwf.domain.tracing import span
 from aiwf.domain.constants import (
+    DEFAULT_JOURNAL_COMPACT_EVERY,
+    DEFAULT_SESSION_LOCK_TIMEOUT,
     DEFAULT_SESSIONS_ROOT,
+    SESSION_CATALOG_FILENAME,
     SESSION_FILENAME,
+    SESSION_JOURNAL_FILENAME,
+    SESSION_LOCK_FILENAME,
     SESSION_TEMP_SUFFIX,
 )
 
+logger = logging.getLogger(__name__)
+
+# List fields that only grow during a session; journaled as appends
+_APPEND_ONLY_FIELDS = ("artifacts", "phase_history")
+
+# (st_mtime_ns, st_size, st_ino) of session.json and the journal (None if absent)
+_FileStamp = tuple[int, int, int] | None
+_SessionStamp = tuple[_FileStamp, _FileStamp]
+
 
 class SessionStore:
-    """Handles persistence of workflow session state"""
+    """Handles persistence of workflow session state
+
+    By default every save rewrites session.json. In journal mode, saves
+    after the first append only the changed fields (and new artifacts /
+    phase transitions) to session.journal.jsonl, which is replayed on load
+    and compacted back into session.json every ``compact_every`` entries.
 
-    def __init__(self, sessions_root: Path | None = None):
+    In journal mode, saves inside a ``coalesce()`` block are deferred and
+    written once per session when the block exits or ``flush()`` is called.
+
+    Saves are compare-and-swap on ``WorkflowState.version``: a save whose
+    state was loaded before another writer's save raises
+    SessionConflictError instead of silently overwriting it. Each save
+    holds the session's advisory lock; callers can hold it across a whole
+    load-modify-save with ``lock()``.
+    """
+
+    def __init__(
+        self,
+        sessions_root: Path | None = None,
+        *,
+        journal: bool = False,
+        compact_every: int = DEFAULT_JOURNAL_COMPACT_EVERY,
+        lock_timeout: float = DEFAULT_SESSION_LOCK_TIMEOUT,
+    ):
         """
         Initialize the session store.
         
         Args:
             sessions_root: Root directory for all sessions (default: .aiwf/sessions)
+            journal: Persist state deltas to a journal instead of full rewrites
+            compact_every: Journal entries written before compacting into session.json
+            lock_timeout: Default seconds to wait for a session lock
         """
         self.sessions_root = sessions_root or DEFAULT_SESSIONS_ROOT
         self.sessions_root.mkdir(parents=True, exist_ok=True)
+        self.catalog = SessionCatalog(self.sessions_root / SESSION_CATALOG_FILENAME)
+        self.journal = journal
+        self.compact_every = compact_every
+        self._locker = SessionLocker(timeout=lock_timeout)
+        # Journal mode: last persisted data and journal length per session
+        self._persisted: dict[str, dict[str, Any]] = {}
+        self._journal_entries: dict[str, int] = {}
+        # Stored version per session, valid while its files keep this stamp
+        self._versions: dict[str, tuple[_SessionStamp, int]] = {}
+        # Coalescing is per thread so one store can serve concurrent sessions
+        self._local = threading.local()
 
     def save(self, state: WorkflowState) -> Path:
         """
         Save workflow state to session.json
         
+        Inside a ``coalesce()`` block the write is deferred until the block
+        exits; the state as of this call is what gets written.
+
+        On success state.version is incremented to the stored version.
+
         Args:
             state: The workflow state to persist
             
@@ -37,25 +103,192 @@ class SessionStore:
             
         Raises:
             IOError: If save fails
+            SessionConflictError: If the session was saved elsewhere since
+                this state was loaded
+            SessionLockTimeout: If the session lock is not acquired in time
         """
-        session_dir = self.sessions_root / state.session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
-
-        session_file = session_dir / SESSION_FILENAME
-        temp_file = session_file.with_suffix(SESSION_TEMP_SUFFIX)
+        session_file = self.sessions_root / state.session_id / SESSION_FILENAME
 
         state.updated_at = datetime.now(timezone.utc)  # Add timezone.utc
 
         # Serialize to JSON
         data = self._serialize(state)
 
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending[state.session_id] = (data, state)
+            return session_file
+
+        self._commit(state, data)
+        return session_file
+
+    @property
+    def lock_stats(self) -> LockStats:
+        """Contention metrics for session locks taken through this store."""
+        return self._locker.stats
+
+    @contextmanager
+    def lock(self, session_id: str, timeout: float | None = None) -> Iterator[None]:
+        """
+        Hold the session's advisory lock for the duration of the block.
+
+        Re-entrant within a thread, so saves inside the block do not wait.
+        Only callers touching the same session contend.
+
+        Args:
+            session_id: The session identifier
+            timeout: Seconds to wait (default: the store's lock_timeout)
+
+        Raises:
+            SessionLockTimeout: If the lock is not acquired in time
+        """
+        lock_path = self.sessions_root / session_id / SESSION_LOCK_FILENAME
+        with self._locker.hold(session_id, lock_path, timeout):
+            yield
+
+    @contextmanager
+    def coalesce(self) -> Iterator[None]:
+        """
+        Defer saves made in this thread until the outermost block exits.
+
+        Each session saved in the block is then written once, with the
+        state from its last save(). Pending saves are flushed even if the
+        block raises, so error states are still persisted.
+
+        Only journal mode defers saves; in snapshot mode every save is
+        written at once, so a crash mid-command loses nothing that was
+        saved. Callers should flush() before waiting on anything slow.
+        """
+        if not self.journal or getattr(self._local, "pending", None) is not None:
+            yield
+            return
+
+        self._local.pending = {}
+        try:
+            yield
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._local.pending = None
+
+    def flush(self) -> None:
+        """Write the saves deferred in this thread's coalesce() block now."""
+        pending = getattr(self._local, "pending", None)
+        while pending:
+            data, state = pending.pop(next(iter(pending)))
+            self._commit(state, data)
+
+    def _flush_pending(self, session_id: str) -> None:
+        """Write a deferred save for session_id now, if there is one."""
+        pending = getattr(self._local, "pending", None)
+        if pending and session_id in pending:
+            data, state = pending.pop(session_id)
+            self._commit(state, data)
+
+    def _commit(self, state: WorkflowState, data: dict[str, Any]) -> None:
+        """Compare-and-swap write of serialized state under the session lock."""
+        base_version = data.get("version", 0)
+        with (
+            span("session_store.save", **{"aiwf.session_id": state.session_id}),
+            self.lock(state.session_id),
+        ):
+            stored_version = self._stored_version(state.session_id)
+            if stored_version is not None and stored_version != base_version:
+                raise SessionConflictError(state.session_id, base_version, stored_version)
+            data["version"] = base_version + 1
+            self._write(state, data)
+        state.version = base_version + 1
+
+    def _stored_version(self, session_id: str) -> int | None:
+        """Return the persisted version of a session, or None if it doesn't exist.
+
+        Called under the session lock. The version recorded by this store's
+        last write is reused while session.json and the journal are
+        unchanged; otherwise the state is read back from disk.
+        """
+        session_dir = self.sessions_root / session_id
+        stamp = _session_stamp(session_dir)
+        if stamp[0] is None:
+            self._versions.pop(session_id, None)
+            return None
+        cached = self._versions.get(session_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with open(session_dir / SESSION_FILENAME, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        self._replay_journal(session_dir / SESSION_JOURNAL_FILENAME, data)
+        version = data.get("version", 0)
+        self._versions[session_id] = (stamp, version)
+        return version
+
+    def _write(self, state: WorkflowState, data: dict[str, Any]) -> None:
+        """Persist serialized state and update the catalog."""
+        session_dir = self.sessions_root / state.session_id
+        session_dir.mkdir(parents=True, exist_ok=True)
+
+        previous = self._persisted.get(state.session_id) if self.journal else None
+        entries = self._journal_entries.get(state.session_id, 0)
+        if previous is not None and entries < self.compact_every:
+            self._append_journal(session_dir, previous, data)
+        else:
+            self._write_snapshot(session_dir, data)
+
+        if self.journal:
+            self._persisted[state.session_id] = data
+        self._versions[state.session_id] = (_session_stamp(session_dir), data["version"])
+
+        # Keep the catalog index in step. session.json is the source of
+        # truth, so an index failure must not fail the save.
+        try:
+            self.catalog.upsert(state)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update session catalog for {state.session_id}: {e}")
+
+    def _write_snapshot(self, session_dir: Path, data: dict[str, Any]) -> None:
+        """Rewrite session.json in full and drop any journal it supersedes."""
+        session_file = session_dir / SESSION_FILENAME
+        temp_file = session_file.with_suffix(SESSION_TEMP_SUFFIX)
+
         # Write atomically - write to temp, then rename
         with open(temp_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
 
         temp_file.replace(session_file)
 
-        return session_file
+        (session_dir / SESSION_JOURNAL_FILENAME).unlink(missing_ok=True)
+        self._journal_entries[session_dir.name] = 0
+
+    def _append_journal(
+        self, session_dir: Path, previous: dict[str, Any], data: dict[str, Any]
+    ) -> None:
+        """Append the delta from previous to data to the session journal."""
+        delta = _diff(previous, data)
+        if not delta:
+            return
+
+        journal_file = session_dir / SESSION_JOURNAL_FILENAME
+        lines = []
+        if not journal_file.exists():
+            # Ties the journal to the snapshot it applies to, so a journal
+            # left behind by an interrupted compaction is not replayed twice
+            lines.append(json.dumps({"base": previous.get("updated_at")}))
+        lines.append(json.dumps(delta, ensure_ascii=False))
+
+        with open(journal_file, 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._journal_entries[session_dir.name] = (
+            self._journal_entries.get(session_dir.name, 0) + 1
+        )
     
     def load(self, session_id: str) -> WorkflowState:
         """
@@ -71,18 +304,106 @@ class SessionStore:
             FileNotFoundError: If session doesn't exist
             ValueError: If session.json is invalid
         """
-        session_file = self.sessions_root / session_id / SESSION_FILENAME
+        self._flush_pending(session_id)
+
+        session_dir = self.sessions_root / session_id
+        session_file = session_dir / SESSION_FILENAME
 
         if not session_file.exists():
             raise FileNotFoundError(
                 f"Session '{session_id}' not found at {session_file}"
             )
         
-        with open(session_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with span("session_store.load", **{"aiwf.session_id": session_id}):
+            with open(session_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            entries, valid_length = self._replay_journal(
+                session_dir / SESSION_JOURNAL_FILENAME, data
+            )
+        if self.journal:
+            if valid_length is not None:
+                self._repair_journal(session_id)
+            self._persisted[session_id] = json.loads(json.dumps(data))
+            self._journal_entries[session_id] = entries
 
         return self._deserialize(data)
-    
+
+    @staticmethod
+    def _replay_journal(journal_file: Path, data: dict[str, Any]) -> tuple[int, int | None]:
+        """
+        Apply journaled deltas to snapshot data in place.
+
+        Returns:
+            (entries applied, valid length): valid length is the number of
+            leading bytes of the journal to keep before appending to it (0:
+            the whole journal is stale) if it ends in a torn write or does
+            not apply to this snapshot, else None
+        """
+        try:
+            raw = journal_file.read_bytes()
+        except FileNotFoundError:
+            return 0, None
+        if not raw:
+            return 0, None
+
+        # Complete (newline-terminated) lines and the offset just past each
+        lines: list[tuple[bytes, int]] = []
+        start = 0
+        while (end := raw.find(b"\n", start)) >= 0:
+            lines.append((raw[start:end], end + 1))
+            start = end + 1
+
+        try:
+            header = json.loads(lines[0][0]) if lines else None
+        except json.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("base") != data.get("updated_at"):
+            logger.warning(f"Ignoring stale session journal {journal_file}")
+            return 0, 0
+
+        applied = 0
+        valid_length = lines[0][1]
+        for line, line_end in lines[1:]:
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            data.update(delta.get("set", {}))
+            for key, items in delta.get("append", {}).items():
+                data.setdefault(key, []).extend(items)
+            applied += 1
+            valid_length = line_end
+
+        if valid_length < len(raw):
+            # Torn final write; everything before it is intact
+            logger.warning(f"Ignoring truncated entry in {journal_file}")
+            return applied, valid_length
+        return applied, None
+
+    def _repair_journal(self, session_id: str) -> None:
+        """Drop a torn tail or stale journal, so later appends are replayed.
+
+        Re-checked under the session lock: a writer holding it may have
+        been mid-append when the journal was read.
+        """
+        session_dir = self.sessions_root / session_id
+        journal_file = session_dir / SESSION_JOURNAL_FILENAME
+        with self.lock(session_id):
+            try:
+                with open(session_dir / SESSION_FILENAME, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return
+            _, valid_length = self._replay_journal(journal_file, data)
+            if valid_length is None:
+                return
+            if valid_length == 0:
+                journal_file.unlink(missing_ok=True)
+            else:
+                os.truncate(journal_file, valid_length)
+            self._versions.pop(session_id, None)
+
     def exists(self, session_id: str) -> bool:
         """
         Check if a session exists.
@@ -130,6 +451,88 @@ class SessionStore:
         
         # Remove all files in the directory
         shutil.rmtree(session_dir)
+        self._persisted.pop(session_id, None)
+        self._journal_entries.pop(session_id, None)
+        self._versions.pop(session_id, None)
+
+        try:
+            self.catalog.remove(session_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove {session_id} from session catalog: {e}")
+
+    def query_sessions(
+        self,
+        *,
+        status: str | None = None,
+        phase: str | None = None,
+        profile: str | None = None,
+        limit: int | None = None,
+    ) -> list[SessionCatalogEntry]:
+        """
+        Query sessions from the catalog index without reading session files.
+
+        The catalog is built from disk the first time it is queried, so
+        sessions created before the index existed are still listed.
+
+        Args:
+            status: Only include sessions with this WorkflowStatus value
+            phase: Only include sessions with this WorkflowPhase value
+            profile: Only include sessions for this profile
+            limit: Maximum number of sessions to return
+
+        Returns:
+            Catalog entries sorted by updated_at, most recent first
+        """
+        if not self.catalog.is_built():
+            self.rebuild_index()
+
+        return self.catalog.query(
+            status=status, phase=phase, profile=profile, limit=limit
+        )
+
+    def query_stage_timings(
+        self,
+        *,
+        session_id: str | None = None,
+        profile: str | None = None,
+    ) -> list[StageInterval]:
+        """
+        Query phase/stage timing intervals from the catalog index.
+
+        Like query_sessions(), builds the catalog from disk on first use.
+
+        Args:
+            session_id: Only include this session
+            profile: Only include sessions for this profile
+
+        Returns:
+            Intervals ordered by session and history position
+        """
+        if not self.catalog.is_built():
+            self.rebuild_index()
+
+        return self.catalog.query_stage_timings(session_id=session_id, profile=profile)
+
+    def rebuild_index(self) -> tuple[int, int]:
+        """
+        Rebuild the catalog index from every session.json on disk.
+
+        Sessions that fail to load are skipped and left out of the index.
+
+        Returns:
+            Tuple of (indexed, skipped) session counts
+        """
+        states: list[WorkflowState] = []
+        skipped = 0
+        for session_id in self.list_sessions():
+            try:
+                states.append(self.load(session_id))
+            except Exception as e:
+                logger.warning(f"Skipping session {session_id} while indexing: {e}")
+                skipped += 1
+
+        self.catalog.replace_all(states)
+        return len(states), skipped
 
     def _serialize(self, state: WorkflowState) -> dict[str, Any]:
         """Convert WorkflowState to JSON-serializable dict."""
@@ -158,4 +561,55 @@ class SessionStore:
         try:
             return WorkflowState(**data)
         except Exception as e:
-            raise ValueError(f"Invalid session data: {e}") from e
\ No newline at end of file
+            raise ValueError(f"Invalid session data: {e}") from e
+
+
+def _file_stamp(path: Path) -> _FileStamp:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _session_stamp(session_dir: Path) -> _SessionStamp:
+    """Stamp of a session's state files.
+
+    Snapshots are replaced atomically (new inode) and journal writes only
+    append (new size), so any other writer's save changes the stamp.
+    """
+    return (
+        _file_stamp(session_dir / SESSION_FILENAME),
+        _file_stamp(session_dir / SESSION_JOURNAL_FILENAME),
+    )
+
+
+def _diff(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Compute a journal delta between two serialized states.
+
+    Returns:
+        {"set": {field: value}, "append": {field: [new items]}} with empty
+        parts omitted; an empty dict when nothing changed
+    """
+    changed: dict[str, Any] = {}
+    appended: dict[str, list[Any]] = {}
+    for key, value in current.items():
+        before = previous.get(key)
+        if key in previous and value == before:
+            continue
+        if (
+            key in _APPEND_ONLY_FIELDS
+            and isinstance(before, list)
+            and isinstance(value, list)
+            and value[: len(before)] == before
+        ):
+            appended[key] = value[len(before):]
+        else:
+            changed[key] = value
+
+    delta: dict[str, Any] = {}
+    if changed:
+        delta["set"] = changed
+    if appended:
+        delta["append"] = appended
+    return delta
@@ -0,0 +1,212 @@
+"""SQLite-backed session store for workspaces with many sessions.
+
+Workflow state (including artifacts and phase history) lives in one
+SQLite database under the sessions root instead of a session.json per
+session. Prompt, response and code files stay in the session
+directories on the filesystem.
+
+The database runs in WAL mode, so readers never block the single
+writer and concurrent CLI processes serialize their writes safely.
+Loads and saves are primary-key lookups; listing and filtering go
+through the session catalog, whose table lives in the same database.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from aiwf.domain.constants import DEFAULT_SESSION_LOCK_TIMEOUT, SESSION_DATABASE_FILENAME
+from aiwf.domain.models.workflow_state import WorkflowState
+from aiwf.domain.persistence.session_catalog import SessionCatalog, _ClosingConnection
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_states (
+    session_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+class SqliteSessionStore(SessionStore):
+    """SessionStore that keeps workflow state in a SQLite database.
+
+    Selected with ``session_persistence: sqlite``. Sessions created by the
+    file-based store are not migrated; switch backends on a fresh sessions
+    root.
+    """
+
+    def __init__(
+        self,
+        sessions_root: Path | None = None,
+        *,
+        timeout: float = 30.0,
+        lock_timeout: float = DEFAULT_SESSION_LOCK_TIMEOUT,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            sessions_root: Root directory for all sessions (default: .aiwf/sessions)
+            timeout: Seconds to wait on a locked database before failing
+            lock_timeout: Default seconds to wait for a session lock
+        """
+        super().__init__(sessions_root, lock_timeout=lock_timeout)
+        self.db_path = self.sessions_root / SESSION_DATABASE_FILENAME
+        self.catalog = SessionCatalog(self.db_path, timeout=timeout)
+        self._timeout = timeout
+
+    def save(self, state: WorkflowState) -> Path:
+        """
+        Save workflow state to the database.
+
+        Args:
+            state: The workflow state to persist
+
+        Returns:
+            Path to the session directory
+
+        Raises:
+            sqlite3.Error: If the write fails
+            SessionConflictError: If the session was saved elsewhere since
+                this state was loaded
+        """
+        super().save(state)
+        return self.sessions_root / state.session_id
+
+    def _write(self, state: WorkflowState, data: dict[str, Any]) -> None:
+        """Persist serialized state and update the catalog."""
+        # Session directory still holds prompts, responses and code
+        (self.sessions_root / state.session_id).mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO session_states (session_id, data, version, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    state.session_id,
+                    json.dumps(data, ensure_ascii=False),
+                    data["version"],
+                    data["updated_at"],
+                ),
+            )
+
+        # The state row is the source of truth; the catalog row is derived
+        try:
+            self.catalog.upsert(state)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update session catalog for {state.session_id}: {e}")
+
+    def _stored_version(self, session_id: str) -> int | None:
+        """Return the persisted version of a session, or None if it doesn't exist."""
+        if not self.db_path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM session_states WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def load(self, session_id: str) -> WorkflowState:
+        """
+        Load workflow state from the database.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            The loaded workflow state
+
+        Raises:
+            FileNotFoundError: If session doesn't exist
+            ValueError: If stored state is invalid
+        """
+        self._flush_pending(session_id)
+
+        with span("session_store.load", **{"aiwf.session_id": session_id}), self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM session_states WHERE session_id = ?", (session_id,)
+            ).fetchone()
+
+        if row is None:
+            raise FileNotFoundError(f"Session '{session_id}' not found in {self.db_path}")
+
+        try:
+            data = json.loads(row[0])
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid session data: {e}") from e
+        return self._deserialize(data)
+
+    def exists(self, session_id: str) -> bool:
+        """
+        Check if a session exists.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            True if session exists, False otherwise
+        """
+        if not self.db_path.exists():
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM session_states WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def list_sessions(self) -> list[str]:
+        """
+        List all session IDs.
+
+        Returns:
+            List of session identifiers
+        """
+        if not self.db_path.exists():
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT session_id FROM session_states ORDER BY session_id"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, session_id: str) -> None:
+        """
+        Delete a session, its state row and its directory.
+
+        Args:
+            session_id: The session identifier
+
+        Raises:
+            FileNotFoundError: If session doesn't exist
+        """
+        if not self.exists(session_id):
+            raise FileNotFoundError(f"Session '{session_id}' not found")
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM session_states WHERE session_id = ?", (session_id,))
+
+        shutil.rmtree(self.sessions_root / session_id, ignore_errors=True)
+
+        try:
+            self.catalog.remove(session_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove {session_id} from session catalog: {e}")
+
+    def _connect(self) -> _ClosingConnection:
+        """Open a WAL-mode connection, creating the schema if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=self._timeout)
+        # Persistent per database file; catalog connections inherit it
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        return _ClosingConnection(conn)
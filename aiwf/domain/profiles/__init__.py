@@ -1,7 +1,15 @@
 from .workflow_profile import WorkflowProfile
 from .profile_factory import ProfileFactory
 
-# Import profiles package to trigger profile registration with ProfileFactory
-import profiles  # noqa: F401
 
-__all__ = ["WorkflowProfile", "ProfileFactory"]
\ No newline at end of file
+def _load_jpa_mt() -> type[WorkflowProfile]:
+    # Importing the profiles package registers its profiles with ProfileFactory
+    from profiles.jpa_mt import JpaMtProfile
+
+    return JpaMtProfile
+
+
+# Built-in profiles are imported on first use, not when this package is imported
+ProfileFactory.register_lazy("jpa-mt", _load_jpa_mt)
+
+__all__ = ["WorkflowProfile", "ProfileFactory"]
@@ -1,10 +1,35 @@
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
+
+from aiwf.domain.providers.provider_pool import config_key
+
 from .workflow_profile import WorkflowProfile
 
+logger = logging.getLogger(__name__)
+
+ConfigFingerprint = tuple[tuple[str, int | None, int | None], ...]
+ProfileLoader = Callable[[], type[WorkflowProfile]]
+
+
 class ProfileFactory:
-    """Factory for creating workflow profile instances (Factory pattern)"""
+    """Factory for creating workflow profile instances (Factory pattern)
+
+    create() always builds a new instance. acquire() returns a cached
+    instance shared within the process, keyed by profile class and config,
+    and rebuilt when one of the profile's config files changes on disk.
+
+    register_lazy() registers a profile by a loader that imports its class
+    on first use, so profiles a command never touches are never imported.
+    """
 
     _registry: dict[str, type[WorkflowProfile]] = {}
+    _loaders: dict[str, ProfileLoader] = {}
+    _loaders_lock = threading.RLock()
+    _instances: dict[tuple[Any, ...], tuple[ConfigFingerprint, WorkflowProfile]] = {}
+    _instances_lock = threading.Lock()
 
     @classmethod
     def register(cls, key: str, profile_class: type[WorkflowProfile]) -> None:
@@ -16,6 +41,46 @@ class ProfileFactory:
             profile_class: The profile class to register
         """
         cls._registry[key] = profile_class
+        cls._loaders.pop(key, None)
+        cls._evict(lambda cache_key: cache_key[0] == key)
+
+    @classmethod
+    def register_lazy(cls, key: str, loader: ProfileLoader) -> None:
+        """
+        Register a profile whose class is imported on first use.
+
+        Does not replace a profile already registered with register().
+        If the loader raises, the failure is logged and the profile is
+        treated as not registered.
+
+        Args:
+            key: Profile identifier
+            loader: Returns the profile class (may import its module)
+        """
+        with cls._loaders_lock:
+            if key not in cls._registry:
+                cls._loaders[key] = loader
+
+    @classmethod
+    def _resolve(cls, key: str) -> None:
+        """Run the pending loader for key, if any.
+
+        Callers wait on the lock for a load another thread is running: its
+        loader is popped before the class is registered.
+        """
+        if key in cls._registry:
+            return
+        with cls._loaders_lock:
+            loader = cls._loaders.pop(key, None)
+            if loader is None:
+                return
+            try:
+                profile_class = loader()
+            except Exception as e:
+                logger.warning(f"Failed to load profile '{key}': {e}")
+                return
+            if key not in cls._registry:
+                cls.register(key, profile_class)
 
     @classmethod
     def create(cls, profile_key: str, config: dict[str, Any] | None = None) -> WorkflowProfile:
@@ -32,8 +97,9 @@ class ProfileFactory:
         Raises:
             KeyError: If profile_key is not registered
         """
+        cls._resolve(profile_key)
         if profile_key not in cls._registry:
-            available = ", ".join(cls._registry.keys())
+            available = ", ".join(cls.list_profiles())
             raise KeyError(
                 f"Profile: '{profile_key}' not found. "
                 f"Available profiles: {available}"
@@ -42,7 +108,53 @@ class ProfileFactory:
         profile_class = cls._registry[profile_key]
         config = config or {}
         return profile_class(**config)
-    
+
+    @classmethod
+    def acquire(cls, profile_key: str, config: dict[str, Any] | None = None) -> WorkflowProfile:
+        """
+        Get a cached profile instance, creating it on first use.
+
+        The instance is rebuilt when any file from the profile class's
+        get_config_paths() changes (mtime or size), so edits to config.yml
+        are picked up without restarting a long-running process. Callers
+        share the instance and must not mutate it.
+
+        Args:
+            profile_key: Registered profile identifier
+            config: Optional configuration for the profile
+
+        Returns:
+            Shared WorkflowProfile instance for this key and config
+
+        Raises:
+            KeyError: If profile_key is not registered
+        """
+        cls._resolve(profile_key)
+        profile_class = cls._registry.get(profile_key)
+        cache_key = (profile_key, profile_class, config_key(config))
+        fingerprint = _config_fingerprint(profile_class)
+
+        with cls._instances_lock:
+            cached = cls._instances.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        profile = cls.create(profile_key, config=config)
+        with cls._instances_lock:
+            cls._instances[cache_key] = (fingerprint, profile)
+        return profile
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Drop all cached profile instances."""
+        cls._evict(lambda cache_key: True)
+
+    @classmethod
+    def _evict(cls, predicate: Callable[[tuple[Any, ...]], bool]) -> None:
+        with cls._instances_lock:
+            for cache_key in [k for k in cls._instances if predicate(k)]:
+                del cls._instances[cache_key]
+
     @classmethod
     def list_profiles(cls) -> list[str]:
         """
@@ -51,7 +163,7 @@ class ProfileFactory:
         Returns:
             List of registered profile identifiers
         """
-        return list(cls._registry.keys())
+        return list(dict.fromkeys([*cls._registry, *cls._loaders]))
 
     @classmethod
     def is_registered(cls, profile_key: str) -> bool:
@@ -64,7 +176,7 @@ class ProfileFactory:
         Returns:
             True if profile is registered, False otherwise
         """
-        return profile_key in cls._registry
+        return profile_key in cls._registry or profile_key in cls._loaders
 
     @classmethod
     def get_all_metadata(cls) -> list[dict[str, Any]]:
@@ -74,6 +186,8 @@ class ProfileFactory:
         Returns:
             List of metadata dicts from each registered profile
         """
+        for key in list(cls._loaders):
+            cls._resolve(key)
         return [
             profile_class.get_metadata()
             for profile_class in cls._registry.values()
@@ -90,6 +204,7 @@ class ProfileFactory:
         Returns:
             Metadata dict if found, None otherwise
         """
+        cls._resolve(profile_key)
         if profile_key not in cls._registry:
             return None
         return cls._registry[profile_key].get_metadata()
@@ -104,28 +219,52 @@ class ProfileFactory:
         Returns:
             Profile class if registered, None otherwise
         """
+        cls._resolve(name)
         return cls._registry.get(name)
 
     @classmethod
     def clear(cls) -> None:
-        """Clear registry (for testing)."""
+        """Clear registry and cached instances (for testing)."""
         cls._registry.clear()
+        cls._loaders.clear()
+        cls.clear_instances()
 
     @classmethod
-    def snapshot(cls) -> dict[str, type[WorkflowProfile]]:
+    def snapshot(cls) -> dict[str, type[WorkflowProfile] | ProfileLoader]:
         """Capture current registry state for later restoration.
 
         Returns:
-            Copy of the current registry dict.
+            Copy of the registry, with pending lazy loaders for profiles
+            not loaded yet.
         """
-        return dict(cls._registry)
+        return {**cls._loaders, **cls._registry}
 
     @classmethod
-    def restore(cls, snapshot: dict[str, type[WorkflowProfile]]) -> None:
+    def restore(cls, snapshot: dict[str, type[WorkflowProfile] | ProfileLoader]) -> None:
         """Restore registry to a previously captured state.
 
         Args:
             snapshot: Registry state from a previous snapshot() call.
         """
         cls._registry.clear()
-        cls._registry.update(snapshot)
\ No newline at end of file
+        cls._loaders.clear()
+        for key, entry in snapshot.items():
+            if isinstance(entry, type):
+                cls._registry[key] = entry
+            else:
+                cls._loaders[key] = entry
+        cls.clear_instances()
+
+
+def _config_fingerprint(profile_class: type[WorkflowProfile] | None) -> ConfigFingerprint:
+    """Return (path, mtime_ns, size) for each config file of profile_class."""
+    get_paths = getattr(profile_class, "get_config_paths", None)
+    paths: list[Path] = list(get_paths()) if callable(get_paths) else []
+    fingerprint = []
+    for path in paths:
+        try:
+            st = path.stat()
+            fingerprint.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            fingerprint.append((str(path), None, None))
+    return tuple(fingerprint)
@@ -32,6 +32,15 @@ class WorkflowProfile(ABC):
             "can_regenerate_prompts": False,  # ADR-0015: Enable prompt regeneration on rejection
         }
 
+    @classmethod
+    def get_config_paths(cls) -> list[Path]:
+        """Return config files read when constructing this profile.
+
+        ProfileFactory.acquire() rebuilds its cached instance when any of
+        these files changes. Profiles without on-disk config return [].
+        """
+        return []
+
     def validate_metadata(self, metadata: dict[str, Any] | None) -> None:
         """Validate metadata required by this profile.
 
@@ -11,6 +11,7 @@ from .approval_provider import (
     SkipApprovalProvider,
     ManualApprovalProvider,
 )
+from .approval_files import ApprovalFile, ApprovalFiles
 from .ai_approval_provider import AIApprovalProvider
 from .approval_factory import ApprovalProviderFactory
 
@@ -30,6 +31,8 @@ __all__ = [
     "ApprovalProvider",
     "SkipApprovalProvider",
     "ManualApprovalProvider",
+    "ApprovalFile",
+    "ApprovalFiles",
     "AIApprovalProvider",
     "ApprovalProviderFactory",
 ]
@@ -2,15 +2,25 @@
 
 ADR-0015: Wraps any AIProvider to function as an ApprovalProvider.
 Uses standardized prompt templates per phase/stage.
+
+File content is fitted into a per-approver token budget. Content is
+allocated by priority (criteria, plan, review and issue files, then code
+files mentioned in the plan, smallest first) and read from disk only up to
+what fits. Files cut short or left out are recorded in the ApprovalResult.
 """
 
 import logging
 import re
+import string
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
+from aiwf.domain.command_profiler import provider_span
+from aiwf.domain.models.ai_provider_result import AIProviderResult
 from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
 from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
+from aiwf.domain.providers.approval_files import ApprovalFile, ApprovalFiles
 from aiwf.domain.providers.approval_provider import ApprovalProvider
 from aiwf.domain.providers.ai_provider import AIProvider
 
@@ -19,7 +29,25 @@ logger = logging.getLogger(__name__)
 
 # Size limits for file content in prompts (review feedback)
 MAX_FILE_CONTENT_SIZE = 50_000  # 50KB per file
-MAX_TOTAL_CONTENT_SIZE = 200_000  # 200KB total
+DEFAULT_TOKEN_BUDGET = 50_000  # ~200KB of file content per prompt
+
+# A file cut shorter than this is left out instead
+MIN_PREFIX_SIZE = 1_000
+
+# Rough token estimate; avoids depending on a provider-specific tokenizer
+CHARS_PER_TOKEN = 4
+
+# Placeholders filled with file content, highest priority first
+_CONTENT_PRIORITY = (
+    "criteria",
+    "plan_content",
+    "review_content",
+    "issues_content",
+    "code_files",
+    "content",
+)
+
+_SKIPPED = "[Skipped - token budget exhausted]"
 
 
 # Approval prompt templates per phase/stage
@@ -125,6 +153,48 @@ FEEDBACK: [Your feedback if rejected, or "None" if approved]
 """
 
 
+class _PromptBudget:
+    """File content allowance for one approval prompt.
+
+    Records which files were cut short or left out.
+    """
+
+    def __init__(self, tokens: int) -> None:
+        self.remaining = tokens * CHARS_PER_TOKEN
+        self.truncated: list[str] = []
+        self.omitted: list[str] = []
+
+    def read(self, handle: ApprovalFile) -> str | None:
+        """Read as much of a file as fits.
+
+        Returns:
+            Content (with a truncation note if cut short), _SKIPPED if the
+            budget is exhausted, or None if the content is unavailable
+        """
+        if self.remaining <= 0:
+            if handle.size is not None:
+                self.omitted.append(handle.path)
+                return _SKIPPED
+            return None
+
+        limit = min(MAX_FILE_CONTENT_SIZE, self.remaining)
+        prefix = handle.read_prefix(limit)
+        if prefix is None:
+            return None
+
+        text, truncated = prefix
+        if truncated and limit < MIN_PREFIX_SIZE:
+            # Too little left to show a useful part of this file
+            self.omitted.append(handle.path)
+            return _SKIPPED
+        self.remaining -= len(text)
+        if not truncated:
+            return text
+        logger.warning(f"File {handle.path} truncated to {len(text)} chars for approval prompt")
+        self.truncated.append(handle.path)
+        return text + f"\n\n[...truncated, showing first {len(text)} chars]"
+
+
 class AIApprovalProvider(ApprovalProvider):
     """Wraps an AIProvider to function as an ApprovalProvider.
 
@@ -132,20 +202,23 @@ class AIApprovalProvider(ApprovalProvider):
     approval decisions from any AI provider.
     """
 
-    def __init__(self, ai_provider: AIProvider):
+    def __init__(self, ai_provider: AIProvider, token_budget: int = DEFAULT_TOKEN_BUDGET):
         """Initialize with an AI provider to wrap.
 
         Args:
             ai_provider: The underlying provider to use for evaluation
+            token_budget: Tokens of file content allowed per prompt; a
+                "token_budget" in the evaluation context overrides it
         """
         self._provider = ai_provider
+        self._token_budget = token_budget
 
     def evaluate(
         self,
         *,
         phase: WorkflowPhase,
         stage: WorkflowStage,
-        files: dict[str, str | None],
+        files: Mapping[str, str | None],
         context: dict[str, Any],
     ) -> ApprovalResult:
         """Build approval prompt, call provider, parse response.
@@ -153,61 +226,77 @@ class AIApprovalProvider(ApprovalProvider):
         Args:
             phase: Current workflow phase
             stage: Current stage
-            files: Dict of filepath -> content
+            files: Mapping of filepath -> content
             context: Session metadata and criteria
 
         Returns:
             ApprovalResult with decision and feedback
         """
-        prompt = self._build_prompt(phase, stage, files, context)
+        prompt, budget = self._build_prompt(phase, stage, files, context)
+        with provider_span():
+            result = self._provider.generate(prompt, context)
+        return self._to_approval_result(result, context, budget)
 
-        result = self._provider.generate(prompt, context)
+    def _to_approval_result(
+        self,
+        result: AIProviderResult | None,
+        context: dict[str, Any],
+        budget: _PromptBudget,
+    ) -> ApprovalResult:
+        """Convert the wrapped provider's result into an approval decision."""
         if result is None:
             # Provider returned None (e.g., manual provider wrapped incorrectly)
             logger.warning("Wrapped provider returned None - rejecting")
-            return ApprovalResult(
+            approval = ApprovalResult(
                 decision=ApprovalDecision.REJECTED,
                 feedback="Provider returned no response",
             )
-
-        if result.response is None:
+        elif result.response is None:
             # Provider returned AIProviderResult with no response text
             # (e.g., file-only provider that writes but doesn't return text)
             logger.warning("Wrapped provider returned result with no response text - rejecting")
-            return ApprovalResult(
+            approval = ApprovalResult(
                 decision=ApprovalDecision.REJECTED,
                 feedback="Provider returned no response text for approval evaluation",
             )
-
-        return self._parse_response(result.response, context)
+        else:
+            approval = self._parse_response(result.response, context)
+
+        if not (budget.truncated or budget.omitted):
+            return approval
+        return approval.model_copy(
+            update={
+                "truncated_files": tuple(budget.truncated),
+                "omitted_files": tuple(budget.omitted),
+            }
+        )
 
     def _build_prompt(
         self,
         phase: WorkflowPhase,
         stage: WorkflowStage,
-        files: dict[str, str | None],
+        files: Mapping[str, str | None],
         context: dict[str, Any],
-    ) -> str:
-        """Build approval prompt from template."""
+    ) -> tuple[str, _PromptBudget]:
+        """Build approval prompt from template.
+
+        Only the placeholders the template uses are filled, in
+        _CONTENT_PRIORITY order, so higher priority content is read first
+        and gets the budget first.
+
+        Returns:
+            The prompt, and the budget recording truncated/omitted files
+        """
         template_key = (phase.value, stage.value)
         template = APPROVAL_TEMPLATES.get(template_key, FALLBACK_TEMPLATE)
+        fields = {name for _, name, _, _ in string.Formatter().parse(template) if name}
 
         allow_rewrite = context.get("allow_rewrite", False)
+        handles = ApprovalFiles.of(files)
+        budget = _PromptBudget(context.get("token_budget") or self._token_budget)
 
         # Build substitution dict
         subs = {
-            "plan_content": self._get_file_content(
-                files, context, "plan_file", "plan.md"
-            ),
-            "code_files": self._format_code_files(files),
-            "review_content": self._get_file_content(
-                files, context, "review_file", "review-response.md"
-            ),
-            "issues_content": self._get_file_content(
-                files, context, "revision_issues_file", "revision-issues.md"
-            ),
-            "criteria": self._load_criteria(context),
-            "content": self._format_all_files(files),
             "rewrite_instruction": (
                 "- You may suggest a rewrite if needed" if allow_rewrite else ""
             ),
@@ -217,57 +306,74 @@ class AIApprovalProvider(ApprovalProvider):
                 else ""
             ),
         }
+        # Text the code files are ranked against
+        references: list[str] = []
+        for name in _CONTENT_PRIORITY:
+            if name not in fields:
+                continue
+            if name == "criteria":
+                subs[name] = self._load_criteria(context, budget)
+            elif name == "plan_content":
+                subs[name] = self._get_file_content(
+                    handles, context, "plan_file", "plan.md", budget
+                )
+            elif name == "review_content":
+                subs[name] = self._get_file_content(
+                    handles, context, "review_file", "review-response.md", budget
+                )
+            elif name == "issues_content":
+                subs[name] = self._get_file_content(
+                    handles, context, "revision_issues_file", "revision-issues.md", budget
+                )
+            elif name == "code_files":
+                subs[name] = self._format_code_files(handles, budget, "\n".join(references))
+            else:
+                subs[name] = self._format_all_files(handles, budget)
+            references.append(subs[name])
 
-        return template.format(**subs)
+        return template.format(**subs), budget
 
     def _get_file_content(
         self,
-        files: dict[str, str | None],
+        files: ApprovalFiles,
         context: dict[str, Any],
         context_key: str,
         default_name: str,
+        budget: _PromptBudget,
     ) -> str:
-        """Get file content from files dict or context path.
+        """Get file content from files mapping, by context path or name.
 
         Args:
-            files: Dict of filepath -> content
+            files: Files offered to the approver
             context: Context dict with file paths
             context_key: Key in context for file path
             default_name: Default filename suffix to match
+            budget: Prompt budget to read within
 
         Returns:
             File content or placeholder message
         """
+        candidates: list[ApprovalFile] = []
         # Try context-specified path first
         file_path = context.get(context_key)
         if file_path and file_path in files:
-            content = files[file_path]
-            if content is not None:
-                return self._truncate_content(content, file_path)
+            candidates.append(files.handle(file_path))
+        # Then the default name pattern
+        candidates.extend(h for h in files.handles() if h.path.endswith(default_name))
 
-        # Try default name pattern
-        for path, content in files.items():
-            if path.endswith(default_name) and content is not None:
-                return self._truncate_content(content, path)
+        for handle in candidates:
+            content = budget.read(handle)
+            if content is not None:
+                return content
 
         return "[Content not available]"
 
-    def _truncate_content(self, content: str, path: str) -> str:
-        """Truncate content if it exceeds size limit."""
-        if len(content) <= MAX_FILE_CONTENT_SIZE:
-            return content
-
-        truncated = content[:MAX_FILE_CONTENT_SIZE]
-        logger.warning(
-            f"File {path} truncated from {len(content)} to {MAX_FILE_CONTENT_SIZE} chars"
-        )
-        return truncated + f"\n\n[...truncated from {len(content)} chars]"
-
-    def _load_criteria(self, context: dict[str, Any]) -> str:
+    def _load_criteria(self, context: dict[str, Any], budget: _PromptBudget) -> str:
         """Load criteria content from file path in context.
 
         Args:
             context: Context dict with optional criteria_file path
+            budget: Prompt budget to read within
 
         Returns:
             Criteria content or default message
@@ -281,8 +387,8 @@ class AIApprovalProvider(ApprovalProvider):
         try:
             path = Path(criteria_path)
             if path.exists() and path.is_file():
-                content = path.read_text(encoding="utf-8")
-                return self._truncate_content(content, str(path))
+                content = budget.read(ApprovalFile(path))
+                return content if content is not None else default_criteria
             else:
                 logger.warning(f"Criteria file not found: {criteria_path}")
                 return default_criteria
@@ -290,48 +396,37 @@ class AIApprovalProvider(ApprovalProvider):
             logger.warning(f"Error loading criteria file {criteria_path}: {e}")
             return default_criteria
 
-    def _format_code_files(self, files: dict[str, str | None]) -> str:
+    def _format_code_files(
+        self, files: ApprovalFiles, budget: _PromptBudget, references: str = ""
+    ) -> str:
         """Format code files for inclusion in prompt.
 
-        Excludes markdown files and applies size limits.
+        Excludes markdown files. Files named in references (the plan or
+        issues text already in the prompt) come first, then smaller files
+        before larger ones, so the budget covers as many files as possible.
         """
-        parts = []
-        total_size = 0
-
-        for path, content in files.items():
-            # Skip non-code files
-            if path.endswith((".md", "-prompt.md", "-response.md")):
-                continue
-
-            if content is not None:
-                truncated = self._truncate_content(content, path)
-                total_size += len(truncated)
-
-                if total_size > MAX_TOTAL_CONTENT_SIZE:
-                    parts.append(f"### {path}\n[Skipped - total size limit reached]")
-                    continue
+        code = [h for h in files.handles() if not h.path.endswith(".md")]
+        code.sort(key=lambda h: (Path(h.path).name not in references, _size_key(h)))
 
-                parts.append(f"### {path}\n```\n{truncated}\n```")
+        parts = []
+        for handle in code:
+            content = budget.read(handle)
+            if content == _SKIPPED:
+                parts.append(f"### {handle.path}\n{_SKIPPED}")
+            elif content is not None:
+                parts.append(f"### {handle.path}\n```\n{content}\n```")
             else:
-                parts.append(f"### {path}\n[File exists but content not provided]")
+                parts.append(f"### {handle.path}\n[File exists but content not provided]")
 
         return "\n\n".join(parts) if parts else "[No code files]"
 
-    def _format_all_files(self, files: dict[str, str | None]) -> str:
-        """Format all files for inclusion in prompt."""
+    def _format_all_files(self, files: ApprovalFiles, budget: _PromptBudget) -> str:
+        """Format all files for inclusion in prompt, smallest first."""
         parts = []
-        total_size = 0
-
-        for path, content in files.items():
+        for handle in sorted(files.handles(), key=_size_key):
+            content = budget.read(handle)
             if content is not None:
-                truncated = self._truncate_content(content, path)
-                total_size += len(truncated)
-
-                if total_size > MAX_TOTAL_CONTENT_SIZE:
-                    parts.append(f"### {path}\n[Skipped - total size limit reached]")
-                    continue
-
-                parts.append(f"### {path}\n{truncated}")
+                parts.append(f"### {handle.path}\n{content}")
 
         return "\n\n".join(parts) if parts else "[No files]"
 
@@ -401,3 +496,8 @@ class AIApprovalProvider(ApprovalProvider):
             "description": "AI-powered approval via AIProvider",
             "fs_ability": "varies",  # Depends on wrapped provider
         }
+
+
+def _size_key(handle: ApprovalFile) -> float:
+    size = handle.size
+    return size if size is not None else float("inf")
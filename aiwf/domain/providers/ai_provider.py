@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
@@ -82,4 +83,48 @@ class AIProvider(ABC):
         Raises:
             ProviderError: If the provider call fails (network, auth, timeout, etc.)
         """
-        ...
\ No newline at end of file
+        ...
+
+    async def agenerate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        system_prompt: str | None = None,
+        connection_timeout: int | None = None,
+        response_timeout: int | None = None,
+    ) -> "AIProviderResult | None":
+        """Async variant of generate().
+
+        Natively async providers override this and implement generate() as
+        a thin wrapper around it. The default runs the sync generate() in a
+        worker thread so sync-only providers never block the event loop.
+
+        Args:
+            prompt: The prompt text to send
+            context: Optional context dictionary (see generate())
+            system_prompt: Optional system prompt for providers that support it
+            connection_timeout: Timeout for establishing connection (None = use default)
+            response_timeout: Timeout for receiving response (None = use default)
+
+        Returns:
+            Same as generate()
+
+        Raises:
+            ProviderError: If the provider call fails (network, auth, timeout, etc.)
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt,
+            context=context,
+            system_prompt=system_prompt,
+            connection_timeout=connection_timeout,
+            response_timeout=response_timeout,
+        )
+
+    def close(self) -> None:
+        """Release long-lived resources held by this instance.
+
+        Instances are pooled and reused across calls (see AIProviderFactory.acquire),
+        so providers may keep an SDK client or CLI process open between calls.
+        Called when a pooled instance expires or is evicted. Default: no-op.
+        """
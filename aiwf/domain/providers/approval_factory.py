@@ -5,6 +5,7 @@ ADR-0015: Registry pattern for approval provider instantiation.
 
 from typing import Any
 
+from aiwf.domain.models.ai_provider_result import AIProviderResult
 from aiwf.domain.providers.approval_provider import (
     ApprovalProvider,
     SkipApprovalProvider,
@@ -14,6 +15,22 @@ from aiwf.domain.providers.ai_approval_provider import AIApprovalProvider
 from aiwf.domain.providers.provider_factory import AIProviderFactory
 
 
+class _LeasedAIProvider:
+    """Pooled AI provider that is leased from AIProviderFactory per call.
+
+    An approver can outlive the pooled instance's TTL; leasing for each
+    generate() keeps the pool from closing the instance mid-evaluation.
+    """
+
+    def __init__(self, key: str, config: dict[str, Any] | None) -> None:
+        self._key = key
+        self._config = config
+
+    def generate(self, *args: Any, **kwargs: Any) -> AIProviderResult | None:
+        with AIProviderFactory.lease(self._key, self._config) as provider:
+            return provider.generate(*args, **kwargs)
+
+
 class ApprovalProviderFactory:
     """Factory for creating approval provider instances.
 
@@ -64,7 +81,7 @@ class ApprovalProviderFactory:
 
         # Fall back to creating AIApprovalProvider wrapping an AI provider
         try:
-            ai_provider = AIProviderFactory.create(key, config)
+            ai_provider = AIProviderFactory.acquire(key, config)
 
             # Validate fs_ability - approval providers must READ files to evaluate
             metadata = ai_provider.get_metadata()
@@ -77,7 +94,7 @@ class ApprovalProviderFactory:
                     f"to evaluate artifacts. Use 'manual' for human approval."
                 )
 
-            return AIApprovalProvider(ai_provider=ai_provider)
+            return AIApprovalProvider(ai_provider=_LeasedAIProvider(key, config))
         except KeyError:
             builtin_keys = list(cls._registry.keys())
             ai_keys = AIProviderFactory.list_providers()
@@ -0,0 +1,145 @@
+"""Lazy file handles passed to approval providers.
+
+The approval gate hands approvers a files mapping of filepath -> content.
+ApprovalFiles implements that mapping without reading anything up front:
+a file is read in full only when its value is looked up, and approvers
+that build bounded prompts (AIApprovalProvider) read a prefix of each file
+through its ApprovalFile handle instead.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+
+# Full reader for a file on disk: content, or None if it does not exist
+FileReader = Callable[[Path], str | None]
+
+_NOT_READ = object()
+
+
+def _read_from_disk(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class ApprovalFile:
+    """A file offered to an approver, read on demand.
+
+    Attributes:
+        path: File path as given to the approver (the files mapping key)
+    """
+
+    def __init__(self, path: str | Path, reader: FileReader | None = None) -> None:
+        """Initialize a handle on a file on disk.
+
+        Args:
+            path: Path of the file
+            reader: Full reader (default: Path.read_text). The approval gate
+                passes SessionFileGateway.read_file so full reads share the
+                command's session file cache.
+        """
+        self.path = str(path)
+        self._file: Path | None = Path(path)
+        self._reader = reader or _read_from_disk
+        self._content: object = _NOT_READ
+
+    @classmethod
+    def from_content(cls, path: str, content: str | None) -> "ApprovalFile":
+        """Handle on content already in memory (None: not provided)."""
+        handle = cls(path)
+        handle._file = None
+        handle._content = content
+        return handle
+
+    @property
+    def size(self) -> int | None:
+        """Size without reading the file: characters if in memory, else bytes.
+
+        None if the file does not exist or its content was not provided.
+        """
+        if self._content is not _NOT_READ:
+            return len(self._content) if isinstance(self._content, str) else None
+        try:
+            return self._file.stat().st_size if self._file is not None else None
+        except OSError:
+            return None
+
+    def read(self) -> str | None:
+        """Full content (read once), or None if unavailable."""
+        if self._content is _NOT_READ:
+            self._content = self._reader(self._file) if self._file is not None else None
+        return self._content  # type: ignore[return-value]
+
+    def read_prefix(self, max_chars: int) -> tuple[str, bool] | None:
+        """Read at most max_chars characters from the start of the file.
+
+        Only the prefix is read from disk, unless the file was already read
+        in full.
+
+        Returns:
+            (text, truncated), where truncated means the file is longer than
+            max_chars, or None if the content is unavailable
+        """
+        if self._content is not _NOT_READ or self._file is None:
+            content = self.read()
+            if content is None:
+                return None
+            return content[:max_chars], len(content) > max_chars
+        try:
+            # Text mode: universal newlines, as Path.read_text
+            with self._file.open(encoding="utf-8", errors="replace") as f:
+                text = f.read(max_chars + 1)
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+        return text[:max_chars], len(text) > max_chars
+
+
+class ApprovalFiles(Mapping[str, str | None]):
+    """Mapping of filepath -> content whose values are read on first access.
+
+    Behaves like the plain dict approvers have always received; handle()
+    gives access to the underlying ApprovalFile for bounded reads.
+    """
+
+    def __init__(self, handles: Iterable[ApprovalFile] = ()) -> None:
+        self._handles: dict[str, ApprovalFile] = {h.path: h for h in handles}
+
+    @classmethod
+    def of(cls, files: Mapping[str, str | None]) -> "ApprovalFiles":
+        """Wrap a files mapping (returned unchanged if already ApprovalFiles)."""
+        if isinstance(files, ApprovalFiles):
+            return files
+        return cls(ApprovalFile.from_content(path, content) for path, content in files.items())
+
+    def add(self, handle: ApprovalFile) -> None:
+        """Add (or replace) a file."""
+        self._handles[handle.path] = handle
+
+    def handle(self, path: str) -> ApprovalFile:
+        """The ApprovalFile for path.
+
+        Raises:
+            KeyError: If path is not in the mapping
+        """
+        return self._handles[path]
+
+    def handles(self) -> list[ApprovalFile]:
+        """All files, in insertion order."""
+        return list(self._handles.values())
+
+    def __getitem__(self, path: str) -> str | None:
+        return self._handles[path].read()
+
+    def __contains__(self, path: object) -> bool:
+        # Mapping's default looks the value up, which would read the file
+        return path in self._handles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._handles)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __repr__(self) -> str:
+        return f"ApprovalFiles({list(self._handles)!r})"
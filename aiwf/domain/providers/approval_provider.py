@@ -5,6 +5,7 @@ Profiles contribute criteria to context - approvers don't contain domain knowled
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
 from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
@@ -31,7 +32,7 @@ class ApprovalProvider(ABC):
         *,
         phase: WorkflowPhase,
         stage: WorkflowStage,
-        files: dict[str, str | None],
+        files: Mapping[str, str | None],
         context: dict[str, Any],
     ) -> ApprovalResult:
         """Evaluate content and return approval decision.
@@ -39,8 +40,10 @@ class ApprovalProvider(ABC):
         Args:
             phase: Current workflow phase (plan, generate, review, revise)
             stage: Current stage (prompt or response)
-            files: Dict of filepath -> content. None value means provider should
+            files: Mapping of filepath -> content. None value means provider should
                    read file directly (for local-read/write capable providers).
+                   The approval gate passes an ApprovalFiles mapping, which
+                   reads each file when its content is looked up.
             context: Session metadata and criteria, including:
                 - session_id: Session identifier
                 - iteration: Current iteration number
@@ -80,7 +83,7 @@ class SkipApprovalProvider(ApprovalProvider):
         *,
         phase: WorkflowPhase,
         stage: WorkflowStage,
-        files: dict[str, str | None],
+        files: Mapping[str, str | None],
         context: dict[str, Any],
     ) -> ApprovalResult:
         """Always approve."""
@@ -107,7 +110,7 @@ class ManualApprovalProvider(ApprovalProvider):
         *,
         phase: WorkflowPhase,
         stage: WorkflowStage,
-        files: dict[str, str | None],
+        files: Mapping[str, str | None],
         context: dict[str, Any],
     ) -> ApprovalResult:
         """Return PENDING to signal pause for user input."""
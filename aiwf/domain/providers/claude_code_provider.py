@@ -6,16 +6,21 @@ approach for production automation.
 
 Claude Code is a local-write provider: it writes files directly using
 its Write tool. The engine validates files exist after execution.
+
+Text output is streamed into the response file (when the engine passes a
+response_path) rather than buffered until the SDK stream ends.
 """
 
-import asyncio
 import shutil
 import warnings
+from pathlib import Path
 from typing import Any
 
 from aiwf.domain.errors import ProviderError
 from aiwf.domain.models.ai_provider_result import AIProviderResult
 from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.event_loop import run_sync
+from aiwf.domain.providers.response_stream import ResponseStream
 
 
 # Default tools for Claude Code - includes Write for file creation
@@ -177,13 +182,15 @@ class ClaudeCodeAIProvider(AIProvider):
     ) -> AIProviderResult:
         """Generate response using Claude Agent SDK.
 
-        Uses asyncio.run() to wrap the async SDK in a sync interface.
+        Thin sync wrapper around agenerate() (see run_sync()).
 
         Args:
             prompt: The prompt text to send to Claude
             context: Optional context dictionary with:
                 - session_dir: Path to session directory
                 - project_root: Path to project root
+                - response_path: Response file to stream text into
+                - on_progress: Progress callback (see ResponseStream)
             system_prompt: Optional system prompt (passed via SDK)
             connection_timeout: Not used (SDK handles internally)
             response_timeout: Not used (SDK handles via max_turns)
@@ -191,12 +198,39 @@ class ClaudeCodeAIProvider(AIProvider):
         Returns:
             AIProviderResult with:
                 - response: Text response from Claude
-                - files: Dict of files written (path -> None for SDK-written files)
+                - files: Dict of files written (path -> None for SDK-written
+                  files, including the streamed response file)
+                - ttft_seconds / latency_seconds: Timing of the SDK stream
+
+        Raises:
+            ProviderError: If SDK fails
+        """
+        return run_sync(self.agenerate(prompt, context, system_prompt))
+
+    async def agenerate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        system_prompt: str | None = None,
+        connection_timeout: int | None = None,
+        response_timeout: int | None = None,
+    ) -> AIProviderResult:
+        """Generate response using Claude Agent SDK on the caller's event loop.
+
+        Args:
+            prompt: The prompt text to send to Claude
+            context: Optional context dictionary (see generate())
+            system_prompt: Optional system prompt (passed via SDK)
+            connection_timeout: Not used (SDK handles internally)
+            response_timeout: Not used (SDK handles via max_turns)
+
+        Returns:
+            AIProviderResult with response text and files written
 
         Raises:
             ProviderError: If SDK fails
         """
-        return asyncio.run(self._async_generate(prompt, context, system_prompt))
+        return await self._async_generate(prompt, context, system_prompt)
 
     async def _async_generate(
         self,
@@ -216,7 +250,7 @@ class ClaudeCodeAIProvider(AIProvider):
         """
         try:
             from claude_agent_sdk import query, ClaudeAgentOptions
-            from claude_agent_sdk.types import AssistantMessage, ToolUseBlock
+            from claude_agent_sdk.types import AssistantMessage, ResultMessage, ToolUseBlock
         except ImportError:
             raise ProviderError(
                 "claude-agent-sdk not installed. "
@@ -225,28 +259,54 @@ class ClaudeCodeAIProvider(AIProvider):
 
         options = self._build_options(context, system_prompt)
 
-        response_text = ""
+        response_path = context.get("response_path") if context else None
+        stream = ResponseStream(
+            Path(response_path) if response_path else None,
+            on_progress=context.get("on_progress") if context else None,
+        )
         files_written: dict[str, None] = {}
+        usage: ResultMessage | None = None
 
         try:
             async for message in query(prompt=prompt, options=options):
+                if isinstance(message, ResultMessage):
+                    # Final message carries token usage and cost
+                    usage = message
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
-                        # Collect text response
+                        # Stream text response as it arrives
                         if hasattr(block, "text"):
-                            response_text += block.text
+                            stream.write(block.text)
 
                         # Track file writes via ToolUseBlock
-                        if isinstance(block, ToolUseBlock) and block.name == "Write":
-                            file_path = block.input.get("file_path")
-                            if file_path:
-                                files_written[file_path] = None
+                        if isinstance(block, ToolUseBlock):
+                            stream.tool_call(block.name)
+                            if block.name == "Write":
+                                file_path = block.input.get("file_path")
+                                if file_path:
+                                    files_written[file_path] = None
 
         except Exception as e:
+            stream.abort()
             # Handle known SDK exceptions with actionable messages
             raise self._wrap_sdk_error(e)
-
-        return AIProviderResult(response=response_text, files=files_written)
+        except BaseException:
+            # Cancelled (e.g. run timeout): keep what arrived as a partial file
+            stream.abort()
+            raise
+
+        stream.complete(files_written)
+
+        input_tokens, output_tokens = _token_counts(usage.usage if usage else None)
+        return AIProviderResult(
+            response=stream.text,
+            files=files_written,
+            ttft_seconds=stream.ttft_seconds,
+            latency_seconds=stream.latency_seconds,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=usage.total_cost_usd if usage else None,
+        )
 
     def _build_options(
         self,
@@ -331,3 +391,23 @@ class ClaudeCodeAIProvider(AIProvider):
         else:
             # Generic fallback for unknown exceptions
             return ProviderError(f"Claude Agent SDK error ({error_type}): {error}")
+
+
+def _token_counts(usage: dict[str, Any] | None) -> tuple[int | None, int | None]:
+    """Extract (input, output) token counts from SDK usage.
+
+    Input includes prompt-cache reads and writes, which the API reports
+    separately from uncached input tokens.
+    """
+    if not usage:
+        return None, None
+    input_counts = [
+        usage[key]
+        for key in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+        if isinstance(usage.get(key), int)
+    ]
+    output_tokens = usage.get("output_tokens")
+    return (
+        sum(input_counts) if input_counts else None,
+        output_tokens if isinstance(output_tokens, int) else None,
+    )
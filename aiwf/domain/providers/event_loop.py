@@ -0,0 +1,60 @@
+"""Shared event loop support for async-capable providers.
+
+Async providers expose ``agenerate()`` and keep ``generate()`` as a thin
+sync wrapper built on ``run_sync()``. Outside of an async orchestrator,
+``run_sync()`` behaves like ``asyncio.run()``. When sync workflow code runs
+in a worker thread on behalf of ``AsyncWorkflowOrchestrator``, the
+orchestrator's loop is published through ``shared_loop`` and coroutines
+are scheduled on that loop instead of on a throwaway per-call loop.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Coroutine, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Loop owned by the active async orchestrator (None = no shared loop).
+# A ContextVar rather than a thread-local so asyncio.to_thread() workers
+# inherit it from the awaiting coroutine.
+shared_loop: ContextVar[asyncio.AbstractEventLoop | None] = ContextVar(
+    "aiwf_shared_loop", default=None
+)
+
+
+@contextmanager
+def use_shared_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Publish loop as the shared loop for the duration of the block."""
+    token = shared_loop.set(loop)
+    try:
+        yield
+    finally:
+        shared_loop.reset(token)
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses the shared loop when one is published and running in another
+    thread; otherwise falls back to ``asyncio.run()``.
+
+    Raises:
+        RuntimeError: If called from the shared loop's own thread (the
+            caller must ``await`` the coroutine instead of blocking the loop)
+    """
+    loop = shared_loop.get()
+    if loop is None or not loop.is_running() or loop.is_closed():
+        return asyncio.run(coro)
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            "run_sync() called on the shared event loop thread; await the coroutine instead"
+        )
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
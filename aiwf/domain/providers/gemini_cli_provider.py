@@ -1,7 +1,9 @@
 """Gemini CLI AI provider using subprocess.
 
 Uses Gemini CLI with stream-json output format for structured parsing.
-Tracks file writes via tool_use/tool_result events.
+Events are read line by line as the CLI emits them; assistant text is
+streamed into the response file and file writes are tracked via
+tool_use/tool_result events.
 
 Gemini CLI is a local-write provider: it writes files directly using
 its write_file and replace tools. The engine validates files exist after execution.
@@ -12,11 +14,14 @@ import json
 import logging
 import shutil
 import warnings
+from pathlib import Path
 from typing import Any
 
 from aiwf.domain.errors import ProviderError
 from aiwf.domain.models.ai_provider_result import AIProviderResult
 from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.event_loop import run_sync
+from aiwf.domain.providers.response_stream import ResponseStream
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,9 @@ VALID_APPROVAL_MODES = {"default", "auto_edit", "yolo"}
 # Default timeout (10 minutes)
 DEFAULT_TIMEOUT = 600
 
+# Longest single stream-json event line accepted (tool events can carry file contents)
+MAX_EVENT_LINE_BYTES = 16 * 1024 * 1024
+
 
 class GeminiCliAIProvider(AIProvider):
     """Gemini CLI AI provider using subprocess.
@@ -163,6 +171,8 @@ class GeminiCliAIProvider(AIProvider):
             context: Optional context dict, may contain:
                 - prompt_file: Path to prompt file (preferred over stdin)
                 - project_root: Working directory fallback
+                - response_path: Response file to stream text into
+                - on_progress: Progress callback (see ResponseStream)
             system_prompt: Optional system prompt (prepended when using stdin)
             connection_timeout: Unused (subprocess-based)
             response_timeout: Unused (uses config timeout)
@@ -170,7 +180,29 @@ class GeminiCliAIProvider(AIProvider):
         Returns:
             AIProviderResult with response text and files written
         """
-        return asyncio.run(self._async_generate(prompt, context, system_prompt))
+        return run_sync(self.agenerate(prompt, context, system_prompt))
+
+    async def agenerate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        system_prompt: str | None = None,
+        connection_timeout: int | None = None,
+        response_timeout: int | None = None,
+    ) -> AIProviderResult:
+        """Generate response using Gemini CLI on the caller's event loop.
+
+        Args:
+            prompt: The prompt to send to Gemini
+            context: Optional context dict (see generate())
+            system_prompt: Optional system prompt
+            connection_timeout: Unused (subprocess-based)
+            response_timeout: Unused (uses config timeout)
+
+        Returns:
+            AIProviderResult with response text and files written
+        """
+        return await self._async_generate(prompt, context, system_prompt)
 
     async def _async_generate(
         self,
@@ -204,6 +236,13 @@ class GeminiCliAIProvider(AIProvider):
             args.extend(["-p", full_prompt])
             logger.debug("Using direct prompt via -p flag")
 
+        response_path = context.get("response_path") if context else None
+        stream = ResponseStream(
+            Path(response_path) if response_path else None,
+            on_progress=context.get("on_progress") if context else None,
+        )
+        events = _StreamJsonEvents(stream)
+
         try:
             # Use stored CLI path for cross-platform compatibility
             cli_cmd = self._cli_path or shutil.which("gemini") or "gemini"
@@ -213,25 +252,49 @@ class GeminiCliAIProvider(AIProvider):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=cwd,
+                limit=MAX_EVENT_LINE_BYTES,
+            )
+        except FileNotFoundError:
+            raise ProviderError(
+                "Gemini CLI not found. "
+                "Install from: https://github.com/google-gemini/gemini-cli"
             )
 
-            # Wait for process completion with timeout
-            stdout_data, stderr_data = await asyncio.wait_for(
-                process.communicate(),
+        # Drain stderr concurrently so a chatty CLI can't block on a full pipe
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            await asyncio.wait_for(
+                self._consume_stdout(process, events),
                 timeout=self._timeout,
             )
-
         except asyncio.TimeoutError:
-            process.kill()
+            _kill(process)
+            stderr_task.cancel()
+            partial = stream.abort()
+            events.log_parse_errors()
+            salvaged = f" Partial response saved to {partial}." if partial else ""
+            if events.files_written:
+                salvaged += f" Files written before timeout: {sorted(events.files_written)}."
             raise ProviderError(
                 f"Gemini CLI timed out after {self._timeout}s. "
-                "Consider increasing timeout config."
+                f"Consider increasing timeout config.{salvaged}"
             )
-        except FileNotFoundError:
+        except ValueError as e:
+            # StreamReader limit exceeded by a single event line
+            _kill(process)
+            stderr_task.cancel()
+            stream.abort()
             raise ProviderError(
-                "Gemini CLI not found. "
-                "Install from: https://github.com/google-gemini/gemini-cli"
+                f"Gemini CLI emitted an event larger than {MAX_EVENT_LINE_BYTES} bytes: {e}"
             )
+        except BaseException:
+            _kill(process)
+            stderr_task.cancel()
+            stream.abort()
+            raise
+
+        stderr_data = await stderr_task
+        events.log_parse_errors()
 
         # Log stderr even on success (may contain warnings)
         if stderr_data:
@@ -240,15 +303,34 @@ class GeminiCliAIProvider(AIProvider):
 
         # Check for process errors
         if process.returncode != 0:
+            stream.abort()
             raise self._wrap_process_error(
                 process.returncode,
                 stderr_data.decode() if stderr_data else "",
             )
 
-        # Parse NDJSON output
-        response_text, files_written = self._parse_ndjson_stream(stdout_data)
-
-        return AIProviderResult(response=response_text, files=files_written)
+        stream.complete(events.files_written)
+
+        return AIProviderResult(
+            response=stream.text,
+            files=events.files_written,
+            ttft_seconds=stream.ttft_seconds,
+            latency_seconds=stream.latency_seconds,
+            input_tokens=events.input_tokens,
+            output_tokens=events.output_tokens,
+        )
+
+    @staticmethod
+    async def _consume_stdout(
+        process: asyncio.subprocess.Process, events: "_StreamJsonEvents"
+    ) -> None:
+        """Handle stream-json events line by line until the CLI exits."""
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            events.feed(line)
+        await process.wait()
 
     def _build_args(self, context: dict[str, Any] | None) -> list[str]:
         """Build CLI arguments from config.
@@ -282,66 +364,6 @@ class GeminiCliAIProvider(AIProvider):
 
         return args
 
-    def _parse_ndjson_stream(
-        self, stdout: bytes
-    ) -> tuple[str, dict[str, None]]:
-        """Parse NDJSON stream and extract response and file writes.
-
-        Args:
-            stdout: Raw stdout bytes from subprocess
-
-        Returns:
-            Tuple of (response_text, files_written dict)
-        """
-        pending_writes: dict[str, str] = {}  # tool_id -> file_path
-        files_written: dict[str, None] = {}
-        response_text = ""
-        parse_errors: list[str] = []
-
-        for line in stdout.decode().splitlines():
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError as e:
-                # Include sample of malformed content for debugging
-                sample = line[:50] + "..." if len(line) > 50 else line
-                parse_errors.append(f"{str(e)[:30]} | {sample!r}")
-                continue
-
-            event_type = event.get("type")
-
-            # Collect assistant messages
-            if event_type == "message" and event.get("role") == "assistant":
-                content = event.get("content", "")
-                if content:
-                    response_text += content
-
-            # Track file write tool invocations
-            elif event_type == "tool_use":
-                tool_name = event.get("tool_name")
-                if tool_name in FILE_WRITE_TOOLS:
-                    tool_id = event.get("tool_id")
-                    file_path = event.get("parameters", {}).get("file_path")
-                    if tool_id and file_path:
-                        pending_writes[tool_id] = file_path
-
-            # Confirm successful writes
-            elif event_type == "tool_result":
-                if event.get("status") == "success":
-                    tool_id = event.get("tool_id")
-                    if tool_id in pending_writes:
-                        files_written[pending_writes[tool_id]] = None
-
-        if parse_errors:
-            logger.warning(
-                f"Malformed JSON lines ({len(parse_errors)}): {parse_errors[:3]}"
-            )
-
-        return response_text, files_written
-
     def _wrap_process_error(self, returncode: int, stderr: str) -> ProviderError:
         """Wrap subprocess errors with actionable messages.
 
@@ -367,3 +389,88 @@ class GeminiCliAIProvider(AIProvider):
             return ProviderError(
                 f"Gemini CLI failed (exit {returncode}): {stderr}"
             )
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass  # Already exited
+
+
+class _StreamJsonEvents:
+    """Incremental handler for Gemini CLI stream-json events.
+
+    Each line is handled and dropped as it arrives: assistant text goes to
+    the ResponseStream and file writes are confirmed live, so memory holds
+    the response text rather than the full event log.
+    """
+
+    def __init__(self, stream: ResponseStream) -> None:
+        self.stream = stream
+        self.files_written: dict[str, None] = {}
+        self.input_tokens: int | None = None
+        self.output_tokens: int | None = None
+        self._pending_writes: dict[str, str] = {}  # tool_id -> file_path
+        self._parse_error_count = 0
+        self._parse_error_samples: list[str] = []
+
+    def feed(self, raw_line: bytes) -> None:
+        """Handle one line of CLI output."""
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line:
+            return
+
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError as e:
+            self._parse_error_count += 1
+            if len(self._parse_error_samples) < 3:
+                # Include sample of malformed content for debugging
+                sample = line[:50] + "..." if len(line) > 50 else line
+                self._parse_error_samples.append(f"{str(e)[:30]} | {sample!r}")
+            return
+
+        event_type = event.get("type")
+
+        # Collect assistant messages
+        if event_type == "message" and event.get("role") == "assistant":
+            content = event.get("content", "")
+            if content:
+                self.stream.write(content)
+
+        # Track file write tool invocations
+        elif event_type == "tool_use":
+            tool_name = event.get("tool_name")
+            if tool_name:
+                self.stream.tool_call(tool_name)
+            if tool_name in FILE_WRITE_TOOLS:
+                tool_id = event.get("tool_id")
+                file_path = event.get("parameters", {}).get("file_path")
+                if tool_id and file_path:
+                    self._pending_writes[tool_id] = file_path
+
+        # Confirm successful writes
+        elif event_type == "tool_result":
+            tool_id = event.get("tool_id")
+            file_path = self._pending_writes.pop(tool_id, None)
+            if file_path is not None and event.get("status") == "success":
+                self.files_written[file_path] = None
+                self.stream.file_written(file_path)
+
+        # Final event carries token usage
+        elif event_type == "result":
+            stats = event.get("stats") or {}
+            if isinstance(stats.get("input_tokens"), int):
+                self.input_tokens = stats["input_tokens"]
+            if isinstance(stats.get("output_tokens"), int):
+                self.output_tokens = stats["output_tokens"]
+
+    def log_parse_errors(self) -> None:
+        """Warn once about malformed lines seen so far."""
+        if self._parse_error_count:
+            logger.warning(
+                f"Malformed JSON lines ({self._parse_error_count}): {self._parse_error_samples}"
+            )
+            self._parse_error_count = 0
+            self._parse_error_samples = []
@@ -1,5 +1,11 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 from .ai_provider import AIProvider
+from .provider_pool import ProviderPool, config_key
+
+# configure_pool() argument default: keep the pool's current setting
+UNCHANGED: Any = object()
 
 
 class AIProviderFactory:
@@ -7,9 +13,15 @@ class AIProviderFactory:
 
     AI providers generate responses to prompts. They may call AI APIs
     or signal manual mode where the user provides the response.
+
+    create() always builds a new instance. acquire() and acquire_validated()
+    return pooled instances shared within the process, keyed by provider
+    class and config. Code calling a pooled instance holds it with lease(),
+    so the pool does not close it mid-call when it expires.
     """
 
     _registry: dict[str, type[AIProvider]] = {}
+    _pool: ProviderPool[AIProvider] = ProviderPool()
 
     @classmethod
     def register(cls, key: str, provider_class: type[AIProvider]) -> None:
@@ -21,6 +33,7 @@ class AIProviderFactory:
             provider_class: The provider class to register
         """
         cls._registry[key] = provider_class
+        cls._pool.evict(lambda pool_key: pool_key[0] == key)
 
     @classmethod
     def create(cls, provider_key: str, config: dict[str, Any] | None = None) -> AIProvider:
@@ -48,6 +61,115 @@ class AIProviderFactory:
         config = config or {}
         return provider_class(**config)
 
+    @classmethod
+    def acquire(cls, provider_key: str, config: dict[str, Any] | None = None) -> AIProvider:
+        """
+        Get a pooled AI provider instance, creating it on first use.
+
+        Args:
+            provider_key: Registered provider identifier
+            config: Optional configuration for the provider
+
+        Returns:
+            Shared AIProvider instance for this key and config
+
+        Raises:
+            KeyError: If provider_key is not registered
+        """
+        return cls._pool.get(
+            cls._pool_key(provider_key, config),
+            lambda: cls.create(provider_key, config),
+        )
+
+    @classmethod
+    @contextmanager
+    def lease(
+        cls, provider_key: str, config: dict[str, Any] | None = None
+    ) -> Iterator[AIProvider]:
+        """
+        Hold a pooled AI provider instance for the duration of the block.
+
+        Args:
+            provider_key: Registered provider identifier
+            config: Optional configuration for the provider
+
+        Yields:
+            Shared AIProvider instance for this key and config
+
+        Raises:
+            KeyError: If provider_key is not registered
+        """
+        with cls._pool.lease(
+            cls._pool_key(provider_key, config),
+            lambda: cls.create(provider_key, config),
+        ) as provider:
+            yield provider
+
+    @classmethod
+    def acquire_validated(
+        cls, provider_key: str, config: dict[str, Any] | None = None
+    ) -> AIProvider:
+        """
+        Get a pooled AI provider instance whose validate() has passed.
+
+        Successful validation is memoized for the pool's validation TTL,
+        so repeated session starts do not repeat environment probes.
+
+        Args:
+            provider_key: Registered provider identifier
+            config: Optional configuration for the provider
+
+        Returns:
+            Shared, validated AIProvider instance
+
+        Raises:
+            KeyError: If provider_key is not registered
+            ProviderError: If validation fails
+        """
+        return cls._pool.get_validated(
+            cls._pool_key(provider_key, config),
+            lambda: cls.create(provider_key, config),
+            lambda provider: provider.validate(),
+        )
+
+    @classmethod
+    def configure_pool(
+        cls,
+        *,
+        ttl: float | None = UNCHANGED,
+        validation_ttl: float | None = UNCHANGED,
+    ) -> None:
+        """
+        Set pooled instance and validation lifetimes (seconds).
+
+        Replaces the pool if either lifetime changes; existing pooled
+        instances are then closed once no lease holds them. Setting the
+        current values again is a no-op.
+
+        Args:
+            ttl: Seconds an instance is reused (None = forever, 0 = no
+                pooling, UNCHANGED = keep current)
+            validation_ttl: Seconds a successful validation is trusted
+                (None = forever, 0 = always re-validate, UNCHANGED = keep current)
+        """
+        old = cls._pool
+        ttl = old.ttl if ttl is UNCHANGED else ttl
+        validation_ttl = old.validation_ttl if validation_ttl is UNCHANGED else validation_ttl
+        if (ttl, validation_ttl) == (old.ttl, old.validation_ttl):
+            return
+        cls._pool = ProviderPool(ttl=ttl, validation_ttl=validation_ttl)
+        old.clear()
+
+    @classmethod
+    def clear_pool(cls) -> None:
+        """Close and drop all pooled provider instances and validation results."""
+        cls._pool.clear()
+
+    @classmethod
+    def _pool_key(cls, provider_key: str, config: dict[str, Any] | None) -> tuple[Any, ...]:
+        # Class identity keeps re-registered keys from reusing stale instances
+        return (provider_key, cls._registry.get(provider_key), config_key(config))
+
     @classmethod
     def list_providers(cls) -> list[str]:
         """
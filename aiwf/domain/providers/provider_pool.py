@@ -0,0 +1,195 @@
+"""Keyed, thread-safe pool of provider instances.
+
+Providers are stateless between calls (configuration is fixed at
+construction), so one instance per (provider class, config) can serve
+every call in a process. Pooling avoids re-running constructor config
+validation and lets providers keep expensive resources (an SDK client, a
+CLI process) alive across calls.
+
+The pool also memoizes successful ``validate()`` results: probes such as
+``shutil.which`` or SDK imports are repeated at most once per
+validation TTL rather than on every session start.
+
+Callers that use an instance for a call take a lease() on it. An instance
+that expires or is evicted while leased is dropped from the pool at once,
+but only closed when its last lease is released.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a pooled instance is reused before it is closed and rebuilt
+DEFAULT_INSTANCE_TTL = 600.0
+# Seconds a successful validate() is trusted before it is re-run
+DEFAULT_VALIDATION_TTL = 300.0
+
+
+def config_key(config: dict[str, Any] | None) -> str:
+    """Stable hashable form of a provider config dict."""
+    return json.dumps(config or {}, sort_keys=True, default=repr)
+
+
+@dataclass
+class _Entry(Generic[T]):
+    instance: T
+    created_at: float
+    validated_at: float | None = None
+    # Open leases; a retired entry is closed when this drops to zero
+    holders: int = 0
+    retired: bool = False
+
+
+class ProviderPool(Generic[T]):
+    """Pool of provider instances with bounded lifetimes.
+
+    Instances whose lifetime has expired are closed (if they define
+    ``close()``) once no lease holds them, and replaced on next use. A TTL
+    of None means no expiry; a TTL of 0 disables reuse (every get() builds
+    a fresh instance).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = DEFAULT_INSTANCE_TTL,
+        validation_ttl: float | None = DEFAULT_VALIDATION_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            ttl: Seconds an instance is reused (None = forever, 0 = never)
+            validation_ttl: Seconds a successful validation is trusted
+                (None = forever, 0 = always re-validate)
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.validation_ttl = validation_ttl
+        self._clock = clock
+        self._entries: dict[Hashable, _Entry[T]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Return the pooled instance for key, building it with factory if needed.
+
+        Args:
+            key: Pool key (identifies provider class and config)
+            factory: Builds a new instance
+
+        Returns:
+            A live instance for key
+        """
+        return self._entry(key, factory).instance
+
+    @contextmanager
+    def lease(self, key: Hashable, factory: Callable[[], T]) -> Iterator[T]:
+        """
+        Hold the pooled instance for key for the duration of the block.
+
+        The instance is not closed while the block runs, even if it expires
+        or is evicted meanwhile.
+
+        Args:
+            key: Pool key (identifies provider class and config)
+            factory: Builds a new instance
+
+        Yields:
+            A live instance for key
+        """
+        with self._lock:
+            entry = self._entry(key, factory)
+            entry.holders += 1
+        try:
+            yield entry.instance
+        finally:
+            self._release(entry)
+
+    def get_validated(
+        self, key: Hashable, factory: Callable[[], T], validate: Callable[[T], None]
+    ) -> T:
+        """
+        Return the pooled instance for key, validated within the validation TTL.
+
+        Failed validations are not memoized, so a fixed environment is
+        picked up on the next call. validate runs outside the pool lock
+        (it may probe a CLI or import an SDK), holding a lease on the
+        instance; concurrent callers may validate the same instance.
+
+        Raises:
+            Whatever validate raises
+        """
+        with self._lock:
+            entry = self._entry(key, factory)
+            now = self._clock()
+            if entry.validated_at is not None and not self._expired(
+                entry.validated_at, self.validation_ttl, now
+            ):
+                return entry.instance
+            entry.holders += 1
+        try:
+            validate(entry.instance)
+            with self._lock:
+                entry.validated_at = now
+        finally:
+            self._release(entry)
+        return entry.instance
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Close and drop every instance whose key matches predicate."""
+        with self._lock:
+            doomed = [k for k in self._entries if predicate(k)]
+            closable = [e for e in map(self._entries.pop, doomed) if self._retire(e)]
+        for entry in closable:
+            _close(entry.instance)
+
+    def clear(self) -> None:
+        """Close and drop every pooled instance."""
+        self.evict(lambda key: True)
+
+    def _entry(self, key: Hashable, factory: Callable[[], T]) -> _Entry[T]:
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry.created_at, self.ttl, now):
+                del self._entries[key]
+                if self._retire(entry):
+                    _close(entry.instance)
+                entry = None
+            if entry is None:
+                entry = _Entry(instance=factory(), created_at=now)
+                if self.ttl != 0:
+                    self._entries[key] = entry
+            return entry
+
+    def _release(self, entry: _Entry[T]) -> None:
+        """Drop one lease; close the entry if it was retired meanwhile."""
+        with self._lock:
+            entry.holders -= 1
+            close = entry.retired and entry.holders == 0
+        if close:
+            _close(entry.instance)
+
+    @staticmethod
+    def _retire(entry: _Entry[T]) -> bool:
+        """Mark a dropped entry retired; True if it can be closed now."""
+        entry.retired = True
+        return entry.holders == 0
+
+    @staticmethod
+    def _expired(since: float, ttl: float | None, now: float) -> bool:
+        return ttl is not None and now - since >= ttl
+
+
+def _close(instance: Any) -> None:
+    close = getattr(instance, "close", None)
+    if callable(close):
+        close()
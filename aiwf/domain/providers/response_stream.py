@@ -0,0 +1,208 @@
+"""Incremental capture of streamed provider responses.
+
+Streaming providers append text blocks to a ResponseStream as they arrive
+instead of concatenating one large string. When a target path is given,
+blocks are written to a temp file beside it and renamed into place on
+completion, so readers never see a half-written response file. A run that
+fails or is cancelled leaves what arrived as ``<response>.partial``.
+
+The stream also measures time to first token and total latency, and
+reports progress through an optional callback.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_SUFFIX = ".partial"
+
+ProgressCallback = Callable[[str, dict[str, Any]], None]
+"""Called as on_progress(kind, data).
+
+Kinds: first_token, bytes, tool_call, and file_written (providers that
+confirm tool writes).
+"""
+
+
+class ResponseStream:
+    """Accumulates a streamed response and optionally writes it to disk.
+
+    Usage:
+        stream = ResponseStream(target, on_progress=callback)
+        try:
+            for chunk in chunks:
+                stream.write(chunk)
+        except BaseException:
+            stream.abort()
+            raise
+        stream.commit()
+    """
+
+    def __init__(
+        self,
+        target: Path | None = None,
+        *,
+        on_progress: ProgressCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Start a stream (latency is measured from here).
+
+        Args:
+            target: Final response file path (None = keep in memory only)
+            on_progress: Optional progress callback
+            clock: Monotonic time source
+        """
+        self.target = target
+        self._on_progress = on_progress
+        self._clock = clock
+        self._started = clock()
+        self._first_token_at: float | None = None
+        self._finished_at: float | None = None
+        self._parts: list[str] = []
+        self._bytes = 0
+        self._file: IO[str] | None = None
+        self._tmp_path: Path | None = None
+
+    @property
+    def text(self) -> str:
+        """All text written so far."""
+        return "".join(self._parts)
+
+    @property
+    def bytes_written(self) -> int:
+        """UTF-8 size of the text written so far."""
+        return self._bytes
+
+    @property
+    def ttft_seconds(self) -> float | None:
+        """Seconds from start to the first non-empty text block."""
+        if self._first_token_at is None:
+            return None
+        return self._first_token_at - self._started
+
+    @property
+    def latency_seconds(self) -> float | None:
+        """Seconds from start to commit/discard/abort (None while open)."""
+        if self._finished_at is None:
+            return None
+        return self._finished_at - self._started
+
+    def write(self, text: str) -> None:
+        """Append a text block."""
+        if not text:
+            return
+        if self._first_token_at is None:
+            self._first_token_at = self._clock()
+            self._progress("first_token", {"ttft_seconds": self.ttft_seconds})
+
+        self._parts.append(text)
+        self._bytes += len(text.encode("utf-8"))
+        if self.target is not None:
+            self._open().write(text)
+        self._progress("bytes", {"bytes": self._bytes})
+
+    def tool_call(self, name: str) -> None:
+        """Report a tool invocation by the provider."""
+        self._progress("tool_call", {"tool": name})
+
+    def file_written(self, path: str) -> None:
+        """Report a file confirmed written by a provider tool."""
+        self._progress("file_written", {"path": path})
+
+    def commit(self) -> bool:
+        """
+        Finish the stream, moving the temp file onto the target.
+
+        Returns:
+            True if a response file was written (False if nothing was
+            streamed or there is no target)
+        """
+        self._finish()
+        if self._file is None or self._tmp_path is None or self.target is None:
+            return False
+        self._close(fsync=True)
+        os.replace(self._tmp_path, self.target)
+        return True
+
+    def complete(self, files_written: dict[str, None]) -> None:
+        """
+        Finish a successful stream for a local-write provider.
+
+        Commits the response file and records it in files_written, unless
+        the provider already wrote the target itself with a file tool (the
+        streamed console text must not overwrite it).
+
+        Args:
+            files_written: Provider-written files (path -> None), updated in place
+        """
+        target = str(self.target) if self.target is not None else None
+        if target is not None and target in files_written:
+            self.discard()
+        elif self.commit():
+            files_written[target] = None
+
+    def discard(self) -> None:
+        """Finish the stream, deleting any temp file."""
+        self._finish()
+        if self._file is not None:
+            self._close(fsync=False)
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def abort(self) -> Path | None:
+        """
+        Finish a failed stream, keeping received text as a partial file.
+
+        Returns:
+            Path of the partial response file, or None if nothing arrived
+        """
+        self._finish()
+        if self._file is None or self._tmp_path is None or self.target is None:
+            return None
+        try:
+            self._close(fsync=False)
+            partial = self.target.with_name(self.target.name + PARTIAL_SUFFIX)
+            os.replace(self._tmp_path, partial)
+        except OSError as e:
+            logger.warning(f"Could not keep partial response for {self.target}: {e}")
+            return None
+        return partial
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            assert self.target is not None
+            self.target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.target.parent, prefix=f".{self.target.name}.", suffix=".tmp"
+            )
+            self._tmp_path = Path(tmp_name)
+            self._file = os.fdopen(fd, "w", encoding="utf-8")
+        return self._file
+
+    def _close(self, *, fsync: bool) -> None:
+        assert self._file is not None
+        if fsync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    def _finish(self) -> None:
+        if self._finished_at is None:
+            self._finished_at = self._clock()
+
+    def _progress(self, kind: str, data: dict[str, Any]) -> None:
+        if self._on_progress is None:
+            return
+        try:
+            self._on_progress(kind, data)
+        except Exception as e:
+            # Progress reporting must never break the generation
+            logger.warning(f"Progress callback failed on {kind}: {e}")
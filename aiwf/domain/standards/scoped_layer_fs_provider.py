@@ -184,6 +184,55 @@ class ScopedLayerFsProvider:
         if not scope or scope not in self.scopes:
             raise ValueError(f"Unknown scope: {scope}")
 
+        # Read and concatenate
+        bundle_parts = []
+        for filename in self._select_files(scope):
+            file_path = self.standards_root / filename
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise ProviderError(f"Standards file not found: {file_path}")
+            except OSError as e:
+                raise ProviderError(f"Failed to read standards file {file_path}: {e}")
+
+            if not content.endswith("\n"):
+                content += "\n"
+
+            bundle_parts.append(f"--- {filename} ---\n{content}")
+
+        return "".join(bundle_parts)
+
+    def get_cache_key(self, context: dict[str, Any]) -> dict[str, Any] | None:
+        """Describe what create_bundle(context) depends on, for the bundle cache.
+
+        Args:
+            context: Same context that will be passed to create_bundle()
+
+        Returns:
+            Cache key material with a 'sources' list of standards files, or
+            None if the bundle cannot be cached (unconfigured or unknown scope)
+        """
+        scope = context.get("scope") if isinstance(context, dict) else None
+        if not self.standards_root or not scope or scope not in self.scopes:
+            return None
+
+        files = self._select_files(scope)
+        return {
+            "standards_root": str(self.standards_root.resolve()),
+            "scope": scope,
+            "files": files,
+            "sources": [self.standards_root / filename for filename in files],
+        }
+
+    def _select_files(self, scope: str) -> list[str]:
+        """Return the standards files for a scope, in bundle order.
+
+        Args:
+            scope: Known scope name
+
+        Returns:
+            File names relative to the standards root
+        """
         layers = self.scopes[scope].get("layers", [])
 
         # Collect standards files preserving order:
@@ -206,20 +255,4 @@ class ScopedLayerFsProvider:
             if layer in self.layer_standards:
                 add_files(self.layer_standards[layer])
 
-        # Read and concatenate
-        bundle_parts = []
-        for filename in ordered_files:
-            file_path = self.standards_root / filename
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except FileNotFoundError:
-                raise ProviderError(f"Standards file not found: {file_path}")
-            except OSError as e:
-                raise ProviderError(f"Failed to read standards file {file_path}: {e}")
-
-            if not content.endswith("\n"):
-                content += "\n"
-
-            bundle_parts.append(f"--- {filename} ---\n{content}")
-
-        return "".join(bundle_parts)
\ No newline at end of file
+        return ordered_files
\ No newline at end of file
@@ -12,6 +12,13 @@ class StandardsProvider(Protocol):
     - RAG/vector database
     - REST API
     - Database
+
+    Providers may also implement the optional method
+    ``get_cache_key(context) -> dict | None`` to let the engine reuse
+    materialized bundles across sessions. It returns JSON-serializable key
+    material for everything the bundle depends on, plus a ``sources`` list
+    of file paths whose size/mtime invalidate the bundle. Returning None
+    (or not implementing it) disables caching for that bundle.
     """
 
     @classmethod
@@ -0,0 +1,263 @@
+"""Span-based tracing of workflow commands, exported as OTLP JSON.
+
+Enabled with ``aiwf --trace-file <path>`` and/or ``--trace-endpoint <url>``
+(AIWF_TRACE_FILE / AIWF_TRACE_ENDPOINT). One command is one trace: the CLI
+opens a root span, and the orchestrator, approval gate and session store
+open child spans with ``span()``. Spans record start/end times, parent
+links, attributes (session_id, phase, iteration, provider, ...) and the
+thread they ran on, so a batch renders as a timeline with one lane per
+worker in any OTLP-compatible viewer.
+
+The export follows the OTLP/HTTP JSON encoding, so a file can be sent to a
+collector as-is (``POST <endpoint>/v1/traces``).
+
+When no tracer is active ``span()`` only checks a module global, so the
+hooks cost nothing in normal runs.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import urllib.request
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiwf.domain.models.workflow_state import WorkflowState
+
+# Instrumentation scope reported in exports
+TRACER_NAME = "aiwf"
+
+# OTLP span kind and status codes
+_SPAN_KIND_INTERNAL = 1
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_active: "Tracer | None" = None
+_current: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "aiwf_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """One timed operation in a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute; None values are dropped."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def to_otlp(self) -> dict[str, Any]:
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns if self.end_ns is not None else self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": (
+                {"code": _STATUS_ERROR, "message": self.error}
+                if self.error is not None
+                else {"code": _STATUS_OK}
+            ),
+        }
+        if self.parent_span_id is not None:
+            otlp["parentSpanId"] = self.parent_span_id
+        return otlp
+
+
+class Tracer:
+    """Collects the spans of one trace.
+
+    Usage:
+        tracer = Tracer()
+        tracer.start("approve", session_id="abc")
+        ...  # run the command
+        tracer.stop()
+        write_otlp_json(path, tracer.to_otlp())
+    """
+
+    def __init__(self, service_name: str = TRACER_NAME) -> None:
+        self.service_name = service_name
+        self.trace_id = os.urandom(16).hex()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._root: Span | None = None
+        self._root_token: contextvars.Token | None = None
+
+    def start(self, name: str, **attributes: Any) -> None:
+        """Open the root span and make this the active tracer."""
+        global _active
+        self._root = self._open(name, parent=None, attributes=attributes)
+        self._root_token = _current.set(self._root)
+        _active = self
+
+    def stop(self, error: BaseException | None = None) -> None:
+        """Close the root span and deactivate this tracer."""
+        global _active
+        if _active is self:
+            _active = None
+        if self._root is not None:
+            self._close(self._root, error)
+            if self._root_token is not None:
+                _current.reset(self._root_token)
+            self._root = None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Record the block as a child of the current span.
+
+        Threads that did not inherit a span (e.g. batch workers) parent
+        their spans to the root span.
+        """
+        parent = _current.get() or self._root
+        span = self._open(name, parent=parent, attributes=attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self._close(span, e)
+            raise
+        else:
+            self._close(span, None)
+        finally:
+            _current.reset(token)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Finished spans as an OTLP ExportTraceServiceRequest (JSON encoding)."""
+        with self._lock:
+            spans = [s.to_otlp() for s in self.spans]
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name, "process.pid": os.getpid()}
+                        )
+                    },
+                    "scopeSpans": [{"scope": {"name": TRACER_NAME}, "spans": spans}],
+                }
+            ]
+        }
+
+    def _open(self, name: str, parent: Span | None, attributes: dict[str, Any]) -> Span:
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+        )
+        thread = threading.current_thread()
+        span.set_attribute("thread.id", thread.ident)
+        span.set_attribute("thread.name", thread.name)
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+        return span
+
+    def _close(self, span: Span, error: BaseException | None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self.spans.append(span)
+
+
+def active_tracer() -> Tracer | None:
+    """Return the tracer of the running command, if any."""
+    return _active
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span in this context, if tracing."""
+    if _active is None:
+        return None
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Record the block as a span of the active trace (no-op when not tracing)."""
+    tracer = _active
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attributes) as current:
+        yield current
+
+
+def write_otlp_json(path: Path, payload: dict[str, Any]) -> Path:
+    """Write an OTLP JSON export, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+    return path
+
+
+def post_otlp_json(endpoint: str, payload: dict[str, Any], timeout: float = 5.0) -> None:
+    """
+    Send an OTLP JSON export to a collector's OTLP/HTTP receiver.
+
+    Args:
+        endpoint: Collector base URL (e.g. http://localhost:4318); the
+            /v1/traces path is appended unless already present
+        payload: Export from Tracer.to_otlp()
+        timeout: Seconds to wait for the collector
+
+    Raises:
+        OSError: If the collector cannot be reached or rejects the export
+            (urllib.error.URLError/HTTPError)
+    """
+    url = endpoint.rstrip("/")
+    if not url.endswith("/v1/traces"):
+        url += "/v1/traces"
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+
+
+def state_attributes(state: "WorkflowState") -> dict[str, Any]:
+    """Common span attributes for a WorkflowState."""
+    return {
+        "aiwf.session_id": state.session_id,
+        "aiwf.profile": state.profile,
+        "aiwf.phase": state.phase,
+        "aiwf.stage": state.stage,
+        "aiwf.iteration": state.current_iteration,
+    }
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(getattr(value, "value", value))}
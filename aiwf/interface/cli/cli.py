@@ -1,13 +1,25 @@
 import click
+import copy
+import functools
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel
 
+from aiwf.domain.constants import (
+    PERF_REPORTS_DIR,
+    RESPONSE_CACHE_DIR,
+    SESSION_PERF_DIRNAME,
+    STANDARDS_CACHE_DIR,
+)
 from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStatus
 
 logger = logging.getLogger(__name__)
 from aiwf.interface.cli.output_models import (
     ApproveOutput,
+    BatchOutput,
+    BatchSessionResult,
     InitOutput,
     ListOutput,
     ProfileDetail,
@@ -15,14 +27,31 @@ from aiwf.interface.cli.output_models import (
     ProfilesOutput,
     ProviderDetail,
     ProviderSummary,
+    ProviderCallStatsRow,
     ProvidersOutput,
+    PruneBlobsOutput,
+    RebuildIndexOutput,
     RejectOutput,
     SessionSummary,
+    StageTimingRow,
+    StatsOutput,
     StatusOutput,
     ValidateOutput,
     ValidationResult,
 )
-from aiwf.application.config_loader import load_config
+from aiwf.application.config_loader import (
+    load_config,
+    resolve_artifact_store,
+    resolve_provider_pool,
+    resolve_response_cache,
+    resolve_session_persistence,
+)
+
+if TYPE_CHECKING:
+    from aiwf.application.providers.response_cache import ResponseCache
+    from aiwf.application.storage import ArtifactBlobStore
+    from aiwf.interface.cli.profile_discovery import ProfileManifestEntry
+    from aiwf.domain.persistence.session_store import SessionStore
 
 
 # Patched by tests where the CLI reads it.
@@ -50,6 +79,123 @@ def _get_sessions_root(ctx: click.Context) -> Path:
     return _get_project_dir(ctx) / ".aiwf" / "sessions"
 
 
+class _WarmCaches:
+    """State `aiwf serve` keeps across commands.
+
+    A one-shot CLI process builds config and session stores per command;
+    the daemon reuses them. Config is reloaded when a config file changes.
+    """
+
+    def __init__(self) -> None:
+        # (project_dir, home) -> (config file stamps, config)
+        self.configs: dict[tuple[Path, Path], tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        # (sessions_root, session_persistence) -> store
+        self.stores: dict[tuple[Path, str], "SessionStore"] = {}
+
+
+# Set by `aiwf serve`; None in a one-shot CLI process.
+_warm: _WarmCaches | None = None
+
+
+def _enable_warm_caches() -> None:
+    global _warm
+    _warm = _WarmCaches()
+
+
+def _load_project_config(project_dir: Path) -> dict[str, Any]:
+    """load_config() for project_dir (memoized on config file changes under `aiwf serve`).
+
+    Also applies the config's provider_pool lifetimes to the provider pool.
+    """
+    home = Path.home()
+    if _warm is None:
+        cfg = load_config(project_root=project_dir, user_home=home)
+        _configure_provider_pool(cfg)
+        return cfg
+
+    stamps = tuple(
+        _file_stamp(root / ".aiwf" / "config.yml") for root in (home, project_dir)
+    )
+    cached = _warm.configs.get((project_dir, home))
+    if cached is None or cached[0] != stamps:
+        cached = (stamps, load_config(project_root=project_dir, user_home=home))
+        _warm.configs[(project_dir, home)] = cached
+    _configure_provider_pool(cached[1])
+    # Callers may modify the config they get
+    return copy.deepcopy(cached[1])
+
+
+def _configure_provider_pool(cfg: dict[str, Any]) -> None:
+    """Apply provider_pool lifetimes (a no-op while they are unchanged)."""
+    from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+    AIProviderFactory.configure_pool(**resolve_provider_pool(cfg))
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_session_store(ctx: click.Context) -> "SessionStore":
+    """Create the session store backend selected by session_persistence."""
+    cfg = _load_project_config(_get_project_dir(ctx))
+    persistence = resolve_session_persistence(cfg)
+    sessions_root = _get_sessions_root(ctx)
+    if _warm is None:
+        return _create_session_store(sessions_root, persistence)
+
+    store = _warm.stores.get((sessions_root, persistence))
+    if store is None:
+        store = _create_session_store(sessions_root, persistence)
+        _warm.stores[(sessions_root, persistence)] = store
+    return store
+
+
+def _create_session_store(sessions_root: Path, persistence: str) -> "SessionStore":
+    from aiwf.domain.persistence.session_store import SessionStore
+
+    if persistence == "sqlite":
+        from aiwf.domain.persistence.sqlite_session_store import SqliteSessionStore
+
+        return SqliteSessionStore(sessions_root=sessions_root)
+    return SessionStore(
+        sessions_root=sessions_root,
+        journal=persistence == "journal",
+    )
+
+
+def _get_response_cache(ctx: click.Context) -> "ResponseCache | None":
+    """Create the provider response cache, or None when response_cache mode is off."""
+    cfg = _load_project_config(_get_project_dir(ctx))
+    settings = resolve_response_cache(cfg)
+    if settings["mode"] == "off":
+        return None
+
+    from aiwf.application.providers.response_cache import ResponseCache
+
+    return ResponseCache(
+        _get_project_dir(ctx) / RESPONSE_CACHE_DIR,
+        settings["mode"],
+        max_bytes=settings["max_bytes"],
+        max_age_seconds=settings["max_age_seconds"],
+    )
+
+
+def _get_artifact_store(ctx: click.Context) -> "ArtifactBlobStore | None":
+    """Create the code artifact blob store, or None unless artifact_store is blobs."""
+    cfg = _load_project_config(_get_project_dir(ctx))
+    if resolve_artifact_store(cfg) != "blobs":
+        return None
+
+    from aiwf.application.storage import ArtifactBlobStore
+
+    return ArtifactBlobStore.for_sessions_root(_get_sessions_root(ctx))
+
+
 def _format_error(e: Exception) -> str:
     """Format exception into user-friendly message."""
     if isinstance(e, FileNotFoundError):
@@ -67,7 +213,45 @@ def _emit_progress(state) -> None:
         click.echo(msg, err=True)
 
 
-@click.group(help="AI Workflow Engine CLI.")
+@functools.cache
+def _profile_entries() -> dict[str, "ProfileManifestEntry"]:
+    """Discovered profiles, registered lazily with ProfileFactory (once per process)."""
+    from aiwf.interface.cli.profile_discovery import register_profile_loaders
+
+    try:
+        entries = register_profile_loaders()
+    except Exception as e:
+        logger.warning(f"Error during profile discovery: {e}")
+        return {}
+    logger.debug(f"Registered profiles: {sorted(entries)}")
+    return entries
+
+
+class _LazyProfileGroup(click.Group):
+    """Root command group whose profile subcommands are imported on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + sorted(name for name in _profile_entries() if name not in self.commands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        entry = _profile_entries().get(cmd_name)
+        if entry is None:
+            return None
+
+        from aiwf.interface.cli.profile_discovery import load_profile_command
+
+        try:
+            return load_profile_command(entry)
+        except Exception as e:
+            logger.warning(f"Failed to load profile '{cmd_name}': {e}")
+            return None
+
+
+@click.group(cls=_LazyProfileGroup, help="AI Workflow Engine CLI.")
 @click.option("--json", "json_output", is_flag=True, help="Emit machine-readable JSON on stdout.")
 @click.option(
     "--project-dir",
@@ -75,11 +259,96 @@ def _emit_progress(state) -> None:
     default=None,
     help="Project root directory (default: current directory)",
 )
+@click.option(
+    "--perf-profile",
+    is_flag=True,
+    envvar="AIWF_PERF_PROFILE",
+    help="Profile CPU and memory of the command and write a JSON report under .aiwf/.",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="AIWF_TRACE_FILE",
+    default=None,
+    help="Write tracing spans of the command to this file as OTLP JSON.",
+)
+@click.option(
+    "--trace-endpoint",
+    envvar="AIWF_TRACE_ENDPOINT",
+    default=None,
+    help="Send tracing spans to an OTLP/HTTP collector (e.g. http://localhost:4318).",
+)
 @click.pass_context
-def cli(ctx: click.Context, json_output: bool, project_dir: str | None) -> None:
+def cli(
+    ctx: click.Context,
+    json_output: bool,
+    project_dir: str | None,
+    perf_profile: bool,
+    trace_file: Path | None,
+    trace_endpoint: str | None,
+) -> None:
     ctx.ensure_object(dict)
     ctx.obj["json"] = bool(json_output)
     ctx.obj["project_dir"] = Path(project_dir) if project_dir else Path.cwd()
+    _profile_entries()
+    if perf_profile and ctx.invoked_subcommand:
+        _start_perf_profile(ctx, ctx.invoked_subcommand)
+    if (trace_file or trace_endpoint) and ctx.invoked_subcommand:
+        _start_tracing(ctx, ctx.invoked_subcommand, trace_file, trace_endpoint)
+
+
+def _start_tracing(
+    ctx: click.Context, command: str, trace_file: Path | None, trace_endpoint: str | None
+) -> None:
+    """Trace the invoked command; spans are exported when the CLI context closes."""
+    from aiwf.domain.tracing import Tracer, post_otlp_json, write_otlp_json
+
+    tracer = Tracer()
+
+    def _finish() -> None:
+        tracer.stop()
+        payload = tracer.to_otlp()
+        if trace_file is not None:
+            write_otlp_json(trace_file, payload)
+        if trace_endpoint:
+            try:
+                post_otlp_json(trace_endpoint, payload)
+            except OSError as e:
+                # Tracing must never fail the command it observes
+                click.echo(f"Warning: could not export trace to {trace_endpoint}: {e}", err=True)
+
+    ctx.call_on_close(_finish)
+    tracer.start(f"aiwf {command}", **{"aiwf.command": command})
+
+
+def _start_perf_profile(ctx: click.Context, command: str) -> None:
+    """Profile the invoked command; the report is written when the CLI context closes."""
+    from datetime import datetime, timezone
+
+    from aiwf.domain.command_profiler import CommandProfiler
+
+    profiler = CommandProfiler(command)
+    started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+    def _finish() -> None:
+        report = profiler.stop()
+        project_dir = _get_project_dir(ctx)
+        session_id = report["session_id"]
+        if session_id:
+            reports_dir = _get_sessions_root(ctx) / session_id / SESSION_PERF_DIRNAME
+        else:
+            reports_dir = project_dir / PERF_REPORTS_DIR
+        path = profiler.write_report(reports_dir / f"{started}-{command}.json", report)
+        # stderr keeps --json output on stdout parseable
+        click.echo(
+            f"Perf profile: {report['wall_seconds']:.3f}s wall "
+            f"({report['engine_seconds']:.3f}s engine, {report['provider_seconds']:.3f}s provider), "
+            f"peak {report['memory']['peak_bytes'] / 1024:.0f} KiB -> {path}",
+            err=True,
+        )
+
+    ctx.call_on_close(_finish)
+    profiler.start()
 
 
 @cli.command("init")
@@ -114,12 +383,8 @@ def init_cmd(
     """
     try:
         from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
-        from aiwf.domain.persistence.session_store import SessionStore
         from aiwf.domain.profiles.profile_factory import ProfileFactory
 
-        # Import profiles to ensure registration
-        import profiles.jpa_mt  # noqa: F401
-
         # Parse context pairs
         context: dict[str, str] = {}
         for pair in context_pairs:
@@ -136,7 +401,7 @@ def init_cmd(
             raise ValueError(f"Profile '{profile_name}' not found. Available: {available}")
 
         # Create profile instance and validate context
-        profile_instance = ProfileFactory.create(profile_name)
+        profile_instance = ProfileFactory.acquire(profile_name)
         validated_context = profile_instance.validate_context(context)
 
         # Build metadata
@@ -155,10 +420,13 @@ def init_cmd(
         }
 
         sessions_root = _get_sessions_root(ctx)
-        session_store = SessionStore(sessions_root=sessions_root)
+        session_store = _get_session_store(ctx)
         orchestrator = WorkflowOrchestrator(
             session_store=session_store,
             sessions_root=sessions_root,
+            standards_cache_dir=_get_project_dir(ctx) / STANDARDS_CACHE_DIR,
+            response_cache=_get_response_cache(ctx),
+            artifact_store=_get_artifact_store(ctx),
         )
 
         session_id = orchestrator.initialize_run(
@@ -209,10 +477,9 @@ def init_cmd(
 @click.pass_context
 def status_cmd(ctx: click.Context, session_id: str) -> None:
     try:
-        from aiwf.domain.persistence.session_store import SessionStore
 
         sessions_root = _get_sessions_root(ctx)
-        session_store = SessionStore(sessions_root=sessions_root)
+        session_store = _get_session_store(ctx)
         state = session_store.load(session_id)
         session_path = str(sessions_root / session_id)
 
@@ -276,11 +543,10 @@ def status_cmd(ctx: click.Context, session_id: str) -> None:
 def approve_cmd(ctx: click.Context, session_id: str, fs_ability: str | None, hash_prompts: bool, no_hash_prompts: bool, events: bool) -> None:
     try:
         from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
-        from aiwf.domain.persistence.session_store import SessionStore
         from aiwf.domain.events.emitter import WorkflowEventEmitter
 
         project_dir = _get_project_dir(ctx)
-        cfg = load_config(project_root=project_dir, user_home=Path.home())
+        cfg = _load_project_config(project_dir)
 
         # Determine effective hash_prompts
         effective_hash = cfg.get("hash_prompts", False)
@@ -295,11 +561,13 @@ def approve_cmd(ctx: click.Context, session_id: str, fs_ability: str | None, has
             event_emitter.subscribe(StderrEventObserver())
 
         sessions_root = _get_sessions_root(ctx)
-        session_store = SessionStore(sessions_root=sessions_root)
+        session_store = _get_session_store(ctx)
         orchestrator = WorkflowOrchestrator(
             session_store=session_store,
             sessions_root=sessions_root,
             event_emitter=event_emitter,
+            response_cache=_get_response_cache(ctx),
+            artifact_store=_get_artifact_store(ctx),
         )
 
         # Call orchestrator.approve with fs_ability
@@ -388,13 +656,14 @@ def reject_cmd(ctx: click.Context, session_id: str, feedback: str) -> None:
     """
     try:
         from aiwf.application.workflow_orchestrator import WorkflowOrchestrator, InvalidCommand
-        from aiwf.domain.persistence.session_store import SessionStore
 
         sessions_root = _get_sessions_root(ctx)
-        session_store = SessionStore(sessions_root=sessions_root)
+        session_store = _get_session_store(ctx)
         orchestrator = WorkflowOrchestrator(
             session_store=session_store,
             sessions_root=sessions_root,
+            response_cache=_get_response_cache(ctx),
+            artifact_store=_get_artifact_store(ctx),
         )
 
         state = orchestrator.reject(session_id, feedback=feedback)
@@ -474,50 +743,36 @@ def list_cmd(
 ) -> None:
     """List all workflow sessions."""
     try:
-        from aiwf.domain.persistence.session_store import SessionStore
-
-        sessions_root = _get_sessions_root(ctx)
-        session_store = SessionStore(sessions_root=sessions_root)
-        session_ids = session_store.list_sessions()
 
-        sessions: list[SessionSummary] = []
-        for session_id in session_ids:
-            try:
-                state = session_store.load(session_id)
-
-                # Apply filters
-                if filter_status != "all":
-                    if filter_status == "in_progress" and state.status != WorkflowStatus.IN_PROGRESS:
-                        continue
-                    elif filter_status == "complete" and state.phase != WorkflowPhase.COMPLETE:
-                        continue
-                    elif filter_status == "error" and state.status != WorkflowStatus.ERROR:
-                        continue
-                    elif filter_status == "cancelled" and state.status != WorkflowStatus.CANCELLED:
-                        continue
-
-                if filter_profile and state.profile != filter_profile:
-                    continue
-
-                sessions.append(SessionSummary(
-                    session_id=state.session_id,
-                    profile=state.profile,
-                    context=state.context,
-                    phase=state.phase.name,
-                    status=state.status.name,
-                    iteration=state.current_iteration,
-                    created_at=state.created_at.isoformat(),
-                    updated_at=state.updated_at.isoformat(),
-                ))
+        # Translate the CLI filter into catalog columns; unknown values match all
+        status_filters = {
+            "in_progress": {"status": WorkflowStatus.IN_PROGRESS.value},
+            "complete": {"phase": WorkflowPhase.COMPLETE.value},
+            "error": {"status": WorkflowStatus.ERROR.value},
+            "cancelled": {"status": WorkflowStatus.CANCELLED.value},
+        }
 
-                if len(sessions) >= limit:
-                    break
-            except Exception:
-                # Skip sessions that fail to load
-                continue
+        sessions_root = _get_sessions_root(ctx)
+        session_store = _get_session_store(ctx)
+        entries = session_store.query_sessions(
+            profile=filter_profile,
+            limit=limit,
+            **status_filters.get(filter_status, {}),
+        )
 
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+        sessions = [
+            SessionSummary(
+                session_id=entry.session_id,
+                profile=entry.profile,
+                context=entry.context,
+                phase=WorkflowPhase(entry.phase).name,
+                status=WorkflowStatus(entry.status).name,
+                iteration=entry.iteration,
+                created_at=entry.created_at,
+                updated_at=entry.updated_at,
+            )
+            for entry in entries
+        ]
 
         if _get_json_mode(ctx):
             _json_emit(
@@ -553,14 +808,349 @@ def list_cmd(
         raise click.ClickException(str(e)) from e
 
 
+@cli.command("rebuild-index")
+@click.pass_context
+def rebuild_index_cmd(ctx: click.Context) -> None:
+    """Rebuild the session catalog index from session files on disk.
+
+    Use this to recover after sessions were copied, edited or removed
+    outside of aiwf.
+    """
+    try:
+
+        session_store = _get_session_store(ctx)
+        indexed, skipped = session_store.rebuild_index()
+
+        if _get_json_mode(ctx):
+            _json_emit(
+                RebuildIndexOutput(
+                    exit_code=0,
+                    indexed=indexed,
+                    skipped=skipped,
+                )
+            )
+            raise click.exceptions.Exit(0)
+
+        click.echo(f"indexed={indexed}")
+        click.echo(f"skipped={skipped}")
+
+    except click.exceptions.Exit:
+        raise
+    except Exception as e:
+        if _get_json_mode(ctx):
+            _json_emit(
+                RebuildIndexOutput(
+                    exit_code=1,
+                    error=str(e),
+                )
+            )
+            raise click.exceptions.Exit(1)
+        raise click.ClickException(str(e)) from e
+
+
+@cli.command("prune-blobs")
+@click.pass_context
+def prune_blobs_cmd(ctx: click.Context) -> None:
+    """Remove stored code artifacts no session uses any more.
+
+    With artifact_store: blobs, code files are kept once under
+    .aiwf/sessions/.blobs/. Run this after deleting session directories,
+    while no workflow command is running.
+    """
+    try:
+        from aiwf.application.storage import ArtifactBlobStore
+
+        store = ArtifactBlobStore.for_sessions_root(_get_sessions_root(ctx))
+        removed, freed = store.prune()
+
+        if _get_json_mode(ctx):
+            _json_emit(
+                PruneBlobsOutput(
+                    exit_code=0,
+                    removed=removed,
+                    freed_bytes=freed,
+                )
+            )
+            raise click.exceptions.Exit(0)
+
+        click.echo(f"removed={removed}")
+        click.echo(f"freed_bytes={freed}")
+
+    except click.exceptions.Exit:
+        raise
+    except Exception as e:
+        if _get_json_mode(ctx):
+            _json_emit(
+                PruneBlobsOutput(
+                    exit_code=1,
+                    error=str(e),
+                )
+            )
+            raise click.exceptions.Exit(1)
+        raise click.ClickException(str(e)) from e
+
+
+@cli.command("stats")
+@click.argument("session_id", type=str, required=False)
+@click.option("--profile", "filter_profile", type=str, default=None, help="Only include sessions for this profile")
+@click.pass_context
+def stats_cmd(ctx: click.Context, session_id: str | None, filter_profile: str | None) -> None:
+    """Summarize provider calls and stage timings.
+
+    Provider calls are grouped by phase and provider (latency, tokens,
+    cost). Stage timings come from the session catalog and report
+    p50/p90/p99 durations per phase, stage and provider, with time spent
+    waiting on a human reported separately from machine time. Aggregates
+    one session, or every session when SESSION_ID is omitted.
+    """
+    try:
+        from aiwf.application.session_stats import (
+            load_metrics,
+            summarize_provider_calls,
+            summarize_stage_timings,
+        )
+
+        metrics = load_metrics(_get_sessions_root(ctx), session_id)
+        if filter_profile is not None:
+            profile_sessions = {
+                entry.session_id
+                for entry in _get_session_store(ctx).query_sessions(profile=filter_profile)
+            }
+            metrics = [m for m in metrics if m.session_id in profile_sessions]
+        rows = [
+            ProviderCallStatsRow(
+                phase=stats.phase,
+                provider=stats.provider,
+                calls=stats.calls,
+                errors=stats.errors,
+                cache_hits=stats.cache_hits,
+                retries=stats.retries,
+                total_seconds=stats.total_seconds,
+                mean_seconds=stats.mean_seconds,
+                p50_seconds=stats.p50_seconds,
+                p90_seconds=stats.p90_seconds,
+                p99_seconds=stats.p99_seconds,
+                mean_ttft_seconds=stats.mean_ttft_seconds,
+                input_tokens=stats.input_tokens,
+                output_tokens=stats.output_tokens,
+                cost_usd=stats.cost_usd,
+            )
+            for stats in summarize_provider_calls(metrics)
+        ]
+        intervals = _get_session_store(ctx).query_stage_timings(
+            session_id=session_id, profile=filter_profile
+        )
+        stages = [
+            StageTimingRow(
+                phase=stats.phase,
+                stage=stats.stage,
+                provider=stats.provider,
+                kind=stats.kind,
+                count=stats.count,
+                total_seconds=stats.total_seconds,
+                p50_seconds=stats.p50_seconds,
+                p90_seconds=stats.p90_seconds,
+                p99_seconds=stats.p99_seconds,
+            )
+            for stats in summarize_stage_timings(intervals)
+        ]
+        total_seconds = sum(row.total_seconds for row in rows)
+        total_cost = sum(row.cost_usd for row in rows)
+        machine_seconds = sum(i.seconds for i in intervals if i.kind == "machine")
+        human_wait_seconds = sum(i.seconds for i in intervals if i.kind == "human")
+
+        if _get_json_mode(ctx):
+            _json_emit(
+                StatsOutput(
+                    exit_code=0,
+                    session_id=session_id,
+                    providers=rows,
+                    stages=stages,
+                    total_calls=len(metrics),
+                    total_seconds=total_seconds,
+                    total_cost_usd=total_cost,
+                    machine_seconds=machine_seconds,
+                    human_wait_seconds=human_wait_seconds,
+                )
+            )
+            raise click.exceptions.Exit(0)
+
+        if not rows and not stages:
+            click.echo("No provider calls or stage timings recorded.")
+            return
+
+        if rows:
+            click.echo(
+                f"{'PHASE':<10}{'PROVIDER':<14}{'CALLS':>6}{'ERRORS':>8}{'TOTAL_S':>10}"
+                f"{'P50_S':>9}{'P90_S':>9}{'P99_S':>9}{'TTFT_S':>9}"
+                f"{'IN_TOK':>10}{'OUT_TOK':>10}{'COST_USD':>10}"
+            )
+            for row in rows:
+                ttft = f"{row.mean_ttft_seconds:.2f}" if row.mean_ttft_seconds is not None else "-"
+                click.echo(
+                    f"{row.phase:<10}{row.provider:<14}{row.calls:>6}{row.errors:>8}"
+                    f"{row.total_seconds:>10.2f}{row.p50_seconds:>9.2f}"
+                    f"{row.p90_seconds:>9.2f}{row.p99_seconds:>9.2f}{ttft:>9}"
+                    f"{row.input_tokens:>10}{row.output_tokens:>10}{row.cost_usd:>10.4f}"
+                )
+            click.echo("")
+
+        if stages:
+            click.echo(
+                f"{'PHASE':<10}{'STAGE':<10}{'PROVIDER':<14}{'KIND':<9}{'COUNT':>6}"
+                f"{'TOTAL_S':>10}{'P50_S':>9}{'P90_S':>9}{'P99_S':>9}"
+            )
+            for stage in stages:
+                click.echo(
+                    f"{stage.phase:<10}{stage.stage or '-':<10}{stage.provider or '-':<14}"
+                    f"{stage.kind:<9}{stage.count:>6}{stage.total_seconds:>10.2f}"
+                    f"{stage.p50_seconds:>9.2f}{stage.p90_seconds:>9.2f}{stage.p99_seconds:>9.2f}"
+                )
+            click.echo("")
+
+        click.echo(f"total_calls={len(metrics)}")
+        click.echo(f"total_seconds={total_seconds:.2f}")
+        click.echo(f"total_cost_usd={total_cost:.4f}")
+        click.echo(f"machine_seconds={machine_seconds:.2f}")
+        click.echo(f"human_wait_seconds={human_wait_seconds:.2f}")
+
+    except click.exceptions.Exit:
+        raise
+    except Exception as e:
+        if _get_json_mode(ctx):
+            _json_emit(
+                StatsOutput(
+                    exit_code=1,
+                    session_id=session_id,
+                    error=str(e),
+                )
+            )
+            raise click.exceptions.Exit(1)
+        raise click.ClickException(str(e)) from e
+
+
+@cli.command("batch")
+@click.argument("manifest_path", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("--workers", type=int, default=None, help="Sessions to run concurrently (overrides manifest)")
+@click.option(
+    "--provider-limit",
+    "provider_limit_pairs",
+    multiple=True,
+    help="Max concurrent calls per provider as key=N (e.g., --provider-limit claude-code=2)",
+)
+@click.pass_context
+def batch_cmd(
+    ctx: click.Context,
+    manifest_path: Path,
+    workers: int | None,
+    provider_limit_pairs: tuple[str, ...],
+) -> None:
+    """Create and run one session per entity in a batch manifest.
+
+    MANIFEST_PATH is a YAML file with shared profile/providers/context and
+    one entry per entity. Sessions run concurrently and each advances as
+    far as its approval configuration allows.
+
+    Example:
+        aiwf batch catalog.yml --workers 8 --provider-limit claude-code=3
+    """
+    try:
+        from aiwf.application.approval_config import ApprovalConfig
+        from aiwf.application.batch_runner import BatchManifest, BatchRunner
+
+        manifest = BatchManifest.from_file(manifest_path)
+
+        provider_limits = dict(manifest.provider_limits)
+        for pair in provider_limit_pairs:
+            key, sep, value = pair.partition("=")
+            if not sep or not value.isdigit() or int(value) < 1:
+                raise ValueError(f"Invalid provider limit: {pair}. Use key=N with N >= 1")
+            provider_limits[key] = int(value)
+
+        total = len(manifest.entries)
+        json_mode = _get_json_mode(ctx)
+        completed = 0
+
+        def report(item) -> None:
+            nonlocal completed
+            completed += 1
+            if json_mode:
+                return
+            outcome = f"error: {item.error}" if item.failed else f"{item.phase} {item.status}"
+            click.echo(
+                f"[{completed}/{total}] {item.label}: {outcome} ({item.elapsed_seconds:.1f}s)",
+                err=True,
+            )
+
+        sessions_root = _get_sessions_root(ctx)
+        runner = BatchRunner(
+            session_store=_get_session_store(ctx),
+            sessions_root=sessions_root,
+            standards_cache_dir=_get_project_dir(ctx) / STANDARDS_CACHE_DIR,
+            workers=workers if workers is not None else manifest.workers,
+            provider_limits=provider_limits,
+            approval_config=ApprovalConfig.from_dict(manifest.approval),
+            on_result=report,
+            response_cache=_get_response_cache(ctx),
+            artifact_store=_get_artifact_store(ctx),
+        )
+        result = runner.run(manifest)
+
+        sessions = [
+            BatchSessionResult(
+                name=item.label,
+                session_id=item.session_id,
+                phase=item.phase,
+                stage=item.stage,
+                status=item.status,
+                pending_approval=item.pending_approval,
+                error=item.error,
+                elapsed_seconds=round(item.elapsed_seconds, 3),
+            )
+            for item in result.items
+        ]
+        exit_code = 1 if result.failed else 0
+
+        if json_mode:
+            _json_emit(
+                BatchOutput(
+                    exit_code=exit_code,
+                    sessions=sessions,
+                    total=len(sessions),
+                    failed=result.failed,
+                    elapsed_seconds=round(result.elapsed_seconds, 3),
+                )
+            )
+            raise click.exceptions.Exit(exit_code)
+
+        # Plain text table output
+        click.echo(f"{'NAME':<20}{'SESSION_ID':<34}{'PHASE':<12}{'STATUS':<12}")
+        for s in sessions:
+            click.echo(f"{s.name:<20}{s.session_id or '-':<34}{s.phase or '-':<12}{s.status or '-':<12}")
+        click.echo(f"total={len(sessions)} failed={result.failed} elapsed={result.elapsed_seconds:.1f}s")
+        raise click.exceptions.Exit(exit_code)
+
+    except click.exceptions.Exit:
+        raise
+    except Exception as e:
+        error_msg = _format_error(e)
+        if _get_json_mode(ctx):
+            _json_emit(
+                BatchOutput(
+                    exit_code=1,
+                    error=error_msg,
+                )
+            )
+            raise click.exceptions.Exit(1)
+        raise click.ClickException(error_msg) from e
+
+
 @cli.command("profiles")
 @click.argument("profile_name", type=str, required=False)
 @click.pass_context
 def profiles_cmd(ctx: click.Context, profile_name: str | None) -> None:
     """List available workflow profiles or show details for a specific profile."""
     try:
-        # Import profiles to ensure registration
-        import profiles.jpa_mt  # noqa: F401
         from aiwf.domain.profiles.profile_factory import ProfileFactory
 
         if profile_name:
@@ -790,7 +1380,7 @@ def _validate_standards_provider(
     try:
         # Determine which profile to use
         project_root = project_dir or Path.cwd()
-        cfg = load_config(project_root=project_root, user_home=Path.home())
+        cfg = _load_project_config(project_root)
         profile_to_use = profile_key or cfg.get("profile")
 
         # Profile is required
@@ -950,14 +1540,47 @@ def validate_cmd(
         raise click.ClickException(str(e)) from e
 
 
-# Discover and register profiles at import time
-def _init_profiles():
-    from aiwf.interface.cli.profile_discovery import discover_and_register_profiles
-    try:
-        registered = discover_and_register_profiles(cli)
-        logger.debug(f"Registered profiles: {registered}")
-    except Exception as e:
-        logger.warning(f"Error during profile discovery: {e}")
+@cli.command("serve")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket to listen on (default: ~/.aiwf/run/daemon.sock, or AIWF_DAEMON_SOCKET)",
+)
+@click.option("--stop", is_flag=True, help="Stop the running daemon and exit.")
+def serve_cmd(socket_path: Path | None, stop: bool) -> None:
+    """Run a daemon that serves CLI commands from a warm process.
+
+    While it runs, `aiwf` commands in other terminals are sent to the daemon
+    over a local Unix socket instead of starting the engine from scratch.
+    Commands run with the calling terminal's working directory and
+    environment (PATH, provider credentials, AIWF_* settings); a command
+    sent while the daemon is busy runs in its own process instead.
+    Providers pooled by the daemon keep the settings they were created
+    with until they expire. Set AIWF_NO_DAEMON=1 to bypass it. Stop it
+    with Ctrl+C or `aiwf serve --stop`.
+    """
+    from aiwf.interface.cli.daemon import create_server, daemon_socket_path, request_daemon
 
+    socket_path = socket_path or daemon_socket_path()
+    if stop:
+        reply = request_daemon("shutdown", socket_path)
+        if reply is None:
+            raise click.ClickException(f"No aiwf daemon running on {socket_path}")
+        click.echo(f"Stopped aiwf daemon (pid {reply['pid']})")
+        return
 
-_init_profiles()
+    try:
+        server = create_server(socket_path)
+    except (RuntimeError, OSError) as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f"aiwf daemon listening on {socket_path} (pid {os.getpid()})", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    click.echo("aiwf daemon stopped", err=True)
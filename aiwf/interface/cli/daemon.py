@@ -0,0 +1,365 @@
+"""Long-running `aiwf serve` daemon and the thin client used by the `aiwf` command.
+
+Every one-shot CLI process re-imports the engine, re-discovers profiles
+and rebuilds config, providers and session stores. `aiwf serve` keeps a
+single process warm: imports, profile discovery, the ProfileFactory
+instance cache, the ProviderFactory pool and, per project, the loaded
+config and session stores (see _WarmCaches in cli.py).
+
+The daemon listens on a Unix socket (~/.aiwf/run/daemon.sock, or
+AIWF_DAEMON_SOCKET). The `aiwf` entry point (main()) only imports the
+standard library before trying the socket; when a daemon answers, the
+command runs there and its output is relayed, otherwise it runs in-process
+as before. Output is produced by the same click commands either way, so
+--json output is identical.
+
+Protocol: the client sends one JSON line,
+    {"op": "run", "argv": [...], "cwd": "...", "env": {...}}
+and the daemon answers with JSON lines
+    {"stream": "stdout" | "stderr", "data": "..."}  (zero or more)
+    {"exit_code": 0}                                (last)
+or, if it is already running a command, with the single line
+    {"busy": true}
+in which case the client runs the command in-process. A long `approve`
+in the daemon therefore never holds up other commands. "ping" and
+"shutdown" ops answer with a single line.
+
+Commands run one at a time in the client's working directory and with the
+client's environment (PATH, provider credentials, AIWF_* settings), which
+replaces the daemon's own environment for the duration of the command.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+from aiwf.domain.constants import DAEMON_SOCKET_FILE
+
+# Setting this (to any value) makes `aiwf` ignore a running daemon
+NO_DAEMON_ENV = "AIWF_NO_DAEMON"
+SOCKET_ENV = "AIWF_DAEMON_SOCKET"
+# Top-level `aiwf` options that take a value (see the cli group in cli.py)
+_VALUE_OPTIONS = {"--project-dir", "--trace-file", "--trace-endpoint"}
+
+
+def daemon_socket_path() -> Path:
+    """Socket path of the daemon: AIWF_DAEMON_SOCKET or ~/.aiwf/run/daemon.sock."""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    return Path.home() / DAEMON_SOCKET_FILE
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+
+def main() -> None:
+    """`aiwf` entry point: run the command in the daemon if one is running."""
+    argv = sys.argv[1:]
+    exit_code = run_via_daemon(argv)
+    if exit_code is None:
+        from aiwf.interface.cli.cli import cli
+
+        cli(args=argv, prog_name="aiwf")
+    sys.exit(exit_code)
+
+
+def run_via_daemon(argv: list[str], socket_path: Path | None = None) -> int | None:
+    """
+    Run a CLI command in the daemon, relaying its output to stdout/stderr.
+
+    Args:
+        argv: CLI arguments (without the program name)
+        socket_path: Daemon socket (default: daemon_socket_path())
+
+    Returns:
+        The command's exit code, or None if no daemon is available or it
+        is busy with another command (the caller should run the command
+        itself)
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, "AF_UNIX"):
+        return None
+    if _subcommand(argv) == "serve":
+        return None
+    sock = _connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+
+    request = {
+        "op": "run",
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            _write_message(stream, request)
+            for line in stream:
+                message = json.loads(line)
+                if message.get("busy"):
+                    return None
+                if "exit_code" in message:
+                    return int(message["exit_code"])
+                target = sys.stderr if message.get("stream") == "stderr" else sys.stdout
+                target.write(message.get("data", ""))
+                target.flush()
+    except (OSError, ValueError) as e:
+        print(f"Error: lost connection to aiwf daemon: {e}", file=sys.stderr)
+        return 1
+    print("Error: aiwf daemon closed the connection", file=sys.stderr)
+    return 1
+
+
+def _subcommand(argv: list[str]) -> str | None:
+    """The subcommand in argv: its first token that is not a top-level option."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--":
+            return next(tokens, None)
+        if token in _VALUE_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token
+    return None
+
+
+def request_daemon(op: str, socket_path: Path | None = None) -> dict[str, Any] | None:
+    """Send a "ping" or "shutdown" request; None if no daemon is listening."""
+    sock = _connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            _write_message(stream, {"op": op})
+            line = stream.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _write_message(stream: Any, message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+# ============================================================================
+# Daemon
+# ============================================================================
+
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that runs CLI commands in this process.
+
+    Connections are handled on their own threads, but commands run one at
+    a time: each one changes the process working directory, environment
+    and sys.stdout/sys.stderr while it runs. A command arriving while
+    another runs is not queued; run_command() returns None and the client
+    runs it itself.
+    """
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, socket_path: Path) -> None:
+        self.socket_path = socket_path
+        self._command_lock = threading.Lock()
+        super().__init__(str(socket_path), _CommandHandler)
+        os.chmod(socket_path, 0o600)
+
+    def run_command(
+        self,
+        argv: list[str],
+        cwd: str,
+        env: dict[str, str],
+        stdout: io.TextIOBase,
+        stderr: io.TextIOBase,
+    ) -> int | None:
+        """Run one CLI command with the client's cwd, environment and output streams.
+
+        Returns:
+            The command's exit code, or None if another command is running
+        """
+        if not self._command_lock.acquire(blocking=False):
+            return None
+        try:
+            with (
+                _working_directory(cwd),
+                _client_environment(env),
+                redirect_stdout(stdout),
+                redirect_stderr(stderr),
+            ):
+                return _invoke_cli(argv)
+        finally:
+            self._command_lock.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def create_server(socket_path: Path | None = None) -> CommandServer:
+    """
+    Bind the daemon socket and warm up the CLI.
+
+    Raises:
+        RuntimeError: If a daemon is already listening on the socket, or
+            Unix sockets are not supported on this platform
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("aiwf serve requires Unix domain socket support")
+    socket_path = socket_path or daemon_socket_path()
+    if request_daemon("ping", socket_path) is not None:
+        raise RuntimeError(f"aiwf daemon already running on {socket_path}")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        socket_path.unlink()  # Left behind by a daemon that did not shut down cleanly
+    except FileNotFoundError:
+        pass
+
+    from aiwf.interface.cli import cli as cli_module
+
+    cli_module._enable_warm_caches()
+    cli_module._profile_entries()
+    # Import what most commands need up front, so the first command is warm too
+    import aiwf.application.workflow_orchestrator  # noqa: F401
+    import aiwf.domain.persistence.session_store  # noqa: F401
+
+    return CommandServer(socket_path)
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    server: CommandServer
+
+    def handle(self) -> None:
+        self._connected = True
+        try:
+            request = json.loads(self.rfile.readline())
+            op = request.get("op", "run")
+        except (ValueError, AttributeError):
+            self._send({"stream": "stderr", "data": "Error: malformed daemon request\n"})
+            self._send({"exit_code": 2})
+            return
+
+        if op == "ping":
+            self._send({"pid": os.getpid(), "socket": str(self.server.socket_path)})
+        elif op == "shutdown":
+            self._send({"pid": os.getpid()})
+            # shutdown() waits for serve_forever() to return; never call it on that thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif op == "run":
+            exit_code = self.server.run_command(
+                [str(arg) for arg in request.get("argv", [])],
+                request.get("cwd") or os.getcwd(),
+                request.get("env") or {},
+                _ClientStream(self._send, "stdout"),
+                _ClientStream(self._send, "stderr"),
+            )
+            if exit_code is None:
+                self._send({"busy": True})
+            else:
+                self._send({"exit_code": exit_code})
+        else:
+            self._send({"stream": "stderr", "data": f"Error: unknown daemon op '{op}'\n"})
+            self._send({"exit_code": 2})
+
+    def _send(self, message: dict[str, Any]) -> None:
+        if not self._connected:
+            return
+        try:
+            _write_message(self.wfile, message)
+        except OSError:
+            # Client went away; let the command finish, drop its output
+            self._connected = False
+
+
+class _ClientStream(io.TextIOBase):
+    """Text stream that forwards each write to the client as a JSON line."""
+
+    def __init__(self, send: Callable[[dict[str, Any]], None], name: str) -> None:
+        super().__init__()
+        self._send = send
+        self._name = name
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if not isinstance(s, str):
+            # click probes streams with write(b"") to detect binary writers
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+        if s:
+            self._send({"stream": self._name, "data": s})
+        return len(s)
+
+
+def _invoke_cli(argv: list[str]) -> int:
+    """Run the click CLI as the `aiwf` process would, returning its exit code."""
+    from aiwf.interface.cli.cli import cli
+
+    try:
+        cli.main(args=argv, prog_name="aiwf")
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        # One failing command must not take the daemon down
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+@contextmanager
+def _working_directory(cwd: str) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextmanager
+def _client_environment(env: dict[str, str]) -> Iterator[None]:
+    """Replace the daemon's environment with the client's for one command."""
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
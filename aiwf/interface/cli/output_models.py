@@ -4,7 +4,10 @@ from pydantic import BaseModel, Field
 
 class BaseOutput(BaseModel):
     schema_version: int = 1
-    command: Literal["init", "status", "approve", "reject", "list", "profiles", "providers", "validate"]
+    command: Literal[
+        "init", "status", "approve", "reject", "list", "rebuild-index",
+        "batch", "profiles", "providers", "validate", "stats",
+    ]
     exit_code: int
     error: str | None = None
 
@@ -64,6 +67,86 @@ class ListOutput(BaseOutput):
     total: int = 0
 
 
+class RebuildIndexOutput(BaseOutput):
+    """Output for rebuild-index command."""
+    command: Literal["rebuild-index"] = "rebuild-index"
+    indexed: int = 0
+    skipped: int = 0
+
+
+class PruneBlobsOutput(BaseOutput):
+    """Output for prune-blobs command."""
+    command: Literal["prune-blobs"] = "prune-blobs"
+    removed: int = 0
+    freed_bytes: int = 0
+
+
+class BatchSessionResult(BaseModel):
+    """Outcome of one batch entry."""
+    name: str
+    session_id: str | None = None
+    phase: str | None = None
+    stage: str | None = None
+    status: str | None = None
+    pending_approval: bool = False
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+
+class BatchOutput(BaseOutput):
+    """Output for batch command."""
+    command: Literal["batch"] = "batch"
+    sessions: list[BatchSessionResult] = Field(default_factory=list)
+    total: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class ProviderCallStatsRow(BaseModel):
+    """Aggregated provider calls for one phase and provider."""
+    phase: str
+    provider: str
+    calls: int
+    errors: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    mean_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p90_seconds: float = 0.0
+    p99_seconds: float = 0.0
+    mean_ttft_seconds: float | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class StageTimingRow(BaseModel):
+    """Duration percentiles for one phase/stage/provider and kind."""
+    phase: str
+    stage: str | None = None
+    provider: str | None = None
+    kind: str  # machine | human
+    count: int
+    total_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p90_seconds: float = 0.0
+    p99_seconds: float = 0.0
+
+
+class StatsOutput(BaseOutput):
+    """Output for stats command."""
+    command: Literal["stats"] = "stats"
+    session_id: str | None = None
+    providers: list[ProviderCallStatsRow] = Field(default_factory=list)
+    stages: list[StageTimingRow] = Field(default_factory=list)
+    total_calls: int = 0
+    total_seconds: float = 0.0
+    total_cost_usd: float = 0.0
+    machine_seconds: float = 0.0
+    human_wait_seconds: float = 0.0
+
+
 class ProfileSummary(BaseModel):
     """Summary of a profile for list output."""
     name: str
@@ -5,16 +5,28 @@ Discovers and registers workflow profiles from:
 2. Entry points (aiwf.profiles group)
 
 Entry points have higher precedence and override local profiles on name collision.
+
+The CLI does not import profiles at startup. register_profile_loaders()
+reads a discovery manifest cached in ~/.aiwf/cache/profiles.json and
+registers each profile lazily; its module is imported only when a command
+needs the profile class or its subcommands. The manifest is rebuilt by a
+full discovery when the local profile directories or the installed
+distributions change.
 """
+import importlib
 import importlib.util
+import json
 import logging
 import os
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 import click
 from importlib.metadata import entry_points
 
+from aiwf.domain.constants import PROFILE_MANIFEST_FILE
 from aiwf.domain.profiles.profile_factory import ProfileFactory
 from aiwf.domain.profiles.workflow_profile import WorkflowProfile
 
@@ -22,6 +34,26 @@ logger = logging.getLogger(__name__)
 
 RegisterFn = Callable[[click.Group], type[WorkflowProfile]]
 
+MANIFEST_FORMAT_VERSION = 1
+
+# Profile command groups built so far, by profile name
+_loaded_groups: dict[str, click.Group] = {}
+
+
+@dataclass(frozen=True)
+class ProfileManifestEntry:
+    """A discovered profile, as recorded in the discovery manifest.
+
+    Attributes:
+        name: Profile name (CLI subcommand and ProfileFactory key)
+        source: "local:<profile dir>" or "entrypoint:<module>:<attr>"
+        description: Help text for the profile's command group
+    """
+
+    name: str
+    source: str
+    description: str
+
 
 def discover_and_register_profiles(
     cli: click.Group,
@@ -55,16 +87,7 @@ def _discover_local_profiles(
     """Discover profiles from local directory."""
     registered = {}
 
-    # Determine profiles directory with precedence:
-    # 1. Explicit profiles_dir parameter
-    # 2. AIWF_PROFILES_DIR environment variable
-    # 3. Default ~/.aiwf/profiles/
-    if profiles_dir is not None:
-        local_dir = profiles_dir
-    elif os.environ.get("AIWF_PROFILES_DIR"):
-        local_dir = Path(os.environ["AIWF_PROFILES_DIR"])
-    else:
-        local_dir = Path.home() / ".aiwf" / "profiles"
+    local_dir = _local_profiles_dir(profiles_dir)
 
     if not local_dir.exists():
         return registered
@@ -80,24 +103,10 @@ def _discover_local_profiles(
         profile_name = profile_dir.name
 
         try:
-            # Load module from file
-            spec = importlib.util.spec_from_file_location(
-                f"aiwf_local_profile_{profile_name}",
-                init_file
-            )
-            if spec is None or spec.loader is None:
-                logger.warning(f"Could not load spec for local profile '{profile_name}'")
-                continue
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            if not hasattr(module, "register"):
-                logger.warning(f"Local profile '{profile_name}' has no register() function")
+            register_fn = _load_local_register_fn(profile_name, init_file)
+            if register_fn is None:
                 continue
 
-            register_fn: RegisterFn = module.register
-
             # Create command group with placeholder help
             profile_group = click.Group(name=profile_name)
             profile_class = register_fn(profile_group)
@@ -158,4 +167,187 @@ def _discover_entrypoint_profiles(cli: click.Group) -> dict[str, str]:
         except Exception as e:
             logger.warning(f"Failed to load profile '{profile_name}': {e}")
 
-    return registered
\ No newline at end of file
+    return registered
+
+# ============================================================================
+# Discovery manifest (lazy loading)
+# ============================================================================
+
+
+def register_profile_loaders(
+    profiles_dir: Path | None = None,
+    manifest_file: Path | None = None,
+) -> dict[str, ProfileManifestEntry]:
+    """Register every discovered profile with ProfileFactory, lazily.
+
+    Args:
+        profiles_dir: Directory to scan for local profiles (see _discover_local_profiles)
+        manifest_file: Manifest cache path (default: ~/.aiwf/cache/profiles.json)
+
+    Returns:
+        Manifest entries by profile name
+    """
+    entries = load_profile_manifest(profiles_dir, manifest_file)
+    for entry in entries:
+        ProfileFactory.register_lazy(entry.name, _profile_loader(entry))
+    return {entry.name: entry for entry in entries}
+
+
+def load_profile_manifest(
+    profiles_dir: Path | None = None,
+    manifest_file: Path | None = None,
+) -> list[ProfileManifestEntry]:
+    """Return the discovered profiles, from the manifest cache when it is current.
+
+    On a cache miss every profile is imported and registered (as
+    discover_and_register_profiles() does) and the manifest is rewritten.
+    """
+    local_dir = _local_profiles_dir(profiles_dir)
+    manifest_file = manifest_file or Path.home() / PROFILE_MANIFEST_FILE
+    key = _discovery_key(local_dir)
+
+    try:
+        payload = json.loads(manifest_file.read_text(encoding="utf-8"))
+        if payload.get("key") == key:
+            return [ProfileManifestEntry(**entry) for entry in payload["profiles"]]
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        pass  # Missing or unreadable manifest: rediscover
+
+    scratch = click.Group(name="aiwf")
+    registered = discover_and_register_profiles(scratch, profiles_dir=local_dir)
+    entries = []
+    for name, source in registered.items():
+        group = scratch.commands[name]
+        if isinstance(group, click.Group):
+            _loaded_groups[name] = group
+        entries.append(ProfileManifestEntry(name=name, source=source, description=group.help or ""))
+
+    payload = {
+        "version": MANIFEST_FORMAT_VERSION,
+        "key": key,
+        "profiles": [asdict(entry) for entry in entries],
+    }
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = manifest_file.with_suffix(".json.tmp")
+        temp_file.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        temp_file.replace(manifest_file)
+    except OSError as e:
+        logger.debug(f"Could not write profile manifest {manifest_file}: {e}")
+    return entries
+
+
+def load_profile_command(entry: ProfileManifestEntry) -> click.Group:
+    """Return a profile's command group, importing the profile if needed.
+
+    Raises:
+        Exception: Whatever the profile module raises while loading
+    """
+    group = _loaded_groups.get(entry.name)
+    if group is None:
+        # Runs the lazy loader registered by register_profile_loaders()
+        ProfileFactory.get(entry.name)
+        group = _loaded_groups.get(entry.name)
+    if group is None:
+        # Class was registered another way; build the commands only
+        _profile_loader(entry)()
+        group = _loaded_groups[entry.name]
+    return group
+
+
+def _profile_loader(entry: ProfileManifestEntry) -> Callable[[], type[WorkflowProfile]]:
+    """Loader that imports a manifest profile and builds its command group."""
+
+    def load() -> type[WorkflowProfile]:
+        kind, _, target = entry.source.partition(":")
+        if kind == "local":
+            register_fn = _load_local_register_fn(entry.name, Path(target) / "__init__.py")
+            if register_fn is None:
+                raise ImportError(f"Local profile '{entry.name}' could not be loaded")
+        elif kind == "entrypoint":
+            register_fn = _load_object(target)
+        else:
+            raise ValueError(f"Unknown profile source: {entry.source}")
+
+        group = click.Group(name=entry.name, help=entry.description or None)
+        profile_class = register_fn(group)
+        _loaded_groups[entry.name] = group
+        return profile_class
+
+    return load
+
+
+def _load_local_register_fn(profile_name: str, init_file: Path) -> RegisterFn | None:
+    """Execute a local profile's __init__.py and return its register(), or None."""
+    spec = importlib.util.spec_from_file_location(
+        f"aiwf_local_profile_{profile_name}",
+        init_file
+    )
+    if spec is None or spec.loader is None:
+        logger.warning(f"Could not load spec for local profile '{profile_name}'")
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    if not hasattr(module, "register"):
+        logger.warning(f"Local profile '{profile_name}' has no register() function")
+        return None
+    return module.register
+
+
+def _load_object(reference: str) -> Any:
+    """Import an entry point reference ("module:attr.path [extras]")."""
+    module_name, _, attr = reference.split("[", 1)[0].strip().partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for part in filter(None, attr.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _local_profiles_dir(profiles_dir: Path | None) -> Path:
+    """Resolve the local profiles directory.
+
+    Precedence: explicit profiles_dir, AIWF_PROFILES_DIR, ~/.aiwf/profiles/.
+    """
+    if profiles_dir is not None:
+        return profiles_dir
+    if os.environ.get("AIWF_PROFILES_DIR"):
+        return Path(os.environ["AIWF_PROFILES_DIR"])
+    return Path.home() / ".aiwf" / "profiles"
+
+
+def _discovery_key(local_dir: Path) -> dict[str, Any]:
+    """Everything a cached manifest depends on.
+
+    Local profiles are keyed by directory and __init__.py mtimes. Installed
+    distributions are keyed by the mtimes of the site-packages directories
+    on sys.path: installing, upgrading or removing a distribution adds,
+    renames or removes its .dist-info directory there. This avoids
+    enumerating distribution metadata on every start.
+    """
+    local: dict[str, list[int]] = {}
+    try:
+        for profile_dir in sorted(local_dir.iterdir()):
+            init_file = profile_dir / "__init__.py"
+            if init_file.is_file():
+                local[profile_dir.name] = [profile_dir.stat().st_mtime_ns, init_file.stat().st_mtime_ns]
+    except OSError:
+        pass  # No local profiles directory
+
+    site: dict[str, int] = {}
+    for entry in sys.path:
+        if not entry.endswith(("site-packages", "dist-packages")):
+            continue
+        try:
+            site[entry] = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+
+    return {
+        "version": MANIFEST_FORMAT_VERSION,
+        "python": sys.version,
+        "local_dir": str(local_dir),
+        "local": local,
+        "site": site,
+    }
@@ -0,0 +1,17 @@
+"""Benchmarks for the engine's own overhead on hot paths.
+
+AI providers are faked, so timings cover only engine work: session
+persistence, listing, standards bundles, prompt rendering, response
+processing and full orchestrator runs.
+
+Run from the repository root:
+
+    python -m benchmarks                          # run and compare to baseline.json
+    python -m benchmarks -k session_store         # only matching benchmarks
+    python -m benchmarks --update-baseline        # record a new baseline
+
+    python -m benchmarks.loadtest --sessions 300 --workers 32   # concurrent load test
+
+Baselines are machine-specific; record one on the machine that runs the
+comparison.
+"""
@@ -0,0 +1,127 @@
+"""Command-line runner: python -m benchmarks --help."""
+
+import argparse
+import importlib
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import (
+    DEFAULT_NOISE_FLOOR,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    calibrate,
+    compare,
+    current_interpreter,
+    load_results,
+    measure,
+    write_results,
+)
+
+BENCHMARK_MODULES = [
+    "benchmarks.bench_session_store",
+    "benchmarks.bench_list",
+    "benchmarks.bench_standards",
+    "benchmarks.bench_jpa_mt_profile",
+    "benchmarks.bench_orchestrator",
+    "benchmarks.bench_cli_startup",
+]
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_OUTPUT = Path(".aiwf") / "benchmarks" / "results.json"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time engine hot paths and compare against a stored baseline.",
+    )
+    parser.add_argument("-k", "--filter", dest="pattern", default=None,
+                        help="Only run benchmarks whose name contains this substring")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help=f"Results JSON path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown over baseline median (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR,
+                        help="Slowdowns under this many seconds are never regressions "
+                             f"(default: {DEFAULT_NOISE_FLOOR})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write results to the baseline path instead of comparing")
+    return parser.parse_args(argv)
+
+
+def _run(pattern: str | None) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="aiwf-bench-") as tmp:
+        for module_name in BENCHMARK_MODULES:
+            module = importlib.import_module(module_name)
+            workdir = Path(tmp) / module_name.rsplit(".", 1)[-1]
+            workdir.mkdir()
+            for benchmark in module.benchmarks(workdir):
+                if pattern and pattern not in benchmark.name:
+                    continue
+                result = measure(benchmark)
+                results.append(result)
+                print(
+                    f"{result.name:<75} median {result.median_seconds * 1000:10.3f} ms"
+                    f"   min {result.min_seconds * 1000:10.3f} ms"
+                )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    # Warnings from fake data (e.g. no code blocks) are noise here
+    logging.basicConfig(level=logging.ERROR)
+
+    calibration = calibrate()
+    print(f"{'calibration':<75} median {calibration * 1000:10.3f} ms")
+    results = _run(args.pattern)
+    if not results:
+        print(f"No benchmarks match: {args.pattern}", file=sys.stderr)
+        return 1
+
+    if args.update_baseline:
+        write_results(args.baseline, results, calibration)
+        print(f"\nBaseline written: {args.baseline}")
+        return 0
+
+    write_results(args.output, results, calibration)
+    print(f"\nResults written: {args.output}")
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; skipping comparison.")
+        return 0
+
+    baseline = load_results(args.baseline)
+    scale = calibration / baseline.calibration_seconds
+    report = compare(results, baseline.results, args.threshold, scale, args.noise_floor)
+    print(
+        f"\nCompared to {args.baseline} (threshold +{args.threshold:.0%}, "
+        f"this machine {scale:.2f}x the baseline's calibration time):"
+    )
+    if baseline.interpreter != current_interpreter():
+        print(
+            f"  Baseline taken on {baseline.interpreter}, this run on {current_interpreter()}; "
+            "ratios are approximate."
+        )
+    for c in report.comparisons:
+        flag = "REGRESSION" if c.regressed else "ok"
+        print(f"  {c.name:<75} {c.ratio:6.2f}x  {flag}")
+    for name in report.new:
+        print(f"  {name:<75}   new")
+    if not args.pattern:
+        for name in report.missing:
+            print(f"  {name:<75}   missing")
+
+    if report.regressions:
+        print(f"\n{len(report.regressions)} regression(s) over threshold.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
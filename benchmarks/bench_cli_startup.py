@@ -0,0 +1,36 @@
+"""Cold start of the `aiwf` process (interpreter, imports, profile manifest)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from aiwf.domain.persistence.session_store import SessionStore
+
+from benchmarks.fixtures import make_state
+from benchmarks.harness import Benchmark
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    project_dir = workdir / "project"
+    store = SessionStore(sessions_root=project_dir / ".aiwf" / "sessions")
+    store.save(make_state("bench-startup", artifacts=4, history=6))
+
+    # Private HOME: the warmup round writes the profile manifest, so timed
+    # rounds measure the cached (normal) start
+    env = {**os.environ, "HOME": str(workdir / "home"), "USERPROFILE": str(workdir / "home")}
+    env.pop("AIWF_PROFILES_DIR", None)
+
+    cases: list[Benchmark] = []
+    for command in (["list"], ["status", "bench-startup"]):
+        argv = [sys.executable, "-m", "aiwf", "--project-dir", str(project_dir), *command]
+
+        def run(argv=argv) -> None:
+            result = subprocess.run(argv, cwd=_REPO_ROOT, env=env, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"{' '.join(argv[2:])} failed: {result.stderr}")
+
+        cases.append(Benchmark(f"cli.cold_start[{command[0]}]", run))
+    return cases
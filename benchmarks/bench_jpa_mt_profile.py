@@ -0,0 +1,59 @@
+"""JpaMtProfile prompt rendering and generation response processing."""
+
+from pathlib import Path
+
+from profiles.jpa_mt.profile import JpaMtProfile
+
+from benchmarks.fixtures import (
+    make_generation_response,
+    make_jpa_mt_config,
+    write_rules_corpus,
+    write_schema,
+)
+from benchmarks.harness import Benchmark
+
+RESPONSE_SIZES = [1_000_000, 4_000_000]
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    rules_path = workdir / "rules"
+    names = write_rules_corpus(rules_path, files=4, rules_per_file=500)
+    profile = JpaMtProfile(config=make_jpa_mt_config(rules_path, names))
+    context = {
+        "scope": "domain",
+        "entity": "Tier",
+        "table": "app.tiers",
+        "bounded_context": "pricing",
+        "schema_file": str(write_schema(workdir / "schema.sql")),
+        "standards_files": names,
+        "standards_prefixes": ["JPA-", "JV-", "PKG-"],
+        "iteration": 1,
+    }
+
+    cases = [
+        Benchmark(
+            f"jpa_mt_profile.{method}",
+            lambda method=method: getattr(profile, method)(context),
+            rounds=10,
+        )
+        for method in (
+            "generate_planning_prompt",
+            "generate_generation_prompt",
+            "generate_review_prompt",
+            "generate_revision_prompt",
+        )
+    ]
+
+    session_dir = workdir / "session"
+    session_dir.mkdir()
+    for size in RESPONSE_SIZES:
+        response = make_generation_response(size)
+        cases.append(
+            Benchmark(
+                f"jpa_mt_profile.process_generation_response[bytes={size}]",
+                lambda response=response: profile.process_generation_response(
+                    response, session_dir, 1
+                ),
+            )
+        )
+    return cases
@@ -0,0 +1,49 @@
+"""`aiwf list` over large session counts."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.interface.cli.cli import cli
+
+from benchmarks.fixtures import make_state
+from benchmarks.harness import Benchmark
+
+SESSION_COUNTS = [1_000, 10_000]
+
+
+def _populate(project_dir: Path, count: int) -> None:
+    """Write count session.json files and index them in one transaction."""
+    store = SessionStore(sessions_root=project_dir / ".aiwf" / "sessions")
+    states = []
+    for i in range(count):
+        state = make_state(f"bench{i:08d}", artifacts=4, history=6)
+        session_dir = store.sessions_root / state.session_id
+        session_dir.mkdir()
+        (session_dir / "session.json").write_text(
+            json.dumps(state.model_dump(mode="json")), encoding="utf-8"
+        )
+        states.append(state)
+    store.catalog.replace_all(states)
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    cases: list[Benchmark] = []
+    runner = CliRunner()
+    for count in SESSION_COUNTS:
+        project_dir = workdir / f"sessions-{count}"
+        project_dir.mkdir()
+        _populate(project_dir, count)
+
+        def list_sessions(project_dir=project_dir, count=count) -> None:
+            result = runner.invoke(
+                cli,
+                ["--json", "--project-dir", str(project_dir), "list", "--limit", str(count)],
+            )
+            if result.exit_code != 0:
+                raise RuntimeError(f"aiwf list failed: {result.output}")
+
+        cases.append(Benchmark(f"list_cmd[sessions={count}]", list_sessions))
+    return cases
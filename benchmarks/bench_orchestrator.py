@@ -0,0 +1,68 @@
+"""Full PLAN -> COMPLETE runs through WorkflowOrchestrator.
+
+Uses the real JPA-MT profile, a fake AI provider that answers instantly
+and skip approvers, so the timing is the engine's own overhead: prompt
+rendering, file I/O, state saves, catalog updates and telemetry.
+"""
+
+from pathlib import Path
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.models.workflow_state import WorkflowPhase
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.profiles.profile_factory import ProfileFactory
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+from benchmarks.fixtures import (
+    BENCH_PROFILE,
+    BENCH_PROVIDERS,
+    bench_profile_class,
+    make_jpa_mt_config,
+    write_rules_corpus,
+    write_schema,
+)
+from benchmarks.harness import Benchmark
+from tests.integration.providers.fake_ai_provider import FakeAIProvider
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    rules_path = workdir / "rules"
+    names = write_rules_corpus(rules_path, files=4, rules_per_file=500)
+    config = make_jpa_mt_config(rules_path, names)
+    schema_file = write_schema(workdir / "schema.sql")
+
+    ProfileFactory.register(BENCH_PROFILE, bench_profile_class(config))
+    AIProviderFactory.register("bench-fake", lambda: FakeAIProvider(review_verdict="PASS"))
+
+    cases: list[Benchmark] = []
+    for persistence in ("snapshot", "journal"):
+        sessions_root = workdir / f"sessions-{persistence}"
+        orchestrator = WorkflowOrchestrator(
+            session_store=SessionStore(
+                sessions_root=sessions_root, journal=persistence == "journal"
+            ),
+            sessions_root=sessions_root,
+            approval_config=ApprovalConfig(default_approver="skip"),
+        )
+
+        def full_run(orchestrator=orchestrator) -> None:
+            session_id = orchestrator.initialize_run(
+                profile=BENCH_PROFILE,
+                providers=dict(BENCH_PROVIDERS),
+                context={
+                    "scope": "domain",
+                    "entity": "Tier",
+                    "table": "app.tiers",
+                    "bounded_context": "pricing",
+                    "schema_file": str(schema_file),
+                    "standards_files": names,
+                    "standards_prefixes": config.scopes["domain"].standards.prefixes,
+                },
+            )
+            state = orchestrator.init(session_id)
+            if state.phase != WorkflowPhase.COMPLETE:
+                raise RuntimeError(f"Run stopped at {state.phase.value}: {state.last_error}")
+
+        cases.append(Benchmark(f"orchestrator.full_run[{persistence}]", full_run, rounds=10))
+    return cases
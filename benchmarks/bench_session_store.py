@@ -0,0 +1,37 @@
+"""SessionStore.save / load at varying artifact and history sizes."""
+
+from pathlib import Path
+
+from aiwf.domain.persistence.session_store import SessionStore
+
+from benchmarks.fixtures import make_state
+from benchmarks.harness import Benchmark
+
+# (artifacts, phase_history entries)
+SIZES = [(10, 20), (100, 200), (1000, 2000)]
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    cases: list[Benchmark] = []
+    for journal in (False, True):
+        mode = "journal" if journal else "snapshot"
+        store = SessionStore(sessions_root=workdir / mode, journal=journal)
+        for artifacts, history in SIZES:
+            params = f"{mode},artifacts={artifacts},history={history}"
+            session_id = f"bench-{mode}-{artifacts}"
+            state = make_state(session_id, artifacts=artifacts, history=history)
+            store.save(state)
+
+            def save(state=state, store=store) -> None:
+                state.messages.clear()
+                store.save(state)
+
+            cases.append(Benchmark(f"session_store.save[{params}]", save, rounds=10))
+            cases.append(
+                Benchmark(
+                    f"session_store.load[{params}]",
+                    lambda store=store, session_id=session_id: store.load(session_id),
+                    rounds=10,
+                )
+            )
+    return cases
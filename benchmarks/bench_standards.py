@@ -0,0 +1,65 @@
+"""Standards bundle creation over large rule corpora and layer files."""
+
+from pathlib import Path
+
+from aiwf.domain.standards.scoped_layer_fs_provider import ScopedLayerFsProvider
+from profiles.jpa_mt import rules_index
+from profiles.jpa_mt.standards import JpaMtStandardsProvider
+
+from benchmarks.fixtures import write_layer_standards, write_rules_corpus
+from benchmarks.harness import Benchmark
+
+# (files, rules per file)
+RULE_CORPORA = [(4, 250), (8, 1_000)]
+
+# (layers, bytes per file)
+LAYER_SIZES = [(4, 16_384), (16, 262_144)]
+
+
+def _reset_compiled_rules(rules_path: Path) -> None:
+    """Drop in-process and on-disk compiled indexes so the next read parses YAML."""
+    with rules_index._COMPILED_LOCK:
+        rules_index._COMPILED_CACHE.clear()
+    for index_file in rules_path.glob(f"*{rules_index.INDEX_SUFFIX}"):
+        index_file.unlink()
+
+
+def benchmarks(workdir: Path) -> list[Benchmark]:
+    cases: list[Benchmark] = []
+    for files, per_file in RULE_CORPORA:
+        rules_path = workdir / f"rules-{files}x{per_file}"
+        names = write_rules_corpus(rules_path, files=files, rules_per_file=per_file)
+        provider = JpaMtStandardsProvider({"rules_path": str(rules_path)})
+        params = f"files={files},rules={files * per_file}"
+
+        for label, prefixes in (("all", []), ("prefixed", ["JPA-", "JV-", "PKG-"])):
+            context = {"scope": "domain", "standards_files": names, "standards_prefixes": prefixes}
+            cases.append(
+                Benchmark(
+                    f"jpa_mt_standards.create_bundle[{params},{label},cold]",
+                    lambda provider=provider, context=context: provider.create_bundle(context),
+                    setup=lambda rules_path=rules_path: _reset_compiled_rules(rules_path),
+                    rounds=3,
+                )
+            )
+            cases.append(
+                Benchmark(
+                    f"jpa_mt_standards.create_bundle[{params},{label},warm]",
+                    lambda provider=provider, context=context: provider.create_bundle(context),
+                    rounds=10,
+                )
+            )
+
+    for layers, file_bytes in LAYER_SIZES:
+        config = write_layer_standards(
+            workdir / f"layers-{layers}x{file_bytes}", layers=layers, file_bytes=file_bytes
+        )
+        provider = ScopedLayerFsProvider(config)
+        cases.append(
+            Benchmark(
+                f"scoped_layer_fs._read_files[layers={layers},bytes={file_bytes}]",
+                lambda provider=provider: provider._read_files({"scope": "full"}),
+                rounds=10,
+            )
+        )
+    return cases
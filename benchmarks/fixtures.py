@@ -0,0 +1,216 @@
+"""Synthetic data for benchmarks.
+
+Everything is generated deterministically into a scratch directory, so
+runs are comparable across machines and never touch real sessions.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aiwf.domain.models.workflow_state import (
+    Artifact,
+    PhaseTransition,
+    TransitionCause,
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from profiles.jpa_mt.config import (
+    JpaMtConfig,
+    ScopeConfig,
+    ScopeStandardsConfig,
+    StandardsConfig,
+    StandardsSource,
+)
+from profiles.jpa_mt.profile import JpaMtProfile
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_ACTIVE_PHASES = (
+    WorkflowPhase.PLAN,
+    WorkflowPhase.GENERATE,
+    WorkflowPhase.REVIEW,
+    WorkflowPhase.REVISE,
+)
+
+_RULE_GROUPS = ("JPA-ENT", "JPA-REP", "JV-DI", "PKG-LAY", "SVC-BIZ", "CTL-NAM", "API-REST", "DOM-ENT")
+
+BENCH_PROFILE = "bench-jpa-mt"
+
+BENCH_PROVIDERS = {
+    "planner": "bench-fake",
+    "generator": "bench-fake",
+    "reviewer": "bench-fake",
+    "reviser": "bench-fake",
+}
+
+
+def make_state(
+    session_id: str,
+    *,
+    artifacts: int = 0,
+    history: int = 0,
+    profile: str = "jpa-mt",
+) -> WorkflowState:
+    """
+    Build an in-progress session with the given number of artifacts and
+    phase_history entries.
+    """
+    phases = [_ACTIVE_PHASES[i % len(_ACTIVE_PHASES)] for i in range(history)]
+    return WorkflowState(
+        session_id=session_id,
+        profile=profile,
+        context={"entity": f"Entity{session_id[-4:]}", "scope": "domain", "table": "app.entities"},
+        phase=WorkflowPhase.GENERATE,
+        stage=WorkflowStage.RESPONSE,
+        status=WorkflowStatus.IN_PROGRESS,
+        current_iteration=max(1, artifacts // 8),
+        standards_hash="0" * 64,
+        ai_providers=dict(BENCH_PROVIDERS),
+        artifacts=[
+            Artifact(
+                path=f"iteration-{i // 8 + 1}/code/Artifact{i}.java",
+                phase=WorkflowPhase.GENERATE,
+                iteration=i // 8 + 1,
+                sha256=f"{i:064x}",
+                created_at=_EPOCH + timedelta(seconds=i),
+            )
+            for i in range(artifacts)
+        ],
+        phase_history=[
+            PhaseTransition(
+                phase=phase,
+                stage=WorkflowStage.PROMPT if i % 2 == 0 else WorkflowStage.RESPONSE,
+                status=WorkflowStatus.IN_PROGRESS,
+                iteration=i // 8 + 1,
+                cause=TransitionCause.AWAIT if i % 2 else TransitionCause.APPROVE,
+                timestamp=_EPOCH + timedelta(seconds=30 * i),
+            )
+            for i, phase in enumerate(phases)
+        ],
+        created_at=_EPOCH,
+        updated_at=_EPOCH,
+    )
+
+
+def write_rules_corpus(rules_path: Path, *, files: int, rules_per_file: int) -> list[str]:
+    """
+    Write files *.rules.yml files, each with rules_per_file rules spread
+    over several rule ID prefixes.
+
+    Returns:
+        The file names written, in order
+    """
+    rules_path.mkdir(parents=True, exist_ok=True)
+    names: list[str] = []
+    for f in range(files):
+        lines = [f"category_{f}:"]
+        per_group = max(1, rules_per_file // len(_RULE_GROUPS))
+        written = 0
+        for group in _RULE_GROUPS:
+            if written >= rules_per_file:
+                break
+            lines.append(f"  {group.lower().replace('-', '_')}:")
+            for n in range(min(per_group, rules_per_file - written)):
+                lines.append(
+                    f"    {group}-{f:02d}{n:04d}: 'M: Rule {n} of {group} in file {f} "
+                    f"MUST be followed consistently across the codebase.'"
+                )
+                written += 1
+        name = f"BENCH_{f:02d}-marked.rules.yml"
+        (rules_path / name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        names.append(name)
+    return names
+
+
+def write_layer_standards(standards_root: Path, *, layers: int, file_bytes: int) -> dict:
+    """
+    Write one markdown standards file per layer plus a universal file.
+
+    Returns:
+        ScopedLayerFsProvider config selecting every layer in a "full" scope
+    """
+    standards_root.mkdir(parents=True, exist_ok=True)
+    paragraph = "- Standards text that a layer must follow, repeated to size.\n"
+    body = paragraph * max(1, file_bytes // len(paragraph))
+    layer_standards: dict[str, list[str]] = {"_universal": ["UNIVERSAL.md"]}
+    (standards_root / "UNIVERSAL.md").write_text(f"# Universal\n\n{body}", encoding="utf-8")
+    layer_names = []
+    for i in range(layers):
+        layer = f"layer{i}"
+        layer_names.append(layer)
+        layer_standards[layer] = [f"LAYER_{i}.md"]
+        (standards_root / f"LAYER_{i}.md").write_text(f"# Layer {i}\n\n{body}", encoding="utf-8")
+    return {
+        "standards": {"root": str(standards_root)},
+        "scopes": {"full": {"layers": layer_names}},
+        "layer_standards": layer_standards,
+    }
+
+
+def make_jpa_mt_config(rules_path: Path, rule_files: list[str]) -> JpaMtConfig:
+    """JPA-MT config whose "domain" scope reads rule_files from rules_path."""
+    return JpaMtConfig(
+        base_package="com.bench.app",
+        standards=StandardsConfig(sources=[StandardsSource(type="local", path=str(rules_path))]),
+        scopes={
+            "domain": ScopeConfig(
+                description="Entity + Repository",
+                artifacts=["entity", "repository"],
+                standards=ScopeStandardsConfig(
+                    files=rule_files,
+                    prefixes=["JPA-", "JV-", "PKG-", "DOM-"],
+                ),
+            ),
+        },
+    )
+
+
+def bench_profile_class(config: JpaMtConfig) -> type[JpaMtProfile]:
+    """JpaMtProfile bound to config, so ProfileFactory can build it without arguments."""
+
+    class BenchJpaMtProfile(JpaMtProfile):
+        def __init__(self) -> None:
+            super().__init__(config=config)
+
+    return BenchJpaMtProfile
+
+
+def write_schema(path: Path) -> Path:
+    """Write a small DDL file for the schema_file context key."""
+    path.write_text(
+        "CREATE TABLE app.entities (\n"
+        "    id BIGINT PRIMARY KEY,\n"
+        "    tenant_id BIGINT NOT NULL,\n"
+        "    name VARCHAR(255) NOT NULL\n"
+        ");\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def make_generation_response(target_bytes: int) -> str:
+    """
+    Build a markdown generation response of about target_bytes, made of
+    ```java blocks with filename comments interleaved with prose.
+    """
+    parts = ["# Generated Code\n\nThe following files implement the entity.\n"]
+    size = len(parts[0])
+    i = 0
+    while size < target_bytes:
+        fields = "\n".join(
+            f"    private String field{n};\n"
+            f"    public String getField{n}() {{ return field{n}; }}"
+            for n in range(40)
+        )
+        block = (
+            f"\nNotes for class {i}: fields mirror the table columns.\n\n"
+            f"```java\n// Entity{i}.java\n"
+            f"package com.bench.app.domain;\n\n"
+            f"public class Entity{i} {{\n{fields}\n}}\n```\n"
+        )
+        parts.append(block)
+        size += len(block)
+        i += 1
+    return "".join(parts)
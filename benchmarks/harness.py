@@ -0,0 +1,257 @@
+"""Timing, result files and baseline comparison for the benchmark suite.
+
+Each benchmark is a callable timed over several rounds after a warmup
+round. Results are written to JSON keyed by benchmark name, together with
+the interpreter, the host and the time of a fixed calibration workload.
+
+Raw timings from two machines (or two interpreters) are not comparable, so
+a run is compared against a stored baseline by median time relative to
+each run's calibration time: a benchmark regressed if it got slower than
+the calibration workload did, by more than the threshold and by more than
+a small absolute noise floor.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+RESULTS_FORMAT_VERSION = 2
+
+DEFAULT_THRESHOLD = 0.25
+"""Allowed slowdown over the baseline median (0.25 = 25%)."""
+
+DEFAULT_NOISE_FLOOR = 0.0005
+"""Slowdowns smaller than this many seconds are timer noise, not regressions."""
+
+CALIBRATION_ROUNDS = 5
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One timed operation.
+
+    Attributes:
+        name: Unique name, "<group>.<operation>[<params>]"
+        run: The operation being timed
+        setup: Untimed preparation run before each round (e.g. resetting a cache)
+        rounds: Timed rounds (after one untimed warmup round)
+    """
+
+    name: str
+    run: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+    rounds: int = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings of one benchmark, in seconds."""
+
+    name: str
+    rounds: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    max_seconds: float
+
+    @classmethod
+    def from_timings(cls, name: str, timings: list[float]) -> "BenchmarkResult":
+        return cls(
+            name=name,
+            rounds=len(timings),
+            min_seconds=min(timings),
+            median_seconds=statistics.median(timings),
+            mean_seconds=statistics.fmean(timings),
+            max_seconds=max(timings),
+        )
+
+
+@dataclass(frozen=True)
+class ResultsFile:
+    """A results file: timings and the environment they were taken in.
+
+    Attributes:
+        results: Timings keyed by benchmark name
+        calibration_seconds: Median time of the calibration workload
+        interpreter: Python implementation and version, e.g. "CPython 3.13.1"
+        host: Platform string, machine type and CPU count
+    """
+
+    results: dict[str, BenchmarkResult]
+    calibration_seconds: float
+    interpreter: str
+    host: str
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A benchmark's median against its baseline median.
+
+    scale is the current run's calibration time over the baseline's; the
+    baseline median is multiplied by it before comparing, so a machine that
+    is uniformly faster or slower than the baseline's is not a regression.
+    """
+
+    name: str
+    baseline_seconds: float
+    current_seconds: float
+    threshold: float
+    scale: float = 1.0
+    noise_floor: float = DEFAULT_NOISE_FLOOR
+
+    @property
+    def expected_seconds(self) -> float:
+        """Baseline median adjusted to this run's machine speed."""
+        return self.baseline_seconds * self.scale
+
+    @property
+    def ratio(self) -> float:
+        if self.expected_seconds <= 0:
+            return 1.0
+        return self.current_seconds / self.expected_seconds
+
+    @property
+    def regressed(self) -> bool:
+        return (
+            self.ratio > 1 + self.threshold
+            and self.current_seconds - self.expected_seconds > self.noise_floor
+        )
+
+
+@dataclass
+class ComparisonReport:
+    """Outcome of comparing a run against a baseline."""
+
+    comparisons: list[Comparison] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # In baseline, not run
+    new: list[str] = field(default_factory=list)  # Run, not in baseline
+
+    @property
+    def regressions(self) -> list[Comparison]:
+        return [c for c in self.comparisons if c.regressed]
+
+
+def measure(benchmark: Benchmark) -> BenchmarkResult:
+    """
+    Time a benchmark: one warmup round, then benchmark.rounds timed rounds.
+
+    setup() runs before every round, warmup included, outside the timing.
+    """
+    timings: list[float] = []
+    for round_no in range(benchmark.rounds + 1):
+        if benchmark.setup is not None:
+            benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        elapsed = time.perf_counter() - start
+        if round_no > 0:
+            timings.append(elapsed)
+    return BenchmarkResult.from_timings(benchmark.name, timings)
+
+
+def _calibration_workload() -> None:
+    # Interpreter-bound mix of what the benchmarks do: hashing, JSON, dicts, strings
+    records = [{"id": i, "name": f"entity-{i}", "tags": ["a", "b", str(i)]} for i in range(2000)]
+    text = json.dumps(records)
+    hashlib.sha256(text.encode("utf-8")).hexdigest()
+    decoded = json.loads(text)
+    sorted(decoded, key=lambda r: r["name"])
+    "\n".join(r["name"].upper() for r in decoded)
+
+
+def calibrate(rounds: int = CALIBRATION_ROUNDS) -> float:
+    """Median time of a fixed workload, the unit run timings are compared in."""
+    return measure(Benchmark("calibration", run=_calibration_workload, rounds=rounds)).median_seconds
+
+
+def current_interpreter() -> str:
+    """Python implementation and version of this process."""
+    return f"{platform.python_implementation()} {sys.version.split()[0]}"
+
+
+def current_host() -> str:
+    """Platform, machine type and CPU count of this process's host."""
+    return f"{platform.platform()} ({platform.machine()}, {os.cpu_count()} CPUs)"
+
+
+def write_results(path: Path, results: list[BenchmarkResult], calibration_seconds: float) -> None:
+    """Write results as JSON, with enough environment info to judge comparability."""
+    payload = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "interpreter": current_interpreter(),
+        "host": current_host(),
+        "calibration_seconds": calibration_seconds,
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> ResultsFile:
+    """
+    Load results written by write_results().
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        ValueError: If the file is not a results file of this format
+    """
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results file: {path}")
+    return ResultsFile(
+        results={
+            name: BenchmarkResult(**result)
+            for name, result in payload.get("results", {}).items()
+        },
+        calibration_seconds=float(payload["calibration_seconds"]),
+        interpreter=payload.get("interpreter", "unknown"),
+        host=payload.get("host", "unknown"),
+    )
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+    scale: float = 1.0,
+    noise_floor: float = DEFAULT_NOISE_FLOOR,
+) -> ComparisonReport:
+    """
+    Compare results against a baseline by median time.
+
+    Args:
+        results: Results of the current run
+        baseline: Stored results, keyed by benchmark name
+        threshold: Allowed slowdown as a fraction of the baseline median
+        scale: Current calibration time over the baseline's (1.0: same machine)
+        noise_floor: Slowdowns under this many seconds never count as regressions
+    """
+    report = ComparisonReport()
+    seen: set[str] = set()
+    for result in results:
+        seen.add(result.name)
+        base = baseline.get(result.name)
+        if base is None:
+            report.new.append(result.name)
+            continue
+        report.comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline_seconds=base.median_seconds,
+                current_seconds=result.median_seconds,
+                threshold=threshold,
+                scale=scale,
+                noise_floor=noise_floor,
+            )
+        )
+    report.missing = sorted(name for name in baseline if name not in seen)
+    return report
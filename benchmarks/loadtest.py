@@ -0,0 +1,603 @@
+"""Concurrent load test: many sessions on one sessions root.
+
+Registers a simulated AI provider with configurable latency, response
+size, failure rate and review verdicts, then drives sessions of the
+JPA-MT profile from INIT to COMPLETE through BatchRunner with skip
+approvers. Sessions run on a thread pool, optionally split across several
+processes sharing the same sessions root (as CLI users on a shared
+workspace would).
+
+Reported:
+- throughput: completed sessions per minute
+- engine overhead per transition: session wall time minus time spent in
+  provider calls (from the session metrics), per phase_history transition
+- lock contention: SessionStore lock stats
+- filesystem operations by session file kind, counted with audit hooks
+  (opens, mkdir, rename/replace, remove, directory listings and SQLite
+  connects; stat/exists calls are not audited by Python)
+
+Run from the repository root:
+
+    python -m benchmarks.loadtest --sessions 300 --workers 32
+    python -m benchmarks.loadtest --sessions 600 --workers 16 --processes 4 --persistence sqlite
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.batch_runner import BatchEntry, BatchManifest, BatchRunner
+from aiwf.application.session_stats import load_metrics, percentile
+from aiwf.domain.constants import (
+    SESSION_CATALOG_FILENAME,
+    SESSION_DATABASE_FILENAME,
+    SESSION_FILENAME,
+    SESSION_JOURNAL_FILENAME,
+    SESSION_LOCK_FILENAME,
+    SESSION_METRICS_FILENAME,
+    SESSION_TEMP_SUFFIX,
+)
+from aiwf.domain.errors import ProviderError
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.models.workflow_state import WorkflowStatus
+from aiwf.domain.persistence.session_lock import LockStats
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.profiles.profile_factory import ProfileFactory
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+from benchmarks.fixtures import (
+    BENCH_PROFILE,
+    bench_profile_class,
+    make_generation_response,
+    make_jpa_mt_config,
+    write_rules_corpus,
+    write_schema,
+)
+
+SIMULATED_PROVIDER_KEY = "simulated"
+
+PERSISTENCE_MODES = ("snapshot", "journal", "sqlite")
+
+
+# ============================================================================
+# Simulated provider
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SimulatedProviderConfig:
+    """Behaviour of the simulated provider.
+
+    Attributes:
+        latency_seconds: Mean time per call
+        latency_jitter: Uniform jitter as a fraction of latency_seconds
+        response_bytes: Approximate size of plan/generate/revise responses
+        failure_rate: Probability that a call raises ProviderError
+        pass_rate: Probability that a review returns PASS
+        max_iterations: Reviews at or past this iteration always PASS
+        seed: Random seed (None = nondeterministic)
+    """
+
+    latency_seconds: float = 0.05
+    latency_jitter: float = 0.5
+    response_bytes: int = 4096
+    failure_rate: float = 0.0
+    pass_rate: float = 0.8
+    max_iterations: int = 3
+    seed: int | None = None
+
+
+class SimulatedAIProvider(AIProvider):
+    """AI provider that sleeps instead of calling a model.
+
+    One instance is shared by all worker threads of a process; the random
+    source is guarded so a seeded run draws the same sequence of latencies,
+    failures and verdicts (the order threads draw them in still varies).
+    """
+
+    def __init__(self, config: SimulatedProviderConfig | None = None) -> None:
+        self.config = config or SimulatedProviderConfig()
+        self._random = random.Random(self.config.seed)
+        self._random_lock = threading.Lock()
+        self._code_response = make_generation_response(self.config.response_bytes)
+        self._plan_response = "# Implementation Plan\n\n" + (
+            "- Step describing part of the implementation.\n"
+            * max(1, self.config.response_bytes // 46)
+        )
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {
+            "name": SIMULATED_PROVIDER_KEY,
+            "description": "Simulated provider for load tests (configurable latency and verdicts)",
+            "requires_config": False,
+            "config_keys": [],
+            "default_connection_timeout": None,
+            "default_response_timeout": None,
+            "fs_ability": "none",
+            "supports_system_prompt": True,
+            "supports_file_attachments": False,
+        }
+
+    def validate(self) -> None:
+        pass
+
+    def generate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        system_prompt: str | None = None,
+        connection_timeout: int | None = None,
+        response_timeout: int | None = None,
+    ) -> AIProviderResult:
+        context = context or {}
+        cfg = self.config
+        with self._random_lock:
+            jitter = self._random.uniform(-cfg.latency_jitter, cfg.latency_jitter)
+            fail = self._random.random() < cfg.failure_rate
+            passed = self._random.random() < cfg.pass_rate
+
+        time.sleep(max(0.0, cfg.latency_seconds * (1 + jitter)))
+        if fail:
+            raise ProviderError("Simulated provider failure")
+
+        phase = context.get("phase")
+        if phase == "review":
+            if int(context.get("iteration", 1)) >= cfg.max_iterations:
+                passed = True
+            return AIProviderResult(response=self._review_response(passed))
+        if phase == "plan":
+            return AIProviderResult(response=self._plan_response)
+        return AIProviderResult(response=self._code_response)
+
+    @staticmethod
+    def _review_response(passed: bool) -> str:
+        verdict = "PASS" if passed else "FAIL"
+        issues = 0 if passed else 1
+        return (
+            "# Code Review\n\n"
+            "@@@REVIEW_META\n"
+            f"verdict: {verdict}\n"
+            f"issues_total: {issues}\n"
+            "issues_critical: 0\n"
+            "missing_inputs: 0\n"
+            "@@@\n"
+        )
+
+
+# ============================================================================
+# Filesystem operation counting
+# ============================================================================
+
+# Audit events counted, mapped to the operation name used in reports
+_FS_EVENTS = {
+    "os.mkdir": "mkdir",
+    "os.rename": "rename",  # Also raised by os.replace
+    "os.remove": "remove",
+    "os.listdir": "list",
+    "os.scandir": "list",
+    "sqlite3.connect": "connect",
+}
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR | os.O_APPEND | os.O_CREAT
+
+
+def classify_session_path(path: str, sessions_root: str) -> str:
+    """
+    Name the kind of session file a path refers to.
+
+    Args:
+        path: Absolute path
+        sessions_root: Absolute sessions root
+
+    Returns:
+        "outside" for paths not under sessions_root, otherwise one of
+        catalog, state, journal, lock, metrics, code, prompt_response, other
+    """
+    if not path.startswith(sessions_root):
+        return "outside"
+    name = os.path.basename(path)
+    if name.startswith((SESSION_CATALOG_FILENAME, SESSION_DATABASE_FILENAME)):
+        return "catalog"  # Includes -wal/-shm/-journal companions
+    if name == SESSION_FILENAME or name.endswith(SESSION_TEMP_SUFFIX):
+        return "state"
+    if name == SESSION_JOURNAL_FILENAME:
+        return "journal"
+    if name == SESSION_LOCK_FILENAME:
+        return "lock"
+    if name == SESSION_METRICS_FILENAME:
+        return "metrics"
+    parts = path[len(sessions_root):].replace(os.sep, "/").split("/")
+    if "code" in parts[:-1]:
+        return "code"
+    if any(part.startswith("iteration-") for part in parts):
+        return "prompt_response"
+    return "other"
+
+
+class FsOpCounter:
+    """Counts filesystem operations under a sessions root via sys.addaudithook.
+
+    Audit hooks cannot be removed, so one counter is installed per process
+    (see for_process) and only counts between start() and stop().
+    """
+
+    _instance: "FsOpCounter | None" = None
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self._root: str | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_process(cls) -> "FsOpCounter":
+        if cls._instance is None:
+            cls._instance = cls()
+            sys.addaudithook(cls._instance._hook)
+        return cls._instance
+
+    def start(self, sessions_root: Path) -> None:
+        with self._lock:
+            self.counts.clear()
+            self._root = os.path.abspath(sessions_root)
+
+    def stop(self) -> dict[str, int]:
+        with self._lock:
+            self._root = None
+            return dict(self.counts)
+
+    def _hook(self, event: str, args: tuple[Any, ...]) -> None:
+        root = self._root
+        if root is None:
+            return
+        if event == "open":
+            path, mode, flags = args
+            if isinstance(mode, str):
+                op = "write" if any(c in mode for c in "wax+") else "read"
+            else:
+                op = "write" if (flags or 0) & _WRITE_FLAGS else "read"
+        else:
+            op = _FS_EVENTS.get(event)
+            if op is None:
+                return
+            path = args[0] if args else None
+        if isinstance(path, (str, bytes, os.PathLike)):
+            path = os.fsdecode(path)
+        else:
+            return  # File descriptors, None
+        kind = classify_session_path(path, root)
+        if kind == "outside":
+            return
+        with self._lock:
+            self.counts[f"{kind}.{op}"] += 1
+
+
+# ============================================================================
+# Load test
+# ============================================================================
+
+
+@dataclass
+class LoadTestReport:
+    """Aggregate results of a load test run."""
+
+    sessions: int = 0
+    completed: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    transitions: int = 0
+    provider_seconds: float = 0.0
+    session_seconds: float = 0.0
+    # Mean engine seconds per transition, one sample per finished session
+    overhead_samples: list[float] = field(default_factory=list, repr=False)
+    lock_stats: LockStats = field(default_factory=LockStats)
+    fs_ops: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput_per_minute(self) -> float:
+        return self.completed / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    @property
+    def engine_seconds(self) -> float:
+        return max(self.session_seconds - self.provider_seconds, 0.0)
+
+    @property
+    def overhead_per_transition(self) -> float:
+        return self.engine_seconds / self.transitions if self.transitions else 0.0
+
+    def merge(self, other: "LoadTestReport") -> None:
+        """Add another shard's counts (elapsed_seconds is left to the caller)."""
+        self.sessions += other.sessions
+        self.completed += other.completed
+        self.failed += other.failed
+        self.transitions += other.transitions
+        self.provider_seconds += other.provider_seconds
+        self.session_seconds += other.session_seconds
+        self.overhead_samples.extend(other.overhead_samples)
+        stats = self.lock_stats
+        stats.acquisitions += other.lock_stats.acquisitions
+        stats.contended += other.lock_stats.contended
+        stats.timeouts += other.lock_stats.timeouts
+        stats.total_wait_seconds += other.lock_stats.total_wait_seconds
+        stats.max_wait_seconds = max(stats.max_wait_seconds, other.lock_stats.max_wait_seconds)
+        for key, count in other.fs_ops.items():
+            self.fs_ops[key] = self.fs_ops.get(key, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sessions": self.sessions,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed_seconds": self.elapsed_seconds,
+            "throughput_per_minute": self.throughput_per_minute,
+            "transitions": self.transitions,
+            "provider_seconds": self.provider_seconds,
+            "engine_seconds": self.engine_seconds,
+            "overhead_per_transition_seconds": {
+                "mean": self.overhead_per_transition,
+                "p50": percentile(self.overhead_samples, 50),
+                "p90": percentile(self.overhead_samples, 90),
+                "p99": percentile(self.overhead_samples, 99),
+            },
+            "lock_stats": asdict(self.lock_stats),
+            "fs_ops": dict(sorted(self.fs_ops.items())),
+        }
+
+
+@dataclass(frozen=True)
+class _Shard:
+    """The part of a load test run by one process (picklable)."""
+
+    sessions_root: Path
+    fixtures_dir: Path
+    first: int
+    count: int
+    workers: int
+    persistence: str
+    provider: SimulatedProviderConfig
+
+
+def _make_store(sessions_root: Path, persistence: str) -> SessionStore:
+    if persistence == "sqlite":
+        from aiwf.domain.persistence.sqlite_session_store import SqliteSessionStore
+
+        return SqliteSessionStore(sessions_root=sessions_root)
+    return SessionStore(sessions_root=sessions_root, journal=persistence == "journal")
+
+
+def _prepare_fixtures(fixtures_dir: Path) -> tuple[list[str], Path]:
+    """Write the rules corpus and schema (idempotent)."""
+    names = write_rules_corpus(fixtures_dir / "rules", files=4, rules_per_file=250)
+    schema_file = write_schema(fixtures_dir / "schema.sql")
+    return names, schema_file
+
+
+def _run_shard(shard: _Shard) -> LoadTestReport:
+    """Drive shard.count sessions on a thread pool in this process."""
+    rule_files = sorted(p.name for p in (shard.fixtures_dir / "rules").glob("*.rules.yml"))
+    config = make_jpa_mt_config(shard.fixtures_dir / "rules", rule_files)
+    ProfileFactory.register(BENCH_PROFILE, bench_profile_class(config))
+    provider = SimulatedAIProvider(shard.provider)
+    AIProviderFactory.register(SIMULATED_PROVIDER_KEY, lambda: provider)
+
+    store = _make_store(shard.sessions_root, shard.persistence)
+    manifest = BatchManifest(
+        profile=BENCH_PROFILE,
+        providers={
+            role: SIMULATED_PROVIDER_KEY
+            for role in ("planner", "generator", "reviewer", "reviser")
+        },
+        context={
+            "scope": "domain",
+            "table": "app.entities",
+            "bounded_context": "loadtest",
+            "schema_file": str(shard.fixtures_dir / "schema.sql"),
+            "standards_files": rule_files,
+            "standards_prefixes": config.scopes["domain"].standards.prefixes,
+        },
+        workers=shard.workers,
+        entries=[
+            BatchEntry(context={"entity": f"Entity{shard.first + i}"})
+            for i in range(shard.count)
+        ],
+    )
+    runner = BatchRunner(
+        session_store=store,
+        sessions_root=shard.sessions_root,
+        workers=shard.workers,
+        approval_config=ApprovalConfig(default_approver="skip"),
+    )
+
+    counter = FsOpCounter.for_process()
+    counter.start(shard.sessions_root)
+    try:
+        batch = runner.run(manifest)
+    finally:
+        fs_ops = counter.stop()
+
+    report = LoadTestReport(sessions=shard.count, fs_ops=fs_ops, lock_stats=store.lock_stats)
+    for item in batch.items:
+        if item.failed or item.status != WorkflowStatus.SUCCESS.name:
+            report.failed += 1
+        else:
+            report.completed += 1
+        if item.session_id is None:
+            continue
+        provider_seconds = sum(
+            m.wall_seconds for m in load_metrics(shard.sessions_root, item.session_id)
+        )
+        try:
+            transitions = len(store.load(item.session_id).phase_history) - 1
+        except (FileNotFoundError, ValueError):
+            continue
+        report.transitions += transitions
+        report.provider_seconds += provider_seconds
+        report.session_seconds += item.elapsed_seconds
+        if transitions > 0:
+            report.overhead_samples.append(
+                max(item.elapsed_seconds - provider_seconds, 0.0) / transitions
+            )
+    return report
+
+
+def run_load_test(
+    sessions_root: Path,
+    *,
+    sessions: int,
+    workers: int,
+    processes: int = 1,
+    persistence: str = "snapshot",
+    provider: SimulatedProviderConfig | None = None,
+    fixtures_dir: Path | None = None,
+) -> LoadTestReport:
+    """
+    Drive sessions concurrently against the simulated provider.
+
+    Args:
+        sessions_root: Sessions root shared by every worker and process
+        sessions: Total sessions to run
+        workers: Worker threads per process
+        processes: Processes sharing the sessions root (1 = this process only)
+        persistence: Session store backend: snapshot, journal or sqlite
+        provider: Simulated provider behaviour
+        fixtures_dir: Where to write rules and schema (default: next to sessions_root)
+
+    Raises:
+        ValueError: If a count is < 1 or persistence is unknown
+    """
+    if sessions < 1 or workers < 1 or processes < 1:
+        raise ValueError("sessions, workers and processes must be >= 1")
+    if persistence not in PERSISTENCE_MODES:
+        raise ValueError(f"Unknown persistence: {persistence}. Use one of {PERSISTENCE_MODES}")
+
+    sessions_root = sessions_root.resolve()
+    sessions_root.mkdir(parents=True, exist_ok=True)
+    fixtures_dir = (fixtures_dir or sessions_root.parent / "loadtest-fixtures").resolve()
+    _prepare_fixtures(fixtures_dir)
+
+    processes = min(processes, sessions)
+    per_process, extra = divmod(sessions, processes)
+    shards: list[_Shard] = []
+    first = 0
+    for i in range(processes):
+        count = per_process + (1 if i < extra else 0)
+        shards.append(
+            _Shard(
+                sessions_root=sessions_root,
+                fixtures_dir=fixtures_dir,
+                first=first,
+                count=count,
+                workers=workers,
+                persistence=persistence,
+                provider=provider or SimulatedProviderConfig(),
+            )
+        )
+        first += count
+
+    started = time.perf_counter()
+    if processes == 1:
+        shard_reports = [_run_shard(shards[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            shard_reports = list(pool.map(_run_shard, shards))
+
+    report = LoadTestReport()
+    for shard_report in shard_reports:
+        report.merge(shard_report)
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def format_report(report: LoadTestReport) -> str:
+    """Render a report as plain text."""
+    data = report.to_dict()
+    overhead = data["overhead_per_transition_seconds"]
+    locks = data["lock_stats"]
+    lines = [
+        f"sessions={report.sessions} completed={report.completed} failed={report.failed}",
+        f"elapsed={report.elapsed_seconds:.2f}s "
+        f"throughput={report.throughput_per_minute:.1f} sessions/min",
+        f"transitions={report.transitions} "
+        f"provider={report.provider_seconds:.2f}s engine={report.engine_seconds:.2f}s",
+        "overhead/transition: "
+        f"mean={overhead['mean'] * 1000:.2f}ms p50={overhead['p50'] * 1000:.2f}ms "
+        f"p90={overhead['p90'] * 1000:.2f}ms p99={overhead['p99'] * 1000:.2f}ms",
+        f"locks: acquisitions={locks['acquisitions']} contended={locks['contended']} "
+        f"timeouts={locks['timeouts']} wait_total={locks['total_wait_seconds']:.3f}s "
+        f"wait_max={locks['max_wait_seconds']:.3f}s",
+        "filesystem operations:",
+    ]
+    lines.extend(f"  {key:<24} {count}" for key, count in data["fs_ops"].items())
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadtest",
+        description="Drive many concurrent sessions against a simulated AI provider.",
+    )
+    parser.add_argument("--sessions", type=int, default=200, help="Total sessions (default: 200)")
+    parser.add_argument("--workers", type=int, default=32, help="Threads per process (default: 32)")
+    parser.add_argument("--processes", type=int, default=1, help="Processes sharing the sessions root")
+    parser.add_argument("--persistence", choices=PERSISTENCE_MODES, default="snapshot",
+                        help="Session store backend (default: snapshot)")
+    parser.add_argument("--sessions-root", type=Path, default=None,
+                        help="Sessions root to load (default: a temporary directory)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean provider latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Latency jitter as a fraction of --latency")
+    parser.add_argument("--response-bytes", type=int, default=4096, help="Approximate response size")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability a provider call fails")
+    parser.add_argument("--pass-rate", type=float, default=0.8, help="Probability a review passes")
+    parser.add_argument("--max-iterations", type=int, default=3, help="Iteration at which reviews always pass")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    # Expected failures (simulated errors, review FAILs) would flood stderr
+    logging.basicConfig(level=logging.ERROR)
+
+    provider = SimulatedProviderConfig(
+        latency_seconds=args.latency,
+        latency_jitter=args.jitter,
+        response_bytes=args.response_bytes,
+        failure_rate=args.failure_rate,
+        pass_rate=args.pass_rate,
+        max_iterations=args.max_iterations,
+        seed=args.seed,
+    )
+    options = dict(
+        sessions=args.sessions,
+        workers=args.workers,
+        processes=args.processes,
+        persistence=args.persistence,
+        provider=provider,
+    )
+
+    if args.sessions_root is not None:
+        report = run_load_test(args.sessions_root, **options)
+    else:
+        with tempfile.TemporaryDirectory(prefix="aiwf-loadtest-") as tmp:
+            report = run_load_test(Path(tmp) / "sessions", **options)
+
+    print(format_report(report))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+    return 1 if report.completed == 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,8 @@ StandardsProviderFactory.register("yaml-rules", JpaMtStandardsProvider)
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_CONFIG_PATH = Path(__file__).parent / "config.yml"
+
 
 class JpaMtProfile(WorkflowProfile):
     """Multi-tenant JPA domain layer generation profile (v2)."""
@@ -44,7 +46,7 @@ class JpaMtProfile(WorkflowProfile):
             self.config = config
         else:
             # Auto-load config.yml from profile directory if it exists
-            config_path = Path(__file__).parent / "config.yml"
+            config_path = _DEFAULT_CONFIG_PATH
             if config_path.exists():
                 self.config = JpaMtConfig.from_yaml(config_path)
             else:
@@ -77,7 +79,7 @@ class JpaMtProfile(WorkflowProfile):
         """
         if config_path is None:
             # Default to profile directory's config.yml
-            config_path = Path(__file__).parent / "config.yml"
+            config_path = _DEFAULT_CONFIG_PATH
             if not config_path.exists():
                 # No default config file, use default config
                 return cls()
@@ -89,6 +91,11 @@ class JpaMtProfile(WorkflowProfile):
         config = JpaMtConfig.from_yaml(config_path)
         return cls(config=config)
 
+    @classmethod
+    def get_config_paths(cls) -> list[Path]:
+        """The auto-loaded config.yml (see __init__)."""
+        return [_DEFAULT_CONFIG_PATH]
+
     @property
     def ai_provider(self) -> "AIProvider | None":
         """Get the configured AI provider, if any.
@@ -939,8 +946,10 @@ class JpaMtProfile(WorkflowProfile):
     def _get_standards_for_context(self, context: dict) -> str:
         """Get standards bundle for the current context.
 
-        Uses the standards provider to generate a filtered standards bundle
-        based on the current scope.
+        Prefers the bundle the engine materialized into the session at init
+        (context["standards_bundle_path"]), which is exactly the content
+        recorded in standards_hash. Falls back to building a filtered bundle
+        with the standards provider (parsed rules files are memoized).
 
         Args:
             context: Workflow context with scope
@@ -948,6 +957,13 @@ class JpaMtProfile(WorkflowProfile):
         Returns:
             Markdown-formatted standards bundle
         """
+        bundle_path = context.get("standards_bundle_path")
+        if bundle_path:
+            try:
+                return Path(bundle_path).read_text(encoding="utf-8")
+            except OSError as e:
+                logger.debug("Materialized standards bundle unavailable: %s", e)
+
         try:
             config = self.get_standards_config()
             provider = JpaMtStandardsProvider(config)
@@ -0,0 +1,200 @@
+"""Compiled rules index for JPA-MT standards files.
+
+Parsing a rules YAML file and walking its nested structure is the costly part
+of building a standards bundle. A CompiledRules holds one file's rules in
+document order plus a sorted rule-ID array, so selecting rules by ID prefix
+is a binary search per prefix rather than a scan of every rule against every
+prefix.
+
+Compiled indexes are memoized per process and serialized next to their YAML
+file as ``<name>.rules.yml.idx``. Both are keyed by the sha256 of the YAML
+bytes, so editing a rules file rebuilds its index.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+Rule = tuple[str, str, str]
+"""A (rule_id, severity, text) tuple."""
+
+INDEX_SUFFIX = ".idx"
+INDEX_FORMAT_VERSION = 2
+
+_COMPILED_CACHE: dict[str, "CompiledRules"] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """Rules from one rules file, indexed by rule ID.
+
+    Attributes:
+        source_sha256: SHA256 of the YAML bytes the index was built from
+        rules: Rules in document order
+        sorted_ids: Rule IDs in sorted order
+        positions: Index into rules for each entry of sorted_ids
+        duplicate_ids: Rule IDs defined more than once in the file, sorted
+    """
+
+    source_sha256: str
+    rules: tuple[Rule, ...]
+    sorted_ids: tuple[str, ...]
+    positions: tuple[int, ...]
+    duplicate_ids: tuple[str, ...] = ()
+
+    @classmethod
+    def build(cls, source_sha256: str, rules: list[Rule]) -> "CompiledRules":
+        """Compile parsed rules into an index."""
+        order = sorted(range(len(rules)), key=lambda i: rules[i][0])
+        sorted_ids = tuple(rules[i][0] for i in order)
+        return cls(
+            source_sha256=source_sha256,
+            rules=tuple(rules),
+            sorted_ids=sorted_ids,
+            positions=tuple(order),
+            # Equal IDs are adjacent once sorted
+            duplicate_ids=tuple(
+                sorted({a for a, b in zip(sorted_ids, sorted_ids[1:]) if a == b})
+            ),
+        )
+
+    def select(self, prefixes: list[str]) -> list[Rule]:
+        """Return rules whose ID starts with any of prefixes.
+
+        Args:
+            prefixes: Rule ID prefixes to include (empty = all)
+
+        Returns:
+            Matching rules in document order
+        """
+        if not prefixes:
+            return list(self.rules)
+
+        selected: set[int] = set()
+        ids = self.sorted_ids
+        for prefix in prefixes:
+            i = bisect_left(ids, prefix)
+            while i < len(ids) and ids[i].startswith(prefix):
+                selected.add(self.positions[i])
+                i += 1
+        return [self.rules[i] for i in sorted(selected)]
+
+    def to_payload(self) -> dict[str, Any]:
+        """Serialize to builtins only (see _IndexUnpickler)."""
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "source_sha256": self.source_sha256,
+            "rules": self.rules,
+            "sorted_ids": self.sorted_ids,
+            "positions": self.positions,
+            "duplicate_ids": self.duplicate_ids,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "CompiledRules | None":
+        """Deserialize, or None if payload is not a current-format index."""
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_FORMAT_VERSION:
+            return None
+        try:
+            return cls(
+                source_sha256=payload["source_sha256"],
+                rules=tuple(tuple(rule) for rule in payload["rules"]),
+                sorted_ids=tuple(payload["sorted_ids"]),
+                positions=tuple(payload["positions"]),
+                duplicate_ids=tuple(payload["duplicate_ids"]),
+            )
+        except (KeyError, TypeError):
+            return None
+
+
+class _IndexUnpickler(pickle.Unpickler):
+    """Unpickler that refuses all globals; index payloads are builtins only."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"Unexpected global in rules index: {module}.{name}")
+
+
+def index_path_for(rules_file: Path) -> Path:
+    """Return the serialized index path for a rules file."""
+    return rules_file.with_name(rules_file.name + INDEX_SUFFIX)
+
+
+def load_compiled_rules(
+    rules_file: Path, parse: Callable[[bytes], list[Rule]]
+) -> CompiledRules:
+    """Load the compiled index for a rules file, building it if stale.
+
+    Lookup order is the in-process memo, then the serialized index next to
+    the file, then parse(). A freshly built index is written back on a
+    best-effort basis (read-only rules directories are fine).
+
+    Args:
+        rules_file: Path to a *.rules.yml file
+        parse: Parses raw YAML bytes into rules
+
+    Returns:
+        Compiled index matching the file's current contents
+
+    Raises:
+        OSError: If the rules file cannot be read
+        yaml.YAMLError: If parse() fails
+    """
+    raw = rules_file.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    memo_key = str(rules_file.resolve())
+
+    with _COMPILED_LOCK:
+        compiled = _COMPILED_CACHE.get(memo_key)
+    if compiled is not None and compiled.source_sha256 == digest:
+        return compiled
+
+    index_path = index_path_for(rules_file)
+    compiled = _read_index(index_path, digest)
+    if compiled is None:
+        compiled = CompiledRules.build(digest, parse(raw))
+        _write_index(index_path, compiled)
+
+    with _COMPILED_LOCK:
+        _COMPILED_CACHE[memo_key] = compiled
+    return compiled
+
+
+def _read_index(index_path: Path, digest: str) -> CompiledRules | None:
+    try:
+        with index_path.open("rb") as f:
+            compiled = CompiledRules.from_payload(_IndexUnpickler(f).load())
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+        logger.debug("Ignoring unreadable rules index %s: %s", index_path, e)
+        return None
+    if compiled is None or compiled.source_sha256 != digest:
+        return None
+    return compiled
+
+
+def _write_index(index_path: Path, compiled: CompiledRules) -> None:
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=index_path.parent, prefix=f".{index_path.name}.", suffix=".tmp"
+        )
+    except OSError as e:
+        logger.debug("Not writing rules index %s: %s", index_path, e)
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(compiled.to_payload(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, index_path)
+    except OSError as e:
+        Path(tmp_name).unlink(missing_ok=True)
+        logger.debug("Not writing rules index %s: %s", index_path, e)
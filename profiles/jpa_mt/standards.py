@@ -13,6 +13,7 @@ import yaml
 logger = logging.getLogger(__name__)
 
 from aiwf.domain.errors import ProviderError
+from profiles.jpa_mt.rules_index import load_compiled_rules
 
 
 class JpaMtStandardsProvider:
@@ -74,6 +75,33 @@ class JpaMtStandardsProvider:
         if not rules_files:
             raise ProviderError(f"No *.rules.yml files found in {self.rules_path}")
 
+    def get_cache_key(self, context: dict[str, Any]) -> dict[str, Any] | None:
+        """Describe what create_bundle(context) depends on, for the bundle cache.
+
+        Args:
+            context: Same context that will be passed to create_bundle()
+
+        Returns:
+            Cache key material with a 'sources' list of rules files, or None
+            if the bundle cannot be cached (rules_path not configured)
+        """
+        if not self.rules_path:
+            return None
+
+        standards_files = list(context.get("standards_files") or [])
+        if standards_files:
+            sources = [self.rules_path / name for name in standards_files]
+        else:
+            sources = sorted(self.rules_path.glob("*.rules.yml"))
+
+        return {
+            "rules_path": str(self.rules_path.resolve()),
+            "scope": context.get("scope"),
+            "standards_files": standards_files,
+            "standards_prefixes": list(context.get("standards_prefixes") or []),
+            "sources": sources,
+        }
+
     def create_bundle(
         self,
         context: dict[str, Any],
@@ -110,24 +138,23 @@ class JpaMtStandardsProvider:
         if not scope:
             raise ValueError("scope is required in context")
 
-        # Load rules from specified files only
-        all_rules = self._load_rules(standards_files)
-
-        # Filter by prefixes
-        filtered_rules = self._filter_by_prefixes(all_rules, standards_prefixes)
+        # Load rules from specified files, selected by prefix via each file's index
+        selected_rules = self._load_rules(standards_files, standards_prefixes)
 
         # Format as markdown
-        return self._format_bundle(filtered_rules, scope)
+        return self._format_bundle(selected_rules, scope)
 
     def _load_rules(
-        self, file_names: list[str]
+        self, file_names: list[str], prefixes: list[str] | None = None
     ) -> dict[str, list[tuple[str, str, str]]]:
         """Load rules from specified YAML files.
 
         Args:
             file_names: List of file names to load (relative to rules_path)
+            prefixes: Rule ID prefixes to include (empty/None = all)
 
-        Detects and warns about duplicate rule IDs across files.
+        Detects and warns about duplicate rule IDs within and across files,
+        over every rule in the files, not only those the prefixes select.
 
         Returns:
             Dict mapping category names to list of (rule_id, severity, text) tuples
@@ -150,20 +177,25 @@ class JpaMtStandardsProvider:
                 continue
             try:
                 category_name = self._file_to_category(file_path)
-                file_rules = self._parse_yaml_file(file_path)
+                compiled = load_compiled_rules(file_path, self._parse_rules)
+                # Check for duplicate rule IDs
+                first_seen = {rule_id: file_path.name for rule_id in compiled.duplicate_ids}
+                first_seen.update(
+                    (rule_id, seen_rule_ids[rule_id])
+                    for rule_id in seen_rule_ids.keys() & set(compiled.sorted_ids)
+                )
+                for rule_id in sorted(first_seen):
+                    logger.warning(
+                        "Duplicate rule ID '%s' found in %s "
+                        "(first seen in %s). Last definition wins.",
+                        rule_id,
+                        file_path.name,
+                        first_seen[rule_id],
+                    )
+                seen_rule_ids.update(dict.fromkeys(compiled.sorted_ids, file_path.name))
+
+                file_rules = compiled.select(prefixes or [])
                 if file_rules:
-                    # Check for duplicate rule IDs
-                    for rule_id, severity, text in file_rules:
-                        if rule_id in seen_rule_ids:
-                            logger.warning(
-                                "Duplicate rule ID '%s' found in %s "
-                                "(first seen in %s). Last definition wins.",
-                                rule_id,
-                                file_path.name,
-                                seen_rule_ids[rule_id],
-                            )
-                        seen_rule_ids[rule_id] = file_path.name
-
                     rules_by_category[category_name] = file_rules
             except yaml.YAMLError as e:
                 raise ProviderError(f"Failed to parse {file_path}: {e}")
@@ -198,23 +230,13 @@ class JpaMtStandardsProvider:
 
         return f"{name} Standards"
 
-    def _parse_yaml_file(self, file_path: Path) -> list[tuple[str, str, str]]:
-        """Parse a single YAML rules file.
-
-        Args:
-            file_path: Path to YAML file
-
-        Returns:
-            List of (rule_id, severity, text) tuples
-        """
-        content = file_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
-
-        if not data or not isinstance(data, dict):
-            return []
+    def _parse_rules(self, raw: bytes) -> list[tuple[str, str, str]]:
+        """Extract rules from raw YAML bytes."""
+        data = yaml.safe_load(raw.decode("utf-8"))
 
         rules: list[tuple[str, str, str]] = []
-        self._extract_rules(data, rules)
+        if data and isinstance(data, dict):
+            self._extract_rules(data, rules)
         return rules
 
     def _extract_rules(
@@ -283,36 +305,6 @@ class JpaMtStandardsProvider:
         # Default to no severity if format doesn't match
         return "", text
 
-    def _filter_by_prefixes(
-        self,
-        rules_by_category: dict[str, list[tuple[str, str, str]]],
-        prefixes: list[str],
-    ) -> dict[str, list[tuple[str, str, str]]]:
-        """Filter rules by ID prefixes.
-
-        Args:
-            rules_by_category: All rules grouped by category
-            prefixes: List of rule ID prefixes to include (empty = all)
-
-        Returns:
-            Filtered rules dict
-        """
-        # Empty prefixes means include all
-        if not prefixes:
-            return rules_by_category
-
-        filtered: dict[str, list[tuple[str, str, str]]] = {}
-        for category, rules in rules_by_category.items():
-            matching_rules = [
-                (rule_id, severity, text)
-                for rule_id, severity, text in rules
-                if any(rule_id.startswith(prefix) for prefix in prefixes)
-            ]
-            if matching_rules:
-                filtered[category] = matching_rules
-
-        return filtered
-
     def _format_bundle(
         self, rules_by_category: dict[str, list[tuple[str, str, str]]], scope: str
     ) -> str:
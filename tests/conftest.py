@@ -2,10 +2,10 @@ from pathlib import Path
 from typing import Any
 import pytest
 
-from aiwf.domain.profiles.profile_factory import ProfileFactory
 from aiwf.domain.models.processing_result import ProcessingResult
 from aiwf.domain.models.workflow_state import WorkflowStatus
 from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.profiles.profile_factory import ProfileFactory
 from aiwf.domain.providers.provider_factory import AIProviderFactory
 
 
@@ -61,6 +61,7 @@ def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """
     monkeypatch.delenv("STANDARDS_DIR", raising=False)
     monkeypatch.delenv("AIWF_SESSIONS_ROOT", raising=False)
+    monkeypatch.delenv("AIWF_RESPONSE_CACHE", raising=False)
 
 
 class FakeProvider(AIProvider):
@@ -106,6 +107,9 @@ def _register_test_providers():
     # Restore original registry state after test
     AIProviderFactory._registry.clear()
     AIProviderFactory._registry.update(original_registry)
+    # Pooled instances and validation results must not leak between tests
+    AIProviderFactory.clear_pool()
+    ProfileFactory.clear_instances()
 
 
 def make_fake_approve(return_value=None, side_effect=None):
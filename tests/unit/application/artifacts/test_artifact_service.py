@@ -174,7 +174,7 @@ class TestApproveGenerateResponse:
         )
 
         with patch("aiwf.application.artifacts.artifact_service.ProfileFactory") as mock_factory:
-            mock_factory.create.return_value = mock_profile
+            mock_factory.acquire.return_value = mock_profile
 
             artifact_service.handle_pre_transition_approval(
                 base_state, session_with_generation_response, mock_add_message
@@ -213,7 +213,7 @@ class TestApproveGenerateResponse:
         )
 
         with patch("aiwf.application.artifacts.artifact_service.ProfileFactory") as mock_factory:
-            mock_factory.create.return_value = mock_profile
+            mock_factory.acquire.return_value = mock_profile
 
             artifact_service.handle_pre_transition_approval(
                 base_state, session_with_generation_response, mock_add_message
@@ -322,7 +322,7 @@ class TestApproveReviseResponse:
         )
 
         with patch("aiwf.application.artifacts.artifact_service.ProfileFactory") as mock_factory:
-            mock_factory.create.return_value = mock_profile
+            mock_factory.acquire.return_value = mock_profile
 
             artifact_service.handle_pre_transition_approval(
                 base_state, session_with_revision_response, mock_add_message
@@ -0,0 +1,210 @@
+"""Tests for ResponseCache and cached provider execution."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.providers import ResponseCache
+from aiwf.application.providers.provider_execution_service import ProviderExecutionService
+from aiwf.domain.errors import ResponseCacheMiss
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+
+class CountingProvider(AIProvider):
+    """Provider that records calls and writes its response file itself."""
+
+    calls = 0
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {"name": "counting", "fs_ability": "local-write"}
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt: str, context: dict[str, Any] | None = None, **kwargs: Any):
+        CountingProvider.calls += 1
+        assert context is not None
+        response_path = Path(context["response_path"])
+        response_path.parent.mkdir(parents=True, exist_ok=True)
+        response_path.write_text(f"answer to {prompt}", encoding="utf-8")
+        return AIProviderResult(response="console", files={str(response_path): None})
+
+
+@pytest.fixture
+def counting_provider():
+    CountingProvider.calls = 0
+    AIProviderFactory.register("counting", CountingProvider)
+    yield
+    AIProviderFactory._registry.pop("counting", None)
+
+
+def context_for(session_dir: Path) -> dict[str, Any]:
+    return {"response_path": str(session_dir / "iteration-1" / "planning-response.md")}
+
+
+class TestResponseCache:
+    def test_key_depends_on_every_input(self):
+        base = ResponseCache.cache_key("claude-code", {"model": "a"}, "sys", "prompt")
+
+        assert ResponseCache.cache_key("claude-code", {"model": "a"}, "sys", "prompt") == base
+        assert ResponseCache.cache_key("gemini-cli", {"model": "a"}, "sys", "prompt") != base
+        assert ResponseCache.cache_key("claude-code", {"model": "b"}, "sys", "prompt") != base
+        assert ResponseCache.cache_key("claude-code", {"model": "a"}, None, "prompt") != base
+        assert ResponseCache.cache_key("claude-code", {"model": "a"}, "sys", "other") != base
+
+    def test_invalid_mode_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Invalid response cache mode"):
+            ResponseCache(tmp_path, "off")
+
+    def test_replay_round_trip(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        result = AIProviderResult(response="hi", files={"code/A.java": "class A {}"})
+
+        assert cache.lookup("p", "k", None) is None
+        assert cache.store("p", "k", result, None)
+        hit = cache.lookup("p", "k", None)
+
+        assert hit is not None and hit.result is not None
+        assert hit.result.response == "hi"
+        assert hit.result.files == {"code/A.java": "class A {}"}
+
+    def test_awaiting_response_is_cached(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        cache.store("manual", "k", None, None)
+
+        hit = cache.lookup("manual", "k", None)
+
+        assert hit is not None and hit.result is None
+
+    def test_record_mode_never_serves(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "record")
+        cache.store("p", "k", AIProviderResult(response="hi"), None)
+
+        assert cache.lookup("p", "k", None) is None
+
+    def test_strict_replay_miss_raises(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "strict-replay")
+
+        with pytest.raises(ResponseCacheMiss, match="strict-replay"):
+            cache.lookup("claude-code", "deadbeef" * 8, None)
+
+    def test_written_files_restored_into_new_iteration(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        recorded = context_for(tmp_path / "session-a")
+        written = Path(recorded["response_path"])
+        written.parent.mkdir(parents=True)
+        written.write_text("# Plan", encoding="utf-8")
+        cache.store("p", "k", AIProviderResult(files={str(written): None}), recorded)
+
+        replaying = context_for(tmp_path / "session-b")
+        hit = cache.lookup("p", "k", replaying)
+
+        restored = Path(replaying["response_path"])
+        assert restored.read_text(encoding="utf-8") == "# Plan"
+        assert hit is not None and hit.result is not None
+        assert hit.result.files == {str(restored): None}
+
+    def test_written_file_outside_iteration_is_not_cached(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        recorded = context_for(tmp_path / "session-a")
+        outside = tmp_path / "session-a" / "notes.md"
+        outside.parent.mkdir(parents=True)
+        outside.write_text("notes", encoding="utf-8")
+
+        stored = cache.store("p", "k", AIProviderResult(files={str(outside): None}), recorded)
+
+        assert not stored
+        assert cache.lookup("p", "k", context_for(tmp_path / "session-b")) is None
+
+    def test_replay_never_writes_outside_iteration(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        cache.store("p", "k", AIProviderResult(response="r"), None)
+        entry_path = tmp_path / "cache" / "k.json"
+        entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        entry["written"] = {"@iteration/../escaped.md": "x", str(tmp_path / "abs.md"): "x"}
+        entry_path.write_text(json.dumps(entry), encoding="utf-8")
+
+        hit = cache.lookup("p", "k", context_for(tmp_path / "session-b"))
+
+        assert hit is not None and hit.result is not None
+        assert not (tmp_path / "session-b" / "escaped.md").exists()
+        assert not (tmp_path / "abs.md").exists()
+
+    def test_uncapturable_written_file_is_not_cached(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        result = AIProviderResult(files={str(tmp_path / "missing.md"): None})
+
+        assert not cache.store("p", "k", result, None)
+        assert cache.lookup("p", "k", None) is None
+
+    def test_evicts_expired_entries(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay", max_age_seconds=60)
+        cache.store("p", "old", AIProviderResult(response="old"), None)
+        old_entry = tmp_path / "cache" / "old.json"
+        stale = time.time() - 120
+        os.utime(old_entry, (stale, stale))
+
+        cache.store("p", "new", AIProviderResult(response="new"), None)
+
+        assert not old_entry.exists()
+        assert cache.lookup("p", "new", None) is not None
+
+    def test_evicts_least_recently_used_over_size(self, tmp_path: Path):
+        cache = ResponseCache(tmp_path / "cache", "replay")
+        for index, key in enumerate(["a", "b"]):
+            cache.store("p", key, AIProviderResult(response="x" * 100), None)
+            past = time.time() - 100 + index
+            os.utime(tmp_path / "cache" / f"{key}.json", (past, past))
+        cache.lookup("p", "a", None)  # a is now most recently used
+        # Room for two entries (sizes differ by a few bytes of timestamp)
+        cache.max_bytes = (tmp_path / "cache" / "a.json").stat().st_size * 5 // 2
+
+        cache.store("p", "c", AIProviderResult(response="x" * 100), None)
+
+        assert cache.lookup("p", "a", None) is not None
+        assert cache.lookup("p", "b", None) is None
+        assert cache.lookup("p", "c", None) is not None
+
+
+class TestCachedExecution:
+    def test_replay_hit_skips_provider(self, tmp_path: Path, counting_provider):
+        service = ProviderExecutionService(ResponseCache(tmp_path / "cache", "replay"))
+
+        first = service.execute("counting", "q", context=context_for(tmp_path / "s1"))
+        second = service.execute("counting", "q", context=context_for(tmp_path / "s2"))
+
+        assert CountingProvider.calls == 1
+        assert not first.cache_hit
+        assert second.cache_hit
+        restored = tmp_path / "s2" / "iteration-1" / "planning-response.md"
+        assert restored.read_text(encoding="utf-8") == "answer to q"
+
+    def test_different_prompt_calls_provider(self, tmp_path: Path, counting_provider):
+        service = ProviderExecutionService(ResponseCache(tmp_path / "cache", "replay"))
+
+        service.execute("counting", "q1", context=context_for(tmp_path / "s1"))
+        service.execute("counting", "q2", context=context_for(tmp_path / "s1"))
+
+        assert CountingProvider.calls == 2
+
+    def test_strict_replay_fails_before_calling_provider(self, tmp_path: Path, counting_provider):
+        service = ProviderExecutionService(ResponseCache(tmp_path / "cache", "strict-replay"))
+
+        with pytest.raises(ResponseCacheMiss):
+            service.execute("counting", "q", context=context_for(tmp_path / "s1"))
+        assert CountingProvider.calls == 0
+
+    def test_without_cache_always_calls_provider(self, tmp_path: Path, counting_provider):
+        service = ProviderExecutionService()
+
+        service.execute("counting", "q", context=context_for(tmp_path / "s1"))
+        service.execute("counting", "q", context=context_for(tmp_path / "s1"))
+
+        assert CountingProvider.calls == 2
@@ -0,0 +1,138 @@
+"""Tests for ArtifactBlobStore and blob-backed code file writes."""
+
+import errno
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.application.storage import (
+    ArtifactBlobStore,
+    SessionFileGateway,
+    session_file_cache,
+)
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.interface.cli.cli import cli
+
+
+@pytest.fixture
+def sessions_root(tmp_path: Path) -> Path:
+    return tmp_path / ".aiwf" / "sessions"
+
+
+@pytest.fixture
+def store(sessions_root: Path) -> ArtifactBlobStore:
+    return ArtifactBlobStore.for_sessions_root(sessions_root)
+
+
+class TestArtifactBlobStore:
+    def test_unchanged_files_are_stored_once(self, sessions_root: Path, store) -> None:
+        gateway = SessionFileGateway(sessions_root / "s1", store)
+
+        first = gateway.write_code_file(1, "Entity.java", "class Entity {}")
+        second = gateway.write_code_file(2, "Entity.java", "class Entity {}")
+        changed = gateway.write_code_file(2, "Repo.java", "class Repo {}")
+
+        assert os.path.samefile(first, second)
+        assert second.read_text() == "class Entity {}"
+        assert changed.read_text() == "class Repo {}"
+        assert store.bytes_written == len("class Entity {}") + len("class Repo {}")
+        assert store.files_linked == 3
+
+    def test_rewrite_does_not_change_other_iterations(self, sessions_root: Path, store) -> None:
+        gateway = SessionFileGateway(sessions_root / "s1", store)
+        first = gateway.write_code_file(1, "Entity.java", "v1")
+        second = gateway.write_code_file(2, "Entity.java", "v1")
+
+        gateway.write_code_file(2, "Entity.java", "v2")
+
+        assert first.read_text() == "v1"
+        assert second.read_text() == "v2"
+
+    def test_plain_write_does_not_change_linked_file(self, sessions_root: Path, store) -> None:
+        first = SessionFileGateway(sessions_root / "s1", store).write_code_file(1, "A.java", "v1")
+        SessionFileGateway(sessions_root / "s1", store).write_code_file(2, "A.java", "v1")
+
+        SessionFileGateway(sessions_root / "s1").write_code_file(2, "A.java", "v2")
+
+        assert first.read_text() == "v1"
+
+    def test_updates_session_file_cache(self, sessions_root: Path, store) -> None:
+        gateway = SessionFileGateway(sessions_root / "s1", store)
+
+        with session_file_cache() as cache:
+            gateway.write_code_file(1, "Entity.java", "class Entity {}")
+            assert gateway.read_code_files(1) == {"Entity.java": "class Entity {}"}
+
+        assert cache.files_read == 0
+
+    def test_prune_removes_only_unreferenced_blobs(self, sessions_root: Path, store) -> None:
+        SessionFileGateway(sessions_root / "keep", store).write_code_file(1, "A.java", "kept")
+        dropped = SessionFileGateway(sessions_root / "drop", store).write_code_file(
+            1, "B.java", "dropped"
+        )
+        dropped.unlink()
+
+        assert store.prune() == (1, len("dropped"))
+        assert store.prune() == (0, 0)
+        assert (sessions_root / "keep" / "iteration-1" / "code" / "A.java").read_text() == "kept"
+
+    def test_stores_blob_again_if_pruned_before_linking(
+        self, sessions_root: Path, store, monkeypatch
+    ) -> None:
+        put = store.put
+
+        def put_then_prune(data: bytes):
+            result = put(data)
+            store.prune()  # A concurrent prune removes the not yet linked blob
+            monkeypatch.setattr(store, "put", put)
+            return result
+
+        monkeypatch.setattr(store, "put", put_then_prune)
+        gateway = SessionFileGateway(sessions_root / "s1", store)
+
+        path = gateway.write_code_file(1, "Entity.java", "class Entity {}")
+
+        assert path.read_text() == "class Entity {}"
+        assert path.stat().st_nlink == 2
+        assert store.files_linked == 1
+
+    def test_falls_back_to_copies_without_hard_links(
+        self, sessions_root: Path, store, monkeypatch
+    ) -> None:
+        def no_links(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "link", no_links)
+        gateway = SessionFileGateway(sessions_root / "s1", store)
+
+        path = gateway.write_code_file(1, "Entity.java", "class Entity {}")
+        gateway.write_code_file(2, "Entity.java", "class Entity {}")
+
+        assert path.read_text() == "class Entity {}"
+        assert path.stat().st_nlink == 1
+        assert store.files_linked == 0
+
+    def test_orchestrator_passes_store_to_artifact_service(self, sessions_root: Path, store) -> None:
+        orchestrator = WorkflowOrchestrator(
+            session_store=MagicMock(), sessions_root=sessions_root, artifact_store=store
+        )
+
+        assert orchestrator._artifact_service.blob_store is store
+
+
+class TestPruneBlobsCommand:
+    def test_reports_removed_blobs(self, tmp_path: Path, sessions_root: Path, store) -> None:
+        path = SessionFileGateway(sessions_root / "s1", store).write_code_file(1, "A.java", "x")
+        path.unlink()
+
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "prune-blobs"]
+        )
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert (output["removed"], output["freed_bytes"]) == (1, 1)
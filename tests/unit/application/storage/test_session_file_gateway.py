@@ -1,9 +1,17 @@
 """Tests for SessionFileGateway."""
 
+import hashlib
+import os
+
 import pytest
 from pathlib import Path
 
-from aiwf.application.storage.session_file_gateway import SessionFileGateway
+from aiwf.application.storage.session_file_gateway import (
+    SessionFileGateway,
+    active_session_file_cache,
+    session_file_cache,
+)
+from aiwf.domain.models.workflow_state import WorkflowPhase
 
 
 class TestWriteCodeFile:
@@ -75,3 +83,120 @@ class TestReadCodeFiles:
         assert len(result) == 2
         assert result["Entity.java"] == "class Entity"
         assert result["Repository.java"] == "interface Repository"
+
+
+class TestSessionFileCache:
+    """Tests for the per-command read-through cache."""
+
+    def test_repeated_reads_hit_disk_once(self, tmp_path: Path) -> None:
+        gateway = SessionFileGateway(tmp_path)
+        path = tmp_path / "iteration-1" / "generation-response.md"
+        path.parent.mkdir()
+        path.write_text("response", encoding="utf-8")
+
+        with session_file_cache() as cache:
+            assert gateway.read_response(1, WorkflowPhase.GENERATE) == "response"
+            assert gateway.read_file(path) == "response"
+            assert gateway.file_sha256(path) == hashlib.sha256(b"response").hexdigest()
+
+        assert cache.files_read == 1
+
+    def test_changed_file_is_reread(self, tmp_path: Path) -> None:
+        path = tmp_path / "plan.md"
+        path.write_text("v1", encoding="utf-8")
+
+        with session_file_cache() as cache:
+            assert cache.read_text(path) == "v1"
+            path.write_text("version 2", encoding="utf-8")
+            assert cache.read_text(path) == "version 2"
+            path.unlink()
+            assert cache.read_text(path) is None
+
+        assert cache.files_read == 2
+
+    def test_gateway_writes_update_cache(self, tmp_path: Path) -> None:
+        gateway = SessionFileGateway(tmp_path)
+
+        with session_file_cache() as cache:
+            gateway.write_prompt(1, WorkflowPhase.PLAN, "one")
+            gateway.write_prompt(1, WorkflowPhase.PLAN, "two")
+            assert gateway.read_prompt(1, WorkflowPhase.PLAN) == "two"
+
+        assert cache.files_read == 0
+
+    def test_newlines_match_path_read_text(self, tmp_path: Path) -> None:
+        path = tmp_path / "review-response.md"
+        path.write_bytes(b"a\r\nb\rc\n")
+
+        with session_file_cache() as cache:
+            assert cache.read_text(path) == path.read_text(encoding="utf-8")
+
+    def test_directory_walk_is_reused_until_tree_changes(self, tmp_path: Path) -> None:
+        gateway = SessionFileGateway(tmp_path)
+        gateway.write_code_file(1, "com/example/Entity.java", "class Entity")
+        nested = gateway.get_iteration_dir(1) / "code" / "com" / "example"
+        # Old mtime, so the file added below visibly changes the directory
+        os.utime(nested, ns=(0, 0))
+
+        with session_file_cache() as cache:
+            assert gateway.read_code_files(1) == {"com/example/Entity.java": "class Entity"}
+            assert gateway.read_code_files(1) == {"com/example/Entity.java": "class Entity"}
+            assert cache.trees_walked == 1
+
+            (nested / "Repository.java").write_text("interface Repository", encoding="utf-8")
+
+            assert set(gateway.read_code_files(1)) == {
+                "com/example/Entity.java",
+                "com/example/Repository.java",
+            }
+            assert cache.trees_walked == 2
+
+    def test_nested_blocks_share_cache(self) -> None:
+        assert active_session_file_cache() is None
+
+        with session_file_cache() as outer:
+            with session_file_cache() as inner:
+                assert inner is outer
+
+        assert active_session_file_cache() is None
+
+    def test_services_share_reads_within_command(self, tmp_path: Path) -> None:
+        from unittest.mock import MagicMock
+
+        from aiwf.application.approval.approval_gate_service import ApprovalGateService
+        from aiwf.application.artifacts.artifact_service import ArtifactService
+        from aiwf.domain.models.workflow_state import WorkflowStage
+
+        gateway = SessionFileGateway(tmp_path)
+        gateway.write_response(1, WorkflowPhase.PLAN, "the plan")
+        state = MagicMock(
+            phase=WorkflowPhase.PLAN, stage=WorkflowStage.RESPONSE, current_iteration=1
+        )
+
+        with session_file_cache() as cache:
+            files = ApprovalGateService().build_approval_files(state, tmp_path, MagicMock())
+            ArtifactService().handle_pre_transition_approval(state, tmp_path, MagicMock())
+
+        assert list(files.values()) == ["the plan"]
+        assert state.plan_hash == hashlib.sha256(b"the plan").hexdigest()
+        assert cache.files_read == 1
+
+    def test_approval_files_are_read_on_demand(self, tmp_path: Path) -> None:
+        from unittest.mock import MagicMock
+
+        from aiwf.application.approval.approval_gate_service import ApprovalGateService
+        from aiwf.domain.models.workflow_state import WorkflowStage
+
+        gateway = SessionFileGateway(tmp_path)
+        gateway.write_response(1, WorkflowPhase.GENERATE, "generated")
+        gateway.write_code_file(1, "Entity.java", "class Entity {}")
+        state = MagicMock(
+            phase=WorkflowPhase.GENERATE, stage=WorkflowStage.RESPONSE, current_iteration=1
+        )
+
+        with session_file_cache() as cache:
+            files = ApprovalGateService().build_approval_files(state, tmp_path, MagicMock())
+            assert cache.files_read == 0
+            assert sorted(Path(p).name for p in files) == ["Entity.java", "generation-response.md"]
+            assert files[str(gateway.get_response_path(1, WorkflowPhase.GENERATE))] == "generated"
+            assert cache.files_read == 1
@@ -194,6 +194,20 @@ class TestApprovalConfigFromDict:
         assert stage.approver == "claude-code"
         assert stage.max_retries == 5  # From default
 
+    def test_token_budget_per_stage_and_default(self):
+        """from_dict reads token_budget per stage, falling back to the default."""
+        data = {
+            "default_token_budget": 30000,
+            "plan.response": "claude-code",
+            "generate.response": {"approver": "claude-code", "token_budget": 8000},
+        }
+
+        config = ApprovalConfig.from_dict(data)
+
+        assert config.get_stage_config("plan", "response").token_budget == 30000
+        assert config.get_stage_config("generate", "response").token_budget == 8000
+        assert config.get_stage_config("review", "response").token_budget == 30000
+
     def test_invalid_value_type_raises(self):
         """from_dict raises on invalid value types."""
         data = {
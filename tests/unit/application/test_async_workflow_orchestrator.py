@@ -0,0 +1,129 @@
+"""Tests for AsyncWorkflowOrchestrator."""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.async_workflow_orchestrator import AsyncWorkflowOrchestrator
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.event_loop import run_sync
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+
+class NativeAsyncProvider(AIProvider):
+    """Async-first provider: generate() is a thin wrapper over agenerate()."""
+
+    loops: list[asyncio.AbstractEventLoop] = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {
+            "name": "native-async",
+            "description": "Async test provider",
+            "requires_config": False,
+            "config_keys": [],
+            "default_connection_timeout": 3,
+            "default_response_timeout": 7,
+        }
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt, context=None, system_prompt=None,
+                 connection_timeout=None, response_timeout=None):
+        return run_sync(self.agenerate(prompt, context, system_prompt,
+                                       connection_timeout, response_timeout))
+
+    async def agenerate(self, prompt, context=None, system_prompt=None,
+                        connection_timeout=None, response_timeout=None):
+        cls = type(self)
+        cls.loops.append(asyncio.get_running_loop())
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+        return AIProviderResult(
+            response=f"timeouts={connection_timeout},{response_timeout}"
+        )
+
+
+@pytest.fixture
+def native_async_provider():
+    AIProviderFactory.register("native-async", NativeAsyncProvider)
+    NativeAsyncProvider.loops = []
+    NativeAsyncProvider.in_flight = 0
+    NativeAsyncProvider.peak = 0
+    return NativeAsyncProvider
+
+
+class TestAsyncWorkflowOrchestrator:
+    def test_concurrent_sessions_share_one_loop(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any], native_async_provider
+    ) -> None:
+        orchestrator = WorkflowOrchestrator(
+            session_store=SessionStore(sessions_root=tmp_path),
+            sessions_root=tmp_path,
+            # Skip the plan prompt gate so init auto-continues into the planner call
+            approval_config=ApprovalConfig.from_dict({"plan.prompt": "skip"}),
+        )
+        async_orch = AsyncWorkflowOrchestrator(orchestrator)
+        providers = {
+            "planner": "native-async",
+            "generator": "manual",
+            "reviewer": "manual",
+            "reviser": "manual",
+        }
+
+        async def main():
+            session_ids = await asyncio.gather(*(
+                async_orch.initialize_run(
+                    profile="jpa-mt", providers=providers, context=valid_jpa_mt_context
+                )
+                for _ in range(3)
+            ))
+            states = await asyncio.gather(*(async_orch.init(sid) for sid in session_ids))
+            return asyncio.get_running_loop(), states
+
+        loop, states = asyncio.run(main())
+
+        assert all(s.phase == WorkflowPhase.PLAN for s in states)
+        assert all(s.stage == WorkflowStage.RESPONSE for s in states)
+        assert len(native_async_provider.loops) == 3
+        assert all(ran_on is loop for ran_on in native_async_provider.loops)
+        assert native_async_provider.peak == 3
+
+    def test_commands_for_same_session_are_serialized(self, tmp_path: Path) -> None:
+        calls: list[str] = []
+        active = threading.Event()
+
+        class RecordingOrchestrator:
+            def init(self, session_id: str):
+                assert not active.is_set(), "commands overlapped"
+                active.set()
+                threading.Event().wait(0.02)
+                calls.append(session_id)
+                active.clear()
+                return session_id
+
+        async_orch = AsyncWorkflowOrchestrator(RecordingOrchestrator())
+
+        async def main():
+            return await asyncio.gather(async_orch.init("s1"), async_orch.init("s1"))
+
+        assert asyncio.run(main()) == ["s1", "s1"]
+        assert calls == ["s1", "s1"]
@@ -0,0 +1,331 @@
+"""Tests for the batch runner."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.batch_runner import (
+    BatchEntry,
+    BatchManifest,
+    BatchRunner,
+    ProviderConcurrencyLimiter,
+)
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.profiles.profile_factory import ProfileFactory
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+
+class _RecordingProvider(AIProvider):
+    """Provider that records peak concurrency and can rendezvous on a barrier."""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    barrier: threading.Barrier | None = None
+    delay = 0.0
+
+    @classmethod
+    def reset(cls, barrier: threading.Barrier | None = None, delay: float = 0.0) -> None:
+        cls.active = 0
+        cls.peak = 0
+        cls.barrier = barrier
+        cls.delay = delay
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {
+            "name": "recording",
+            "description": "Recording provider for tests",
+            "requires_config": False,
+            "config_keys": [],
+            "default_connection_timeout": None,
+            "default_response_timeout": None,
+        }
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt, context=None, system_prompt=None,
+                 connection_timeout=None, response_timeout=None):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            if cls.barrier is not None:
+                cls.barrier.wait(timeout=5)
+            time.sleep(cls.delay)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+        return AIProviderResult(response="# Plan\n")
+
+
+class _RecordingApprover(_RecordingProvider):
+    """Recording provider that can read files, so it can serve as an AI approver."""
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {**super().get_metadata(), "name": "recording-approver", "fs_ability": "local-read"}
+
+
+class _RecordingProfile:
+    """Stand-in profile class for lazy-loading tests (create() is mocked for jpa-mt)."""
+
+
+@pytest.fixture(autouse=True)
+def passthrough_context_validation(mock_jpa_mt_profile):
+    """Let the mocked profile return the context it is given."""
+    mock_jpa_mt_profile.validate_context.side_effect = lambda context: dict(context)
+
+
+@pytest.fixture(autouse=True)
+def jpa_mt_registered(monkeypatch):
+    """Report the mocked jpa-mt profile as registered, even if no test imported it."""
+    is_registered = ProfileFactory.is_registered.__func__
+    monkeypatch.setattr(
+        ProfileFactory,
+        "is_registered",
+        classmethod(lambda cls, key: key == "jpa-mt" or is_registered(cls, key)),
+    )
+
+
+@pytest.fixture
+def recording_provider():
+    AIProviderFactory.register("recording", _RecordingProvider)
+    _RecordingProvider.reset()
+    yield _RecordingProvider
+    _RecordingProvider.reset()
+
+
+def _manifest(context: dict[str, Any], entities: list[str], **kwargs) -> BatchManifest:
+    shared = {k: v for k, v in context.items() if k not in ("entity", "table")}
+    return BatchManifest(
+        profile="jpa-mt",
+        context=shared,
+        entries=[
+            BatchEntry(context={"entity": name, "table": name.lower()})
+            for name in entities
+        ],
+        **kwargs,
+    )
+
+
+def _runner(tmp_path: Path, **kwargs) -> BatchRunner:
+    sessions_root = tmp_path / "sessions"
+    return BatchRunner(
+        session_store=SessionStore(sessions_root=sessions_root),
+        sessions_root=sessions_root,
+        **kwargs,
+    )
+
+
+# Skip the plan prompt gate so init auto-continues into the planner call
+_AUTO_PLAN = ApprovalConfig.from_dict({"plan.prompt": "skip"})
+
+
+class TestBatchManifest:
+    def test_resolve_entry_merges_defaults(self) -> None:
+        manifest = BatchManifest(
+            profile="jpa-mt",
+            providers={"planner": "claude-code"},
+            context={"bounded-context": "catalog", "scope": "domain"},
+            metadata={"developer": "dev"},
+            entries=[
+                BatchEntry(
+                    context={"entity": "Product", "scope": "vertical"},
+                    providers={"generator": "gemini-cli"},
+                )
+            ],
+        )
+
+        profile, context, providers, metadata = manifest.resolve_entry(manifest.entries[0])
+
+        assert profile == "jpa-mt"
+        assert context == {"bounded_context": "catalog", "scope": "vertical", "entity": "Product"}
+        assert providers == {
+            "planner": "claude-code",
+            "generator": "gemini-cli",
+            "reviewer": "manual",
+            "reviser": "manual",
+        }
+        assert metadata == {"developer": "dev"}
+
+    def test_from_file_loads_yaml(self, tmp_path: Path) -> None:
+        path = tmp_path / "batch.yml"
+        path.write_text(
+            "profile: jpa-mt\n"
+            "workers: 2\n"
+            "provider_limits: {claude-code: 1}\n"
+            "entries:\n"
+            "  - context: {entity: Product}\n",
+            encoding="utf-8",
+        )
+
+        manifest = BatchManifest.from_file(path)
+
+        assert manifest.workers == 2
+        assert manifest.provider_limits == {"claude-code": 1}
+        assert manifest.entries[0].context == {"entity": "Product"}
+
+    def test_from_file_rejects_invalid_workers(self, tmp_path: Path) -> None:
+        path = tmp_path / "batch.yml"
+        path.write_text("profile: jpa-mt\nworkers: 0\nentries: []\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="workers"):
+            BatchManifest.from_file(path)
+
+    def test_from_file_missing(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            BatchManifest.from_file(tmp_path / "missing.yml")
+
+
+class TestBatchRunner:
+    def test_unknown_profile_fails_before_any_entry_runs(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        manifest = _manifest(valid_jpa_mt_context, ["Product", "Category"])
+        manifest.entries[1].profile = "no-such-profile"
+        runner = _runner(tmp_path, workers=2)
+
+        with pytest.raises(ValueError, match="Profile 'no-such-profile' not found"):
+            runner.run(manifest)
+
+        assert list((tmp_path / "sessions").glob("*/session.json")) == []
+
+    def test_profiles_load_on_calling_thread(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        loaded_on: list[str] = []
+
+        def loader():
+            loaded_on.append(threading.current_thread().name)
+            return _RecordingProfile
+
+        snapshot = ProfileFactory.snapshot()
+        ProfileFactory._registry.pop("jpa-mt", None)
+        ProfileFactory.register_lazy("jpa-mt", loader)
+        try:
+            manifest = _manifest(valid_jpa_mt_context, ["Product", "Category", "Order"])
+            _runner(tmp_path, workers=3).run(manifest)
+        finally:
+            ProfileFactory.restore(snapshot)
+
+        assert loaded_on == [threading.current_thread().name]
+
+    def test_runs_every_entry_in_manifest_order(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        manifest = _manifest(valid_jpa_mt_context, ["Product", "Category", "Order"])
+
+        result = _runner(tmp_path, workers=3).run(manifest)
+
+        assert [item.label for item in result.items] == ["Product", "Category", "Order"]
+        assert result.failed == 0
+        for item in result.items:
+            assert item.session_id
+            assert item.phase == "PLAN"
+            assert item.status == "IN_PROGRESS"
+            assert item.pending_approval is True
+        store = SessionStore(sessions_root=tmp_path / "sessions")
+        assert len(store.list_sessions()) == 3
+
+    def test_failing_entry_does_not_abort_batch(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        manifest = _manifest(valid_jpa_mt_context, ["Product", "Category"])
+        manifest.entries.append(BatchEntry(name="broken", context={"scope": "bogus"}))
+
+        result = _runner(tmp_path, workers=2).run(manifest)
+
+        assert result.failed == 1
+        broken = result.items[2]
+        assert broken.label == "broken"
+        assert broken.session_id is None
+        assert "scope" in broken.error
+        assert all(not item.failed for item in result.items[:2])
+
+    def test_entries_run_concurrently(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any], recording_provider
+    ) -> None:
+        # Each provider call waits for all three; sequential execution would break the barrier
+        recording_provider.reset(barrier=threading.Barrier(3))
+        manifest = _manifest(
+            valid_jpa_mt_context,
+            ["A", "B", "C"],
+            providers={"planner": "recording"},
+        )
+
+        result = _runner(tmp_path, workers=3, approval_config=_AUTO_PLAN).run(manifest)
+
+        assert result.failed == 0
+        assert recording_provider.peak == 3
+        assert all(item.stage == "RESPONSE" for item in result.items)
+
+    def test_provider_limit_caps_concurrent_calls(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any], recording_provider
+    ) -> None:
+        recording_provider.reset(delay=0.05)
+        manifest = _manifest(
+            valid_jpa_mt_context,
+            ["A", "B", "C", "D"],
+            providers={"planner": "recording"},
+        )
+
+        result = _runner(
+            tmp_path,
+            workers=4,
+            provider_limits={"recording": 1},
+            approval_config=_AUTO_PLAN,
+        ).run(manifest)
+
+        assert result.failed == 0
+        assert recording_provider.peak == 1
+
+    def test_provider_limit_caps_concurrent_approvals(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        AIProviderFactory.register("recording-approver", _RecordingApprover)
+        _RecordingApprover.reset(delay=0.05)
+        manifest = _manifest(valid_jpa_mt_context, ["A", "B", "C", "D"])
+        try:
+            _runner(
+                tmp_path,
+                workers=4,
+                provider_limits={"recording-approver": 1},
+                approval_config=ApprovalConfig.from_dict({"plan.prompt": "recording-approver"}),
+            ).run(manifest)
+        finally:
+            AIProviderFactory._registry.pop("recording-approver", None)
+
+        assert _RecordingApprover.peak == 1
+
+    def test_on_result_called_for_each_entry(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        seen: list[str] = []
+        manifest = _manifest(valid_jpa_mt_context, ["Product", "Category"])
+
+        _runner(tmp_path, on_result=lambda item: seen.append(item.label)).run(manifest)
+
+        assert sorted(seen) == ["Category", "Product"]
+
+    def test_rejects_invalid_worker_count(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            _runner(tmp_path, workers=0)
+
+
+class TestProviderConcurrencyLimiter:
+    def test_unlimited_key_is_not_gated(self) -> None:
+        limiter = ProviderConcurrencyLimiter({"claude-code": 1})
+
+        with limiter.slot("claude-code"):
+            # Other keys must not block while claude-code's only slot is held
+            with limiter.slot("gemini-cli"):
+                pass
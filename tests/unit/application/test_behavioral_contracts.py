@@ -55,7 +55,7 @@ class TestGateOrdering:
 
         Uses _run_gate_after_action directly since gates now run automatically.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -106,7 +106,7 @@ class TestGateOrdering:
 
         Uses _run_gate_after_action directly since gates now run automatically.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -158,7 +158,7 @@ class TestRetryCountLifecycle:
 
         Phase 2: approve() now requires pending_approval=True to resolve.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -201,7 +201,7 @@ class TestManualApproverBehavior:
 
         Gate runs, returns PENDING, workflow pauses. User can edit, then approve.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -243,7 +243,7 @@ class TestMaxRetriesExhaustion:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -291,7 +291,7 @@ class TestContextBuilderPattern:
 
     def test_base_context_contains_shared_keys(self) -> None:
         """Base context should include session_id, iteration, metadata."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             session_id="session-123",
             phase=WorkflowPhase.PLAN,
@@ -316,7 +316,7 @@ class TestContextBuilderPattern:
         """Approval context should include base context plus approval-specific keys."""
         from aiwf.application.approval import GateContext
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             session_id="session-123",
             phase=WorkflowPhase.PLAN,
@@ -366,7 +366,7 @@ class TestContextBuilderPattern:
 
     def test_provider_context_uses_base_context(self) -> None:
         """Provider context should be based on base context."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             session_id="session-123",
             phase=WorkflowPhase.PLAN,
@@ -401,7 +401,7 @@ class TestSuggestedContentHandling:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -445,7 +445,7 @@ class TestSuggestedContentHandling:
 
     def test_suggested_content_included_in_context_on_retry(self) -> None:
         """suggested_content should be passed to provider context on retry."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -476,7 +476,7 @@ class TestPromptRegenerationCapability:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -522,7 +522,7 @@ class TestPromptRegenerationCapability:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -581,7 +581,7 @@ class TestApprovalErrorHandling:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -620,7 +620,7 @@ class TestApprovalErrorHandling:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -659,7 +659,7 @@ class TestApprovalErrorHandling:
 
         Phase 2: Gates run via _run_gate_after_action after content creation.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -712,7 +712,7 @@ class TestApproveRejectIdempotence:
         """approve() when pending_approval=False raises InvalidCommand."""
         from aiwf.application.workflow_orchestrator import InvalidCommand
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -739,7 +739,7 @@ class TestApproveRejectIdempotence:
         """reject() when pending_approval=False raises InvalidCommand."""
         from aiwf.application.workflow_orchestrator import InvalidCommand
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -804,7 +804,7 @@ class TestGateErrorRetry:
         """Gate error -> last_error set -> approve() retries -> succeeds."""
         from aiwf.domain.errors import ProviderError
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
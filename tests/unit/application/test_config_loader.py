@@ -10,6 +10,10 @@ from pathlib import Path
 import pytest
 from aiwf.application.config_loader import (
     resolve_fs_ability,
+    resolve_artifact_store,
+    resolve_provider_pool,
+    resolve_response_cache,
+    resolve_session_persistence,
     load_workflow_config,
     validate_provider_keys,
     ConfigLoadError,
@@ -198,6 +202,87 @@ class TestResolveFsAbility:
         assert resolve_fs_ability(None, "test-provider", {}, {}) == "local-write"
 
 
+class TestResolveSessionPersistence:
+    """Tests for resolve_session_persistence()."""
+
+    def test_defaults_to_snapshot(self):
+        assert resolve_session_persistence({}) == "snapshot"
+
+    def test_journal_mode(self):
+        assert resolve_session_persistence({"session_persistence": "journal"}) == "journal"
+
+    def test_invalid_value_raises_error(self):
+        with pytest.raises(ConfigLoadError) as exc_info:
+            resolve_session_persistence({"session_persistence": "jornal"})
+        assert "Invalid session_persistence 'jornal'" in str(exc_info.value)
+        assert "journal, snapshot, sqlite" in str(exc_info.value)
+
+
+class TestResolveArtifactStore:
+    """Tests for resolve_artifact_store()."""
+
+    def test_defaults_to_files(self):
+        assert resolve_artifact_store({}) == "files"
+
+    def test_blobs(self):
+        assert resolve_artifact_store({"artifact_store": "blobs"}) == "blobs"
+
+    def test_invalid_value_raises_error(self):
+        with pytest.raises(ConfigLoadError) as exc_info:
+            resolve_artifact_store({"artifact_store": "blob"})
+        assert "Invalid artifact_store 'blob'" in str(exc_info.value)
+
+
+class TestResolveResponseCache:
+    """Tests for resolve_response_cache()."""
+
+    def test_defaults_to_off(self):
+        settings = resolve_response_cache({})
+        assert settings["mode"] == "off"
+        assert settings["max_bytes"] == 256 * 1024 * 1024
+        assert settings["max_age_seconds"] == 30 * 24 * 3600
+
+    def test_mode_string_shorthand(self):
+        assert resolve_response_cache({"response_cache": "replay"})["mode"] == "replay"
+
+    def test_limits_from_mapping(self):
+        settings = resolve_response_cache(
+            {"response_cache": {"mode": "record", "max_size_mb": 1, "max_age_days": 0.5}}
+        )
+        assert settings == {"mode": "record", "max_bytes": 1024 * 1024, "max_age_seconds": 43200}
+
+    def test_env_var_overrides_mode(self, monkeypatch):
+        monkeypatch.setenv("AIWF_RESPONSE_CACHE", "strict-replay")
+        assert resolve_response_cache({"response_cache": "record"})["mode"] == "strict-replay"
+
+    def test_invalid_mode_raises_error(self):
+        with pytest.raises(ConfigLoadError) as exc_info:
+            resolve_response_cache({"response_cache": "replya"})
+        assert "Invalid response_cache mode 'replya'" in str(exc_info.value)
+
+    def test_invalid_limit_raises_error(self):
+        with pytest.raises(ConfigLoadError):
+            resolve_response_cache({"response_cache": {"mode": "replay", "max_size_mb": 0}})
+
+
+class TestResolveProviderPool:
+    """Tests for resolve_provider_pool()."""
+
+    def test_defaults(self):
+        assert resolve_provider_pool({}) == {"ttl": 600.0, "validation_ttl": 300.0}
+
+    def test_null_means_forever(self):
+        settings = resolve_provider_pool(
+            {"provider_pool": {"ttl_seconds": None, "validation_ttl_seconds": 0}}
+        )
+        assert settings == {"ttl": None, "validation_ttl": 0.0}
+
+    @pytest.mark.parametrize("value", [-1, "soon"])
+    def test_invalid_ttl_raises_error(self, value):
+        with pytest.raises(ConfigLoadError):
+            resolve_provider_pool({"provider_pool": {"ttl_seconds": value}})
+
+
 class TestFsAbilityConfigValidation:
     """Tests for invalid fs_ability values in config raising ConfigLoadError."""
 
@@ -57,7 +57,7 @@ def _make_orchestrator(
     approval_config: ApprovalConfig | None = None,
 ) -> WorkflowOrchestrator:
     """Create orchestrator with mocked store."""
-    store = Mock(spec=SessionStore)
+    store = MagicMock(spec=SessionStore)
     return WorkflowOrchestrator(
         session_store=store,
         sessions_root=tmp_path,
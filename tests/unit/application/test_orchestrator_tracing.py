@@ -0,0 +1,88 @@
+"""Tests for the tracing spans recorded by WorkflowOrchestrator."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiwf.application.approval_config import ApprovalConfig, StageApprovalConfig
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain import tracing
+from aiwf.domain.models.workflow_state import (
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.tracing import Tracer
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    tracer.start("aiwf init")
+    yield tracer
+    if tracing._active is tracer:
+        tracer.stop()
+
+
+def test_init_records_nested_spans(tmp_path: Path, tracer: Tracer) -> None:
+    store = SessionStore(sessions_root=tmp_path)
+    store.save(
+        WorkflowState(
+            session_id="s1",
+            profile="test-profile",
+            context={},
+            phase=WorkflowPhase.INIT,
+            stage=None,
+            status=WorkflowStatus.IN_PROGRESS,
+            ai_providers={"planner": "manual"},
+            standards_hash="abc123",
+        )
+    )
+    orchestrator = WorkflowOrchestrator(
+        session_store=store,
+        sessions_root=tmp_path,
+        approval_config=ApprovalConfig(stages={"plan.prompt": StageApprovalConfig(approver="skip")}),
+    )
+    orchestrator._prompt_service = MagicMock()
+    orchestrator._prompt_service.generate_prompt.return_value = MagicMock(
+        user_prompt="Plan it", prompt_filename="planning-prompt.md"
+    )
+
+    state = orchestrator.init("s1")
+    tracer.stop()
+
+    assert (state.phase, state.stage) == (WorkflowPhase.PLAN, WorkflowStage.RESPONSE)
+    by_id = {s.span_id: s for s in tracer.spans}
+    names = [s.name for s in tracer.spans]
+    for name in (
+        "orchestrator.execute_command",
+        "orchestrator.execute_action",
+        "orchestrator.create_prompt",
+        "approval.gate",
+        "approval.evaluate",
+        "orchestrator.call_ai",
+        "session_store.load",
+        "session_store.save",
+    ):
+        assert name in names
+
+    command = next(s for s in tracer.spans if s.name == "orchestrator.execute_command")
+    assert command.attributes["aiwf.command"] == "init"
+    assert command.attributes["aiwf.session_id"] == "s1"
+
+    call_ai = next(s for s in tracer.spans if s.name == "orchestrator.call_ai")
+    assert call_ai.attributes["aiwf.provider"] == "manual"
+    assert call_ai.attributes["aiwf.role"] == "planner"
+    assert call_ai.attributes["aiwf.phase"] == WorkflowPhase.PLAN
+
+    # call_ai runs from the auto-continue inside the prompt's approval gate
+    ancestors = []
+    parent = by_id.get(call_ai.parent_span_id)
+    while parent is not None:
+        ancestors.append(parent.name)
+        parent = by_id.get(parent.parent_span_id)
+    assert "approval.gate" in ancestors
+    assert ancestors[-1] == "aiwf init"
@@ -49,7 +49,7 @@ class TestOrchestratorInit:
 
     def test_init_from_init_phase_transitions_to_plan_prompt(self) -> None:
         """init from INIT transitions to PLAN[PROMPT]."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.INIT, stage=None)
         store.load.return_value = state
 
@@ -66,7 +66,7 @@ class TestOrchestratorInit:
 
     def test_init_from_non_init_phase_raises_error(self) -> None:
         """init from non-INIT phase raises InvalidCommand."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -88,7 +88,7 @@ class TestOrchestratorApprove:
 
     def test_approve_from_plan_prompt_transitions_to_plan_response(self) -> None:
         """approve from PLAN[PROMPT] with pending_approval transitions to PLAN[RESPONSE]."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -112,7 +112,7 @@ class TestOrchestratorApprove:
         self, tmp_path: Path
     ) -> None:
         """approve from PLAN[RESPONSE] with pending_approval transitions to GENERATE[PROMPT]."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -142,7 +142,7 @@ class TestOrchestratorApprove:
 
     def test_approve_from_init_raises_error(self) -> None:
         """approve from INIT without pending_approval raises InvalidCommand."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.INIT, stage=None)
         store.load.return_value = state
 
@@ -164,7 +164,7 @@ class TestOrchestratorReject:
 
     def test_reject_from_response_stage_with_manual_provider(self) -> None:
         """reject from RESPONSE stage with manual provider keeps pending for user intervention."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.RESPONSE,
@@ -189,7 +189,7 @@ class TestOrchestratorReject:
 
     def test_reject_without_pending_approval_raises_error(self) -> None:
         """reject without pending_approval raises InvalidCommand."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -212,7 +212,7 @@ class TestOrchestratorCancel:
 
     def test_cancel_from_any_active_state_transitions_to_cancelled(self) -> None:
         """cancel from any active state transitions to CANCELLED."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.GENERATE, stage=WorkflowStage.RESPONSE)
         store.load.return_value = state
 
@@ -229,7 +229,7 @@ class TestOrchestratorCancel:
 
     def test_cancel_from_terminal_state_raises_error(self) -> None:
         """cancel from terminal state raises InvalidCommand."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.COMPLETE, stage=None)
         store.load.return_value = state
 
@@ -251,7 +251,7 @@ class TestOrchestratorSaveState:
 
     def test_commands_save_state_after_transition(self) -> None:
         """Commands save state after successful transition."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -282,7 +282,7 @@ class TestTerminalStateCommands:
         """All commands raise InvalidCommand from terminal states."""
         from aiwf.application.workflow_orchestrator import InvalidCommand
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=terminal_phase, stage=None)
         store.load.return_value = state
 
@@ -346,7 +346,7 @@ class TestTerminalStatusUpdates:
 
         Updated for Phase 2: approve() requires pending_approval=True.
         """
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.REVIEW,
             stage=WorkflowStage.RESPONSE,
@@ -393,7 +393,7 @@ class TestPromptRejectionHandling:
         from aiwf.domain.providers.ai_approval_provider import AIApprovalProvider
         from aiwf.domain.profiles.profile_factory import ProfileFactory
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -443,7 +443,7 @@ class TestPromptRejectionHandling:
         """
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -491,7 +491,7 @@ class TestPromptRejectionHandling:
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
         from aiwf.domain.profiles.profile_factory import ProfileFactory
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -542,7 +542,7 @@ class TestGateAfterAction:
         """APPROVED result triggers automatic transition to next stage."""
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -576,7 +576,7 @@ class TestGateAfterAction:
         """PENDING result sets pending_approval and does NOT transition."""
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -612,7 +612,7 @@ class TestGateAfterAction:
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
         from aiwf.domain.profiles.profile_factory import ProfileFactory
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -647,7 +647,7 @@ class TestGateAfterAction:
         """Gate errors don't crash workflow - state saved for retry."""
         from aiwf.domain.errors import ProviderError
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -676,7 +676,7 @@ class TestGateAfterAction:
 
     def test_stageless_state_skips_gate(self, tmp_path: Path) -> None:
         """States without stage (INIT, terminal) skip gate."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.INIT, stage=None)
         store.load.return_value = state
 
@@ -699,7 +699,7 @@ class TestAutoContinue:
 
     def test_auto_continue_advances_stage(self, tmp_path: Path) -> None:
         """Auto-continue transitions from PROMPT to RESPONSE."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -719,7 +719,7 @@ class TestAutoContinue:
 
     def test_auto_continue_executes_next_action(self, tmp_path: Path) -> None:
         """Auto-continue executes the action for the new stage."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -745,7 +745,7 @@ class TestGateIntegration:
         from aiwf.application.transitions import Action
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT)
         store.load.return_value = state
 
@@ -769,7 +769,7 @@ class TestGateIntegration:
         from aiwf.application.transitions import Action
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(phase=WorkflowPhase.PLAN, stage=WorkflowStage.RESPONSE)
         store.load.return_value = state
 
@@ -794,7 +794,7 @@ class TestApproveCommandRedesigned:
 
     def test_approve_resolves_pending(self, tmp_path: Path) -> None:
         """approve command resolves pending_approval and continues."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -822,7 +822,7 @@ class TestApproveCommandRedesigned:
         """approve command without pending_approval raises error."""
         from aiwf.application.workflow_orchestrator import InvalidCommand
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -844,7 +844,7 @@ class TestApproveCommandRedesigned:
         """approve after gate error retries the gate."""
         from aiwf.domain.models.approval_result import ApprovalResult, ApprovalDecision
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -876,7 +876,7 @@ class TestRejectCommandRedesigned:
 
     def test_reject_stores_feedback_and_awaits_intervention(self, tmp_path: Path) -> None:
         """reject command stores feedback and awaits user intervention (for manual provider)."""
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
@@ -901,7 +901,7 @@ class TestRejectCommandRedesigned:
         """reject command without pending_approval raises error."""
         from aiwf.application.workflow_orchestrator import InvalidCommand
 
-        store = Mock(spec=SessionStore)
+        store = MagicMock(spec=SessionStore)
         state = _make_state(
             phase=WorkflowPhase.PLAN,
             stage=WorkflowStage.PROMPT,
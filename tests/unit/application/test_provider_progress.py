@@ -0,0 +1,88 @@
+"""Tests for streaming provider context and PROVIDER_PROGRESS events."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.events.emitter import WorkflowEventEmitter
+from aiwf.domain.events.event import WorkflowEvent
+from aiwf.domain.events.event_types import WorkflowEventType
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+from aiwf.domain.providers.response_stream import ResponseStream
+
+
+class StreamingProvider(AIProvider):
+    """Writes its response through ResponseStream like a streaming SDK provider."""
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {"name": "streaming", "fs_ability": "local-write"}
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt: str, context: dict[str, Any] | None = None, **kwargs: Any):
+        assert context is not None
+        stream = ResponseStream(
+            Path(context["response_path"]), on_progress=context["on_progress"]
+        )
+        stream.write("# Plan\n")
+        stream.tool_call("Read")
+        stream.write("Streamed body.\n")
+        stream.commit()
+        return AIProviderResult(
+            response=stream.text,
+            files={context["response_path"]: None},
+            ttft_seconds=stream.ttft_seconds,
+            latency_seconds=stream.latency_seconds,
+        )
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[WorkflowEvent] = []
+
+    def on_event(self, event: WorkflowEvent) -> None:
+        self.events.append(event)
+
+
+@pytest.fixture
+def streaming_provider():
+    AIProviderFactory.register("streaming", StreamingProvider)
+    yield
+    AIProviderFactory._registry.pop("streaming", None)
+
+
+def test_streaming_provider_writes_response_and_emits_progress(
+    tmp_path: Path, streaming_provider, valid_jpa_mt_context: dict[str, Any]
+) -> None:
+    recorder = Recorder()
+    emitter = WorkflowEventEmitter()
+    emitter.subscribe(recorder, [WorkflowEventType.PROVIDER_PROGRESS])
+    orchestrator = WorkflowOrchestrator(
+        session_store=SessionStore(sessions_root=tmp_path),
+        sessions_root=tmp_path,
+        event_emitter=emitter,
+        approval_config=ApprovalConfig(default_approver="manual"),
+    )
+    session_id = orchestrator.initialize_run(
+        profile="jpa-mt",
+        providers={"planner": "streaming", "generator": "manual",
+                   "reviewer": "manual", "reviser": "manual"},
+        context=valid_jpa_mt_context,
+    )
+
+    orchestrator.init(session_id)
+    orchestrator.approve(session_id)  # PLAN[PROMPT] -> PLAN[RESPONSE] calls AI
+
+    response = tmp_path / session_id / "iteration-1" / "planning-response.md"
+    assert response.read_text(encoding="utf-8") == "# Plan\nStreamed body.\n"
+    kinds = [event.metadata["kind"] for event in recorder.events]
+    assert kinds == ["first_token", "bytes", "tool_call", "bytes"]
+    assert all(event.session_id == session_id for event in recorder.events)
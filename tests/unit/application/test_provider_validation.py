@@ -90,8 +90,8 @@ def test_initialize_run_validates_all_providers(
         },
     )
 
-    # Should have been validated twice (once per role)
-    assert len(ValidatingProvider.validation_calls) == 2
+    # Roles sharing a provider key are validated once
+    assert len(ValidatingProvider.validation_calls) == 1
 
 
 def test_initialize_run_fails_fast_on_invalid_provider(
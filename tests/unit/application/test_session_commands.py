@@ -0,0 +1,120 @@
+"""Tests for session locking and save coalescing around orchestrator commands."""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.errors import SessionLockTimeout
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+
+@pytest.fixture
+def orchestrator(tmp_path: Path) -> WorkflowOrchestrator:
+    return WorkflowOrchestrator(
+        session_store=SessionStore(sessions_root=tmp_path, lock_timeout=0.2),
+        sessions_root=tmp_path,
+    )
+
+
+class DiskObservingProvider(AIProvider):
+    """Records the session phase stored on disk while generate() runs."""
+
+    sessions_root: Path
+    seen: list[tuple[WorkflowPhase, str | None]] = []
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {"name": "disk-observing", "fs_ability": "none"}
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt: str, context: dict[str, Any] | None = None, **kwargs: Any):
+        assert context is not None
+        stored = SessionStore(sessions_root=self.sessions_root).load(context["session_id"])
+        self.seen.append((stored.phase, stored.stage.value if stored.stage else None))
+        return AIProviderResult(response="# Plan\n")
+
+
+def _new_session(
+    orchestrator: WorkflowOrchestrator, context: dict[str, Any], planner: str = "manual"
+) -> str:
+    return orchestrator.initialize_run(
+        profile="jpa-mt",
+        providers={"planner": planner, "generator": "manual",
+                   "reviewer": "manual", "reviser": "manual"},
+        context=context,
+    )
+
+
+class TestSessionCommands:
+    def test_command_fails_while_session_is_locked_elsewhere(
+        self, orchestrator: WorkflowOrchestrator, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        session_id = _new_session(orchestrator, valid_jpa_mt_context)
+        held, release = threading.Event(), threading.Event()
+
+        def other_process() -> None:
+            with orchestrator.session_store.lock(session_id):
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=other_process)
+        thread.start()
+        held.wait()
+        try:
+            with pytest.raises(SessionLockTimeout):
+                orchestrator.cancel(session_id)
+        finally:
+            release.set()
+            thread.join()
+
+        assert orchestrator.session_store.load(session_id).phase == WorkflowPhase.INIT
+
+    def test_journal_command_writes_state_once(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        orchestrator = WorkflowOrchestrator(
+            session_store=SessionStore(sessions_root=tmp_path, journal=True),
+            sessions_root=tmp_path,
+        )
+        session_id = _new_session(orchestrator, valid_jpa_mt_context)
+        store = orchestrator.session_store
+        writes: list[str] = []
+        original = store._write
+        store._write = lambda state, data: (writes.append(state.session_id), original(state, data))
+
+        state = orchestrator.init(session_id)
+
+        assert state.phase == WorkflowPhase.PLAN
+        assert writes == [session_id]
+        assert state.version == 2
+
+    def test_journal_saves_are_flushed_before_provider_call(
+        self, tmp_path: Path, valid_jpa_mt_context: dict[str, Any]
+    ) -> None:
+        AIProviderFactory.register("disk-observing", DiskObservingProvider)
+        DiskObservingProvider.sessions_root = tmp_path
+        DiskObservingProvider.seen = []
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        orchestrator = WorkflowOrchestrator(session_store=store, sessions_root=tmp_path)
+        try:
+            session_id = _new_session(orchestrator, valid_jpa_mt_context, planner="disk-observing")
+            orchestrator.init(session_id)  # -> PLAN[PROMPT], prompt written
+
+            with store.coalesce():
+                state = store.load(session_id)
+                state.stage = WorkflowStage.RESPONSE
+                store.save(state)
+                orchestrator._action_call_ai(state, tmp_path / session_id)
+        finally:
+            AIProviderFactory._registry.pop("disk-observing", None)
+
+        assert DiskObservingProvider.seen == [(WorkflowPhase.PLAN, "response")]
@@ -0,0 +1,251 @@
+"""Tests for provider call telemetry recording and aggregation."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.application.approval_config import ApprovalConfig
+from aiwf.application.session_stats import (
+    load_metrics,
+    percentile,
+    summarize_provider_calls,
+    summarize_stage_timings,
+)
+from aiwf.application.workflow_orchestrator import WorkflowOrchestrator
+from aiwf.domain.errors import ProviderError
+from aiwf.domain.models.phase_timing import StageInterval
+from aiwf.domain.models.workflow_state import TransitionCause, WorkflowPhase, WorkflowStage
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.persistence.session_metrics import ProviderCallMetric, SessionMetricsLog
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+
+
+class MeteredProvider(AIProvider):
+    """Returns a response with usage, or fails when told to."""
+
+    fail = False
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {"name": "metered", "fs_ability": "none"}
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt: str, context: dict[str, Any] | None = None, **kwargs: Any):
+        if MeteredProvider.fail:
+            raise ProviderError("rate limited")
+        return AIProviderResult(
+            response="# Plan",
+            ttft_seconds=0.25,
+            input_tokens=1200,
+            output_tokens=300,
+            cost_usd=0.02,
+        )
+
+
+@pytest.fixture
+def metered_provider():
+    MeteredProvider.fail = False
+    AIProviderFactory.register("metered", MeteredProvider)
+    yield
+    AIProviderFactory._registry.pop("metered", None)
+
+
+def _metric(phase: str, provider: str, **overrides) -> ProviderCallMetric:
+    fields: dict[str, Any] = {
+        "session_id": "s1",
+        "phase": phase,
+        "iteration": 1,
+        "role": "planner",
+        "provider": provider,
+        "outcome": "ok",
+        "wall_seconds": 1.0,
+    }
+    fields.update(overrides)
+    return ProviderCallMetric(**fields)
+
+
+def _start_plan(tmp_path: Path, context: dict[str, Any]) -> tuple[WorkflowOrchestrator, str]:
+    orchestrator = WorkflowOrchestrator(
+        session_store=SessionStore(sessions_root=tmp_path),
+        sessions_root=tmp_path,
+        approval_config=ApprovalConfig(default_approver="manual"),
+    )
+    session_id = orchestrator.initialize_run(
+        profile="jpa-mt",
+        providers={"planner": "metered", "generator": "manual",
+                   "reviewer": "manual", "reviser": "manual"},
+        context=context,
+    )
+    orchestrator.init(session_id)
+    return orchestrator, session_id
+
+
+class TestProviderCallRecording:
+    def test_successful_call_is_recorded(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+
+        orchestrator.approve(session_id)  # PLAN[PROMPT] -> PLAN[RESPONSE] calls AI
+
+        [metric] = SessionMetricsLog(tmp_path / session_id).read()
+        assert metric.phase == "plan"
+        assert metric.role == "planner"
+        assert metric.provider == "metered"
+        assert metric.outcome == "ok"
+        assert metric.retry == 0
+        assert metric.wall_seconds >= 0
+        assert (metric.ttft_seconds, metric.input_tokens, metric.output_tokens) == (0.25, 1200, 300)
+        assert metric.cost_usd == 0.02
+
+    def test_failed_call_is_recorded(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+        MeteredProvider.fail = True
+
+        with pytest.raises(ProviderError):
+            orchestrator.approve(session_id)
+
+        [metric] = SessionMetricsLog(tmp_path / session_id).read()
+        assert metric.outcome == "error"
+        assert metric.error == "rate limited"
+
+    def test_metrics_stay_out_of_session_json(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+
+        orchestrator.approve(session_id)
+
+        session_json = (tmp_path / session_id / "session.json").read_text(encoding="utf-8")
+        assert "input_tokens" not in session_json
+
+
+class TestSummarizeProviderCalls:
+    def test_groups_by_phase_and_provider(self):
+        stats = summarize_provider_calls([
+            _metric("plan", "claude-code", wall_seconds=2.0, ttft_seconds=0.5,
+                    input_tokens=100, output_tokens=10, cost_usd=0.01),
+            _metric("plan", "claude-code", wall_seconds=4.0, retry=1, cache_hit=True),
+            _metric("generate", "gemini-cli", outcome="error", wall_seconds=1.0),
+        ])
+
+        plan, generate = stats
+        assert (plan.phase, plan.provider, plan.calls) == ("plan", "claude-code", 2)
+        assert plan.total_seconds == 6.0
+        assert plan.mean_seconds == 3.0
+        assert plan.mean_ttft_seconds == 0.5
+        assert (plan.input_tokens, plan.output_tokens, plan.cost_usd) == (100, 10, 0.01)
+        assert (plan.retries, plan.cache_hits, plan.errors) == (1, 1, 0)
+        assert (generate.errors, generate.mean_ttft_seconds) == (1, None)
+
+    def test_load_metrics_across_sessions(self, tmp_path: Path):
+        for session_id in ("a", "b"):
+            (tmp_path / session_id).mkdir()
+            SessionMetricsLog(tmp_path / session_id).append(
+                _metric("plan", "manual", session_id=session_id)
+            )
+
+        assert [m.session_id for m in load_metrics(tmp_path)] == ["a", "b"]
+        assert [m.session_id for m in load_metrics(tmp_path, "b")] == ["b"]
+
+    def test_load_metrics_unknown_session_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            load_metrics(tmp_path, "missing")
+
+
+class TestPhaseHistoryRecording:
+    def _history(self, orchestrator: WorkflowOrchestrator, session_id: str):
+        return [
+            (entry.phase, entry.stage, entry.cause)
+            for entry in orchestrator.session_store.load(session_id).phase_history
+        ]
+
+    def test_commands_record_transitions_and_waits(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+        orchestrator.approve(session_id)
+
+        assert self._history(orchestrator, session_id) == [
+            (WorkflowPhase.INIT, None, TransitionCause.INIT),
+            (WorkflowPhase.PLAN, WorkflowStage.PROMPT, TransitionCause.INIT),
+            (WorkflowPhase.PLAN, WorkflowStage.PROMPT, TransitionCause.AWAIT),
+            (WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.APPROVE),
+            (WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.AWAIT),
+        ]
+
+    def test_wait_is_recorded_without_an_extra_save(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+        saves: list[TransitionCause] = []
+        original_save = orchestrator.session_store.save
+
+        def counting_save(state):
+            saves.append(state.phase_history[-1].cause)
+            original_save(state)
+
+        monkeypatch.setattr(orchestrator.session_store, "save", counting_save)
+        orchestrator.approve(session_id)
+
+        # The gate's pending save and auto-continue's save; none added for the wait
+        assert saves == [TransitionCause.AWAIT, TransitionCause.AWAIT]
+
+    def test_reject_and_provider_error_are_recorded(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+        orchestrator.approve(session_id)
+        MeteredProvider.fail = True
+
+        with pytest.raises(ProviderError):
+            orchestrator.reject(session_id, "more detail")
+
+        causes = [cause for _, _, cause in self._history(orchestrator, session_id)]
+        assert causes[-2:] == [TransitionCause.REJECT, TransitionCause.ERROR]
+
+    def test_cancel_is_terminal_without_wait(
+        self, tmp_path: Path, metered_provider, valid_jpa_mt_context: dict[str, Any]
+    ):
+        orchestrator, session_id = _start_plan(tmp_path, valid_jpa_mt_context)
+        orchestrator.cancel(session_id)
+
+        assert self._history(orchestrator, session_id)[-1] == (
+            WorkflowPhase.CANCELLED, None, TransitionCause.CANCEL
+        )
+
+
+class TestStageTimingStats:
+    def test_percentile_interpolates(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.5
+        assert percentile(values, 90) == pytest.approx(90.1)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_groups_by_phase_stage_provider_and_kind(self):
+        def interval(kind: str, seconds: float) -> StageInterval:
+            return StageInterval(
+                phase="plan", stage="response", provider="claude-code",
+                cause=None, kind=kind, seconds=seconds,
+            )
+
+        machine, human = summarize_stage_timings([
+            interval("machine", 10.0),
+            interval("human", 300.0),
+            interval("machine", 30.0),
+        ])
+
+        assert (machine.kind, machine.count, machine.total_seconds) == ("machine", 2, 40.0)
+        assert machine.p50_seconds == 20.0
+        assert (human.kind, human.p99_seconds) == ("human", 300.0)
@@ -0,0 +1,175 @@
+"""Tests for the shared standards bundle cache."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from aiwf.application.standards_cache import StandardsBundleCache
+from aiwf.application.standards_materializer import materialize_standards
+from profiles.jpa_mt.standards import JpaMtStandardsProvider
+
+
+class _CountingProvider:
+    """Cacheable provider that concatenates its source files."""
+
+    def __init__(self, sources: list[Path]) -> None:
+        self.sources = sources
+        self.calls = 0
+
+    def get_cache_key(self, context: dict[str, Any]) -> dict[str, Any]:
+        return {"scope": context.get("scope"), "sources": self.sources}
+
+    def create_bundle(self, context: dict[str, Any]) -> str:
+        self.calls += 1
+        body = "".join(p.read_text(encoding="utf-8") for p in self.sources)
+        return f"# {context['scope']}\n{body}"
+
+
+class _UncacheableProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create_bundle(self, context: dict[str, Any]) -> str:
+        self.calls += 1
+        return "bundle\n"
+
+
+def _session(tmp_path: Path, name: str) -> Path:
+    session_dir = tmp_path / "sessions" / name
+    session_dir.mkdir(parents=True)
+    return session_dir
+
+
+def _materialize(cache, provider, session_dir, scope="domain") -> str:
+    return materialize_standards(
+        session_dir=session_dir,
+        context={"scope": scope, "entity": session_dir.name},
+        provider=provider,
+        cache=cache,
+        provider_key="counting",
+    )
+
+
+class TestStandardsBundleCache:
+    def test_bundle_built_once_across_sessions(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+
+        first = _materialize(cache, provider, _session(tmp_path, "a"))
+        second = _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 1
+        assert first == second == hashlib.sha256(b"# domain\nrule\n").hexdigest()
+        bundle_a = tmp_path / "sessions" / "a" / "standards-bundle.md"
+        bundle_b = tmp_path / "sessions" / "b" / "standards-bundle.md"
+        assert bundle_b.read_text(encoding="utf-8") == "# domain\nrule\n"
+        assert not os.path.samefile(bundle_a, bundle_b)
+
+    def test_editing_session_bundle_leaves_cache_intact(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+        _materialize(cache, provider, _session(tmp_path, "a"))
+
+        (tmp_path / "sessions" / "a" / "standards-bundle.md").write_text("edited\n")
+        _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 1
+        bundle_b = tmp_path / "sessions" / "b" / "standards-bundle.md"
+        assert bundle_b.read_text(encoding="utf-8") == "# domain\nrule\n"
+
+    def test_corrupted_entry_rebuilds(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+        _materialize(cache, provider, _session(tmp_path, "a"))
+
+        for entry in (tmp_path / "cache").glob("*.md"):
+            entry.write_text("tampered\n", encoding="utf-8")
+        bundle_hash = _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 2
+        assert bundle_hash == hashlib.sha256(b"# domain\nrule\n").hexdigest()
+        bundle_b = tmp_path / "sessions" / "b" / "standards-bundle.md"
+        assert bundle_b.read_text(encoding="utf-8") == "# domain\nrule\n"
+
+    def test_source_change_invalidates_entry(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+        _materialize(cache, provider, _session(tmp_path, "a"))
+
+        source.write_text("changed rule\n", encoding="utf-8")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        bundle_hash = _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 2
+        assert bundle_hash == hashlib.sha256(b"# domain\nchanged rule\n").hexdigest()
+
+    def test_key_material_distinguishes_bundles(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+
+        domain_hash = _materialize(cache, provider, _session(tmp_path, "a"), scope="domain")
+        vertical_hash = _materialize(cache, provider, _session(tmp_path, "b"), scope="vertical")
+
+        assert provider.calls == 2
+        assert domain_hash != vertical_hash
+
+    def test_uncacheable_provider_falls_back(self, tmp_path: Path) -> None:
+        provider = _UncacheableProvider()
+        cache = StandardsBundleCache(tmp_path / "cache")
+
+        _materialize(cache, provider, _session(tmp_path, "a"))
+        _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_missing_hash_sidecar_rebuilds(self, tmp_path: Path) -> None:
+        source = tmp_path / "rules.md"
+        source.write_text("rule\n", encoding="utf-8")
+        provider = _CountingProvider([source])
+        cache = StandardsBundleCache(tmp_path / "cache")
+        _materialize(cache, provider, _session(tmp_path, "a"))
+
+        for sidecar in (tmp_path / "cache").glob("*.sha256"):
+            sidecar.unlink()
+        _materialize(cache, provider, _session(tmp_path, "b"))
+
+        assert provider.calls == 2
+
+
+class TestJpaMtStandardsCacheKey:
+    def test_cache_key_lists_rules_files(self, tmp_path: Path) -> None:
+        (tmp_path / "b.rules.yml").write_text("x: {}", encoding="utf-8")
+        (tmp_path / "a.rules.yml").write_text("x: {}", encoding="utf-8")
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        key = provider.get_cache_key({"scope": "domain", "entity": "Foo"})
+
+        assert key["scope"] == "domain"
+        assert [p.name for p in key["sources"]] == ["a.rules.yml", "b.rules.yml"]
+        assert "entity" not in key
+
+    def test_cache_key_none_without_rules_path(self) -> None:
+        assert JpaMtStandardsProvider({}).get_cache_key({"scope": "domain"}) is None
+
+    def test_new_rules_file_changes_key(self, tmp_path: Path) -> None:
+        (tmp_path / "a.rules.yml").write_text("x: {}", encoding="utf-8")
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+        cache = StandardsBundleCache(tmp_path / "cache")
+        before = cache.cache_key("yaml-rules", provider, {"scope": "domain"})
+
+        (tmp_path / "b.rules.yml").write_text("x: {}", encoding="utf-8")
+
+        assert cache.cache_key("yaml-rules", provider, {"scope": "domain"}) != before
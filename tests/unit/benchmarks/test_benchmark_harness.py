@@ -0,0 +1,99 @@
+"""Tests for benchmark timing, result files and baseline comparison."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    calibrate,
+    compare,
+    current_interpreter,
+    load_results,
+    measure,
+    write_results,
+)
+
+
+def _result(name: str, median: float) -> BenchmarkResult:
+    return BenchmarkResult.from_timings(name, [median])
+
+
+class TestMeasure:
+    def test_runs_warmup_plus_rounds_with_setup_each_time(self) -> None:
+        calls: list[str] = []
+        benchmark = Benchmark(
+            "demo", run=lambda: calls.append("run"), setup=lambda: calls.append("setup"), rounds=3
+        )
+
+        result = measure(benchmark)
+
+        assert result.rounds == 3
+        assert calls == ["setup", "run"] * 4
+        assert result.min_seconds <= result.median_seconds <= result.max_seconds
+
+
+class TestResultsFile:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "out" / "results.json"
+        write_results(path, [_result("a", 0.5), _result("b", 1.0)], calibration_seconds=0.02)
+
+        loaded = load_results(path)
+
+        assert loaded.results["a"] == _result("a", 0.5)
+        assert loaded.results["b"].median_seconds == 1.0
+        assert loaded.calibration_seconds == 0.02
+        assert loaded.interpreter == current_interpreter()
+
+    def test_rejects_unknown_format(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.json"
+        path.write_text('{"version": 99, "results": {}}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_results(path)
+
+
+class TestCalibrate:
+    def test_returns_positive_median(self) -> None:
+        assert calibrate(rounds=1) > 0
+
+
+class TestCompare:
+    def test_flags_only_slowdowns_over_threshold(self) -> None:
+        baseline = {"fast": _result("fast", 1.0), "slow": _result("slow", 1.0)}
+
+        report = compare(
+            [_result("fast", 1.2), _result("slow", 1.3)], baseline, threshold=0.25
+        )
+
+        assert [c.name for c in report.regressions] == ["slow"]
+        assert report.comparisons[1].ratio == pytest.approx(1.3)
+
+    def test_reports_new_and_missing_benchmarks(self) -> None:
+        baseline = {"old": _result("old", 1.0), "kept": _result("kept", 1.0)}
+
+        report = compare([_result("kept", 0.5), _result("added", 1.0)], baseline)
+
+        assert report.new == ["added"]
+        assert report.missing == ["old"]
+        assert report.regressions == []
+
+    def test_scales_baseline_by_machine_speed(self) -> None:
+        baseline = {"a": _result("a", 1.0)}
+
+        # This machine runs the calibration workload twice as slowly
+        same_speed = compare([_result("a", 2.2)], baseline, threshold=0.25, scale=2.0)
+        slower = compare([_result("a", 2.6)], baseline, threshold=0.25, scale=2.0)
+
+        assert same_speed.regressions == []
+        assert same_speed.comparisons[0].ratio == pytest.approx(1.1)
+        assert [c.name for c in slower.regressions] == ["a"]
+
+    def test_ignores_slowdowns_under_noise_floor(self) -> None:
+        baseline = {"tiny": _result("tiny", 0.0001)}
+
+        report = compare([_result("tiny", 0.0003)], baseline, noise_floor=0.0005)
+
+        assert report.comparisons[0].ratio == pytest.approx(3.0)
+        assert report.regressions == []
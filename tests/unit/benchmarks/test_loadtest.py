@@ -0,0 +1,109 @@
+"""Tests for the concurrent load-test harness."""
+
+from pathlib import Path
+
+import pytest
+
+from aiwf.domain.errors import ProviderError
+from aiwf.domain.profiles.profile_factory import ProfileFactory
+from benchmarks.loadtest import (
+    SimulatedAIProvider,
+    SimulatedProviderConfig,
+    classify_session_path,
+    run_load_test,
+)
+
+
+@pytest.fixture
+def restore_profiles():
+    snapshot = ProfileFactory.snapshot()
+    yield
+    ProfileFactory.restore(snapshot)
+
+
+class TestClassifySessionPath:
+    @pytest.mark.parametrize(
+        "relative, kind",
+        [
+            ("catalog.sqlite3", "catalog"),
+            ("sessions.sqlite3-wal", "catalog"),
+            ("abc/session.json", "state"),
+            ("abc/session.json.tmp", "state"),
+            ("abc/session.journal.jsonl", "journal"),
+            ("abc/session.lock", "lock"),
+            ("abc/metrics.jsonl", "metrics"),
+            ("abc/iteration-1/code/Foo.java", "code"),
+            ("abc/iteration-2/review-response.md", "prompt_response"),
+            ("abc/plan.md", "other"),
+        ],
+    )
+    def test_kinds(self, relative: str, kind: str) -> None:
+        assert classify_session_path(f"/ws/sessions/{relative}", "/ws/sessions") == kind
+
+    def test_outside_root(self) -> None:
+        assert classify_session_path("/ws/rules/a.rules.yml", "/ws/sessions") == "outside"
+
+
+class TestSimulatedAIProvider:
+    def test_review_verdict_follows_pass_rate(self) -> None:
+        provider = SimulatedAIProvider(
+            SimulatedProviderConfig(latency_seconds=0, pass_rate=0.0, max_iterations=3)
+        )
+
+        first = provider.generate("p", {"phase": "review", "iteration": 1})
+        last = provider.generate("p", {"phase": "review", "iteration": 3})
+
+        assert "verdict: FAIL" in first.response
+        assert "verdict: PASS" in last.response
+
+    def test_code_response_has_requested_size(self) -> None:
+        provider = SimulatedAIProvider(
+            SimulatedProviderConfig(latency_seconds=0, response_bytes=20_000)
+        )
+
+        result = provider.generate("p", {"phase": "generate", "iteration": 1})
+
+        assert len(result.response) >= 20_000
+        assert "```java" in result.response
+
+    def test_failure_rate_raises(self) -> None:
+        provider = SimulatedAIProvider(
+            SimulatedProviderConfig(latency_seconds=0, failure_rate=1.0)
+        )
+
+        with pytest.raises(ProviderError):
+            provider.generate("p", {"phase": "plan"})
+
+
+class TestRunLoadTest:
+    def test_drives_sessions_to_completion(self, tmp_path: Path, restore_profiles) -> None:
+        report = run_load_test(
+            tmp_path / "sessions",
+            sessions=6,
+            workers=3,
+            provider=SimulatedProviderConfig(latency_seconds=0, pass_rate=1.0, seed=7),
+        )
+
+        assert report.completed == 6
+        assert report.failed == 0
+        assert report.transitions > 0
+        assert len(report.overhead_samples) == 6
+        assert report.lock_stats.acquisitions >= 6
+        assert report.fs_ops["state.write"] >= 6
+        assert report.fs_ops["code.write"] >= 6
+        assert report.to_dict()["throughput_per_minute"] > 0
+
+    def test_counts_failed_sessions(self, tmp_path: Path, restore_profiles) -> None:
+        report = run_load_test(
+            tmp_path / "sessions",
+            sessions=3,
+            workers=3,
+            provider=SimulatedProviderConfig(latency_seconds=0, failure_rate=1.0),
+        )
+
+        assert report.completed == 0
+        assert report.failed == 3
+
+    def test_rejects_unknown_persistence(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown persistence"):
+            run_load_test(tmp_path, sessions=1, workers=1, persistence="memory")
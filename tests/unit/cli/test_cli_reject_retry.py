@@ -78,6 +78,34 @@ class TestRejectCommand:
         assert result.exit_code == 0
         mock_orch.reject.assert_called_once_with("test-session", feedback="Bad response")
 
+    @patch("aiwf.interface.cli.cli._get_response_cache")
+    @patch("aiwf.domain.persistence.session_store.SessionStore")
+    @patch("aiwf.application.workflow_orchestrator.WorkflowOrchestrator")
+    def test_reject_passes_response_cache(
+        self, mock_orch_cls, mock_store_cls, mock_get_cache
+    ) -> None:
+        """reject regenerates through the configured response cache."""
+        mock_orch_cls.return_value.reject.return_value = _make_state()
+
+        result = CliRunner().invoke(cli, ["reject", "test-session", "--feedback", "Bad"])
+
+        assert result.exit_code == 0
+        assert mock_orch_cls.call_args.kwargs["response_cache"] is mock_get_cache.return_value
+
+    @patch("aiwf.interface.cli.cli._get_artifact_store")
+    @patch("aiwf.domain.persistence.session_store.SessionStore")
+    @patch("aiwf.application.workflow_orchestrator.WorkflowOrchestrator")
+    def test_reject_passes_artifact_store(
+        self, mock_orch_cls, mock_store_cls, mock_get_store
+    ) -> None:
+        """reject writes regenerated code through the configured blob store."""
+        mock_orch_cls.return_value.reject.return_value = _make_state()
+
+        result = CliRunner().invoke(cli, ["reject", "test-session", "--feedback", "Bad"])
+
+        assert result.exit_code == 0
+        assert mock_orch_cls.call_args.kwargs["artifact_store"] is mock_get_store.return_value
+
     @patch("aiwf.domain.persistence.session_store.SessionStore")
     @patch("aiwf.application.workflow_orchestrator.WorkflowOrchestrator")
     def test_reject_json_output(self, mock_orch_cls, mock_store_cls) -> None:
@@ -29,6 +29,7 @@ class TestWorkflowEventType:
             "WORKFLOW_COMPLETED",
             "WORKFLOW_FAILED",
             "ITERATION_STARTED",
+            "PROVIDER_PROGRESS",
         }
         actual_types = {e.name for e in WorkflowEventType}
         assert actual_types == expected_types
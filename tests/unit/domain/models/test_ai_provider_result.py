@@ -59,7 +59,10 @@ class TestAIProviderResultContract:
 
     def test_model_fields_exist(self) -> None:
         """All documented fields exist on the model."""
-        expected_fields = {"files", "response"}
+        expected_fields = {
+            "files", "response", "ttft_seconds", "latency_seconds",
+            "input_tokens", "output_tokens", "cost_usd",
+        }
         assert expected_fields == set(AIProviderResult.model_fields.keys())
 
     def test_files_is_mutable_dict(self) -> None:
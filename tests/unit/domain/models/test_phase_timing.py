@@ -0,0 +1,82 @@
+"""Tests for stage intervals derived from phase_history."""
+
+from datetime import datetime, timedelta, timezone
+
+from aiwf.domain.models.phase_timing import stage_intervals
+from aiwf.domain.models.workflow_state import (
+    PhaseTransition,
+    TransitionCause,
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(phase, stage, cause, seconds, status=WorkflowStatus.IN_PROGRESS):
+    return PhaseTransition(
+        phase=phase, stage=stage, status=status, cause=cause,
+        timestamp=START + timedelta(seconds=seconds),
+    )
+
+
+def _state(history) -> WorkflowState:
+    return WorkflowState(
+        session_id="s1",
+        profile="jpa-mt",
+        phase=history[-1].phase,
+        status=history[-1].status,
+        standards_hash="0" * 64,
+        ai_providers={"planner": "claude-code", "generator": "manual"},
+        phase_history=history,
+    )
+
+
+class TestStageIntervals:
+    def test_splits_machine_and_human_time(self):
+        state = _state([
+            _entry(WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.APPROVE, 0),
+            _entry(WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.AWAIT, 30),
+            _entry(WorkflowPhase.GENERATE, WorkflowStage.PROMPT, TransitionCause.APPROVE, 90),
+        ])
+
+        machine, human = stage_intervals(state)
+
+        assert (machine.phase, machine.stage, machine.kind, machine.seconds) == (
+            "plan", "response", "machine", 30.0
+        )
+        assert machine.provider == "claude-code"
+        assert machine.cause == "approve"
+        assert (human.kind, human.seconds) == ("human", 60.0)
+
+    def test_error_wait_is_human_time(self):
+        state = _state([
+            _entry(WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.ERROR, 0,
+                   status=WorkflowStatus.ERROR),
+            _entry(WorkflowPhase.PLAN, WorkflowStage.RESPONSE, TransitionCause.APPROVE, 5),
+        ])
+
+        [interval] = stage_intervals(state)
+
+        assert interval.kind == "human"
+
+    def test_last_entry_is_open(self):
+        state = _state([_entry(WorkflowPhase.INIT, None, TransitionCause.INIT, 0)])
+
+        assert stage_intervals(state) == []
+
+    def test_legacy_entries_without_stage_or_cause(self):
+        state = _state([
+            PhaseTransition(phase=WorkflowPhase.INIT, status=WorkflowStatus.IN_PROGRESS,
+                            timestamp=START),
+            _entry(WorkflowPhase.PLAN, WorkflowStage.PROMPT, TransitionCause.INIT, 1),
+        ])
+
+        [interval] = stage_intervals(state)
+
+        assert (interval.phase, interval.stage, interval.cause, interval.kind) == (
+            "init", None, None, "machine"
+        )
+        assert interval.provider is None
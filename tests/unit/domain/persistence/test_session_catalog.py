@@ -0,0 +1,300 @@
+"""Tests for the session catalog index and SessionStore catalog integration."""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.domain.constants import SESSION_CATALOG_FILENAME
+from aiwf.domain.models.workflow_state import (
+    PhaseTransition,
+    TransitionCause,
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.persistence.session_catalog import SessionCatalog
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.interface.cli.cli import cli
+
+
+def _make_state(session_id: str, **kwargs) -> WorkflowState:
+    defaults = {
+        "session_id": session_id,
+        "profile": "jpa-mt",
+        "context": {"entity": f"Entity{session_id}"},
+        "phase": WorkflowPhase.PLAN,
+        "stage": WorkflowStage.PROMPT,
+        "status": WorkflowStatus.IN_PROGRESS,
+        "ai_providers": {"planner": "manual"},
+        "standards_hash": "0" * 64,
+    }
+    defaults.update(kwargs)
+    return WorkflowState(**defaults)
+
+
+class TestSessionCatalog:
+    """Tests for SessionCatalog in isolation."""
+
+    def test_catalog_file_created_lazily(self, tmp_path: Path) -> None:
+        """Constructing a catalog does not touch disk."""
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+
+        assert not catalog.db_path.exists()
+        assert catalog.is_built() is False
+
+    def test_upsert_replaces_existing_row(self, tmp_path: Path) -> None:
+        """upsert() keeps one row per session."""
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        state = _make_state("s1")
+        catalog.upsert(state)
+
+        state.phase = WorkflowPhase.GENERATE
+        state.current_iteration = 2
+        catalog.upsert(state)
+
+        entries = catalog.query()
+        assert len(entries) == 1
+        assert entries[0].phase == "generate"
+        assert entries[0].iteration == 2
+        assert entries[0].entity == "Entitys1"
+        assert entries[0].context == {"entity": "Entitys1"}
+
+    def test_query_filters_sorts_and_limits(self, tmp_path: Path) -> None:
+        """query() filters by column, sorts by updated_at desc, applies limit."""
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        catalog.upsert(_make_state("old", updated_at=base))
+        catalog.upsert(_make_state("new", updated_at=base + timedelta(hours=2)))
+        catalog.upsert(_make_state("mid", updated_at=base + timedelta(hours=1)))
+        catalog.upsert(
+            _make_state("err", status=WorkflowStatus.ERROR, profile="other")
+        )
+
+        in_progress = catalog.query(status="in_progress")
+        assert [e.session_id for e in in_progress] == ["new", "mid", "old"]
+
+        assert [e.session_id for e in catalog.query(status="in_progress", limit=2)] == [
+            "new",
+            "mid",
+        ]
+        assert [e.session_id for e in catalog.query(profile="other")] == ["err"]
+
+    def test_remove_deletes_row(self, tmp_path: Path) -> None:
+        """remove() drops the row and is a no-op for unknown sessions."""
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        catalog.upsert(_make_state("s1"))
+
+        catalog.remove("s1")
+        catalog.remove("missing")
+
+        assert catalog.count() == 0
+
+
+def _timed_state(session_id: str, profile: str = "jpa-mt") -> WorkflowState:
+    """State whose history spends 2s machine time then 60s waiting in PLAN[PROMPT]."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entry = lambda cause, stage, seconds: PhaseTransition(  # noqa: E731
+        phase=WorkflowPhase.PLAN,
+        stage=stage,
+        status=WorkflowStatus.IN_PROGRESS,
+        cause=cause,
+        timestamp=start + timedelta(seconds=seconds),
+    )
+    return _make_state(
+        session_id,
+        profile=profile,
+        phase_history=[
+            entry(TransitionCause.INIT, WorkflowStage.PROMPT, 0),
+            entry(TransitionCause.AWAIT, WorkflowStage.PROMPT, 2),
+            entry(TransitionCause.APPROVE, WorkflowStage.RESPONSE, 62),
+        ],
+    )
+
+
+class TestCatalogStageTimings:
+    """Tests for stage timing rows kept alongside session rows."""
+
+    def test_upsert_indexes_closed_intervals(self, tmp_path: Path) -> None:
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        catalog.upsert(_timed_state("s1"))
+
+        timings = catalog.query_stage_timings()
+
+        assert [(t.stage, t.kind, t.seconds, t.provider) for t in timings] == [
+            ("prompt", "machine", 2.0, "manual"),
+            ("prompt", "human", 60.0, "manual"),
+        ]
+
+    def test_upsert_replaces_and_remove_deletes_timings(self, tmp_path: Path) -> None:
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        catalog.upsert(_timed_state("s1"))
+        catalog.upsert(_timed_state("s1"))
+        assert len(catalog.query_stage_timings(session_id="s1")) == 2
+
+        catalog.remove("s1")
+
+        assert catalog.query_stage_timings() == []
+
+    def test_filters_by_profile(self, tmp_path: Path) -> None:
+        catalog = SessionCatalog(tmp_path / "catalog.sqlite3")
+        catalog.upsert(_timed_state("s1"))
+        catalog.upsert(_timed_state("s2", profile="other"))
+
+        assert len(catalog.query_stage_timings(profile="other")) == 2
+
+    def test_catalog_from_older_version_is_rebuilt(self, tmp_path: Path) -> None:
+        """A catalog built before stage timings existed is rebuilt on first query."""
+        store = SessionStore(sessions_root=tmp_path)
+        store.save(_timed_state("s1"))
+        store.rebuild_index()
+        with sqlite3.connect(store.catalog.db_path) as conn:
+            conn.execute("DELETE FROM stage_timings")
+            conn.execute("UPDATE catalog_meta SET value = '1' WHERE key = 'built'")
+        conn.close()
+
+        assert len(store.query_stage_timings()) == 2
+
+
+class TestSessionStoreCatalog:
+    """Tests for SessionStore keeping the catalog up to date."""
+
+    def test_save_updates_catalog(self, tmp_path: Path) -> None:
+        """save() upserts the catalog row with the saved updated_at."""
+        store = SessionStore(sessions_root=tmp_path)
+        state = _make_state("s1")
+
+        store.save(state)
+
+        entries = store.catalog.query()
+        assert [e.session_id for e in entries] == ["s1"]
+        assert entries[0].updated_at == state.updated_at.isoformat()
+
+    def test_delete_removes_from_catalog(self, tmp_path: Path) -> None:
+        """delete() removes the session's catalog row."""
+        store = SessionStore(sessions_root=tmp_path)
+        store.save(_make_state("s1"))
+        store.save(_make_state("s2"))
+
+        store.delete("s1")
+
+        assert [e.session_id for e in store.catalog.query()] == ["s2"]
+
+    def test_query_sessions_builds_index_from_existing_sessions(
+        self, tmp_path: Path
+    ) -> None:
+        """Sessions written before the catalog existed are indexed on first query."""
+        for session_id in ("a", "b"):
+            session_dir = tmp_path / session_id
+            session_dir.mkdir()
+            (session_dir / "session.json").write_text(
+                json.dumps(_make_state(session_id).model_dump(mode="json")),
+                encoding="utf-8",
+            )
+
+        store = SessionStore(sessions_root=tmp_path)
+        entries = store.query_sessions()
+
+        assert sorted(e.session_id for e in entries) == ["a", "b"]
+        assert store.catalog.is_built() is True
+
+    def test_query_sessions_does_not_load_session_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Once built, queries are answered without loading any session."""
+        store = SessionStore(sessions_root=tmp_path)
+        store.save(_make_state("s1"))
+        store.rebuild_index()
+
+        def fail_load(self, session_id):
+            raise AssertionError("load() must not be called")
+
+        monkeypatch.setattr(SessionStore, "load", fail_load)
+
+        assert [e.session_id for e in store.query_sessions()] == ["s1"]
+
+    def test_rebuild_index_skips_invalid_and_prunes_stale(self, tmp_path: Path) -> None:
+        """rebuild_index() drops rows for removed sessions and skips bad files."""
+        store = SessionStore(sessions_root=tmp_path)
+        store.save(_make_state("keep"))
+        store.save(_make_state("gone"))
+
+        # Remove a session behind the store's back, and add a corrupt one
+        import shutil
+        shutil.rmtree(tmp_path / "gone")
+        bad_dir = tmp_path / "bad"
+        bad_dir.mkdir()
+        (bad_dir / "session.json").write_text("{not json", encoding="utf-8")
+
+        indexed, skipped = store.rebuild_index()
+
+        assert (indexed, skipped) == (1, 1)
+        assert [e.session_id for e in store.catalog.query()] == ["keep"]
+
+
+class TestListCommandUsesCatalog:
+    """Tests for `aiwf list` and `aiwf rebuild-index`."""
+
+    def _sessions_root(self, project_dir: Path) -> Path:
+        return project_dir / ".aiwf" / "sessions"
+
+    def test_list_returns_most_recent_first_with_limit(self, tmp_path: Path) -> None:
+        """list sorts across all sessions before applying --limit."""
+        store = SessionStore(sessions_root=self._sessions_root(tmp_path))
+        store.save(_make_state("first"))
+        store.save(_make_state("second"))
+        store.save(_make_state("third"))
+
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "list", "--limit", "2"],
+        )
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert [s["session_id"] for s in output["sessions"]] == ["third", "second"]
+        assert output["sessions"][0]["phase"] == "PLAN"
+        assert output["sessions"][0]["status"] == "IN_PROGRESS"
+
+    def test_list_complete_filter_matches_phase(self, tmp_path: Path) -> None:
+        """--status complete selects sessions in the COMPLETE phase."""
+        store = SessionStore(sessions_root=self._sessions_root(tmp_path))
+        store.save(_make_state("open"))
+        store.save(
+            _make_state(
+                "done",
+                phase=WorkflowPhase.COMPLETE,
+                stage=None,
+                status=WorkflowStatus.SUCCESS,
+            )
+        )
+
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "list", "--status", "complete"],
+        )
+
+        output = json.loads(result.output)
+        assert [s["session_id"] for s in output["sessions"]] == ["done"]
+
+    def test_rebuild_index_command(self, tmp_path: Path) -> None:
+        """rebuild-index reports indexed and skipped counts."""
+        sessions_root = self._sessions_root(tmp_path)
+        store = SessionStore(sessions_root=sessions_root)
+        store.save(_make_state("s1"))
+        (sessions_root / SESSION_CATALOG_FILENAME).unlink()
+
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "rebuild-index"]
+        )
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["command"] == "rebuild-index"
+        assert output["indexed"] == 1
+        assert output["skipped"] == 0
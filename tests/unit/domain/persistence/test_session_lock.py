@@ -0,0 +1,203 @@
+"""Tests for per-session locking and compare-and-swap saves."""
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from aiwf.domain.errors import SessionConflictError, SessionLockTimeout
+from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowState, WorkflowStatus
+from aiwf.domain.persistence.session_lock import SessionLocker
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.persistence.sqlite_session_store import SqliteSessionStore
+
+
+def _state(session_id: str = "s1") -> WorkflowState:
+    return WorkflowState(
+        session_id=session_id,
+        profile="jpa-mt",
+        phase=WorkflowPhase.INIT,
+        status=WorkflowStatus.IN_PROGRESS,
+        standards_hash="abc123",
+        ai_providers={"planner": "manual"},
+    )
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path: Path) -> SessionStore:
+    if request.param == "sqlite":
+        return SqliteSessionStore(sessions_root=tmp_path)
+    return SessionStore(sessions_root=tmp_path)
+
+
+class TestCompareAndSwap:
+    def test_save_increments_version(self, store: SessionStore) -> None:
+        state = _state()
+        store.save(state)
+        store.save(state)
+
+        assert state.version == 2
+        assert store.load("s1").version == 2
+
+    def test_stale_writer_is_rejected(self, store: SessionStore) -> None:
+        store.save(_state())
+        first = store.load("s1")
+        second = store.load("s1")
+
+        first.phase = WorkflowPhase.PLAN
+        store.save(first)
+        second.phase = WorkflowPhase.CANCELLED
+
+        with pytest.raises(SessionConflictError) as exc_info:
+            store.save(second)
+
+        assert exc_info.value.expected_version == 1
+        assert exc_info.value.actual_version == 2
+        assert store.load("s1").phase == WorkflowPhase.PLAN
+
+    def test_coalesced_saves_bump_version_once(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+
+        with store.coalesce():
+            store.save(state)
+            store.save(state)
+
+        assert state.version == 2
+        assert store.load("s1").version == 2
+
+    def test_journal_mode_tracks_version(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        store.save(state)
+        stale = SessionStore(sessions_root=tmp_path).load("s1")
+        store.save(state)
+
+        with pytest.raises(SessionConflictError):
+            SessionStore(sessions_root=tmp_path, journal=True).save(stale)
+
+
+    def test_own_writes_do_not_reread_state(self, tmp_path: Path, monkeypatch) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        replays = []
+        monkeypatch.setattr(
+            SessionStore, "_replay_journal", staticmethod(lambda *args: replays.append(args) or (0, None))
+        )
+
+        for _ in range(3):
+            store.save(state)
+
+        assert state.version == 4
+        assert replays == []
+
+    def test_other_writer_invalidates_cached_version(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        other = SessionStore(sessions_root=tmp_path, journal=True)
+        other.save(other.load("s1"))
+
+        with pytest.raises(SessionConflictError):
+            store.save(state)
+
+
+class TestSessionLock:
+    def test_lock_is_reentrant_within_thread(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, lock_timeout=0.2)
+
+        with store.lock("s1"):
+            with store.lock("s1"):
+                store.save(_state())
+
+        assert store.lock_stats.acquisitions == 1
+
+    def test_contended_lock_waits_and_records_metrics(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path)
+        held = threading.Event()
+
+        def holder() -> None:
+            with store.lock("s1"):
+                held.set()
+                time.sleep(0.2)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        with store.lock("s1", timeout=5):
+            pass
+        thread.join()
+
+        stats = store.lock_stats
+        assert stats.acquisitions == 2
+        assert stats.contended == 1
+        assert stats.max_wait_seconds > 0.05
+
+    def test_other_sessions_do_not_contend(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path)
+
+        with store.lock("s1"):
+            with store.lock("s2", timeout=0):
+                pass
+
+        assert store.lock_stats.contended == 0
+
+    def test_lock_held_by_other_process_times_out(self, tmp_path: Path) -> None:
+        pytest.importorskip("fcntl")
+        lock_path = tmp_path / "s1" / "session.lock"
+        lock_path.parent.mkdir(parents=True)
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import fcntl, sys, time\n"
+                f"f = open({str(lock_path)!r}, 'w')\n"
+                "fcntl.flock(f, fcntl.LOCK_EX)\n"
+                "print('locked', flush=True)\n"
+                "time.sleep(30)\n",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "locked"
+            store = SessionStore(sessions_root=tmp_path)
+
+            with pytest.raises(SessionLockTimeout):
+                with store.lock("s1", timeout=0.2):
+                    pass
+
+            assert store.lock_stats.timeouts == 1
+        finally:
+            holder.kill()
+            holder.wait()
+
+    def test_timeout_is_not_an_os_error(self) -> None:
+        # Session I/O handlers catch OSError; a busy session must not look like one
+        assert not issubclass(SessionLockTimeout, OSError)
+
+    def test_locker_releases_on_error(self, tmp_path: Path) -> None:
+        locker = SessionLocker(timeout=0.2)
+        lock_path = tmp_path / "session.lock"
+
+        with pytest.raises(RuntimeError):
+            with locker.hold("s1", lock_path):
+                raise RuntimeError("boom")
+
+        acquired: list[bool] = []
+
+        def acquire() -> None:
+            with locker.hold("s1", lock_path):
+                acquired.append(True)
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        assert acquired == [True]
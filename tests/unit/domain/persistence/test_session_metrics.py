@@ -0,0 +1,44 @@
+"""Tests for the per-session provider metrics file."""
+
+from pathlib import Path
+
+from aiwf.domain.persistence.session_metrics import ProviderCallMetric, SessionMetricsLog
+
+
+def _metric(**overrides) -> ProviderCallMetric:
+    fields = {
+        "session_id": "s1",
+        "phase": "plan",
+        "iteration": 1,
+        "role": "planner",
+        "provider": "claude-code",
+        "outcome": "ok",
+        "wall_seconds": 1.5,
+    }
+    fields.update(overrides)
+    return ProviderCallMetric(**fields)
+
+
+class TestSessionMetricsLog:
+    def test_round_trip_preserves_order(self, tmp_path: Path):
+        log = SessionMetricsLog(tmp_path)
+        log.append(_metric(input_tokens=100, output_tokens=20, cost_usd=0.01))
+        log.append(_metric(phase="generate", outcome="error", error="boom"))
+
+        metrics = log.read()
+
+        assert [m.phase for m in metrics] == ["plan", "generate"]
+        assert metrics[0].input_tokens == 100
+        assert metrics[0].cost_usd == 0.01
+        assert metrics[1].error == "boom"
+
+    def test_missing_file_reads_empty(self, tmp_path: Path):
+        assert SessionMetricsLog(tmp_path).read() == []
+
+    def test_torn_line_is_skipped(self, tmp_path: Path):
+        log = SessionMetricsLog(tmp_path)
+        log.append(_metric())
+        with open(log.path, "a", encoding="utf-8") as f:
+            f.write('{"session_id": "s1", "pha')
+
+        assert len(log.read()) == 1
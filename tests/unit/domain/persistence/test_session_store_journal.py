@@ -0,0 +1,283 @@
+"""Tests for SessionStore journal persistence and save coalescing."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from aiwf.domain.constants import SESSION_JOURNAL_FILENAME
+from aiwf.domain.models.workflow_state import (
+    Artifact,
+    PhaseTransition,
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.persistence.session_store import SessionStore
+
+
+def _state(session_id: str = "journal-session") -> WorkflowState:
+    return WorkflowState(
+        session_id=session_id,
+        profile="jpa-mt",
+        phase=WorkflowPhase.INIT,
+        status=WorkflowStatus.IN_PROGRESS,
+        standards_hash="abc123",
+        ai_providers={"planner": "manual"},
+        phase_history=[
+            PhaseTransition(phase=WorkflowPhase.INIT, status=WorkflowStatus.IN_PROGRESS)
+        ],
+    )
+
+
+def _advance(state: WorkflowState, iteration: int) -> None:
+    state.phase = WorkflowPhase.GENERATE
+    state.stage = WorkflowStage.RESPONSE
+    state.phase_history.append(
+        PhaseTransition(phase=WorkflowPhase.GENERATE, status=WorkflowStatus.IN_PROGRESS)
+    )
+    state.artifacts.append(
+        Artifact(
+            path=f"iteration-{iteration}/code/Foo.java",
+            phase=WorkflowPhase.GENERATE,
+            iteration=iteration,
+        )
+    )
+
+
+def _journal_lines(store: SessionStore, session_id: str) -> list[dict]:
+    journal = store.sessions_root / session_id / SESSION_JOURNAL_FILENAME
+    return [json.loads(line) for line in journal.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJournalMode:
+    def test_first_save_writes_snapshot(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        store.save(_state())
+
+        session_dir = tmp_path / "journal-session"
+        assert (session_dir / "session.json").exists()
+        assert not (session_dir / SESSION_JOURNAL_FILENAME).exists()
+
+    def test_later_saves_append_deltas(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        snapshot = (tmp_path / "journal-session" / "session.json").read_text(encoding="utf-8")
+
+        _advance(state, 1)
+        store.save(state)
+
+        header, delta = _journal_lines(store, "journal-session")
+        assert header == {"base": json.loads(snapshot)["updated_at"]}
+        assert delta["set"]["phase"] == "generate"
+        assert len(delta["append"]["phase_history"]) == 1
+        assert len(delta["append"]["artifacts"]) == 1
+        assert "context" not in delta["set"]
+        # Snapshot untouched
+        assert (tmp_path / "journal-session" / "session.json").read_text(encoding="utf-8") == snapshot
+
+    def test_load_replays_journal(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        for i in range(1, 4):
+            _advance(state, i)
+            store.save(state)
+
+        loaded = SessionStore(sessions_root=tmp_path).load("journal-session")
+
+        assert loaded.model_dump(mode="json") == state.model_dump(mode="json")
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True, compact_every=2)
+        state = _state()
+        store.save(state)
+        for i in range(1, 4):
+            _advance(state, i)
+            store.save(state)
+
+        session_dir = tmp_path / "journal-session"
+        # Two journaled deltas, then the next save compacts
+        assert not (session_dir / SESSION_JOURNAL_FILENAME).exists()
+        data = json.loads((session_dir / "session.json").read_text(encoding="utf-8"))
+        assert len(data["artifacts"]) == 3
+
+    def test_journal_continues_across_store_instances(self, tmp_path: Path) -> None:
+        state = _state()
+        SessionStore(sessions_root=tmp_path, journal=True).save(state)
+
+        second = SessionStore(sessions_root=tmp_path, journal=True)
+        loaded = second.load("journal-session")
+        _advance(loaded, 1)
+        second.save(loaded)
+
+        assert len(_journal_lines(second, "journal-session")) == 2
+        assert len(SessionStore(sessions_root=tmp_path).load("journal-session").artifacts) == 1
+
+    def test_stale_journal_is_ignored(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        _advance(state, 1)
+        store.save(state)
+
+        # Simulate a crash after compaction wrote the snapshot but before
+        # the journal was removed
+        journal = tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME
+        stale = journal.read_text(encoding="utf-8")
+        SessionStore(sessions_root=tmp_path).save(state)
+        journal.write_text(stale, encoding="utf-8")
+
+        loaded = SessionStore(sessions_root=tmp_path).load("journal-session")
+        assert len(loaded.artifacts) == 1
+        assert len(loaded.phase_history) == 2
+
+    def test_truncated_final_entry_is_ignored(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        _advance(state, 1)
+        store.save(state)
+
+        journal = tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"set": {"phase": "rev')
+
+        loaded = SessionStore(sessions_root=tmp_path).load("journal-session")
+        assert loaded.phase == WorkflowPhase.GENERATE
+
+    def test_saves_after_torn_entry_are_replayed(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        _advance(state, 1)
+        store.save(state)
+        journal = tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"set": {"phase": "rev')
+
+        resumed = SessionStore(sessions_root=tmp_path, journal=True)
+        loaded = resumed.load("journal-session")
+        _advance(loaded, 2)
+        resumed.save(loaded)
+
+        assert len(_journal_lines(resumed, "journal-session")) == 3
+        assert len(SessionStore(sessions_root=tmp_path).load("journal-session").artifacts) == 2
+
+    def test_saves_after_stale_journal_are_replayed(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        _advance(state, 1)
+        store.save(state)
+        journal = tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME
+        stale = journal.read_text(encoding="utf-8")
+        SessionStore(sessions_root=tmp_path).save(state)
+        journal.write_text(stale, encoding="utf-8")
+
+        resumed = SessionStore(sessions_root=tmp_path, journal=True)
+        loaded = resumed.load("journal-session")
+        _advance(loaded, 2)
+        resumed.save(loaded)
+
+        assert len(SessionStore(sessions_root=tmp_path).load("journal-session").artifacts) == 2
+
+    def test_snapshot_mode_load_leaves_journal_alone(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+        _advance(state, 1)
+        store.save(state)
+        journal = tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"set": {"phase": "rev')
+        torn = journal.read_bytes()
+
+        SessionStore(sessions_root=tmp_path).load("journal-session")
+
+        assert journal.read_bytes() == torn
+
+    def test_snapshot_mode_removes_leftover_journal(self, tmp_path: Path) -> None:
+        state = _state()
+        journal_store = SessionStore(sessions_root=tmp_path, journal=True)
+        journal_store.save(state)
+        _advance(state, 1)
+        journal_store.save(state)
+
+        SessionStore(sessions_root=tmp_path).save(state)
+
+        assert not (tmp_path / "journal-session" / SESSION_JOURNAL_FILENAME).exists()
+
+
+class TestCoalesce:
+    def test_saves_in_block_are_written_once(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+
+        with patch.object(store, "_write", wraps=store._write) as write:
+            with store.coalesce():
+                store.save(state)
+                state.phase = WorkflowPhase.PLAN
+                store.save(state)
+                with store.coalesce():
+                    store.save(state)
+                assert write.call_count == 0
+
+        assert write.call_count == 1
+        assert store.load("journal-session").phase == WorkflowPhase.PLAN
+
+    def test_written_state_is_as_of_last_save(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+
+        with store.coalesce():
+            state.phase = WorkflowPhase.PLAN
+            store.save(state)
+            state.phase = WorkflowPhase.GENERATE  # never saved
+
+        assert store.load("journal-session").phase == WorkflowPhase.PLAN
+
+    def test_pending_saves_flushed_on_error(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        state.last_error = "boom"
+
+        try:
+            with store.coalesce():
+                store.save(state)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert store.load("journal-session").last_error == "boom"
+
+    def test_load_inside_block_sees_pending_save(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+        store.save(state)
+
+        with store.coalesce():
+            state.phase = WorkflowPhase.PLAN
+            store.save(state)
+            assert store.load("journal-session").phase == WorkflowPhase.PLAN
+
+    def test_flush_writes_pending_saves(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path, journal=True)
+        state = _state()
+
+        with store.coalesce():
+            state.phase = WorkflowPhase.PLAN
+            store.save(state)
+            store.flush()
+            assert SessionStore(sessions_root=tmp_path).load("journal-session").phase == WorkflowPhase.PLAN
+
+    def test_snapshot_mode_saves_immediately(self, tmp_path: Path) -> None:
+        store = SessionStore(sessions_root=tmp_path)
+        state = _state()
+
+        with store.coalesce():
+            state.phase = WorkflowPhase.PLAN
+            store.save(state)
+            assert SessionStore(sessions_root=tmp_path).load("journal-session").phase == WorkflowPhase.PLAN
@@ -0,0 +1,119 @@
+"""Tests for the SQLite-backed SessionStore."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from aiwf.domain.constants import SESSION_DATABASE_FILENAME
+from aiwf.domain.models.workflow_state import (
+    PhaseTransition,
+    WorkflowPhase,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.persistence.sqlite_session_store import SqliteSessionStore
+
+
+def _state(session_id: str, profile: str = "jpa-mt") -> WorkflowState:
+    return WorkflowState(
+        session_id=session_id,
+        profile=profile,
+        phase=WorkflowPhase.INIT,
+        status=WorkflowStatus.IN_PROGRESS,
+        standards_hash="abc123",
+        ai_providers={"planner": "manual"},
+        phase_history=[
+            PhaseTransition(phase=WorkflowPhase.INIT, status=WorkflowStatus.IN_PROGRESS)
+        ],
+    )
+
+
+class TestSqliteSessionStore:
+    def test_round_trip_without_session_json(self, tmp_path: Path) -> None:
+        store = SqliteSessionStore(sessions_root=tmp_path)
+        state = _state("s1")
+        state.context = {"entity": "Foo"}
+        store.save(state)
+
+        loaded = SqliteSessionStore(sessions_root=tmp_path).load("s1")
+
+        assert loaded.model_dump(mode="json") == state.model_dump(mode="json")
+        assert (tmp_path / "s1").is_dir()
+        assert not (tmp_path / "s1" / "session.json").exists()
+
+    def test_database_uses_wal(self, tmp_path: Path) -> None:
+        SqliteSessionStore(sessions_root=tmp_path).save(_state("s1"))
+
+        conn = sqlite3.connect(tmp_path / SESSION_DATABASE_FILENAME)
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        assert mode == "wal"
+
+    def test_missing_session_raises(self, tmp_path: Path) -> None:
+        store = SqliteSessionStore(sessions_root=tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            store.load("nope")
+        assert store.exists("nope") is False
+
+    def test_list_exists_and_delete(self, tmp_path: Path) -> None:
+        store = SqliteSessionStore(sessions_root=tmp_path)
+        for session_id in ("b", "a"):
+            store.save(_state(session_id))
+
+        assert store.list_sessions() == ["a", "b"]
+        assert store.exists("a")
+
+        store.delete("a")
+
+        assert store.list_sessions() == ["b"]
+        assert not (tmp_path / "a").exists()
+        with pytest.raises(FileNotFoundError):
+            store.delete("a")
+
+    def test_query_uses_shared_database(self, tmp_path: Path) -> None:
+        store = SqliteSessionStore(sessions_root=tmp_path)
+        store.save(_state("s1", profile="jpa-mt"))
+        store.save(_state("s2", profile="other"))
+
+        entries = store.query_sessions(profile="other")
+
+        assert [e.session_id for e in entries] == ["s2"]
+        assert not (tmp_path / "catalog.sqlite3").exists()
+
+    def test_coalesced_saves_write_once(self, tmp_path: Path) -> None:
+        store = SqliteSessionStore(sessions_root=tmp_path)
+        state = _state("s1")
+
+        with store.coalesce():
+            store.save(state)
+            state.phase = WorkflowPhase.PLAN
+            store.save(state)
+            assert store.load("s1").phase == WorkflowPhase.PLAN
+
+        assert store.load("s1").phase == WorkflowPhase.PLAN
+
+    def test_concurrent_writers(self, tmp_path: Path) -> None:
+        errors: list[BaseException] = []
+
+        def worker(n: int) -> None:
+            try:
+                store = SqliteSessionStore(sessions_root=tmp_path)
+                for i in range(10):
+                    store.save(_state(f"w{n}-{i}"))
+            except BaseException as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(SqliteSessionStore(sessions_root=tmp_path).list_sessions()) == 40
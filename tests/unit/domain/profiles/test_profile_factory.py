@@ -0,0 +1,164 @@
+"""Tests for ProfileFactory instance caching."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aiwf.domain.profiles.profile_factory import ProfileFactory
+
+
+class CountingProfile:
+    """Minimal profile stand-in that records constructions."""
+
+    config_path: Path | None = None
+    created = 0
+
+    def __init__(self, **config: Any):
+        CountingProfile.created += 1
+        self.config = config
+
+    @classmethod
+    def get_config_paths(cls) -> list[Path]:
+        return [cls.config_path] if cls.config_path else []
+
+
+@pytest.fixture
+def counting_profile(tmp_path: Path):
+    snapshot = ProfileFactory.snapshot()
+    CountingProfile.created = 0
+    CountingProfile.config_path = tmp_path / "config.yml"
+    CountingProfile.config_path.write_text("a: 1\n")
+    ProfileFactory.register("counting", CountingProfile)  # type: ignore[arg-type]
+    yield CountingProfile.config_path
+    ProfileFactory.restore(snapshot)
+
+
+class TestProfileFactoryAcquire:
+    def test_reuses_instance(self, counting_profile):
+        first = ProfileFactory.acquire("counting")
+
+        assert ProfileFactory.acquire("counting") is first
+        assert CountingProfile.created == 1
+
+    def test_distinct_config_gets_distinct_instance(self, counting_profile):
+        first = ProfileFactory.acquire("counting")
+        other = ProfileFactory.acquire("counting", {"scope": "domain"})
+
+        assert other is not first
+        assert other.config == {"scope": "domain"}
+
+    def test_config_file_change_rebuilds(self, counting_profile: Path):
+        first = ProfileFactory.acquire("counting")
+
+        counting_profile.write_text("a: 22\n")
+        st = counting_profile.stat()
+        os.utime(counting_profile, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert ProfileFactory.acquire("counting") is not first
+        assert CountingProfile.created == 2
+
+    def test_config_file_removal_rebuilds(self, counting_profile: Path):
+        first = ProfileFactory.acquire("counting")
+
+        counting_profile.unlink()
+
+        assert ProfileFactory.acquire("counting") is not first
+
+    def test_create_always_builds_new_instance(self, counting_profile):
+        cached = ProfileFactory.acquire("counting")
+
+        assert ProfileFactory.create("counting") is not cached
+
+    def test_register_drops_cached_instances(self, counting_profile):
+        first = ProfileFactory.acquire("counting")
+
+        ProfileFactory.register("counting", CountingProfile)  # type: ignore[arg-type]
+
+        assert ProfileFactory.acquire("counting") is not first
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(KeyError, match="not found"):
+            ProfileFactory.acquire("does-not-exist")
+
+
+@pytest.fixture
+def registry():
+    snapshot = ProfileFactory.snapshot()
+    yield
+    ProfileFactory.restore(snapshot)
+
+
+class TestProfileFactoryRegisterLazy:
+    def test_loader_runs_on_first_use(self, registry):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return CountingProfile
+
+        ProfileFactory.register_lazy("lazy", loader)  # type: ignore[arg-type]
+
+        assert ProfileFactory.is_registered("lazy")
+        assert "lazy" in ProfileFactory.list_profiles()
+        assert calls == []
+        assert ProfileFactory.get("lazy") is CountingProfile
+        assert ProfileFactory.get("lazy") is CountingProfile
+        assert calls == [1]
+
+    def test_does_not_replace_eager_registration(self, registry):
+        ProfileFactory.register("counting", CountingProfile)  # type: ignore[arg-type]
+
+        ProfileFactory.register_lazy("counting", lambda: pytest.fail("loader called"))
+
+        assert ProfileFactory.get("counting") is CountingProfile
+
+    def test_failed_loader_is_not_registered(self, registry, caplog):
+        def loader():
+            raise ImportError("missing module")
+
+        ProfileFactory.register_lazy("broken", loader)
+
+        assert ProfileFactory.get("broken") is None
+        assert not ProfileFactory.is_registered("broken")
+        assert "missing module" in caplog.text
+
+    def test_snapshot_restore_keeps_pending_loaders(self, registry):
+        calls = []
+        ProfileFactory.register_lazy("lazy", lambda: calls.append(1) or CountingProfile)  # type: ignore[arg-type,return-value]
+        snapshot = ProfileFactory.snapshot()
+
+        ProfileFactory.clear()
+        ProfileFactory.restore(snapshot)
+
+        assert calls == []
+        assert ProfileFactory.create("lazy").config == {}
+
+    def test_concurrent_callers_wait_for_running_load(self, registry):
+        release = threading.Event()
+
+        def slow_loader():
+            release.wait(timeout=5)
+            return CountingProfile
+
+        ProfileFactory.register_lazy("lazy", slow_loader)  # type: ignore[arg-type]
+        errors: list[BaseException] = []
+
+        def acquire() -> None:
+            try:
+                ProfileFactory.acquire("lazy")
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=acquire) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)  # Let one thread start the load and the rest reach it
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert errors == []
@@ -3,6 +3,7 @@
 ADR-0015: Tests for AI-powered approval provider adapter.
 """
 
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -13,6 +14,7 @@ from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowStage
 from aiwf.domain.providers.ai_provider import AIProvider
 from aiwf.domain.providers.approval_provider import ApprovalProvider
 from aiwf.domain.providers.ai_approval_provider import AIApprovalProvider
+from aiwf.domain.providers.approval_files import ApprovalFile, ApprovalFiles
 
 
 def _mock_provider_result(response: str) -> AIProviderResult:
@@ -402,3 +404,108 @@ class TestAIApprovalProviderSuggestedContent:
 
         assert result.decision == ApprovalDecision.REJECTED
         assert result.suggested_content is None
+
+
+class TestAIApprovalProviderTokenBudget:
+    """Tests for token-budgeted prompt construction."""
+
+    @staticmethod
+    def _evaluate(provider: AIApprovalProvider, files, context=None, phase=WorkflowPhase.GENERATE):
+        return provider.evaluate(
+            phase=phase,
+            stage=WorkflowStage.RESPONSE,
+            files=files,
+            context=context or {},
+        )
+
+    def test_large_file_is_read_as_bounded_prefix(self, tmp_path: Path) -> None:
+        """Files on disk are read only up to the budget, never in full."""
+        plan = tmp_path / "plan.md"
+        plan.write_text("x" * 10_000)
+        full_reader = Mock(side_effect=AssertionError("full read"))
+        mock_provider = Mock(spec=AIProvider)
+        mock_provider.generate.return_value = _mock_provider_result("DECISION: APPROVED")
+        provider = AIApprovalProvider(ai_provider=mock_provider, token_budget=500)
+
+        result = self._evaluate(
+            provider, ApprovalFiles([ApprovalFile(plan, reader=full_reader)]), phase=WorkflowPhase.PLAN
+        )
+
+        prompt = mock_provider.generate.call_args[0][0]
+        assert "x" * 2000 in prompt
+        assert "x" * 2001 not in prompt
+        assert "[...truncated, showing first 2000 chars]" in prompt
+        assert result.truncated_files == (str(plan),)
+        assert result.omitted_files == ()
+        full_reader.assert_not_called()
+
+    def test_plan_gets_budget_before_code(self) -> None:
+        """Code files that do not fit are omitted and recorded in the result."""
+        mock_provider = Mock(spec=AIProvider)
+        mock_provider.generate.return_value = _mock_provider_result("DECISION: APPROVED")
+        provider = AIApprovalProvider(ai_provider=mock_provider, token_budget=100)
+
+        result = self._evaluate(
+            provider, {"Big.java": "b" * 300, "plan.md": "p" * 350, "Small.java": "s" * 40}
+        )
+
+        prompt = mock_provider.generate.call_args[0][0]
+        assert "p" * 350 in prompt
+        assert "s" * 40 in prompt
+        assert "### Big.java\n[Skipped - token budget exhausted]" in prompt
+        assert result.decision == ApprovalDecision.APPROVED
+        assert result.omitted_files == ("Big.java",)
+
+    def test_code_files_named_in_plan_come_first(self) -> None:
+        """Files the plan mentions are allocated before smaller unmentioned files."""
+        mock_provider = Mock(spec=AIProvider)
+        mock_provider.generate.return_value = _mock_provider_result("DECISION: APPROVED")
+        provider = AIApprovalProvider(ai_provider=mock_provider)
+
+        self._evaluate(
+            provider,
+            {"Util.java": "u", "Entity.java": "e" * 100, "plan.md": "Create Entity.java"},
+        )
+
+        prompt = mock_provider.generate.call_args[0][0]
+        assert prompt.index("### Entity.java") < prompt.index("### Util.java")
+
+    def test_context_budget_overrides_default(self) -> None:
+        """A token_budget in the context (from the stage config) wins."""
+        mock_provider = Mock(spec=AIProvider)
+        mock_provider.generate.return_value = _mock_provider_result("DECISION: APPROVED")
+        provider = AIApprovalProvider(ai_provider=mock_provider)
+
+        result = self._evaluate(
+            provider, {"plan.md": "p" * 2000, "A.java": "a"}, context={"token_budget": 300}
+        )
+
+        assert result.truncated_files == ("plan.md",)
+        assert result.omitted_files == ("A.java",)
+
+
+class TestApprovalFiles:
+    """Tests for the lazy files mapping passed to approvers."""
+
+    def test_reads_on_lookup_only(self, tmp_path: Path) -> None:
+        """Files are read when their content is looked up, once."""
+        path = tmp_path / "Entity.java"
+        path.write_text("class Entity {}")
+        reader = Mock(side_effect=lambda p: p.read_text())
+        files = ApprovalFiles([ApprovalFile(path, reader=reader)])
+
+        assert str(path) in files
+        assert list(files) == [str(path)]
+        reader.assert_not_called()
+
+        assert files[str(path)] == "class Entity {}"
+        assert dict(files) == {str(path): "class Entity {}"}
+        reader.assert_called_once_with(path)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """A missing file has no size and None content."""
+        handle = ApprovalFile(tmp_path / "missing.md")
+
+        assert handle.size is None
+        assert handle.read_prefix(10) is None
+        assert ApprovalFiles([handle])[handle.path] is None
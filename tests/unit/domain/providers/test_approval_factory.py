@@ -48,15 +48,15 @@ class TestApprovalProviderFactoryAIFallback:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             provider = ApprovalProviderFactory.create("claude")
 
             assert isinstance(provider, AIApprovalProvider)
-            mock_factory.create.assert_called_once_with("claude", None)
+            mock_factory.acquire.assert_called_once_with("claude", None)
 
     def test_ai_fallback_passes_config_to_provider_factory(self) -> None:
-        """AI fallback passes config to AIProviderFactory.create."""
+        """AI fallback passes config to AIProviderFactory.acquire."""
         mock_response_provider = Mock(spec=AIProvider)
         mock_response_provider.get_metadata.return_value = {"fs_ability": "local-write"}
         config = {"api_key": "test-key", "model": "claude-3"}
@@ -64,18 +64,18 @@ class TestApprovalProviderFactoryAIFallback:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             ApprovalProviderFactory.create("claude", config=config)
 
-            mock_factory.create.assert_called_once_with("claude", config)
+            mock_factory.acquire.assert_called_once_with("claude", config)
 
     def test_ai_fallback_propagates_provider_factory_errors(self) -> None:
-        """If AIProviderFactory.create fails, error propagates."""
+        """If AIProviderFactory.acquire fails, error propagates."""
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.side_effect = KeyError("Provider 'unknown' not found")
+            mock_factory.acquire.side_effect = KeyError("Provider 'unknown' not found")
 
             with pytest.raises(KeyError):
                 ApprovalProviderFactory.create("unknown")
@@ -158,11 +158,11 @@ class TestApprovalProviderFactoryConfig:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             ApprovalProviderFactory.create("gpt", config=config)
 
-            mock_factory.create.assert_called_once_with("gpt", config)
+            mock_factory.acquire.assert_called_once_with("gpt", config)
 
 
 class TestApprovalProviderFactoryFsAbilityValidation:
@@ -184,7 +184,7 @@ class TestApprovalProviderFactoryFsAbilityValidation:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             with pytest.raises(ValueError) as exc_info:
                 ApprovalProviderFactory.create("api-only")
@@ -200,7 +200,7 @@ class TestApprovalProviderFactoryFsAbilityValidation:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             with pytest.raises(ValueError) as exc_info:
                 ApprovalProviderFactory.create("write-only-provider")
@@ -215,7 +215,7 @@ class TestApprovalProviderFactoryFsAbilityValidation:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             provider = ApprovalProviderFactory.create("local-reader")
             assert isinstance(provider, AIApprovalProvider)
@@ -228,7 +228,7 @@ class TestApprovalProviderFactoryFsAbilityValidation:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             provider = ApprovalProviderFactory.create("local-writer")
             assert isinstance(provider, AIApprovalProvider)
@@ -241,7 +241,7 @@ class TestApprovalProviderFactoryFsAbilityValidation:
         with patch(
             "aiwf.domain.providers.approval_factory.AIProviderFactory"
         ) as mock_factory:
-            mock_factory.create.return_value = mock_response_provider
+            mock_factory.acquire.return_value = mock_response_provider
 
             with pytest.raises(ValueError) as exc_info:
                 ApprovalProviderFactory.create("no-fs")
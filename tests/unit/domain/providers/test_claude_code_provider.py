@@ -486,6 +486,143 @@ class TestClaudeCodeAIProviderGenerate:
             assert len(result.files) == 2
 
 
+class TestClaudeCodeAIProviderStreaming:
+    """Tests for streaming text into the response file."""
+
+    @staticmethod
+    def _message(*blocks: Any) -> Any:
+        from claude_agent_sdk.types import AssistantMessage
+
+        message = Mock(spec=AssistantMessage)
+        message.content = list(blocks)
+        return message
+
+    @staticmethod
+    def _text(text: str) -> Any:
+        block = Mock()
+        block.text = text
+        return block
+
+    def test_streams_text_into_response_file(self, tmp_path):
+        """Text blocks land in response_path and the file is reported as written."""
+        response_path = tmp_path / "iteration-1" / "generation-response.md"
+
+        async def mock_query(*args, **kwargs):
+            yield self._message(self._text("part one, "))
+            yield self._message(self._text("part two"))
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            result = ClaudeCodeAIProvider().generate(
+                "Prompt", context={"response_path": str(response_path)}
+            )
+
+        assert response_path.read_text(encoding="utf-8") == "part one, part two"
+        assert result.response == "part one, part two"
+        assert result.files == {str(response_path): None}
+        assert result.ttft_seconds is not None
+        assert result.latency_seconds >= result.ttft_seconds
+        assert [p.name for p in response_path.parent.iterdir()] == [response_path.name]
+
+    def test_reports_usage_and_cost_from_result_message(self):
+        """Token usage (including prompt-cache input) and cost come from ResultMessage."""
+        from claude_agent_sdk.types import ResultMessage
+
+        result_message = Mock(spec=ResultMessage)
+        result_message.usage = {
+            "input_tokens": 10,
+            "cache_creation_input_tokens": 200,
+            "cache_read_input_tokens": 1000,
+            "output_tokens": 42,
+        }
+        result_message.total_cost_usd = 0.0125
+
+        async def mock_query(*args, **kwargs):
+            yield self._message(self._text("done"))
+            yield result_message
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            result = ClaudeCodeAIProvider().generate("Prompt")
+
+        assert result.input_tokens == 1210
+        assert result.output_tokens == 42
+        assert result.cost_usd == 0.0125
+
+    def test_usage_absent_without_result_message(self):
+        async def mock_query(*args, **kwargs):
+            yield self._message(self._text("done"))
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            result = ClaudeCodeAIProvider().generate("Prompt")
+
+        assert (result.input_tokens, result.output_tokens, result.cost_usd) == (None, None, None)
+
+    def test_reports_progress_events(self, tmp_path):
+        """on_progress receives first_token, bytes and tool_call events."""
+        from claude_agent_sdk.types import ToolUseBlock
+
+        tool = Mock(spec=ToolUseBlock)
+        tool.name = "Read"
+        tool.input = {"file_path": "/x"}
+        events: list[tuple[str, dict]] = []
+
+        async def mock_query(*args, **kwargs):
+            yield self._message(self._text("ab"), tool, self._text("cd"))
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            ClaudeCodeAIProvider().generate(
+                "Prompt",
+                context={
+                    "response_path": str(tmp_path / "r.md"),
+                    "on_progress": lambda kind, data: events.append((kind, data)),
+                },
+            )
+
+        kinds = [kind for kind, _ in events]
+        assert kinds == ["first_token", "bytes", "tool_call", "bytes"]
+        assert events[2][1] == {"tool": "Read"}
+        assert events[-1][1] == {"bytes": 4}
+
+    def test_failure_keeps_partial_response(self, tmp_path):
+        """Text received before an SDK error is kept as <response>.partial."""
+        response_path = tmp_path / "generation-response.md"
+
+        async def mock_query(*args, **kwargs):
+            yield self._message(self._text("half a response"))
+            raise ConnectionError("Lost connection")
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            with pytest.raises(ProviderError):
+                ClaudeCodeAIProvider().generate(
+                    "Prompt", context={"response_path": str(response_path)}
+                )
+
+        assert not response_path.exists()
+        partial = tmp_path / "generation-response.md.partial"
+        assert partial.read_text(encoding="utf-8") == "half a response"
+
+    def test_does_not_overwrite_response_written_by_claude(self, tmp_path):
+        """If Claude writes the response file itself, streamed text is discarded."""
+        from claude_agent_sdk.types import ToolUseBlock
+
+        response_path = tmp_path / "generation-response.md"
+        write = Mock(spec=ToolUseBlock)
+        write.name = "Write"
+        write.input = {"file_path": str(response_path)}
+
+        async def mock_query(*args, **kwargs):
+            response_path.write_text("written by tool", encoding="utf-8")
+            yield self._message(self._text("console chatter"), write)
+
+        with patch("claude_agent_sdk.query", side_effect=mock_query):
+            result = ClaudeCodeAIProvider().generate(
+                "Prompt", context={"response_path": str(response_path)}
+            )
+
+        assert response_path.read_text(encoding="utf-8") == "written by tool"
+        assert result.files == {str(response_path): None}
+        assert list(tmp_path.iterdir()) == [response_path]
+
+
 class TestClaudeCodeAIProviderErrorHandling:
     """Tests for error handling in generate()."""
 
@@ -0,0 +1,76 @@
+"""Tests for shared event loop support and the async provider contract."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from aiwf.domain.models.ai_provider_result import AIProviderResult
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.event_loop import run_sync, shared_loop, use_shared_loop
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class SyncOnlyProvider(AIProvider):
+    """Provider implementing only the sync contract."""
+
+    def validate(self) -> None:
+        pass
+
+    def generate(self, prompt, context=None, system_prompt=None,
+                 connection_timeout=None, response_timeout=None):
+        return AIProviderResult(
+            response=f"{prompt}|{system_prompt}|{threading.current_thread().name}"
+        )
+
+
+class TestRunSync:
+    def test_without_shared_loop_uses_fresh_loop(self) -> None:
+        assert shared_loop.get() is None
+        assert isinstance(run_sync(_current_loop()), asyncio.AbstractEventLoop)
+
+    def test_worker_thread_runs_on_shared_loop(self) -> None:
+        async def main() -> tuple[Any, Any]:
+            loop = asyncio.get_running_loop()
+            with use_shared_loop(loop):
+                ran_on = await asyncio.to_thread(run_sync, _current_loop())
+            return loop, ran_on
+
+        loop, ran_on = asyncio.run(main())
+
+        assert ran_on is loop
+
+    def test_raises_on_shared_loop_thread(self) -> None:
+        async def main() -> None:
+            with use_shared_loop(asyncio.get_running_loop()):
+                run_sync(_current_loop())
+
+        with pytest.raises(RuntimeError, match="await the coroutine"):
+            asyncio.run(main())
+
+    def test_use_shared_loop_restores_previous_value(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            with use_shared_loop(loop):
+                assert shared_loop.get() is loop
+            assert shared_loop.get() is None
+        finally:
+            loop.close()
+
+
+class TestDefaultAgenerate:
+    def test_default_agenerate_runs_generate_off_loop(self) -> None:
+        provider = SyncOnlyProvider()
+
+        async def main() -> AIProviderResult:
+            return await provider.agenerate("hello", system_prompt="sys")
+
+        result = asyncio.run(main())
+
+        prompt, system_prompt, thread_name = result.response.split("|")
+        assert (prompt, system_prompt) == ("hello", "sys")
+        assert thread_name != threading.main_thread().name
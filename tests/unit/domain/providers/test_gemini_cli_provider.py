@@ -13,7 +13,9 @@ from aiwf.domain.providers.gemini_cli_provider import (
     FILE_WRITE_TOOLS,
     GeminiCliAIProvider,
     VALID_APPROVAL_MODES,
+    _StreamJsonEvents,
 )
+from aiwf.domain.providers.response_stream import ResponseStream
 
 
 def make_ndjson(*events: dict) -> bytes:
@@ -22,6 +24,48 @@ def make_ndjson(*events: dict) -> bytes:
     return "\n".join(lines).encode()
 
 
+def _parse(stdout: bytes) -> tuple[str, dict[str, None]]:
+    """Feed stdout line by line, as the provider does while streaming."""
+    stream = ResponseStream()
+    events = _StreamJsonEvents(stream)
+    for line in stdout.splitlines():
+        events.feed(line)
+    events.log_parse_errors()
+    return stream.text, events.files_written
+
+
+class FakeStreamReader:
+    """Minimal asyncio.StreamReader stand-in fed from bytes."""
+
+    def __init__(self, data: bytes = b"", *, hang: bool = False):
+        self._lines = data.splitlines(keepends=True)
+        self._hang = hang
+
+    async def readline(self) -> bytes:
+        if self._lines:
+            return self._lines.pop(0)
+        if self._hang:
+            await asyncio.sleep(3600)
+        return b""
+
+    async def read(self) -> bytes:
+        data = b"".join(self._lines)
+        self._lines = []
+        return data
+
+
+def make_process(
+    stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0, hang: bool = False
+) -> AsyncMock:
+    """Helper to create a mocked subprocess with streamed stdout/stderr."""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.stdout = FakeStreamReader(stdout, hang=hang)
+    process.stderr = FakeStreamReader(stderr)
+    process.kill = MagicMock()
+    return process
+
+
 class TestGeminiCliAIProviderInit:
     """Tests for provider initialization."""
 
@@ -193,61 +237,56 @@ class TestGeminiCliAIProviderBuildArgs:
 
 
 class TestGeminiCliAIProviderNdjsonParsing:
-    """Tests for _parse_ndjson_stream() method."""
+    """Tests for the incremental stream-json event parser (_StreamJsonEvents.feed)."""
 
     def test_parse_extracts_assistant_messages(self):
         """Parser extracts text from assistant messages."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "message", "role": "assistant", "content": "Hello world"}
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Hello world"
         assert files == {}
 
     def test_parse_handles_multiple_messages(self):
         """Parser concatenates multiple assistant messages."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "message", "role": "assistant", "content": "Part 1. "},
             {"type": "message", "role": "assistant", "content": "Part 2."},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Part 1. Part 2."
 
     def test_parse_ignores_user_messages(self):
         """Parser ignores user role messages."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "message", "role": "user", "content": "User input"},
             {"type": "message", "role": "assistant", "content": "Response"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Response"
 
     def test_parse_tracks_write_file_tool(self):
         """Parser tracks write_file tool calls."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
              "parameters": {"file_path": "/path/to/file.txt"}},
             {"type": "tool_result", "tool_id": "t1", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert "/path/to/file.txt" in files
         assert files["/path/to/file.txt"] is None
 
     def test_parse_tracks_replace_tool(self):
         """Parser tracks replace tool calls."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "tool_use", "tool_name": "replace", "tool_id": "t1",
              "parameters": {"file_path": "/path/to/edit.txt",
@@ -255,13 +294,12 @@ class TestGeminiCliAIProviderNdjsonParsing:
             {"type": "tool_result", "tool_id": "t1", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert "/path/to/edit.txt" in files
 
     def test_parse_tracks_multiple_file_writes(self):
         """Parser tracks multiple write operations."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
              "parameters": {"file_path": "/path/file1.txt"}},
@@ -271,7 +309,7 @@ class TestGeminiCliAIProviderNdjsonParsing:
             {"type": "tool_result", "tool_id": "t2", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert len(files) == 2
         assert "/path/file1.txt" in files
@@ -279,7 +317,6 @@ class TestGeminiCliAIProviderNdjsonParsing:
 
     def test_parse_only_tracks_successful_writes(self):
         """Parser ignores failed tool_result events."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
              "parameters": {"file_path": "/path/failed.txt"}},
@@ -289,57 +326,52 @@ class TestGeminiCliAIProviderNdjsonParsing:
             {"type": "tool_result", "tool_id": "t2", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert len(files) == 1
         assert "/path/success.txt" in files
         assert "/path/failed.txt" not in files
 
-    def test_parse_handles_malformed_json(self):
+    def test_parse_handles_malformed_json(self, caplog):
         """Parser logs warning with sample content and continues."""
-        provider = GeminiCliAIProvider()
         # Mix valid and invalid JSON lines
         stdout = b'{"type":"message","role":"assistant","content":"Valid"}\n'
         stdout += b'not valid json\n'
         stdout += b'{"type":"message","role":"assistant","content":" end"}\n'
 
-        with patch.object(provider, "_parse_ndjson_stream", wraps=provider._parse_ndjson_stream):
-            response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Valid end"
+        assert "Malformed JSON lines (1)" in caplog.text
 
     def test_parse_handles_partial_line(self):
         """Parser handles truncated/incomplete JSON lines gracefully."""
-        provider = GeminiCliAIProvider()
         stdout = b'{"type":"message","role":"assistant","content":"Complete"}\n'
         stdout += b'{"type":"message","role":"assis'  # Truncated
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Complete"
 
     def test_parse_handles_empty_output(self):
         """Parser returns empty response for empty output."""
-        provider = GeminiCliAIProvider()
         stdout = b""
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == ""
         assert files == {}
 
     def test_parse_handles_blank_lines(self):
         """Parser skips blank lines."""
-        provider = GeminiCliAIProvider()
         stdout = b'\n\n{"type":"message","role":"assistant","content":"Hello"}\n\n'
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Hello"
 
     def test_parse_handles_mixed_events(self):
         """Parser handles interleaved message and tool events."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "init", "session_id": "abc123", "model": "gemini-2.5"},
             {"type": "message", "role": "assistant", "content": "Creating file..."},
@@ -350,21 +382,20 @@ class TestGeminiCliAIProviderNdjsonParsing:
             {"type": "result", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert response == "Creating file... Done!"
         assert "/path/file.txt" in files
 
     def test_parse_ignores_read_file_tool(self):
         """Parser does not track read_file tool calls."""
-        provider = GeminiCliAIProvider()
         stdout = make_ndjson(
             {"type": "tool_use", "tool_name": "read_file", "tool_id": "t1",
              "parameters": {"file_path": "/path/read.txt"}},
             {"type": "tool_result", "tool_id": "t1", "status": "success"},
         )
 
-        response, files = provider._parse_ndjson_stream(stdout)
+        response, files = _parse(stdout)
 
         assert files == {}
 
@@ -376,14 +407,9 @@ class TestGeminiCliAIProviderGenerate:
     def mock_subprocess(self):
         """Mock asyncio.create_subprocess_exec."""
         with patch("asyncio.create_subprocess_exec") as mock:
-            process = AsyncMock()
-            process.returncode = 0
-            process.communicate = AsyncMock(return_value=(
-                make_ndjson(
-                    {"type": "message", "role": "assistant", "content": "Hello"}
-                ),
-                b"",
-            ))
+            process = make_process(
+                make_ndjson({"type": "message", "role": "assistant", "content": "Hello"})
+            )
             mock.return_value = process
             yield mock, process
 
@@ -435,11 +461,10 @@ class TestGeminiCliAIProviderGenerate:
     def test_generate_returns_response_text(self, mock_subprocess):
         """generate() returns parsed response text."""
         mock, process = mock_subprocess
-        process.communicate.return_value = (
+        mock.return_value = make_process(
             make_ndjson(
                 {"type": "message", "role": "assistant", "content": "Response text"}
-            ),
-            b"",
+            )
         )
 
         provider = GeminiCliAIProvider()
@@ -451,14 +476,13 @@ class TestGeminiCliAIProviderGenerate:
     def test_generate_returns_files_written(self, mock_subprocess):
         """generate() returns tracked files in AIProviderResult."""
         mock, process = mock_subprocess
-        process.communicate.return_value = (
+        mock.return_value = make_process(
             make_ndjson(
                 {"type": "message", "role": "assistant", "content": "Created file"},
                 {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
                  "parameters": {"file_path": "/path/new.txt"}},
                 {"type": "tool_result", "tool_id": "t1", "status": "success"},
-            ),
-            b"",
+            )
         )
 
         provider = GeminiCliAIProvider()
@@ -536,6 +560,94 @@ class TestGeminiCliAIProviderGenerate:
         assert call_kwargs["cwd"] == "/config/dir"
 
 
+class TestGeminiCliAIProviderStreaming:
+    """Tests for incremental event handling during generate()."""
+
+    def test_streams_response_into_response_file(self, tmp_path):
+        """Assistant text is written to response_path and reported as written."""
+        response_path = tmp_path / "planning-response.md"
+        process = make_process(
+            make_ndjson(
+                {"type": "message", "role": "assistant", "content": "# Plan\n"},
+                {"type": "message", "role": "assistant", "content": "Step 1"},
+            )
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            result = GeminiCliAIProvider().generate(
+                "Test", context={"response_path": str(response_path)}
+            )
+
+        assert response_path.read_text(encoding="utf-8") == "# Plan\nStep 1"
+        assert result.response == "# Plan\nStep 1"
+        assert result.files == {str(response_path): None}
+        assert result.ttft_seconds is not None
+        assert result.latency_seconds is not None
+
+    def test_reports_token_usage_from_result_event(self):
+        """Token counts come from the final result event's stats."""
+        process = make_process(
+            make_ndjson(
+                {"type": "message", "role": "assistant", "content": "ok"},
+                {"type": "result", "status": "success",
+                 "stats": {"total_tokens": 130, "input_tokens": 100, "output_tokens": 30}},
+            )
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            result = GeminiCliAIProvider().generate("Test")
+
+        assert (result.input_tokens, result.output_tokens) == (100, 30)
+        assert result.cost_usd is None
+
+    def test_reports_progress_including_file_writes(self, tmp_path):
+        """on_progress sees text, tool calls and confirmed file writes as they arrive."""
+        events: list[tuple[str, dict]] = []
+        process = make_process(
+            make_ndjson(
+                {"type": "message", "role": "assistant", "content": "Writing"},
+                {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
+                 "parameters": {"file_path": "/path/A.java"}},
+                {"type": "tool_result", "tool_id": "t1", "status": "success"},
+            )
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            GeminiCliAIProvider().generate(
+                "Test",
+                context={"on_progress": lambda kind, data: events.append((kind, data))},
+            )
+
+        assert events[0][0] == "first_token"
+        assert events[1:] == [
+            ("bytes", {"bytes": 7}),
+            ("tool_call", {"tool": "write_file"}),
+            ("file_written", {"path": "/path/A.java"}),
+        ]
+
+    def test_does_not_overwrite_response_written_by_gemini(self, tmp_path):
+        """A response file written by Gemini's write_file tool is kept as is."""
+        response_path = tmp_path / "review-response.md"
+        response_path.write_text("from tool", encoding="utf-8")
+        process = make_process(
+            make_ndjson(
+                {"type": "message", "role": "assistant", "content": "Done."},
+                {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
+                 "parameters": {"file_path": str(response_path)}},
+                {"type": "tool_result", "tool_id": "t1", "status": "success"},
+            )
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            result = GeminiCliAIProvider().generate(
+                "Test", context={"response_path": str(response_path)}
+            )
+
+        assert response_path.read_text(encoding="utf-8") == "from tool"
+        assert result.files == {str(response_path): None}
+        assert list(tmp_path.iterdir()) == [response_path]
+
+
 class TestGeminiCliAIProviderErrorHandling:
     """Tests for error handling in generate()."""
 
@@ -543,32 +655,54 @@ class TestGeminiCliAIProviderErrorHandling:
     def mock_subprocess(self):
         """Mock asyncio.create_subprocess_exec."""
         with patch("asyncio.create_subprocess_exec") as mock:
-            process = AsyncMock()
-            process.returncode = 0
-            process.communicate = AsyncMock(return_value=(b"", b""))
+            process = make_process()
             mock.return_value = process
             yield mock, process
 
     def test_timeout_raises_provider_error(self, mock_subprocess):
         """Timeout raises ProviderError with suggestion."""
         mock, process = mock_subprocess
-        process.communicate.side_effect = asyncio.TimeoutError()
-        process.kill = MagicMock()
+        process = make_process(hang=True)
+        mock.return_value = process
 
-        provider = GeminiCliAIProvider({"timeout": 10})
+        provider = GeminiCliAIProvider({"timeout": 0.05})
 
         with pytest.raises(ProviderError) as exc_info:
             provider.generate("Test")
 
         assert "timed out" in str(exc_info.value)
-        assert "10s" in str(exc_info.value)
+        assert "0.05s" in str(exc_info.value)
         process.kill.assert_called_once()
 
+    def test_timeout_salvages_partial_response_and_writes(self, mock_subprocess, tmp_path):
+        """Text and confirmed writes received before a timeout are kept."""
+        mock, process = mock_subprocess
+        mock.return_value = make_process(
+            make_ndjson(
+                {"type": "message", "role": "assistant", "content": "Half done"},
+                {"type": "tool_use", "tool_name": "write_file", "tool_id": "t1",
+                 "parameters": {"file_path": "/path/Entity.java"}},
+                {"type": "tool_result", "tool_id": "t1", "status": "success"},
+            ) + b"\n",
+            hang=True,
+        )
+        response_path = tmp_path / "generation-response.md"
+
+        provider = GeminiCliAIProvider({"timeout": 0.05})
+
+        with pytest.raises(ProviderError) as exc_info:
+            provider.generate("Test", context={"response_path": str(response_path)})
+
+        partial = tmp_path / "generation-response.md.partial"
+        assert partial.read_text(encoding="utf-8") == "Half done"
+        assert not response_path.exists()
+        assert str(partial) in str(exc_info.value)
+        assert "/path/Entity.java" in str(exc_info.value)
+
     def test_process_error_raises_provider_error(self, mock_subprocess):
         """Non-zero exit code raises ProviderError."""
         mock, process = mock_subprocess
-        process.returncode = 1
-        process.communicate.return_value = (b"", b"Some error message")
+        mock.return_value = make_process(stderr=b"Some error message", returncode=1)
 
         provider = GeminiCliAIProvider()
 
@@ -581,8 +715,9 @@ class TestGeminiCliAIProviderErrorHandling:
     def test_auth_error_suggests_login(self, mock_subprocess):
         """Auth errors suggest gemini auth login."""
         mock, process = mock_subprocess
-        process.returncode = 1
-        process.communicate.return_value = (b"", b"Authentication failed: not logged in")
+        mock.return_value = make_process(
+            stderr=b"Authentication failed: not logged in", returncode=1
+        )
 
         provider = GeminiCliAIProvider()
 
@@ -608,8 +743,7 @@ class TestGeminiCliAIProviderErrorHandling:
     def test_exit_code_127_suggests_install(self, mock_subprocess):
         """Exit code 127 (command not found) includes install link."""
         mock, process = mock_subprocess
-        process.returncode = 127
-        process.communicate.return_value = (b"", b"gemini: command not found")
+        mock.return_value = make_process(stderr=b"gemini: command not found", returncode=127)
 
         provider = GeminiCliAIProvider()
 
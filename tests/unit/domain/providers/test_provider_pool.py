@@ -0,0 +1,287 @@
+"""Tests for ProviderPool and pooled AIProviderFactory access."""
+
+import threading
+from typing import Any
+
+import pytest
+
+from aiwf.application.providers import ProviderExecutionService
+from aiwf.domain.errors import ProviderError
+from aiwf.domain.providers.ai_provider import AIProvider
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+from aiwf.domain.providers.provider_pool import ProviderPool, config_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Closable:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class CountingProvider(AIProvider):
+    """Provider that records instantiations, validations and closes."""
+
+    created = 0
+    validations = 0
+    closed = 0
+    fail_validation = False
+
+    def __init__(self, **config: Any):
+        CountingProvider.created += 1
+        self.config = config
+
+    @classmethod
+    def get_metadata(cls) -> dict[str, Any]:
+        return {"name": "counting", "fs_ability": "none"}
+
+    def validate(self) -> None:
+        CountingProvider.validations += 1
+        if CountingProvider.fail_validation:
+            raise ProviderError("not available")
+
+    def generate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        system_prompt: str | None = None,
+        connection_timeout: int | None = None,
+        response_timeout: int | None = None,
+    ):
+        return None
+
+    def close(self) -> None:
+        CountingProvider.closed += 1
+
+
+@pytest.fixture
+def counting_provider():
+    CountingProvider.created = 0
+    CountingProvider.validations = 0
+    CountingProvider.closed = 0
+    CountingProvider.fail_validation = False
+    AIProviderFactory.register("counting", CountingProvider)
+    yield
+    AIProviderFactory._registry.pop("counting", None)
+
+
+class TestProviderPool:
+    def test_reuses_instance_for_same_key(self):
+        pool: ProviderPool[object] = ProviderPool()
+
+        first = pool.get("k", object)
+        second = pool.get("k", object)
+
+        assert first is second
+
+    def test_expired_instance_is_closed_and_rebuilt(self):
+        clock = FakeClock()
+        pool: ProviderPool[Closable] = ProviderPool(ttl=10, clock=clock)
+        first = pool.get("k", Closable)
+
+        clock.now = 10
+        second = pool.get("k", Closable)
+
+        assert second is not first
+        assert first.closed
+
+    def test_zero_ttl_disables_reuse(self):
+        pool: ProviderPool[object] = ProviderPool(ttl=0)
+
+        assert pool.get("k", object) is not pool.get("k", object)
+
+    def test_validation_memoized_within_ttl(self):
+        clock = FakeClock()
+        pool: ProviderPool[object] = ProviderPool(validation_ttl=5, clock=clock)
+        calls = []
+
+        pool.get_validated("k", object, calls.append)
+        clock.now = 4
+        pool.get_validated("k", object, calls.append)
+        assert len(calls) == 1
+
+        clock.now = 5
+        pool.get_validated("k", object, calls.append)
+        assert len(calls) == 2
+
+    def test_failed_validation_is_not_memoized(self):
+        pool: ProviderPool[object] = ProviderPool()
+        attempts = []
+
+        def flaky(instance: object) -> None:
+            attempts.append(instance)
+            if len(attempts) == 1:
+                raise ProviderError("missing CLI")
+
+        with pytest.raises(ProviderError):
+            pool.get_validated("k", object, flaky)
+        pool.get_validated("k", object, flaky)
+
+        assert len(attempts) == 2
+
+    def test_validation_does_not_block_other_leases(self):
+        pool: ProviderPool[object] = ProviderPool()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_validate(instance: object) -> None:
+            started.set()
+            release.wait(timeout=5)
+
+        validating = threading.Thread(target=pool.get_validated, args=("slow", object, slow_validate))
+        validating.start()
+        try:
+            assert started.wait(timeout=5)
+            leased = threading.Event()
+
+            def lease_other() -> None:
+                with pool.lease("other", object):
+                    leased.set()
+
+            threading.Thread(target=lease_other).start()
+            assert leased.wait(timeout=1)
+        finally:
+            release.set()
+            validating.join(timeout=5)
+
+    def test_instance_retired_during_validation_is_closed_after(self):
+        pool: ProviderPool[Closable] = ProviderPool()
+
+        def evicting_validate(instance: Closable) -> None:
+            pool.clear()
+            assert not instance.closed
+
+        instance = pool.get_validated("k", Closable, evicting_validate)
+
+        assert instance.closed
+
+    def test_clear_closes_instances(self):
+        pool: ProviderPool[Closable] = ProviderPool()
+        instance = pool.get("k", Closable)
+
+        pool.clear()
+
+        assert instance.closed
+        assert pool.get("k", Closable) is not instance
+
+    def test_leased_instance_is_closed_after_release(self):
+        clock = FakeClock()
+        pool: ProviderPool[Closable] = ProviderPool(ttl=10, clock=clock)
+
+        with pool.lease("k", Closable) as held:
+            clock.now = 10
+            replacement = pool.get("k", Closable)
+            pool.clear()
+            assert replacement.closed
+            assert not held.closed
+
+        assert held.closed
+
+    def test_lease_reuses_pooled_instance(self):
+        pool: ProviderPool[Closable] = ProviderPool()
+
+        with pool.lease("k", Closable) as held:
+            pass
+
+        assert pool.get("k", Closable) is held
+        assert not held.closed
+
+    def test_config_key_ignores_dict_order(self):
+        assert config_key({"a": 1, "b": 2}) == config_key({"b": 2, "a": 1})
+        assert config_key(None) == config_key({})
+
+
+class TestFactoryPooling:
+    def test_acquire_reuses_instance_per_config(self, counting_provider):
+        first = AIProviderFactory.acquire("counting")
+        again = AIProviderFactory.acquire("counting", {})
+        other = AIProviderFactory.acquire("counting", {"model": "x"})
+
+        assert first is again
+        assert other is not first
+        assert CountingProvider.created == 2
+
+    def test_create_always_builds_new_instance(self, counting_provider):
+        AIProviderFactory.acquire("counting")
+
+        assert AIProviderFactory.create("counting") is not AIProviderFactory.acquire("counting")
+
+    def test_acquire_validated_probes_once(self, counting_provider):
+        AIProviderFactory.acquire_validated("counting")
+        AIProviderFactory.acquire_validated("counting")
+
+        assert CountingProvider.validations == 1
+
+    def test_acquire_validated_retries_after_failure(self, counting_provider):
+        CountingProvider.fail_validation = True
+        with pytest.raises(ProviderError):
+            AIProviderFactory.acquire_validated("counting")
+
+        CountingProvider.fail_validation = False
+        AIProviderFactory.acquire_validated("counting")
+
+        assert CountingProvider.validations == 2
+
+    def test_register_evicts_pooled_instances(self, counting_provider):
+        AIProviderFactory.acquire("counting")
+
+        AIProviderFactory.register("counting", CountingProvider)
+
+        assert CountingProvider.closed == 1
+        AIProviderFactory.acquire("counting")
+        assert CountingProvider.created == 2
+
+    def test_acquire_unknown_provider_raises(self):
+        with pytest.raises(KeyError):
+            AIProviderFactory.acquire("does-not-exist")
+
+    def test_provider_is_not_closed_mid_call(self, counting_provider, monkeypatch):
+        closed_during_call = []
+
+        def generate(self, prompt, **kwargs):
+            AIProviderFactory.clear_pool()  # e.g. evicted by another thread
+            closed_during_call.append(CountingProvider.closed)
+            return None
+
+        monkeypatch.setattr(CountingProvider, "generate", generate)
+        ProviderExecutionService().execute("counting", "prompt")
+
+        assert closed_during_call == [0]
+        assert CountingProvider.closed == 1
+
+    def test_configure_pool_none_ttl_means_no_expiry(self):
+        original = AIProviderFactory._pool
+        try:
+            AIProviderFactory.configure_pool(ttl=None)
+            assert AIProviderFactory._pool.ttl is None
+
+            AIProviderFactory.configure_pool(validation_ttl=5)
+            assert AIProviderFactory._pool.ttl is None
+            assert AIProviderFactory._pool.validation_ttl == 5
+        finally:
+            AIProviderFactory._pool = original
+
+    def test_configure_pool_zero_ttl_disables_pooling(self, counting_provider):
+        original = AIProviderFactory._pool
+        try:
+            AIProviderFactory.configure_pool(ttl=0)
+
+            assert AIProviderFactory.acquire("counting") is not AIProviderFactory.acquire("counting")
+        finally:
+            AIProviderFactory._pool = original
+
+    def test_configure_pool_with_current_values_keeps_pool(self):
+        original = AIProviderFactory._pool
+        try:
+            AIProviderFactory.configure_pool(ttl=original.ttl, validation_ttl=original.validation_ttl)
+            assert AIProviderFactory._pool is original
+        finally:
+            AIProviderFactory._pool = original
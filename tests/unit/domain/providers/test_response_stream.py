@@ -0,0 +1,82 @@
+"""Tests for ResponseStream."""
+
+from pathlib import Path
+
+from aiwf.domain.providers.response_stream import ResponseStream
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseStream:
+    def test_in_memory_stream_collects_text(self):
+        stream = ResponseStream()
+
+        stream.write("hello ")
+        stream.write("")
+        stream.write("wörld")
+
+        assert stream.text == "hello wörld"
+        assert stream.bytes_written == len("hello wörld".encode("utf-8"))
+        assert stream.commit() is False
+
+    def test_commit_renames_temp_file_onto_target(self, tmp_path: Path):
+        target = tmp_path / "resp.md"
+        stream = ResponseStream(target)
+
+        stream.write("content")
+        assert not target.exists()
+
+        assert stream.commit() is True
+        assert target.read_text(encoding="utf-8") == "content"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_empty_stream_writes_nothing(self, tmp_path: Path):
+        stream = ResponseStream(tmp_path / "resp.md")
+
+        assert stream.commit() is False
+        assert list(tmp_path.iterdir()) == []
+
+    def test_abort_keeps_partial(self, tmp_path: Path):
+        target = tmp_path / "resp.md"
+        stream = ResponseStream(target)
+        stream.write("partial")
+
+        partial = stream.abort()
+
+        assert partial == tmp_path / "resp.md.partial"
+        assert partial.read_text(encoding="utf-8") == "partial"
+        assert not target.exists()
+
+    def test_discard_removes_temp_file(self, tmp_path: Path):
+        stream = ResponseStream(tmp_path / "resp.md")
+        stream.write("x")
+
+        stream.discard()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_timing(self):
+        clock = FakeClock()
+        stream = ResponseStream(clock=clock)
+        clock.now = 1.5
+        stream.write("a")
+        clock.now = 4.0
+        stream.commit()
+
+        assert stream.ttft_seconds == 1.5
+        assert stream.latency_seconds == 4.0
+
+    def test_failing_progress_callback_is_ignored(self):
+        def broken(kind, data):
+            raise RuntimeError("observer bug")
+
+        stream = ResponseStream(on_progress=broken)
+        stream.write("still works")
+
+        assert stream.text == "still works"
@@ -0,0 +1,111 @@
+"""Unit tests for CommandProfiler and its span hooks."""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from aiwf.domain import command_profiler
+from aiwf.domain.command_profiler import (
+    CommandProfiler,
+    action_span,
+    active_profiler,
+    provider_span,
+)
+
+
+@pytest.fixture
+def profiler():
+    profiler = CommandProfiler("approve", top_n=5)
+    profiler.start()
+    yield profiler
+    if command_profiler._active is profiler:
+        profiler.stop()
+
+
+class TestSpansWithoutProfiler:
+    def test_spans_are_noops(self) -> None:
+        assert active_profiler() is None
+        with action_span("call_ai:plan", "s1"):
+            with provider_span():
+                pass
+        assert active_profiler() is None
+
+
+class TestCommandProfiler:
+    def test_start_and_stop_manage_active_profiler(self, profiler: CommandProfiler) -> None:
+        assert active_profiler() is profiler
+
+        profiler.stop()
+
+        assert active_profiler() is None
+        assert not tracemalloc.is_tracing()
+
+    def test_splits_provider_time_from_engine_time(self, profiler: CommandProfiler) -> None:
+        with action_span("call_ai:generate", "s1"):
+            with provider_span():
+                time.sleep(0.05)
+
+        report = profiler.stop()
+
+        (action,) = report["actions"]
+        assert action["action"] == "call_ai:generate"
+        assert action["calls"] == 1
+        assert action["provider_seconds"] >= 0.05
+        assert action["engine_seconds"] < action["wall_seconds"]
+        assert report["provider_seconds"] == pytest.approx(action["provider_seconds"])
+        assert report["session_id"] == "s1"
+
+    def test_nested_actions_are_exclusive(self, profiler: CommandProfiler) -> None:
+        with action_span("approve:plan", "s1"):
+            with action_span("create_prompt:generate", "s1"):
+                time.sleep(0.05)
+
+        report = profiler.stop()
+
+        actions = {a["action"]: a for a in report["actions"]}
+        assert actions["create_prompt:generate"]["wall_seconds"] >= 0.05
+        assert actions["approve:plan"]["wall_seconds"] < 0.05
+
+    def test_attributes_allocations_to_action(self, profiler: CommandProfiler) -> None:
+        kept = []
+        with action_span("create_prompt:plan"):
+            kept.append(bytearray(512 * 1024))
+
+        report = profiler.stop()
+
+        (action,) = report["actions"]
+        assert action["net_alloc_bytes"] >= 512 * 1024
+        assert action["peak_bytes"] >= 512 * 1024
+        assert report["memory"]["peak_bytes"] >= 512 * 1024
+        assert report["memory"]["top_allocations"]
+
+    def test_report_lists_top_functions(self, profiler: CommandProfiler) -> None:
+        sum(i * i for i in range(10_000))
+
+        report = profiler.stop()
+
+        assert 0 < len(report["top_functions"]) <= 5
+        assert {"function", "calls", "total_seconds", "cumulative_seconds"} <= set(
+            report["top_functions"][0]
+        )
+
+    def test_mixed_sessions_leave_session_id_unset(self, profiler: CommandProfiler) -> None:
+        with action_span("call_ai:plan", "s1"):
+            pass
+        with action_span("call_ai:plan", "s2"):
+            pass
+
+        report = profiler.stop()
+
+        assert report["session_id"] is None
+        assert report["actions"][0]["calls"] == 2
+
+    def test_write_report_creates_directories(self, profiler: CommandProfiler, tmp_path: Path) -> None:
+        report = profiler.stop()
+
+        path = CommandProfiler.write_report(tmp_path / "perf" / "r.json", report)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["command"] == "approve"
@@ -0,0 +1,175 @@
+"""Unit tests for span-based tracing and the OTLP JSON export."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+from aiwf.domain import tracing
+from aiwf.domain.models.workflow_state import (
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.tracing import (
+    Tracer,
+    active_tracer,
+    current_span,
+    post_otlp_json,
+    span,
+    state_attributes,
+    write_otlp_json,
+)
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    tracer.start("aiwf approve", **{"aiwf.command": "approve"})
+    yield tracer
+    if tracing._active is tracer:
+        tracer.stop()
+
+
+def _spans_by_name(tracer: Tracer) -> dict[str, tracing.Span]:
+    return {s.name: s for s in tracer.spans}
+
+
+def _otlp_attrs(otlp_span: dict) -> dict:
+    return {a["key"]: a["value"] for a in otlp_span["attributes"]}
+
+
+class TestSpanWithoutTracer:
+    def test_span_is_noop(self) -> None:
+        assert active_tracer() is None
+        with span("orchestrator.call_ai") as current:
+            assert current is None
+            assert current_span() is None
+
+
+class TestTracer:
+    def test_nested_spans_link_to_parents(self, tracer: Tracer) -> None:
+        with span("orchestrator.execute_command"):
+            with span("orchestrator.execute_action"):
+                pass
+        tracer.stop()
+
+        spans = _spans_by_name(tracer)
+        root = spans["aiwf approve"]
+        command = spans["orchestrator.execute_command"]
+        action = spans["orchestrator.execute_action"]
+        assert root.parent_span_id is None
+        assert command.parent_span_id == root.span_id
+        assert action.parent_span_id == command.span_id
+        assert {s.trace_id for s in tracer.spans} == {tracer.trace_id}
+        assert command.start_ns <= action.start_ns <= action.end_ns <= command.end_ns
+
+    def test_worker_threads_parent_to_root(self, tracer: Tracer) -> None:
+        def run() -> None:
+            with span("batch.entry"):
+                pass
+
+        worker = threading.Thread(target=run, name="aiwf-batch_0")
+        worker.start()
+        worker.join()
+        tracer.stop()
+
+        spans = _spans_by_name(tracer)
+        entry = spans["batch.entry"]
+        assert entry.parent_span_id == spans["aiwf approve"].span_id
+        assert entry.attributes["thread.name"] == "aiwf-batch_0"
+
+    def test_records_errors(self, tracer: Tracer) -> None:
+        with pytest.raises(ValueError):
+            with span("orchestrator.call_ai"):
+                raise ValueError("no provider")
+        tracer.stop()
+
+        failed = _spans_by_name(tracer)["orchestrator.call_ai"]
+        assert failed.error == "ValueError: no provider"
+        assert failed.to_otlp()["status"] == {"code": 2, "message": "ValueError: no provider"}
+
+    def test_stop_deactivates(self, tracer: Tracer) -> None:
+        tracer.stop()
+
+        assert active_tracer() is None
+        assert current_span() is None
+
+
+class TestOtlpExport:
+    def test_export_uses_otlp_json_encoding(self, tracer: Tracer) -> None:
+        state = WorkflowState(
+            session_id="s1",
+            profile="jpa-mt",
+            context={},
+            phase=WorkflowPhase.GENERATE,
+            stage=WorkflowStage.RESPONSE,
+            status=WorkflowStatus.IN_PROGRESS,
+            current_iteration=2,
+            ai_providers={},
+            standards_hash="0",
+        )
+        with span("orchestrator.call_ai", **state_attributes(state)) as current:
+            current.set_attribute("aiwf.provider", "claude-code")
+            current.set_attribute("aiwf.cost_usd", 0.25)
+            current.set_attribute("aiwf.cached", False)
+        tracer.stop()
+
+        payload = tracer.to_otlp()
+        (resource,) = payload["resourceSpans"]
+        resource_attrs = {a["key"]: a["value"] for a in resource["resource"]["attributes"]}
+        assert resource_attrs["service.name"] == {"stringValue": "aiwf"}
+        (scope,) = resource["scopeSpans"]
+        otlp = next(s for s in scope["spans"] if s["name"] == "orchestrator.call_ai")
+        assert len(otlp["traceId"]) == 32 and len(otlp["spanId"]) == 16
+        assert otlp["parentSpanId"]
+        assert int(otlp["endTimeUnixNano"]) >= int(otlp["startTimeUnixNano"])
+        attrs = _otlp_attrs(otlp)
+        assert attrs["aiwf.session_id"] == {"stringValue": "s1"}
+        assert attrs["aiwf.phase"] == {"stringValue": "generate"}
+        assert attrs["aiwf.iteration"] == {"intValue": "2"}
+        assert attrs["aiwf.cost_usd"] == {"doubleValue": 0.25}
+        assert attrs["aiwf.cached"] == {"boolValue": False}
+
+    def test_write_otlp_json(self, tracer: Tracer, tmp_path: Path) -> None:
+        tracer.stop()
+
+        path = write_otlp_json(tmp_path / "traces" / "trace.json", tracer.to_otlp())
+
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        assert payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "aiwf approve"
+
+    def test_post_to_collector(self, tracer: Tracer) -> None:
+        received: list[tuple[str, dict]] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received.append((self.path, json.loads(body)))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        tracer.stop()
+
+        post_otlp_json(f"http://127.0.0.1:{server.server_port}", tracer.to_otlp())
+        thread.join()
+        server.server_close()
+
+        ((path, payload),) = received
+        assert path == "/v1/traces"
+        assert payload == tracer.to_otlp()
+
+    def test_post_to_unreachable_collector_raises_oserror(self, tracer: Tracer) -> None:
+        tracer.stop()
+
+        with pytest.raises(OSError):
+            post_otlp_json("http://127.0.0.1:9", tracer.to_otlp(), timeout=1.0)
@@ -415,4 +415,125 @@ def register(cli_group):
         assert "my-profile" in cli.commands
         profile_group = cli.commands["my-profile"]
         assert isinstance(profile_group, click.Group)
-        assert "init" in profile_group.commands
\ No newline at end of file
+        assert "init" in profile_group.commands
+
+LAZY_PROFILE_INIT = '''
+import click
+from pathlib import Path
+
+# Counts imports; kept outside the profile dir so the manifest key is stable
+with Path(__file__).parent.parent.parent.joinpath("loads.txt").open("a") as f:
+    f.write("x")
+
+class LazyProfile:
+    @classmethod
+    def get_metadata(cls):
+        return {"name": "lazy", "description": "Lazy profile"}
+
+def register(cli_group):
+    @cli_group.command("info")
+    def info():
+        click.echo("Lazy profile info")
+    return LazyProfile
+'''
+
+
+class TestProfileManifest:
+    """Tests for the cached discovery manifest and lazy profile loading."""
+
+    @pytest.fixture
+    def lazy_profile(self, tmp_path):
+        profile_dir = tmp_path / "profiles" / "lazy"
+        profile_dir.mkdir(parents=True)
+        (profile_dir / "__init__.py").write_text(LAZY_PROFILE_INIT)
+        return profile_dir
+
+    @staticmethod
+    def _loads(profile_dir: Path) -> int:
+        loads = profile_dir.parent.parent / "loads.txt"
+        return len(loads.read_text()) if loads.exists() else 0
+
+    def test_first_run_discovers_and_writes_manifest(self, tmp_path, lazy_profile, clean_registry):
+        from aiwf.interface.cli.profile_discovery import load_profile_manifest
+
+        manifest = tmp_path / "cache" / "profiles.json"
+        with patch("aiwf.interface.cli.profile_discovery.entry_points", return_value=[]):
+            entries = load_profile_manifest(lazy_profile.parent, manifest)
+
+        assert [(e.name, e.description) for e in entries] == [("lazy", "Lazy profile")]
+        assert entries[0].source == f"local:{lazy_profile}"
+        assert self._loads(lazy_profile) == 1
+        assert manifest.exists()
+
+    def test_cached_manifest_skips_imports(self, tmp_path, lazy_profile, clean_registry):
+        from aiwf.interface.cli.profile_discovery import load_profile_manifest
+
+        manifest = tmp_path / "cache" / "profiles.json"
+        with patch("aiwf.interface.cli.profile_discovery.entry_points", return_value=[]):
+            load_profile_manifest(lazy_profile.parent, manifest)
+            entries = load_profile_manifest(lazy_profile.parent, manifest)
+
+        assert [e.name for e in entries] == ["lazy"]
+        assert self._loads(lazy_profile) == 1
+
+    def test_profile_change_invalidates_manifest(self, tmp_path, lazy_profile, clean_registry):
+        import os
+        from aiwf.interface.cli.profile_discovery import load_profile_manifest
+
+        manifest = tmp_path / "cache" / "profiles.json"
+        with patch("aiwf.interface.cli.profile_discovery.entry_points", return_value=[]):
+            load_profile_manifest(lazy_profile.parent, manifest)
+            init_file = lazy_profile / "__init__.py"
+            st = init_file.stat()
+            os.utime(init_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            load_profile_manifest(lazy_profile.parent, manifest)
+
+        assert self._loads(lazy_profile) == 2
+
+    def test_registered_loaders_import_on_first_use(self, tmp_path, lazy_profile, clean_registry):
+        from aiwf.interface.cli import profile_discovery
+        from aiwf.interface.cli.profile_discovery import (
+            load_profile_command,
+            register_profile_loaders,
+        )
+
+        manifest = tmp_path / "cache" / "profiles.json"
+        with patch("aiwf.interface.cli.profile_discovery.entry_points", return_value=[]):
+            register_profile_loaders(lazy_profile.parent, manifest)  # Builds the manifest
+        ProfileFactory.clear()
+        profile_discovery._loaded_groups.clear()
+
+        with patch("aiwf.interface.cli.profile_discovery.entry_points", return_value=[]):
+            entries = register_profile_loaders(lazy_profile.parent, manifest)
+
+        assert ProfileFactory.is_registered("lazy")
+        assert self._loads(lazy_profile) == 1
+
+        group = load_profile_command(entries["lazy"])
+
+        assert self._loads(lazy_profile) == 2
+        assert "info" in group.commands
+        assert group.help == "Lazy profile"
+        assert ProfileFactory.get("lazy").get_metadata()["name"] == "lazy"
+
+    def test_entrypoint_source_imports_module(self, tmp_path, monkeypatch, clean_registry):
+        from aiwf.interface.cli.profile_discovery import (
+            ProfileManifestEntry,
+            load_profile_command,
+        )
+
+        package = tmp_path / "ep_profile_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text(LAZY_PROFILE_INIT)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        group = load_profile_command(
+            ProfileManifestEntry(
+                name="ep-lazy",
+                source="entrypoint:ep_profile_pkg:register",
+                description="Entry point profile",
+            )
+        )
+
+        assert group.name == "ep-lazy"
+        assert "info" in group.commands
@@ -0,0 +1,117 @@
+"""Unit tests for the `aiwf batch` CLI command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.application.batch_runner import BatchItemResult, BatchResult, BatchRunner
+from aiwf.interface.cli.cli import cli
+
+
+MANIFEST = """\
+profile: jpa-mt
+workers: 2
+provider_limits: {claude-code: 1}
+entries:
+  - context: {entity: Product}
+  - context: {entity: Category}
+"""
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    path = tmp_path / "batch.yml"
+    path.write_text(MANIFEST, encoding="utf-8")
+    return path
+
+
+def _fake_run(items: list[BatchItemResult], captured: dict):
+    def run(self, manifest):
+        captured["workers"] = self.workers
+        captured["limiter"] = self._limiter
+        for item in items:
+            self._on_result(item)
+        return BatchResult(items=items, elapsed_seconds=1.5)
+    return run
+
+
+class TestBatchCommand:
+    def test_json_output_reports_each_session(
+        self, tmp_path: Path, manifest_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        items = [
+            BatchItemResult(index=0, label="Product", session_id="s1", phase="PLAN",
+                            stage="PROMPT", status="IN_PROGRESS", pending_approval=True),
+            BatchItemResult(index=1, label="Category", session_id="s2", phase="PLAN",
+                            stage="PROMPT", status="IN_PROGRESS", pending_approval=True),
+        ]
+        captured: dict = {}
+        monkeypatch.setattr(BatchRunner, "run", _fake_run(items, captured))
+
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "batch", str(manifest_path), "--workers", "5"],
+        )
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["command"] == "batch"
+        assert output["total"] == 2
+        assert output["failed"] == 0
+        assert [s["name"] for s in output["sessions"]] == ["Product", "Category"]
+        assert captured["workers"] == 5
+
+    def test_failed_entry_sets_exit_code(
+        self, tmp_path: Path, manifest_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        items = [
+            BatchItemResult(index=0, label="Product", session_id="s1", phase="PLAN",
+                            stage="PROMPT", status="IN_PROGRESS"),
+            BatchItemResult(index=1, label="Category", error="boom"),
+        ]
+        monkeypatch.setattr(BatchRunner, "run", _fake_run(items, {}))
+
+        result = CliRunner().invoke(
+            cli, ["--project-dir", str(tmp_path), "batch", str(manifest_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "[2/2] Category: error: boom" in result.output
+        assert "total=2 failed=1" in result.output
+
+    def test_provider_limit_option_overrides_manifest(
+        self, tmp_path: Path, manifest_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        captured: dict = {}
+        monkeypatch.setattr(BatchRunner, "run", _fake_run([], captured))
+
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "batch", str(manifest_path),
+             "--provider-limit", "claude-code=3"],
+        )
+
+        assert result.exit_code == 0
+        semaphore = captured["limiter"]._semaphores["claude-code"]
+        assert semaphore._initial_value == 3
+
+    def test_invalid_provider_limit(self, tmp_path: Path, manifest_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "batch", str(manifest_path),
+             "--provider-limit", "claude-code"],
+        )
+
+        assert result.exit_code == 1
+        output = json.loads(result.output)
+        assert "Invalid provider limit" in output["error"]
+
+    def test_missing_manifest(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "batch", str(tmp_path / "nope.yml")]
+        )
+
+        assert result.exit_code == 1
+        assert "not found" in json.loads(result.output)["error"]
@@ -0,0 +1,203 @@
+"""Unit tests for the `aiwf serve` daemon and its client."""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.interface.cli import cli as cli_module
+from aiwf.interface.cli import daemon as daemon_module
+from aiwf.interface.cli.cli import cli
+from aiwf.interface.cli.daemon import create_server, request_daemon, run_via_daemon
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def socket_path():
+    # Short path: Unix socket paths are limited to ~100 characters
+    tmp = tempfile.mkdtemp(prefix="aiwf-")
+    yield Path(tmp) / "daemon.sock"
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    cli_module._warm = None
+
+
+def _run(socket_path: Path, argv: list[str], cwd: Path, env: dict[str, str] | None = None):
+    """Speak the daemon protocol directly; returns (exit_code, stdout, stderr)."""
+    out: dict[str, str] = {"stdout": "", "stderr": ""}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            request = {"op": "run", "argv": argv, "cwd": str(cwd), "env": env or {}}
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            for line in stream:
+                message = json.loads(line)
+                if "exit_code" in message:
+                    return message["exit_code"], out["stdout"], out["stderr"]
+                out[message["stream"]] += message["data"]
+    raise AssertionError("daemon closed the connection")
+
+
+class TestDaemon:
+    def test_output_matches_in_process_cli(self, daemon, socket_path, tmp_path: Path) -> None:
+        argv = ["--json", "--project-dir", str(tmp_path), "list"]
+
+        exit_code, stdout, _ = _run(socket_path, argv, tmp_path)
+
+        assert exit_code == 0
+        assert stdout == CliRunner().invoke(cli, argv).stdout
+        assert json.loads(stdout)["command"] == "list"
+
+    def test_runs_in_client_working_directory(self, daemon, socket_path, tmp_path: Path) -> None:
+        exit_code, stdout, _ = _run(socket_path, ["--json", "status", "missing"], tmp_path)
+
+        assert exit_code == 1
+        output = json.loads(stdout)
+        assert output["session_path"] == str(tmp_path / ".aiwf" / "sessions" / "missing")
+        assert os.getcwd() != str(tmp_path)
+
+    def test_errors_go_to_stderr(self, daemon, socket_path, tmp_path: Path) -> None:
+        exit_code, stdout, stderr = _run(socket_path, ["status", "missing"], tmp_path)
+
+        assert exit_code == 1
+        assert stdout == ""
+        assert "Error: Session 'missing' not found" in stderr
+
+    def test_forwards_aiwf_environment(self, daemon, socket_path, tmp_path: Path) -> None:
+        exit_code, _, stderr = _run(
+            socket_path, ["list"], tmp_path, env={"AIWF_PERF_PROFILE": "1"}
+        )
+
+        assert exit_code == 0
+        assert "Perf profile:" in stderr
+        assert list((tmp_path / ".aiwf" / "perf").glob("*-list.json"))
+        assert "AIWF_PERF_PROFILE" not in os.environ
+
+    def test_runs_with_client_environment(self, daemon, socket_path, tmp_path: Path) -> None:
+        seen = {}
+        original = cli_module.cli.main
+
+        def record_env(*args, **kwargs):
+            seen.update(os.environ)
+            return original(*args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(cli_module.cli, "main", record_env)
+            _run(socket_path, ["list"], tmp_path, env={"PATH": "/client/bin", "API_KEY": "k"})
+
+        assert seen == {"PATH": "/client/bin", "API_KEY": "k"}
+        assert os.environ.get("API_KEY") is None
+        assert os.environ["PATH"] != "/client/bin"
+
+    def test_reuses_session_store_across_commands(self, daemon, socket_path, tmp_path: Path) -> None:
+        _run(socket_path, ["list"], tmp_path)
+        (store,) = cli_module._warm.stores.values()
+
+        _run(socket_path, ["status", "missing"], tmp_path)
+
+        assert list(cli_module._warm.stores.values()) == [store]
+
+    def test_reloads_changed_config(self, daemon) -> None:
+        project = Path(tempfile.mkdtemp(prefix="aiwf-"))
+        config_file = project / ".aiwf" / "config.yml"
+        config_file.parent.mkdir()
+        config_file.write_text("dev: alice\n", encoding="utf-8")
+
+        assert cli_module._load_project_config(project)["dev"] == "alice"
+        config_file.write_text("dev: robert\n", encoding="utf-8")
+
+        assert cli_module._load_project_config(project)["dev"] == "robert"
+        shutil.rmtree(project)
+
+    def test_busy_daemon_does_not_queue_commands(self, daemon, socket_path, tmp_path: Path) -> None:
+        with daemon._command_lock:
+            assert run_via_daemon(["list"], socket_path) is None
+
+        assert _run(socket_path, ["list"], tmp_path)[0] == 0
+
+    def test_refuses_second_daemon(self, daemon, socket_path) -> None:
+        with pytest.raises(RuntimeError, match="already running"):
+            create_server(socket_path)
+
+    def test_shutdown_removes_socket(self, socket_path) -> None:
+        server = create_server(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        reply = request_daemon("shutdown", socket_path)
+        thread.join(timeout=5)
+        server.server_close()
+        cli_module._warm = None
+
+        assert reply == {"pid": os.getpid()}
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+class TestClient:
+    def test_no_daemon_runs_in_process(self, socket_path) -> None:
+        assert run_via_daemon(["list"], socket_path) is None
+
+    @pytest.mark.parametrize(
+        ("argv", "routed"),
+        [
+            (["serve"], False),
+            (["--json", "serve", "--stop"], False),
+            (["--project-dir", ".", "serve"], False),
+            (["--", "serve"], False),
+            (["status", "serve"], True),
+            (["--project-dir", "serve", "list"], True),
+        ],
+    )
+    def test_only_serve_subcommand_skips_daemon(self, socket_path, monkeypatch, argv, routed) -> None:
+        connected = []
+        monkeypatch.setattr(daemon_module, "_connect", lambda path: connected.append(path))
+
+        assert run_via_daemon(argv, socket_path) is None
+        assert bool(connected) is routed
+
+    def test_opt_out(self, daemon, socket_path, monkeypatch) -> None:
+        monkeypatch.setenv("AIWF_NO_DAEMON", "1")
+
+        assert run_via_daemon(["list"], socket_path) is None
+
+    def test_aiwf_command_uses_daemon(self, daemon, socket_path, tmp_path: Path) -> None:
+        env = {**os.environ, "AIWF_DAEMON_SOCKET": str(socket_path), "PYTHONPATH": str(REPO_ROOT)}
+
+        result = subprocess.run(
+            [sys.executable, "-m", "aiwf", "--json", "list"],
+            cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["command"] == "list"
+        # Served by the daemon: its warm store cache saw the command
+        assert (tmp_path / ".aiwf" / "sessions", "snapshot") in cli_module._warm.stores
+
+    def test_stop_without_daemon(self, socket_path) -> None:
+        result = CliRunner().invoke(cli, ["serve", "--stop", "--socket", str(socket_path)])
+
+        assert result.exit_code == 1
+        assert "No aiwf daemon running" in result.output
@@ -0,0 +1,44 @@
+"""Unit tests for the --perf-profile CLI option."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from aiwf.domain.command_profiler import active_profiler
+from aiwf.interface.cli.cli import cli
+
+
+class TestPerfProfileOption:
+    def test_writes_project_report_for_sessionless_command(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "--perf-profile", "list"]
+        )
+
+        assert result.exit_code == 0, result.output
+        # Report summary goes to stderr; stdout stays a single JSON document
+        assert json.loads(result.stdout)["sessions"] == []
+        assert "Perf profile:" in result.stderr
+
+        (report_path,) = (tmp_path / ".aiwf" / "perf").glob("*-list.json")
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["command"] == "list"
+        assert report["session_id"] is None
+        assert report["top_functions"]
+        assert active_profiler() is None
+
+    def test_enabled_by_environment_variable(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli,
+            ["--project-dir", str(tmp_path), "list"],
+            env={"AIWF_PERF_PROFILE": "1"},
+        )
+
+        assert result.exit_code == 0, result.output
+        assert list((tmp_path / ".aiwf" / "perf").glob("*-list.json"))
+
+    def test_off_by_default(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["--project-dir", str(tmp_path), "list"])
+
+        assert result.exit_code == 0, result.output
+        assert not (tmp_path / ".aiwf" / "perf").exists()
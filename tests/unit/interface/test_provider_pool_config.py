@@ -0,0 +1,32 @@
+"""Unit tests for applying provider_pool config in the CLI."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.domain.providers.provider_factory import AIProviderFactory
+from aiwf.interface.cli.cli import cli
+
+
+@pytest.fixture
+def restore_pool():
+    original = AIProviderFactory._pool
+    yield
+    AIProviderFactory._pool = original
+
+
+class TestProviderPoolConfig:
+    def test_config_sets_pool_lifetimes(self, tmp_path: Path, restore_pool) -> None:
+        config_dir = tmp_path / ".aiwf"
+        config_dir.mkdir()
+        (config_dir / "config.yml").write_text(
+            "provider_pool:\n  ttl_seconds: null\n  validation_ttl_seconds: 30\n",
+            encoding="utf-8",
+        )
+
+        result = CliRunner().invoke(cli, ["--json", "--project-dir", str(tmp_path), "list"])
+
+        assert result.exit_code == 0, result.output
+        assert AIProviderFactory._pool.ttl is None
+        assert AIProviderFactory._pool.validation_ttl == 30
@@ -0,0 +1,76 @@
+"""Unit tests for session_persistence backend selection in the CLI."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from aiwf.domain.models.workflow_state import WorkflowPhase, WorkflowState, WorkflowStatus
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.domain.persistence.sqlite_session_store import SqliteSessionStore
+from aiwf.interface.cli.cli import cli
+
+
+def _write_config(project_dir: Path, persistence: str) -> None:
+    config_dir = project_dir / ".aiwf"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "config.yml").write_text(
+        f"session_persistence: {persistence}\n", encoding="utf-8"
+    )
+
+
+def _state(session_id: str) -> WorkflowState:
+    return WorkflowState(
+        session_id=session_id,
+        profile="jpa-mt",
+        phase=WorkflowPhase.PLAN,
+        status=WorkflowStatus.IN_PROGRESS,
+        standards_hash="abc123",
+        ai_providers={"planner": "manual"},
+    )
+
+
+class TestSessionPersistenceSelection:
+    def test_sqlite_backend_serves_status_and_list(self, tmp_path: Path) -> None:
+        _write_config(tmp_path, "sqlite")
+        SqliteSessionStore(sessions_root=tmp_path / ".aiwf" / "sessions").save(_state("s1"))
+        runner = CliRunner()
+
+        status = runner.invoke(cli, ["--json", "--project-dir", str(tmp_path), "status", "s1"])
+        listing = runner.invoke(cli, ["--json", "--project-dir", str(tmp_path), "list"])
+
+        assert status.exit_code == 0, status.output
+        assert json.loads(status.output)["phase"] == "PLAN"
+        assert [s["session_id"] for s in json.loads(listing.output)["sessions"]] == ["s1"]
+
+    def test_sqlite_backend_does_not_read_session_json(self, tmp_path: Path) -> None:
+        _write_config(tmp_path, "sqlite")
+        SessionStore(sessions_root=tmp_path / ".aiwf" / "sessions").save(_state("s1"))
+
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "status", "s1"]
+        )
+
+        assert result.exit_code == 1
+
+    @pytest.mark.parametrize("persistence", ["snapshot", "journal"])
+    def test_file_backends_read_session_json(self, tmp_path: Path, persistence: str) -> None:
+        _write_config(tmp_path, persistence)
+        SessionStore(sessions_root=tmp_path / ".aiwf" / "sessions").save(_state("s1"))
+
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "status", "s1"]
+        )
+
+        assert result.exit_code == 0, result.output
+
+    def test_invalid_persistence_is_reported(self, tmp_path: Path) -> None:
+        _write_config(tmp_path, "mongo")
+
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "status", "s1"]
+        )
+
+        assert result.exit_code == 1
+        assert "session_persistence" in result.output
@@ -0,0 +1,107 @@
+"""Unit tests for the stats CLI command."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from aiwf.domain.models.workflow_state import (
+    PhaseTransition,
+    TransitionCause,
+    WorkflowPhase,
+    WorkflowStage,
+    WorkflowState,
+    WorkflowStatus,
+)
+from aiwf.domain.persistence.session_metrics import ProviderCallMetric, SessionMetricsLog
+from aiwf.domain.persistence.session_store import SessionStore
+from aiwf.interface.cli.cli import cli
+
+
+def _record(sessions_root: Path, session_id: str, **overrides) -> None:
+    fields = {
+        "session_id": session_id,
+        "phase": "plan",
+        "iteration": 1,
+        "role": "planner",
+        "provider": "claude-code",
+        "outcome": "ok",
+        "wall_seconds": 2.0,
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cost_usd": 0.5,
+    }
+    fields.update(overrides)
+    session_dir = sessions_root / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+    SessionMetricsLog(session_dir).append(ProviderCallMetric(**fields))
+
+
+class TestStatsCommand:
+    def test_json_aggregates_all_sessions(self, tmp_path: Path) -> None:
+        sessions_root = tmp_path / ".aiwf" / "sessions"
+        _record(sessions_root, "s1")
+        _record(sessions_root, "s2", wall_seconds=4.0)
+        _record(sessions_root, "s2", phase="review", provider="manual", outcome="awaiting",
+                wall_seconds=0.0, input_tokens=None, output_tokens=None, cost_usd=None)
+
+        result = CliRunner().invoke(cli, ["--json", "--project-dir", str(tmp_path), "stats"])
+
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.output)
+        assert payload["total_calls"] == 3
+        assert payload["total_cost_usd"] == 1.0
+        plan = payload["providers"][0]
+        assert (plan["phase"], plan["calls"], plan["mean_seconds"]) == ("plan", 2, 3.0)
+        assert plan["input_tokens"] == 200
+
+    def test_single_session_text_output(self, tmp_path: Path) -> None:
+        sessions_root = tmp_path / ".aiwf" / "sessions"
+        _record(sessions_root, "s1")
+        _record(sessions_root, "s2", provider="gemini-cli")
+
+        result = CliRunner().invoke(cli, ["--project-dir", str(tmp_path), "stats", "s1"])
+
+        assert result.exit_code == 0, result.output
+        assert "claude-code" in result.output
+        assert "gemini-cli" not in result.output
+        assert "total_calls=1" in result.output
+
+    def test_unknown_session_fails(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli, ["--json", "--project-dir", str(tmp_path), "stats", "missing"]
+        )
+
+        assert result.exit_code == 1
+        assert "not found" in json.loads(result.output)["error"]
+
+    def test_reports_stage_timings_from_catalog(self, tmp_path: Path) -> None:
+        sessions_root = tmp_path / ".aiwf" / "sessions"
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        history = [
+            PhaseTransition(phase=WorkflowPhase.PLAN, stage=WorkflowStage.PROMPT,
+                            status=WorkflowStatus.IN_PROGRESS, cause=cause,
+                            timestamp=start + timedelta(seconds=seconds))
+            for cause, seconds in [
+                (TransitionCause.INIT, 0), (TransitionCause.AWAIT, 3), (TransitionCause.APPROVE, 33),
+            ]
+        ]
+        SessionStore(sessions_root=sessions_root).save(
+            WorkflowState(
+                session_id="s1", profile="jpa-mt", phase=WorkflowPhase.PLAN,
+                stage=WorkflowStage.PROMPT, status=WorkflowStatus.IN_PROGRESS,
+                standards_hash="0" * 64, ai_providers={"planner": "manual"},
+                phase_history=history,
+            )
+        )
+
+        result = CliRunner().invoke(cli, ["--json", "--project-dir", str(tmp_path), "stats"])
+
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.output)
+        assert [(row["kind"], row["p50_seconds"]) for row in payload["stages"]] == [
+            ("machine", 3.0), ("human", 30.0),
+        ]
+        assert payload["machine_seconds"] == 3.0
+        assert payload["human_wait_seconds"] == 30.0
@@ -0,0 +1,35 @@
+"""Unit tests for the --trace-file / --trace-endpoint CLI options."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from aiwf.domain.tracing import active_tracer
+from aiwf.interface.cli.cli import cli
+
+
+class TestTraceOptions:
+    def test_trace_file_receives_otlp_json(self, tmp_path: Path) -> None:
+        trace_file = tmp_path / "traces" / "list.json"
+
+        result = CliRunner().invoke(
+            cli,
+            ["--json", "--project-dir", str(tmp_path), "--trace-file", str(trace_file), "list"],
+        )
+
+        assert result.exit_code == 0, result.output
+        payload = json.loads(trace_file.read_text(encoding="utf-8"))
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [s["name"] for s in spans] == ["aiwf list"]
+        assert active_tracer() is None
+
+    def test_unreachable_endpoint_warns_without_failing(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(
+            cli,
+            ["--project-dir", str(tmp_path), "list"],
+            env={"AIWF_TRACE_ENDPOINT": "http://127.0.0.1:9"},
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "could not export trace" in result.stderr
@@ -553,3 +553,36 @@ class TestTemplateRendering:
 
         # Engine vars like {{STANDARDS}} are expected to remain
         # (resolved by PromptAssembler, not profile)
+
+
+class TestStandardsForContext:
+    """Tests for standards bundle lookup in prompts."""
+
+    def test_reads_materialized_bundle(self, tmp_path: Path):
+        """A materialized session bundle is used instead of rebuilding."""
+        bundle = tmp_path / "standards-bundle.md"
+        bundle.write_text("# Session bundle\n", encoding="utf-8")
+        profile = JpaMtProfile()
+
+        with patch("profiles.jpa_mt.profile.JpaMtStandardsProvider") as provider_cls:
+            standards = profile._get_standards_for_context(
+                {"scope": "domain", "standards_bundle_path": str(bundle)}
+            )
+
+        assert standards == "# Session bundle\n"
+        provider_cls.assert_not_called()
+
+    def test_missing_bundle_falls_back_to_provider(self, tmp_path: Path):
+        """A missing bundle file falls back to the standards provider."""
+        profile = JpaMtProfile()
+
+        with patch("profiles.jpa_mt.profile.JpaMtStandardsProvider") as provider_cls:
+            provider_cls.return_value.create_bundle.return_value = "# Built\n"
+            standards = profile._get_standards_for_context(
+                {
+                    "scope": "domain",
+                    "standards_bundle_path": str(tmp_path / "missing.md"),
+                }
+            )
+
+        assert standards == "# Built\n"
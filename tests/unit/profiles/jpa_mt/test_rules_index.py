@@ -0,0 +1,145 @@
+"""Tests for the compiled JPA-MT rules index."""
+
+import pickle
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from profiles.jpa_mt.rules_index import (
+    CompiledRules,
+    index_path_for,
+    load_compiled_rules,
+)
+from profiles.jpa_mt.standards import JpaMtStandardsProvider
+
+
+RULES = [
+    ("JPA-ENT-002", "M", "Second entity rule."),
+    ("SVC-BIZ-001", "C", "Service rule."),
+    ("JPA-ENT-001", "C", "First entity rule."),
+    ("JPA-REP-001", "m", "Repository rule."),
+]
+
+
+class TestCompiledRulesSelect:
+    def test_empty_prefixes_returns_all_in_document_order(self):
+        compiled = CompiledRules.build("digest", RULES)
+
+        assert compiled.select([]) == RULES
+
+    def test_prefix_range_preserves_document_order(self):
+        compiled = CompiledRules.build("digest", RULES)
+
+        assert compiled.select(["JPA-ENT-"]) == [RULES[0], RULES[2]]
+
+    def test_overlapping_prefixes_do_not_duplicate(self):
+        compiled = CompiledRules.build("digest", RULES)
+
+        selected = compiled.select(["JPA-", "JPA-ENT-", "SVC-"])
+
+        assert selected == RULES
+
+    def test_build_records_duplicate_ids(self):
+        compiled = CompiledRules.build("digest", RULES + [("SVC-BIZ-001", "m", "Again.")])
+
+        assert compiled.duplicate_ids == ("SVC-BIZ-001",)
+        assert CompiledRules.from_payload(compiled.to_payload()) == compiled
+
+    def test_unmatched_prefix_returns_nothing(self):
+        compiled = CompiledRules.build("digest", RULES)
+
+        assert compiled.select(["CTL-", "ZZZ-"]) == []
+
+
+class TestLoadCompiledRules:
+    def test_writes_index_next_to_rules_file(self, tmp_path: Path):
+        rules_file = tmp_path / "a.rules.yml"
+        rules_file.write_text("x", encoding="utf-8")
+
+        load_compiled_rules(rules_file, lambda raw: RULES)
+
+        assert index_path_for(rules_file).name == "a.rules.yml.idx"
+        assert index_path_for(rules_file).is_file()
+
+    def test_serialized_index_skips_parse(self, tmp_path: Path, monkeypatch):
+        rules_file = tmp_path / "a.rules.yml"
+        rules_file.write_text("x", encoding="utf-8")
+        load_compiled_rules(rules_file, lambda raw: RULES)
+
+        # Simulate a fresh process: only the on-disk index remains
+        monkeypatch.setattr("profiles.jpa_mt.rules_index._COMPILED_CACHE", {})
+        parse = Mock(return_value=[])
+        compiled = load_compiled_rules(rules_file, parse)
+
+        parse.assert_not_called()
+        assert list(compiled.rules) == RULES
+
+    def test_changed_file_rebuilds_index(self, tmp_path: Path):
+        rules_file = tmp_path / "a.rules.yml"
+        rules_file.write_text("x", encoding="utf-8")
+        load_compiled_rules(rules_file, lambda raw: RULES)
+
+        rules_file.write_text("y", encoding="utf-8")
+        compiled = load_compiled_rules(rules_file, lambda raw: RULES[:1])
+
+        assert list(compiled.rules) == RULES[:1]
+
+    def test_index_with_globals_is_rejected(self, tmp_path: Path, monkeypatch):
+        rules_file = tmp_path / "a.rules.yml"
+        rules_file.write_text("x", encoding="utf-8")
+        index_path_for(rules_file).write_bytes(pickle.dumps(Path("evil")))
+        monkeypatch.setattr("profiles.jpa_mt.rules_index._COMPILED_CACHE", {})
+
+        compiled = load_compiled_rules(rules_file, lambda raw: RULES)
+
+        assert list(compiled.rules) == RULES
+
+    def test_unwritable_directory_still_compiles(self, tmp_path: Path, monkeypatch):
+        rules_file = tmp_path / "a.rules.yml"
+        rules_file.write_text("x", encoding="utf-8")
+
+        def refuse(*args, **kwargs):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr("profiles.jpa_mt.rules_index.tempfile.mkstemp", refuse)
+        compiled = load_compiled_rules(rules_file, lambda raw: RULES)
+
+        assert list(compiled.rules) == RULES
+        assert not index_path_for(rules_file).exists()
+
+
+class TestProviderUsesIndex:
+    def test_bundle_from_index_matches_prefix_selection(self, tmp_path: Path):
+        (tmp_path / "jpa.rules.yml").write_text(
+            """jpa:
+  entity:
+    JPA-ENT-001: 'C: Entity rule.'
+  service:
+    SVC-BIZ-001: 'C: Service rule.'
+"""
+        )
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        bundle = provider.create_bundle(
+            {"scope": "domain", "standards_prefixes": ["JPA-"]}
+        )
+
+        assert "JPA-ENT-001" in bundle
+        assert "SVC-BIZ-001" not in bundle
+        assert (tmp_path / "jpa.rules.yml.idx").is_file()
+        # Index artifacts are not picked up as rules files
+        assert provider.get_cache_key({"scope": "domain"})["sources"] == [
+            tmp_path / "jpa.rules.yml"
+        ]
+
+    @pytest.mark.parametrize("prefixes", [[], ["JPA-"], ["SVC-", "JPA-ENT"]])
+    def test_rules_dir_without_matches_keeps_header(self, tmp_path: Path, prefixes):
+        (tmp_path / "empty.rules.yml").write_text("")
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        bundle = provider.create_bundle(
+            {"scope": "full", "standards_prefixes": prefixes}
+        )
+
+        assert bundle.startswith("# Standards Bundle (full scope)")
@@ -2,6 +2,9 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+
+import yaml
 
 from profiles.jpa_mt.standards import JpaMtStandardsProvider
 from aiwf.domain.errors import ProviderError
@@ -459,6 +462,44 @@ class TestJpaMtStandardsProviderEdgeCases:
         assert "Duplicate rule ID" in caplog.text
         assert "JPA-ENT-001" in caplog.text
 
+    def test_duplicate_rule_id_outside_prefixes_logs_warning(self, tmp_path: Path, caplog):
+        """Duplicates are reported even when the prefixes select neither definition."""
+        (tmp_path / "file1.rules.yml").write_text(
+            """rules:
+  JPA-ENT-001: 'C: Entity rule.'
+  SVC-BIZ-001: 'C: First definition.'
+"""
+        )
+        (tmp_path / "file2.rules.yml").write_text(
+            """rules:
+  SVC-BIZ-001: 'C: Second definition (duplicate).'
+"""
+        )
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        import logging
+        with caplog.at_level(logging.WARNING):
+            provider.create_bundle({"scope": "domain", "standards_prefixes": ["JPA-"]})
+
+        assert "Duplicate rule ID 'SVC-BIZ-001'" in caplog.text
+
+    def test_duplicate_rule_id_within_file_logs_warning(self, tmp_path: Path, caplog):
+        """Rule IDs repeated across sections of one file log a warning."""
+        (tmp_path / "file1.rules.yml").write_text(
+            """entities:
+  JPA-ENT-001: 'C: First definition.'
+repositories:
+  JPA-ENT-001: 'C: Second definition (duplicate).'
+"""
+        )
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        import logging
+        with caplog.at_level(logging.WARNING):
+            provider.create_bundle({"scope": "domain"})
+
+        assert "Duplicate rule ID 'JPA-ENT-001' found in file1.rules.yml" in caplog.text
+
     def test_duplicate_rule_id_last_wins(self, tmp_path: Path):
         """When duplicate rule IDs exist, last definition wins."""
         # Create two files - sorted order means file1 < file2
@@ -482,3 +523,38 @@ class TestJpaMtStandardsProviderEdgeCases:
         # But actually each file creates its own category, so both appear
         # The warning is about tracking, not merging
         assert "JPA-ENT-001" in bundle
+
+
+class TestJpaMtStandardsProviderParseMemo:
+    """Tests for memoized parsing of rules files."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path):
+        """Repeated bundle builds reuse parsed rules instead of re-reading YAML."""
+        (tmp_path / "memo.rules.yml").write_text(
+            """jpa:
+  JPA-MEMO-001: 'C: Parsed once.'
+"""
+        )
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+
+        with patch("profiles.jpa_mt.standards.yaml.safe_load", wraps=yaml.safe_load) as load:
+            first = provider.create_bundle({"scope": "domain"})
+            second = JpaMtStandardsProvider(
+                {"rules_path": str(tmp_path)}
+            ).create_bundle({"scope": "domain"})
+
+        assert first == second
+        assert load.call_count == 1
+
+    def test_changed_content_is_reparsed(self, tmp_path: Path):
+        """Editing a rules file yields the new rules."""
+        rules_file = tmp_path / "memo.rules.yml"
+        rules_file.write_text("jpa:\n  JPA-MEMO-002: 'C: Before.'\n")
+        provider = JpaMtStandardsProvider({"rules_path": str(tmp_path)})
+        provider.create_bundle({"scope": "domain"})
+
+        rules_file.write_text("jpa:\n  JPA-MEMO-002: 'C: After.'\n")
+        bundle = provider.create_bundle({"scope": "domain"})
+
+        assert "After." in bundle
+        assert "Before." not in bundle